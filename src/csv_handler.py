@@ -311,6 +311,22 @@ class CSVHandler:
         except Exception as exc:
             self.logger.error(f"Error appending to CSV {csv_file}: {exc}")
 
+    def snapshot_csv(self, csv_file):
+        """
+        Records the current byte length of a CSV file under the write lock.
+
+        Rows are always written whole while the lock is held, so the returned
+        offset marks a complete-row boundary. Readers can release the lock and
+        then read only up to this offset while appends continue.
+
+        :param csv_file: Path to the CSV file.
+        :return: Byte offset of the end of the last complete row, or 0 if missing.
+        """
+        with self.lock:
+            if not csv_file or not os.path.exists(csv_file):
+                return 0
+            return os.path.getsize(csv_file)
+
     def set_csv_save_directory(self, directory, preserve_filenames=False, move_existing_files=False):
         """
         Sets a new directory for saving CSV files.
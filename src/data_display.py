@@ -6,9 +6,81 @@ from key_name_definitions import TelemetryKey
 from unit_conversion import convert_value
 
 class DataDisplay:
+    DISPLAY_ORDER = (
+        TelemetryKey.TOTAL_CAPACITY_WH, TelemetryKey.TOTAL_CAPACITY_AH, TelemetryKey.TOTAL_VOLTAGE,
+        TelemetryKey.MC1BUS_VOLTAGE, TelemetryKey.MC1BUS_CURRENT, TelemetryKey.MC1VEL_RPM,
+        TelemetryKey.MC1VEL_VELOCITY, TelemetryKey.MC1VEL_SPEED, TelemetryKey.MC1TP1_HEATSINK_TEMP,
+        TelemetryKey.MC1TP1_MOTOR_TEMP, TelemetryKey.MC1TP2_INLET_TEMP, TelemetryKey.MC1TP2_CPU_TEMP,
+        TelemetryKey.MC1PHA_PHASE_A_CURRENT, TelemetryKey.MC1PHA_PHASE_B_CURRENT,
+        TelemetryKey.MC1CUM_BUS_AMPHOURS, TelemetryKey.MC1CUM_ODOMETER, TelemetryKey.MC1VVC_VD_VECTOR,
+        TelemetryKey.MC1VVC_VQ_VECTOR, TelemetryKey.MC1IVC_ID_VECTOR, TelemetryKey.MC1IVC_IQ_VECTOR,
+        TelemetryKey.MC1BEM_BEMFD_VECTOR, TelemetryKey.MC1BEM_BEMFQ_VECTOR, TelemetryKey.MC1_BUS_POWER_W, TelemetryKey.MC1_MECHANICAL_POWER_W, TelemetryKey.MC1_EFFICIENCY_PCT,
+        TelemetryKey.MC2BUS_VOLTAGE, TelemetryKey.MC2BUS_CURRENT, TelemetryKey.MC2VEL_RPM,
+        TelemetryKey.MC2VEL_VELOCITY, TelemetryKey.MC2VEL_SPEED, TelemetryKey.MC2TP1_HEATSINK_TEMP,
+        TelemetryKey.MC2TP1_MOTOR_TEMP, TelemetryKey.MC2TP2_INLET_TEMP, TelemetryKey.MC2TP2_CPU_TEMP,
+        TelemetryKey.MC2PHA_PHASE_A_CURRENT, TelemetryKey.MC2PHA_PHASE_B_CURRENT,
+        TelemetryKey.MC2CUM_BUS_AMPHOURS, TelemetryKey.MC2CUM_ODOMETER, TelemetryKey.MC2VVC_VD_VECTOR,
+        TelemetryKey.MC2VVC_VQ_VECTOR, TelemetryKey.MC2IVC_ID_VECTOR, TelemetryKey.MC2IVC_IQ_VECTOR,
+        TelemetryKey.MC2BEM_BEMFD_VECTOR, TelemetryKey.MC2BEM_BEMFQ_VECTOR, TelemetryKey.MC2_BUS_POWER_W, TelemetryKey.MC2_MECHANICAL_POWER_W, TelemetryKey.MC2_EFFICIENCY_PCT,
+        TelemetryKey.MOTORS_TOTAL_BUS_POWER_W, TelemetryKey.MOTORS_TOTAL_MECHANICAL_POWER_W, TelemetryKey.MOTORS_AVERAGE_EFFICIENCY_PCT,
+        TelemetryKey.DC_DRV_MOTOR_VELOCITY_SETPOINT, TelemetryKey.DC_DRV_MOTOR_CURRENT_SETPOINT,
+        TelemetryKey.BP_VMX_ID, TelemetryKey.BP_VMX_VOLTAGE, TelemetryKey.BP_VMN_ID, TelemetryKey.BP_VMN_VOLTAGE,
+        TelemetryKey.BP_TMX_ID, TelemetryKey.BP_TMX_TEMPERATURE,
+        TelemetryKey.BP_PVS_VOLTAGE, TelemetryKey.BP_PVS_MILLIAMP_S, TelemetryKey.BP_PVS_AH,
+        TelemetryKey.BP_ISH_AMPS, TelemetryKey.BP_ISH_SOC, TelemetryKey.BATTERY_STRING_IMBALANCE_V, TelemetryKey.BATTERY_STRING_IMBALANCE_PCT,
+        TelemetryKey.BATTERY_PACK_POWER_W, TelemetryKey.BATTERY_PACK_POWER_KW, TelemetryKey.BATTERY_POWER_DIRECTION, TelemetryKey.BATTERY_C_RATE,
+        TelemetryKey.DC_SWITCH_POSITION,  
+        # Header for MC1LIM
+        "MC1LIM Motor Controller Data:",
+        TelemetryKey.MC1LIM_CAN_RECEIVE_ERROR_COUNT,
+        TelemetryKey.MC1LIM_CAN_TRANSMIT_ERROR_COUNT,
+        TelemetryKey.MC1LIM_ACTIVE_MOTOR_INFO,
+        TelemetryKey.MC1LIM_ERRORS,
+        TelemetryKey.MC1LIM_LIMITS,
+
+        # Header for MC2LIM
+        "MC2LIM Motor Controller Data:",
+        TelemetryKey.MC2LIM_CAN_RECEIVE_ERROR_COUNT,
+        TelemetryKey.MC2LIM_CAN_TRANSMIT_ERROR_COUNT,
+        TelemetryKey.MC2LIM_ACTIVE_MOTOR_INFO,
+        TelemetryKey.MC2LIM_ERRORS,
+        TelemetryKey.MC2LIM_LIMITS,
+
+        TelemetryKey.SHUNT_USED_AH, TelemetryKey.SHUNT_INTEGRATION_STATUS,
+        TelemetryKey.SHUNT_SAMPLE_INTERVAL_S,
+        TelemetryKey.SHUNT_REMAINING_AH, TelemetryKey.USED_AH_REMAINING_AH,
+        TelemetryKey.SHUNT_REMAINING_WH, TelemetryKey.USED_AH_REMAINING_WH, 
+        TelemetryKey.SHUNT_REMAINING_TIME, TelemetryKey.USED_AH_REMAINING_TIME,
+        TelemetryKey.USED_AH_EXACT_TIME, TelemetryKey.PREDICTED_REMAINING_TIME,
+        TelemetryKey.PREDICTED_REMAINING_TIME_UNCERTAINTY,
+        TelemetryKey.PREDICTED_EXACT_TIME,
+        TelemetryKey.PREDICTED_BREAK_EVEN_SPEED,
+        TelemetryKey.PREDICTED_BREAK_EVEN_SPEED_UNCERTAINTY,
+        TelemetryKey.PREDICTION_DATA_AGE_S,
+        TelemetryKey.PREDICTION_QUALITY_FLAGS,
+        "Navigation / GPS:",
+        TelemetryKey.NAV_LATITUDE, TelemetryKey.NAV_LONGITUDE,
+        TelemetryKey.NAV_ELEVATION_M, TelemetryKey.NAV_ELEVATION_VALID,
+        TelemetryKey.NAV_ELEVATION_AGE_MS,
+        TelemetryKey.NAV_SATS_VISIBLE, TelemetryKey.NAV_SATS_VISIBLE_VALID,
+        TelemetryKey.NAV_SATS_VISIBLE_AGE_MS, TelemetryKey.NAV_SATS_USED,
+        TelemetryKey.NAV_SATS_USED_VALID, TelemetryKey.NAV_SATS_USED_AGE_MS,
+        "IMU / G-Force:",
+        TelemetryKey.IMU_G_VALID, TelemetryKey.IMU_G_CALIBRATED,
+        TelemetryKey.IMU_G_MOUNT_VALID,
+        TelemetryKey.IMU_FORWARD_G, TelemetryKey.IMU_LINEAR_X_G,
+        TelemetryKey.IMU_LINEAR_Y_G, TelemetryKey.IMU_LINEAR_Z_G,
+        TelemetryKey.IMU_TOTAL_G, TelemetryKey.IMU_DYNAMIC_G,
+        TelemetryKey.IMU_PEAK_BOOT_G, TelemetryKey.IMU_G_AGE_MS,
+        TelemetryKey.DEVICE_TIMESTAMP, TelemetryKey.BOARD_UPTIME,
+        TelemetryKey.BOARD_UPTIME_MS, TelemetryKey.TIMESTAMP
+    )
+
     def __init__(self, units):
         self.units = units
         self.logger = logging.getLogger(__name__)
+        # key -> (raw value, formatted lines) from the previous snapshot.
+        self._line_cache = {}
         self.logger.info("DataDisplay initialized.")
 
     def format_with_unit(self, key, value):
@@ -76,118 +148,51 @@ class DataDisplay:
         """
         Formats and displays all telemetry data.
         """
-        self.logger.debug("Starting display of telemetry data.")
-        order = [
-            TelemetryKey.TOTAL_CAPACITY_WH, TelemetryKey.TOTAL_CAPACITY_AH, TelemetryKey.TOTAL_VOLTAGE,
-            TelemetryKey.MC1BUS_VOLTAGE, TelemetryKey.MC1BUS_CURRENT, TelemetryKey.MC1VEL_RPM,
-            TelemetryKey.MC1VEL_VELOCITY, TelemetryKey.MC1VEL_SPEED, TelemetryKey.MC1TP1_HEATSINK_TEMP,
-            TelemetryKey.MC1TP1_MOTOR_TEMP, TelemetryKey.MC1TP2_INLET_TEMP, TelemetryKey.MC1TP2_CPU_TEMP,
-            TelemetryKey.MC1PHA_PHASE_A_CURRENT, TelemetryKey.MC1PHA_PHASE_B_CURRENT,
-            TelemetryKey.MC1CUM_BUS_AMPHOURS, TelemetryKey.MC1CUM_ODOMETER, TelemetryKey.MC1VVC_VD_VECTOR,
-            TelemetryKey.MC1VVC_VQ_VECTOR, TelemetryKey.MC1IVC_ID_VECTOR, TelemetryKey.MC1IVC_IQ_VECTOR,
-            TelemetryKey.MC1BEM_BEMFD_VECTOR, TelemetryKey.MC1BEM_BEMFQ_VECTOR, TelemetryKey.MC1_BUS_POWER_W, TelemetryKey.MC1_MECHANICAL_POWER_W, TelemetryKey.MC1_EFFICIENCY_PCT,
-            TelemetryKey.MC2BUS_VOLTAGE, TelemetryKey.MC2BUS_CURRENT, TelemetryKey.MC2VEL_RPM,
-            TelemetryKey.MC2VEL_VELOCITY, TelemetryKey.MC2VEL_SPEED, TelemetryKey.MC2TP1_HEATSINK_TEMP,
-            TelemetryKey.MC2TP1_MOTOR_TEMP, TelemetryKey.MC2TP2_INLET_TEMP, TelemetryKey.MC2TP2_CPU_TEMP,
-            TelemetryKey.MC2PHA_PHASE_A_CURRENT, TelemetryKey.MC2PHA_PHASE_B_CURRENT,
-            TelemetryKey.MC2CUM_BUS_AMPHOURS, TelemetryKey.MC2CUM_ODOMETER, TelemetryKey.MC2VVC_VD_VECTOR,
-            TelemetryKey.MC2VVC_VQ_VECTOR, TelemetryKey.MC2IVC_ID_VECTOR, TelemetryKey.MC2IVC_IQ_VECTOR,
-            TelemetryKey.MC2BEM_BEMFD_VECTOR, TelemetryKey.MC2BEM_BEMFQ_VECTOR, TelemetryKey.MC2_BUS_POWER_W, TelemetryKey.MC2_MECHANICAL_POWER_W, TelemetryKey.MC2_EFFICIENCY_PCT,
-            TelemetryKey.MOTORS_TOTAL_BUS_POWER_W, TelemetryKey.MOTORS_TOTAL_MECHANICAL_POWER_W, TelemetryKey.MOTORS_AVERAGE_EFFICIENCY_PCT,
-            TelemetryKey.DC_DRV_MOTOR_VELOCITY_SETPOINT, TelemetryKey.DC_DRV_MOTOR_CURRENT_SETPOINT,
-            TelemetryKey.BP_VMX_ID, TelemetryKey.BP_VMX_VOLTAGE, TelemetryKey.BP_VMN_ID, TelemetryKey.BP_VMN_VOLTAGE,
-            TelemetryKey.BP_TMX_ID, TelemetryKey.BP_TMX_TEMPERATURE,
-            TelemetryKey.BP_PVS_VOLTAGE, TelemetryKey.BP_PVS_MILLIAMP_S, TelemetryKey.BP_PVS_AH,
-            TelemetryKey.BP_ISH_AMPS, TelemetryKey.BP_ISH_SOC, TelemetryKey.BATTERY_STRING_IMBALANCE_V, TelemetryKey.BATTERY_STRING_IMBALANCE_PCT,
-            TelemetryKey.BATTERY_PACK_POWER_W, TelemetryKey.BATTERY_PACK_POWER_KW, TelemetryKey.BATTERY_POWER_DIRECTION, TelemetryKey.BATTERY_C_RATE,
-            TelemetryKey.DC_SWITCH_POSITION,  
-            # Header for MC1LIM
-            "MC1LIM Motor Controller Data:",
-            TelemetryKey.MC1LIM_CAN_RECEIVE_ERROR_COUNT,
-            TelemetryKey.MC1LIM_CAN_TRANSMIT_ERROR_COUNT,
-            TelemetryKey.MC1LIM_ACTIVE_MOTOR_INFO,
-            TelemetryKey.MC1LIM_ERRORS,
-            TelemetryKey.MC1LIM_LIMITS,
-
-            # Header for MC2LIM
-            "MC2LIM Motor Controller Data:",
-            TelemetryKey.MC2LIM_CAN_RECEIVE_ERROR_COUNT,
-            TelemetryKey.MC2LIM_CAN_TRANSMIT_ERROR_COUNT,
-            TelemetryKey.MC2LIM_ACTIVE_MOTOR_INFO,
-            TelemetryKey.MC2LIM_ERRORS,
-            TelemetryKey.MC2LIM_LIMITS,
-
-            TelemetryKey.SHUNT_USED_AH, TelemetryKey.SHUNT_INTEGRATION_STATUS,
-            TelemetryKey.SHUNT_SAMPLE_INTERVAL_S,
-            TelemetryKey.SHUNT_REMAINING_AH, TelemetryKey.USED_AH_REMAINING_AH,
-            TelemetryKey.SHUNT_REMAINING_WH, TelemetryKey.USED_AH_REMAINING_WH, 
-            TelemetryKey.SHUNT_REMAINING_TIME, TelemetryKey.USED_AH_REMAINING_TIME,
-            TelemetryKey.USED_AH_EXACT_TIME, TelemetryKey.PREDICTED_REMAINING_TIME,
-            TelemetryKey.PREDICTED_REMAINING_TIME_UNCERTAINTY,
-            TelemetryKey.PREDICTED_EXACT_TIME,
-            TelemetryKey.PREDICTED_BREAK_EVEN_SPEED,
-            TelemetryKey.PREDICTED_BREAK_EVEN_SPEED_UNCERTAINTY,
-            TelemetryKey.PREDICTION_DATA_AGE_S,
-            TelemetryKey.PREDICTION_QUALITY_FLAGS,
-            "Navigation / GPS:",
-            TelemetryKey.NAV_LATITUDE, TelemetryKey.NAV_LONGITUDE,
-            TelemetryKey.NAV_ELEVATION_M, TelemetryKey.NAV_ELEVATION_VALID,
-            TelemetryKey.NAV_ELEVATION_AGE_MS,
-            TelemetryKey.NAV_SATS_VISIBLE, TelemetryKey.NAV_SATS_VISIBLE_VALID,
-            TelemetryKey.NAV_SATS_VISIBLE_AGE_MS, TelemetryKey.NAV_SATS_USED,
-            TelemetryKey.NAV_SATS_USED_VALID, TelemetryKey.NAV_SATS_USED_AGE_MS,
-            "IMU / G-Force:",
-            TelemetryKey.IMU_G_VALID, TelemetryKey.IMU_G_CALIBRATED,
-            TelemetryKey.IMU_G_MOUNT_VALID,
-            TelemetryKey.IMU_FORWARD_G, TelemetryKey.IMU_LINEAR_X_G,
-            TelemetryKey.IMU_LINEAR_Y_G, TelemetryKey.IMU_LINEAR_Z_G,
-            TelemetryKey.IMU_TOTAL_G, TelemetryKey.IMU_DYNAMIC_G,
-            TelemetryKey.IMU_PEAK_BOOT_G, TelemetryKey.IMU_G_AGE_MS,
-            TelemetryKey.DEVICE_TIMESTAMP, TelemetryKey.BOARD_UPTIME,
-            TelemetryKey.BOARD_UPTIME_MS, TelemetryKey.TIMESTAMP
-        ]
-
         lines = []
-        for item in order:
+        for item in self.DISPLAY_ORDER:
             if isinstance(item, str):
                 # It's a header, add it to lines
                 lines.append("")  # Add blank line before header
                 lines.append(item)
+                continue
+
+            key = item
+            key_name = key.value[0]
+            if key == TelemetryKey.DC_SWC_VALUE:
+                continue  # Rendered together with DC_SWITCH_POSITION
+            if key_name not in data:
+                lines.append(f"{key_name}: N/A")
+                continue
+
+            value = data[key_name]
+            if key == TelemetryKey.DC_SWITCH_POSITION:
+                value = (value, data.get(TelemetryKey.DC_SWC_VALUE.value[0]))
+            # Most fields hold still between ticks, so the formatted line is
+            # reused until the raw value changes.
+            cached = self._line_cache.get(key_name)
+            if cached is not None and cached[0] == value:
+                lines.extend(cached[1])
+                continue
+
+            if key == TelemetryKey.DC_SWITCH_POSITION:
+                # Handle DC_SWC information
+                rendered = ("", self.format_SWC_information(data))
             else:
-                key = item
-                key_name = key.value[0]
-                if key_name in data:
-                    value = data[key_name]
-                    self.logger.debug(f"Processing key: {repr(key_name)}, value: {value}")
-
-                    if key == TelemetryKey.DC_SWITCH_POSITION:
-                        # Handle DC_SWC information
-                        lines.append("")
-                        dc_swc_output = self.format_SWC_information(data)
-                        lines.append(dc_swc_output)
-                        self.logger.debug(f"DC_SWC data added to display.")
-                    elif key == TelemetryKey.DC_SWC_VALUE:
-                        continue  # Skip to avoid duplication
+                # Format and append other data with units if applicable
+                try:
+                    if isinstance(value, list):
+                        # Join list items for display
+                        value_str = ', '.join(str(v) for v in value)
                     else:
-                        # Format and append other data with units if applicable
-                        try:
-                            if isinstance(value, list):
-                                # Join list items for display
-                                value_str = ', '.join(str(v) for v in value)
-                            else:
-                                value_str = value
-                            display_value = self.format_with_unit(key, value_str)
-                            lines.append(f"{key_name}: {display_value}")
-                            self.logger.debug(f"Data added to display: {repr(key_name)}: {display_value}")
-                        except Exception as e:
-                            self.logger.error(f"Error formatting value for {key_name}: {value}, Exception: {e}")
-                            lines.append(f"{key_name}: {value}")
-                else:
-                    lines.append(f"{key_name}: N/A")
-                    self.logger.debug(f"Key {repr(key_name)} not found in data. Added 'N/A' to display.")
+                        value_str = value
+                    rendered = (f"{key_name}: {self.format_with_unit(key, value_str)}",)
+                except Exception as e:
+                    self.logger.error(f"Error formatting value for {key_name}: {value}, Exception: {e}")
+                    rendered = (f"{key_name}: {value}",)
+            if not isinstance(value, list):
+                self._line_cache[key_name] = (value, rendered)
+            lines.extend(rendered)
 
         # Add separator line
         lines.append("----------------------------------------")
-        display_output = "\n".join(lines)
-        self.logger.debug("Finished generating display output.")
-        return display_output
+        return "\n".join(lines)
@@ -13,18 +13,41 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import QEvent, QSettings, Qt
 import json
 import logging
-import math
 import re
+import time
+from datetime import datetime
+import numpy as np
 import pyqtgraph as pg
 
 from gui_files.custom_plot_widget import CustomPlotWidget
+from gui_files.plot_decimation import MinMaxPyramid, minmax_decimate
+from gui_files.plot_ring_buffer import PlotRingBuffer
 from key_name_definitions import KEY_UNITS
-from unit_conversion import convert_value, build_metric_units_dict, build_imperial_units_dict
+from unit_conversion import convert_array, build_metric_units_dict, build_imperial_units_dict
 
 
 class BaseGraphTab(QWidget):
     # Shared implementation for all live graph tabs. Motor, battery, remaining
     # capacity, and insight tabs differ mostly by key list, not behavior.
+    # Window value 0 plots the whole session from the on-disk history store.
+    # Without a store it can only show what the live ring still holds.
+    FULL_SESSION = 0
+    WINDOW_OPTIONS = (
+        ("Last 1 min", 60),
+        ("Last 3 min", 180),
+        ("Last 6 min", 360),
+        ("Last 15 min", 900),
+        ("Full session", FULL_SESSION),
+    )
+    DEFAULT_WINDOW_SECONDS = 360
+    # Buffers hold the longest window at this rate; faster snapshots replace
+    # the newest sample, so point counts stay bounded by duration.
+    MAX_PLOT_RATE_HZ = 5.0
+    # Curves get about two points per horizontal pixel (one min, one max),
+    # so redraw cost follows plot width instead of window length.
+    POINTS_PER_PIXEL = 2
+    FALLBACK_PLOT_WIDTH = 1000
+
     def __init__(self, title, keys, units, color_mapping):
         super().__init__()
         self.title = title
@@ -34,11 +57,17 @@ class BaseGraphTab(QWidget):
         self.logger = logging.getLogger(__name__)
 
         self.unit_overrides = self._load_unit_overrides()
-        self._last_raw = {}
         self._metric_map = build_metric_units_dict()
         self._imperial_map = build_imperial_units_dict()
-        self.data_buffers = {k: [] for k in keys}
-        self.max_points = 361
+        self.window_seconds = self.DEFAULT_WINDOW_SECONDS
+        history_seconds = max(seconds for _label, seconds in self.WINDOW_OPTIONS)
+        self.data_buffers = {
+            k: PlotRingBuffer.for_duration(history_seconds, self.MAX_PLOT_RATE_HZ)
+            for k in keys
+        }
+        self._stale_keys = set()
+        self.history_store = None
+        self._history_pyramids = {}
         self.paused = False
         self.graph_widgets = {}
         self._hover_proxies = {}
@@ -55,13 +84,12 @@ class BaseGraphTab(QWidget):
 
         header.addWidget(QLabel("Window:"))
         self.window_combo = QComboBox()
-        # These windows are sample counts, not wall-clock durations. The labels
-        # assume roughly one UI update per second, which matches normal telemetry.
-        self.window_combo.addItem("Last 1 min", 60)
-        self.window_combo.addItem("Last 3 min", 180)
-        self.window_combo.addItem("Last 6 min", 361)
-        self.window_combo.addItem("Last 15 min", 900)
-        self.window_combo.setCurrentIndex(2)
+        # Windows are wall-clock durations. Buffers always keep the longest
+        # window, so switching windows only changes which slice is drawn.
+        for label, seconds in self.WINDOW_OPTIONS:
+            self.window_combo.addItem(label, seconds)
+        self.window_combo.setCurrentIndex(self.window_combo.findData(self.window_seconds))
+        self._update_full_session_label()
         self.window_combo.currentIndexChanged.connect(self._on_window_changed)
         header.addWidget(self.window_combo)
 
@@ -90,14 +118,15 @@ class BaseGraphTab(QWidget):
         container.installEventFilter(self)
 
     def _add_graph(self, layout, key, color):
-        pw = CustomPlotWidget()
+        pw = CustomPlotWidget(axisItems={"bottom": pg.DateAxisItem(orientation="bottom")})
         pw.setTitle(key)
         pw.setLabel("left", self._display_unit(key))
-        pw.setLabel("bottom", "Samples")
+        pw.setLabel("bottom", "Time")
         pw.showGrid(x=True, y=True, alpha=0.35)
         pw.setFixedHeight(300)
         pw.graph_curve = pw.plot(pen=pg.mkPen(color=color, width=2))
-        pw.hover_values = []
+        pw.hover_times = np.empty(0, dtype=np.float64)
+        pw.hover_values = np.empty(0, dtype=np.float64)
         pw.hover_vline = pg.InfiniteLine(angle=90, movable=False, pen=pg.mkPen("#facc15", width=1))
         pw.hover_hline = pg.InfiniteLine(angle=0, movable=False, pen=pg.mkPen("#facc15", width=1))
         pw.hover_label = pg.TextItem("", anchor=(0, 1), color="#ffffff", fill=pg.mkBrush(20, 24, 31, 220))
@@ -111,6 +140,8 @@ class BaseGraphTab(QWidget):
             slot=lambda event, key=key, pw=pw: self._on_plot_hover(event, key, pw),
         )
         pw.double_clicked.connect(lambda ev, pw=pw, key=key: self._on_dblclick(ev, pw, key))
+        pw.sigXRangeChanged.connect(lambda *_args, key=key, pw=pw: self._on_x_range_changed(key, pw))
+        pw.redrawing = False
 
         self.graph_widgets[key] = pw
         layout.addWidget(pw)
@@ -119,12 +150,28 @@ class BaseGraphTab(QWidget):
         return self.unit_overrides.get(key) or self.units_map.get(key) or KEY_UNITS.get(key, "")
 
     def _on_window_changed(self):
-        self.max_points = int(self.window_combo.currentData() or 361)
-        for key, buf in self.data_buffers.items():
-            if len(buf) > self.max_points:
-                self.data_buffers[key] = buf[-self.max_points:]
+        data = self.window_combo.currentData()
+        self.window_seconds = self.DEFAULT_WINDOW_SECONDS if data is None else int(data)
         self._redraw_buffers()
 
+    def _update_full_session_label(self):
+        index = self.window_combo.findData(self.FULL_SESSION)
+        if index < 0:
+            return
+        if self.history_store is not None:
+            self.window_combo.setItemText(index, "Full session")
+        else:
+            minutes = max(seconds for _label, seconds in self.WINDOW_OPTIONS) // 60
+            self.window_combo.setItemText(index, f"Full session (last {minutes} min)")
+
+    def set_history_store(self, store):
+        """Attach the SessionHistoryStore that backs the Full session window."""
+        self.history_store = store
+        self._history_pyramids = {}
+        self._update_full_session_label()
+        if self.window_seconds == self.FULL_SESSION:
+            self._redraw_buffers()
+
     def _set_paused(self, paused):
         self.paused = paused
         self.pause_button.setText("Resume" if paused else "Pause")
@@ -144,8 +191,8 @@ class BaseGraphTab(QWidget):
         self.units_map = units_map.copy()
         for key, pw in self.graph_widgets.items():
             pw.setLabel("left", self._display_unit(key))
-        if self._last_raw:
-            self.update_graphs(self._last_raw, force=True)
+        # Buffers hold raw units, so a units change is only a redraw.
+        self._redraw_buffers()
 
     def _on_double_click_unit(self, key):
         orig = KEY_UNITS.get(key, "")
@@ -172,8 +219,7 @@ class BaseGraphTab(QWidget):
         self._save_unit_overrides()
 
         self.graph_widgets[key].setLabel("left", unit)
-        if self._last_raw:
-            self.update_graphs(self._last_raw, force=True)
+        self._redraw_plot(key, self.graph_widgets[key])
 
     def _settings_key(self):
         safe_title = re.sub(r"[^A-Za-z0-9_]+", "_", self.title).strip("_") or "graph"
@@ -211,65 +257,153 @@ class BaseGraphTab(QWidget):
         else:
             self._toggle_zoom(pw)
 
-    def update_graphs(self, telemetry_data, force=False):
-        self._last_raw = telemetry_data.copy()
+    def update_graphs(self, telemetry_data, force=False, render=True, timestamp=None):
+        """
+        Append one telemetry snapshot to the plot buffers.
+
+        `timestamp` is the epoch time used on the x axis; it defaults to now.
+
+        With render=False only the buffers are updated and the touched plots
+        are marked stale; render_graphs() pushes them to the widgets later.
+        """
         if self.paused and not force:
             return
 
-        for key, pw in self.graph_widgets.items():
+        now = time.time() if timestamp is None else float(timestamp)
+        for key in self.graph_widgets:
             if key not in telemetry_data:
                 continue
             raw = telemetry_data[key]
-            target = self._display_unit(key)
-            try:
-                disp = convert_value(key, raw, target)
-            except Exception:
-                disp = raw
-
-            buf = self.data_buffers[key]
-            buf.append(disp)
-            if len(buf) > self.max_points:
-                # Trim in place so long-running sessions do not grow memory
-                # usage while the selected time window stays responsive.
-                buf[:] = buf[-self.max_points:]
 
-            self._redraw_plot(key, pw)
-            self.logger.debug("[%s] %s: %s -> %s %s", self.title, key, raw, disp, target)
+            # The ring overwrites its oldest sample once full, so long sessions
+            # keep a fixed memory footprint without trimming on every tick.
+            # Values stay in raw units and are converted when drawn.
+            self.data_buffers[key].append(now, raw)
+            self._stale_keys.add(key)
+            self.logger.debug("[%s] %s: %s", self.title, key, raw)
+
+        if render:
+            self.render_graphs()
+
+    def render_graphs(self):
+        """Redraw only the plots whose buffers changed since the last render."""
+        for key in list(self._stale_keys):
+            pw = self.graph_widgets.get(key)
+            if pw is not None:
+                self._redraw_plot(key, pw)
+        self._stale_keys.clear()
 
     def _redraw_buffers(self):
         for key, pw in self.graph_widgets.items():
             self._redraw_plot(key, pw)
+        self._stale_keys.clear()
 
     def _redraw_plot(self, key, pw):
-        clean = [v for v in self.data_buffers[key] if isinstance(v, (int, float)) and math.isfinite(v)]
-        pw.hover_values = clean
-        pw.graph_curve.setData(clean)
-        if not clean:
+        if self.window_seconds == self.FULL_SESSION:
+            if self.history_store is not None and self.history_store.has_key(key):
+                self._redraw_history(key, pw)
+                return
+            # Without a history store, or before this key has history, fall
+            # back to everything the ring holds (the longest live window).
+            times, values = self.data_buffers[key].view()
+        else:
+            times, values = self.data_buffers[key].window(self.window_seconds)
+        values = convert_array(key, values, self._display_unit(key))
+        # Invalid samples are NaN in the ring; connect='finite' draws them as
+        # gaps so no per-point filtering is needed before handing over views.
+        pw.hover_times = times
+        pw.hover_values = values
+        plot_times, plot_values = times, values
+        if pw.zoom_enabled and len(times):
+            # Zoomed plots decimate only the visible span so detail returns
+            # as the user zooms in.
+            x_min, x_max = pw.plotItem.vb.viewRange()[0]
+            start = max(0, int(np.searchsorted(times, x_min)) - 1)
+            stop = min(len(times), int(np.searchsorted(times, x_max)) + 1)
+            plot_times, plot_values = times[start:stop], values[start:stop]
+        plot_times, plot_values = minmax_decimate(plot_times, plot_values, self._max_plot_points(pw))
+        pw.redrawing = True
+        try:
+            pw.graph_curve.setData(plot_times, plot_values, connect="finite")
+        finally:
+            pw.redrawing = False
+        if not len(values):
+            self._hide_hover(pw)
+
+    def _redraw_history(self, key, pw):
+        store = self.history_store
+        times = store.flushed_times()
+        column = store.flushed_column(key)
+        pending_times, pending_values = store.pending(key)
+        pyramid = self._history_pyramids.setdefault(key, MinMaxPyramid())
+        pyramid.update(column)
+
+        start, stop = 0, len(times)
+        if pw.zoom_enabled and (len(times) or len(pending_times)):
+            x_min, x_max = pw.plotItem.vb.viewRange()[0]
+            start = max(0, int(np.searchsorted(times, x_min)) - 1)
+            stop = min(len(times), int(np.searchsorted(times, x_max)) + 1)
+            keep = (pending_times >= x_min) & (pending_times <= x_max)
+            pending_times, pending_values = pending_times[keep], pending_values[keep]
+
+        # Only the selected rows are read from the memory map.
+        rows = pyramid.select(start, stop, self._max_plot_points(pw))
+        plot_times = np.concatenate((times[rows], pending_times))
+        raw_values = np.concatenate((np.asarray(column[rows], dtype=np.float64), pending_values))
+        # History stores raw units; convert only the points being drawn.
+        target = self._display_unit(key)
+        plot_values = convert_array(key, raw_values, target)
+
+        pw.hover_times = plot_times
+        pw.hover_values = plot_values
+        pw.redrawing = True
+        try:
+            pw.graph_curve.setData(plot_times, plot_values, connect="finite")
+        finally:
+            pw.redrawing = False
+        if not len(plot_values):
             self._hide_hover(pw)
 
+    def _max_plot_points(self, pw):
+        width = int(pw.plotItem.vb.width()) or self.FALLBACK_PLOT_WIDTH
+        return max(2, width * self.POINTS_PER_PIXEL)
+
+    def _on_x_range_changed(self, key, pw):
+        if pw.zoom_enabled and not pw.redrawing:
+            self._redraw_plot(key, pw)
+
     def _on_plot_hover(self, event, key, pw):
         pos = event[0] if isinstance(event, tuple) else event
         if not pw.sceneBoundingRect().contains(pos):
             self._hide_hover(pw)
             return
-        values = getattr(pw, "hover_values", [])
-        if not values:
+        values = getattr(pw, "hover_values", None)
+        if values is None or not len(values):
             self._hide_hover(pw)
             return
 
-        mouse_point = pw.plotItem.vb.mapSceneToView(pos)
-        idx = int(round(mouse_point.x()))
-        if idx < 0 or idx >= len(values):
+        times = pw.hover_times
+        mouse_x = pw.plotItem.vb.mapSceneToView(pos).x()
+        if mouse_x < times[0] or mouse_x > times[-1]:
+            self._hide_hover(pw)
+            return
+        # Snap to the nearest sample in time.
+        idx = int(np.searchsorted(times, mouse_x))
+        if idx >= len(times) or (idx > 0 and mouse_x - times[idx - 1] < times[idx] - mouse_x):
+            idx -= 1
+
+        sample_time = float(times[idx])
+        value = float(values[idx])
+        if not np.isfinite(value):
             self._hide_hover(pw)
             return
-
-        value = values[idx]
         unit = self._display_unit(key)
-        label = f"{key}\nSample {idx + 1}/{len(values)}: {value:.3f} {unit}".rstrip()
-        pw.hover_vline.setPos(idx)
+        clock = datetime.fromtimestamp(sample_time).strftime("%H:%M:%S")
+        label = f"{key}\n{clock}: {value:.3f} {unit}".rstrip()
+        pw.hover_vline.setPos(sample_time)
         pw.hover_hline.setPos(value)
         pw.hover_label.setText(label)
-        pw.hover_label.setPos(idx, value)
+        pw.hover_label.setPos(sample_time, value)
         for item in (pw.hover_vline, pw.hover_hline, pw.hover_label):
             item.show()
         widget_pos = pw.mapFromScene(pos)
@@ -2,16 +2,17 @@
 # src/gui_files/gui_custom_data_table.py
 # -------------------------
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QTableView,
     QHeaderView, QInputDialog, QMenu, QMessageBox
 )
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor, QBrush, QFont, QCursor
+from PyQt6.QtGui import QFont, QCursor
+from gui_files.telemetry_table_model import TelemetryTableModel
 from key_name_definitions import TelemetryKey, KEY_UNITS
+from telemetry_snapshot import TelemetrySnapshot
 from unit_conversion import (
     build_metric_units_dict,
     build_imperial_units_dict,
-    convert_value
 )
 import json, os
 
@@ -44,66 +45,41 @@ class CustomizableDataTableTab(QWidget):
 
     def _init_ui(self):
         layout = QVBoxLayout(self)
-        self.table = QTableWidget(self)
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["Parameter","Value","Unit"])
+        self.model = TelemetryTableModel(self, header_background="#34312A")
+        self.table = QTableView(self)
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(
             QHeaderView.ResizeMode.Stretch
         )
         self.table.setEditTriggers(
-            QTableWidget.EditTrigger.NoEditTriggers
+            QTableView.EditTrigger.NoEditTriggers
+        )
+        self.table.doubleClicked.connect(
+            lambda index: self._on_cell_double_clicked(index.row(), index.column())
         )
-        self.table.cellDoubleClicked.connect(self._on_cell_double_clicked)
         self.table.setFont(QFont("Arial", 14))
         layout.addWidget(self.table)
         self.setLayout(layout)
 
-    def update_data(self, telemetry_data):
-        self._last_raw = telemetry_data.copy()
-        
-        # Calculate total rows needed (group headers + parameters)
-        total_rows = sum(len(keys) + 1 for keys in self.groups.values())
-        self.table.setRowCount(total_rows)
-
-        self._row_key_map.clear()
-        current_row = 0
-        
-        for group_name, keys in self.groups.items():
-            # Add group header row
-            header_item = QTableWidgetItem(group_name)
-            header_item.setBackground(QBrush(QColor("#34312A")))
-            header_item.setForeground(QBrush(QColor("#FFD400")))
-            header_item.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-            self.table.setItem(current_row, 0, header_item)
-            
-            # Span header across all columns
-            self.table.setSpan(current_row, 0, 1, 3)
-            current_row += 1
-
-            # Add parameters under the group
-            for idx, key in enumerate(keys):
-                self._row_key_map[current_row] = (group_name, idx)
-                raw = telemetry_data.get(key)
-                target = self.unit_overrides.get(key, self.units_map.get(key, ""))
-                disp = convert_value(key, raw, target)
-
-                # Parameter cell
-                p = QTableWidgetItem(key)
-                p.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-                p.setForeground(QBrush(QColor("#FFF")))
-                self.table.setItem(current_row, 0, p)
+    def _unit_for_key(self, key):
+        return self.unit_overrides.get(key, self.units_map.get(key, ""))
 
-                # Value cell
-                v = QTableWidgetItem(str(disp))
-                v.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.table.setItem(current_row, 1, v)
-
-                # Unit cell
-                u = QTableWidgetItem(target)
-                u.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.table.setItem(current_row, 2, u)
+    def update_data(self, telemetry_data):
+        self._last_raw = TelemetrySnapshot.of(telemetry_data)
 
-                current_row += 1
+        # Rows are rebuilt only when the groups change; normal ticks update
+        # the model's value cells in place.
+        if self.model.set_groups(self.groups):
+            self.table.clearSpans()
+            for row in self.model.group_rows():
+                # Span header across all columns
+                self.table.setSpan(row, 0, 1, 3)
+            self._row_key_map = {
+                row: self.model.position_at(row)
+                for row in range(self.model.rowCount())
+                if self.model.key_at(row) is not None
+            }
+        self.model.update_values(telemetry_data, self._unit_for_key)
 
     def set_units_map(self, units_map, units_mode):
         self.units_map = units_map
@@ -139,7 +115,7 @@ class CustomizableDataTableTab(QWidget):
             for unit_choice in (orig, m, i):
                 if unit_choice and unit_choice not in choices:
                     choices.append(unit_choice)
-            current_unit = self.unit_overrides.get(key, self.units_map.get(key, ""))
+            current_unit = self._unit_for_key(key)
             unit, ok = QInputDialog.getItem(
                 self, f"Select Unit for {key}", "Unit:", choices,
                 current=choices.index(current_unit) if current_unit in choices else 0,
@@ -18,6 +18,7 @@ from PyQt6.QtWidgets import (
 
 from key_name_definitions import TelemetryKey
 from key_name_definitions import KEY_UNITS
+from telemetry_snapshot import TelemetrySnapshot
 from unit_conversion import (
     build_imperial_units_dict,
     build_metric_units_dict,
@@ -203,7 +204,7 @@ class DashboardTab(QWidget):
         self.connection = status or "Unknown"
 
     def update_data(self, telemetry_data):
-        self.last_telemetry_data = telemetry_data.copy()
+        self.last_telemetry_data = TelemetrySnapshot.of(telemetry_data)
         for key, card in self.cards.items():
             if key == TelemetryKey.NAV_VEHICLE_MPH.value[0]:
                 display, target, state = self._speed_card_display(telemetry_data, card.unit)
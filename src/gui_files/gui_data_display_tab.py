@@ -1,8 +1,8 @@
 # src/gui_files/gui_data_display_tab.py
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTextEdit
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QPlainTextEdit
 from PyQt6.QtGui import QTextCursor, QFont
+from collections import deque
 import logging
 from data_display import DataDisplay  # Import DataDisplay class
 
@@ -10,20 +10,33 @@ class DataDisplayTab(QWidget):
     """
     A GUI tab for displaying formatted telemetry data.
     """
+    # The log keeps roughly this many recent snapshots; older text blocks are
+    # dropped by the widget so memory and layout cost stay flat all day.
+    MAX_SNAPSHOTS = 30
+    # Fallback block budget until the first snapshot reveals its line count.
+    DEFAULT_MAX_BLOCKS = 5000
+
     def __init__(self, units):
         super().__init__()
         self.units = units  # Store units for later use
         self.logger = logging.getLogger(__name__)
         self.data_display_instance = DataDisplay(units)  # Create an instance of DataDisplay
+        # Snapshots that arrive while the tab is hidden wait here unformatted.
+        # Anything older than what the log would keep is counted, not replayed;
+        # one slot is left for the "skipped" note.
+        self._pending = deque(maxlen=self.MAX_SNAPSHOTS - 1)
+        self._skipped_pending = 0
         self.init_ui()
 
     def init_ui(self):
         layout = QVBoxLayout(self)
 
-        # Initialize QTextEdit for multi-line, scrollable display
-        self.data_display = QTextEdit()
+        # QPlainTextEdit appends without rich-text layout and trims its
+        # oldest blocks once maximumBlockCount is reached.
+        self.data_display = QPlainTextEdit()
         self.data_display.setReadOnly(True)  # Make it read-only
-        self.data_display.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        self.data_display.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.data_display.setMaximumBlockCount(self.DEFAULT_MAX_BLOCKS)
 
         # Set larger monospaced font
         font = QFont("Courier New", 12)
@@ -45,19 +58,36 @@ class DataDisplayTab(QWidget):
 
         # Use DataDisplay instance to format data
         display_text = self.data_display_instance.display(telemetry_data)
+        max_blocks = (display_text.count("\n") + 1) * self.MAX_SNAPSHOTS
+        if self.data_display.maximumBlockCount() != max_blocks:
+            self.data_display.setMaximumBlockCount(max_blocks)
 
         # Get scrollbar information before appending new data
         scrollbar = self.data_display.verticalScrollBar()
         at_bottom = scrollbar.value() == scrollbar.maximum()
 
-        # Append the new data to the QTextEdit
-        self.data_display.append(display_text)
+        # Append the new data to the log
+        self.data_display.appendPlainText(display_text)
 
         # If the scrollbar was at the bottom before appending, scroll to the bottom
         if at_bottom:
             self.data_display.moveCursor(QTextCursor.MoveOperation.End)
 
-        self.logger.info("Data Display updated.")
+        self.logger.debug("Data Display updated.")
+
+    def queue_display(self, telemetry_data):
+        """Hold a snapshot for flush_pending() without formatting it yet."""
+        if len(self._pending) == self._pending.maxlen:
+            self._skipped_pending += 1
+        self._pending.append(telemetry_data)
+
+    def flush_pending(self):
+        """Format and append every snapshot queued while the tab was hidden."""
+        if self._skipped_pending:
+            self.data_display.appendPlainText(f"... {self._skipped_pending} updates skipped while hidden ...")
+            self._skipped_pending = 0
+        while self._pending:
+            self.update_display(self._pending.popleft())
 
     def set_units_map(self, units_map, units_mode=None):
         self.units = units_map
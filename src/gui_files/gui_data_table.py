@@ -1,20 +1,24 @@
 # src/gui_files/gui_data_table.py
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QTableView,
     QHeaderView, QInputDialog
 )
-from PyQt6.QtCore import QSettings, Qt
-from PyQt6.QtGui import QColor, QBrush, QFont
+from PyQt6.QtCore import QSettings
+from PyQt6.QtGui import QColor, QFont
 import json, logging
 
+from gui_files.telemetry_table_model import TelemetryTableModel
 from key_name_definitions import TelemetryKey, KEY_UNITS
+from telemetry_snapshot import TelemetrySnapshot
 from unit_conversion import (
     build_metric_units_dict,
     build_imperial_units_dict,
-    convert_value
 )
 
+ERROR_COLOR = QColor("#FF0000")
+WARNING_COLOR = QColor("#FFA500")
+
 class DataTableTab(QWidget):
     """
     A tab for telemetry: Parameter / Value / Unit,
@@ -31,8 +35,6 @@ class DataTableTab(QWidget):
         self.units_map  = units_map
         self.units_mode = units_mode
         self.groups     = groups
-        self._row_for_key = {}
-        self._layout_signature = None
 
         # build metric/imperial maps so unit selector can show both
         self._metric_map   = build_metric_units_dict()
@@ -59,19 +61,25 @@ class DataTableTab(QWidget):
 
     def _init_ui(self):
         layout = QVBoxLayout(self)
-        self.table = QTableWidget(self)
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["Parameter","Value","Unit"])
+        self.model = TelemetryTableModel(
+            self,
+            spacer_rows=True,
+            value_background=self._value_background,
+        )
+        self.table = QTableView(self)
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(
             QHeaderView.ResizeMode.Stretch
         )
         self.table.setEditTriggers(
-            QTableWidget.EditTrigger.NoEditTriggers
+            QTableView.EditTrigger.NoEditTriggers
         )
         self.table.setSelectionMode(
-            QTableWidget.SelectionMode.NoSelection
+            QTableView.SelectionMode.NoSelection
+        )
+        self.table.doubleClicked.connect(
+            lambda index: self._on_cell_double_clicked(index.row(), index.column())
         )
-        self.table.cellDoubleClicked.connect(self._on_cell_double_clicked)
 
         font = QFont("Arial", 16)
         self.table.setFont(font)
@@ -87,109 +95,43 @@ class DataTableTab(QWidget):
             self.update_data(self._last_raw)
 
     def update_data(self, telemetry_data):
-        self._last_raw = telemetry_data.copy()
-
-        # count rows
-        total = sum(1 + len(keys) + 1 for keys in self.groups.values())
-        signature = tuple((group, tuple(keys)) for group, keys in self.groups.items())
-        if self.table.rowCount() != total or signature != self._layout_signature:
-            # The table structure is stable during normal telemetry. Rebuild it
-            # only when groups change, then update value cells in place.
-            self._build_static_rows(total, signature)
-
-        for key, row in self._row_for_key.items():
-            raw = telemetry_data.get(key)
-            target = self.unit_overrides.get(key, self.units_map.get(key, ""))
-            disp = convert_value(key, raw, target)
-
-            value_item = self.table.item(row, 1)
-            if value_item is None:
-                value_item = QTableWidgetItem()
-                value_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.table.setItem(row, 1, value_item)
-            value_item.setText(str(disp))
-            value_item.setForeground(QBrush(QColor("#FFF")))
-            value_item.setBackground(QBrush())
-
-            bg = None
-            if key == TelemetryKey.TELEMETRY_STATUS.value[0]:
-                s = str(raw).strip().lower()
-                if s and s not in ("0", "none", "n/a", "ok"):
-                    bg = QColor("#FF0000")
-            elif key in self.error_keys:
-                s = str(raw).strip().lower()
-                if s and s not in ("0", "none", "n/a"):
-                    bg = QColor("#FF0000")
-            elif key in self.error_count_keys:
-                try:
-                    if int(raw) > 0:
-                        bg = QColor("#FFA500")
-                except Exception:
-                    pass
-
-            if bg:
-                value_item.setBackground(QBrush(bg))
-
-            unit_item = self.table.item(row, 2)
-            if unit_item is None:
-                unit_item = QTableWidgetItem()
-                unit_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.table.setItem(row, 2, unit_item)
-            unit_item.setText(target)
-            unit_item.setForeground(QBrush(QColor("#FFF")))
-
-    def _build_static_rows(self, total, signature):
-        # Build group headers and parameter/unit cells once. update_data() keeps
-        # the hot path limited to value text and warning colors.
-        self.table.setRowCount(total)
-        self._row_for_key.clear()
-
-        row = 0
-        for group, keys in self.groups.items():
-            # header
-            hdr = QTableWidgetItem(group)
-            hdr.setTextAlignment(Qt.AlignmentFlag.AlignLeft |
-                                 Qt.AlignmentFlag.AlignVCenter)
-            hdr.setForeground(QBrush(QColor("#FFD400")))
-            hdr.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-            hdr.setFlags(Qt.ItemFlag.ItemIsEnabled)
-            self.table.setItem(row, 0, hdr)
-            self.table.setSpan(row, 0, 1, 3)
-            row += 1
-
-            for key in keys:
-                # Param
-                pi = QTableWidgetItem(key)
-                pi.setTextAlignment(Qt.AlignmentFlag.AlignLeft|
-                                    Qt.AlignmentFlag.AlignVCenter)
-                pi.setForeground(QBrush(QColor("#FFF")))
-                self.table.setItem(row,0,pi)
-
-                vi = QTableWidgetItem("--")
-                vi.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                vi.setForeground(QBrush(QColor("#FFF")))
-                self.table.setItem(row,1,vi)
-
-                # Unit
-                ui = QTableWidgetItem(self.units_map.get(key, ""))
-                ui.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                ui.setForeground(QBrush(QColor("#FFF")))
-                self.table.setItem(row,2,ui)
-
-                self._row_for_key[key] = row
-                row += 1
-
-            # spacer
-            row += 1
-        self._layout_signature = signature
+        self._last_raw = TelemetrySnapshot.of(telemetry_data)
+
+        # The table structure is stable during normal telemetry. Rows and
+        # spans are rebuilt only when groups change; the model then repaints
+        # just the value cells that changed.
+        if self.model.set_groups(self.groups):
+            self.table.clearSpans()
+            for row in self.model.group_rows():
+                self.table.setSpan(row, 0, 1, 3)
+        self.model.update_values(telemetry_data, self._unit_for_key)
+
+    def _unit_for_key(self, key):
+        return self.unit_overrides.get(key, self.units_map.get(key, ""))
+
+    def _value_background(self, key, raw):
+        if key == TelemetryKey.TELEMETRY_STATUS.value[0]:
+            s = str(raw).strip().lower()
+            if s and s not in ("0", "none", "n/a", "ok"):
+                return ERROR_COLOR
+        elif key in self.error_keys:
+            s = str(raw).strip().lower()
+            if s and s not in ("0", "none", "n/a"):
+                return ERROR_COLOR
+        elif key in self.error_count_keys:
+            try:
+                if int(raw) > 0:
+                    return WARNING_COLOR
+            except Exception:
+                pass
+        return None
 
     def _on_cell_double_clicked(self, r, c):
         if c != 2:  # only Unit column
             return
-        pi = self.table.item(r,0)
-        if not pi:
+        key = self.model.key_at(r)
+        if not key:
             return
-        key = pi.text()
 
         # possible units: original, metric, imperial
         orig = KEY_UNITS.get(key,"")
@@ -200,8 +142,7 @@ class DataTableTab(QWidget):
             if u and u not in choices:
                 choices.append(u)
 
-        current = self.unit_overrides.get(key,
-                   self.units_map.get(key,""))
+        current = self._unit_for_key(key)
         idx = choices.index(current) if current in choices else 0
 
         unit, ok = QInputDialog.getItem(
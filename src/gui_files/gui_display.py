@@ -20,6 +20,7 @@ from PyQt6.QtCore import pyqtSignal, QTimer
 import json
 import os
 import logging
+import time
 
 # Make sure this import is correct in your environment.
 from key_name_definitions import TelemetryKey, solcast_keys_for_prefix
@@ -42,6 +43,9 @@ from gui_files.gui_config_dialog import ConfigDialog
 from gui_files.gui_simulation_tab import SimulationTab
 from gui_files.gui_gps_map_tab import GPSMapTab
 from gui_files.gui_dashboard_tab import DashboardTab
+from gui_files.tab_render_scheduler import TabRenderScheduler
+from session_history_store import SessionHistoryStore
+from telemetry_snapshot import TelemetrySnapshot
 
 from unit_conversion import build_metric_units_dict, build_imperial_units_dict, convert_value
 
@@ -55,7 +59,7 @@ class TelemetryGUI(QWidget):
     machine_learning_retrain_signal_with_files = pyqtSignal(list)
     export_bundle_requested = pyqtSignal(str, str)
     import_bundle_requested = pyqtSignal(str, bool)
-    start_simulation_replay_requested = pyqtSignal(str, float)
+    start_simulation_replay_requested = pyqtSignal(str, float, bool)
     simulation_replay_speed_changed = pyqtSignal(float)
     start_simulation_scenario_requested = pyqtSignal(str, float, dict)
     stop_simulation_requested = pyqtSignal()
@@ -362,6 +366,21 @@ class TelemetryGUI(QWidget):
                                      self.units, self.color_mapping)
         self.graph_tabs.addTab(self.insights_tab, "Insights")
 
+        # Every graphed key is also recorded to a memory-mapped session store
+        # so the Full session window can page through the whole race day.
+        self.history_root = os.path.join(self.csv_handler.root_directory, 'history')
+        self.history_keys = list(dict.fromkeys(key for keys in graph_groups.values() for key in keys))
+        self.history_store = None
+        self._live_history_store = None
+        self._replaying = False
+        self._replay_last_time = None
+        try:
+            self.history_store = SessionHistoryStore.create_session(self.history_root, self.history_keys)
+        except OSError as e:
+            self.logger.error(f"Session history unavailable: {e}")
+        for graph_tab in self._graph_tab_list():
+            graph_tab.set_history_store(self.history_store)
+
         # Data Table Tab
         data_table_groups = {
             "Motor Controllers": [
@@ -585,6 +604,11 @@ class TelemetryGUI(QWidget):
         self.settings_tab.install_version_requested.connect(self.on_install_version_requested)
         self.tabs.addTab(self.settings_tab, "Settings")
 
+        # Hidden pages keep ingesting telemetry but repaint only when shown.
+        self.render_scheduler = TabRenderScheduler(self.tabs)
+        for nested in (self.graph_tabs, self.data_tabs, self.tools_tabs):
+            self.render_scheduler.watch(nested)
+
         # Populate versions shortly after UI loads (non-blocking)
         try:
             QTimer.singleShot(300, self.on_refresh_versions)
@@ -757,38 +781,46 @@ class TelemetryGUI(QWidget):
                 pass
             self.updater.download_and_apply_version(version)
 
-    def update_all_tabs(self, telemetry_data: dict):
+    def update_all_tabs(self, telemetry_data: dict, timestamp: float | None = None):
         """
         Slot to receive telemetry data and update all tabs accordingly.
+
+        `timestamp` is the sample's POSIX time when it is not "now", as for
+        turbo replay; graphs and session history are keyed by it.
         """
         try:
-            # Exclude 'Errors' and 'Limits' or anything you don't want to graph
-
             self.last_update = datetime.now()
             self._refresh_header_age()
-            enriched_data = telemetry_data.copy()
-            lap_already_computed = TelemetryKey.NAV_LAP_STATUS.value[0] in enriched_data
+            # One immutable snapshot per tick; every tab, the map included,
+            # keeps this reference instead of copying the dict.
+            snapshot = TelemetrySnapshot.of(telemetry_data)
+            lap_already_computed = TelemetryKey.NAV_LAP_STATUS.value[0] in snapshot
             route_metrics = self.gps_map_tab.update_data(
-                enriched_data,
+                snapshot,
                 update_laps=not lap_already_computed,
-            ) or {}
-            enriched_data.update(route_metrics)
-
-            self.last_telemetry_data = enriched_data.copy()
-            graph_data = {k: v for k, v in enriched_data.items() if k not in ['Errors', 'Limits']}
+                compute_metrics=not lap_already_computed,
+            )
+            # The application merges NAV_* metrics before emitting, so a merged
+            # copy is only built when the map had to compute them itself.
+            enriched_data = TelemetrySnapshot(snapshot, route_metrics) if route_metrics else snapshot
+            self.last_telemetry_data = enriched_data
 
             # Fan the same enriched snapshot into every view so Dashboard, Map,
             # tables, and graphs stay consistent for a given telemetry tick.
-            self.dashboard_tab.update_data(enriched_data)
-            self.mc1_tab.update_graphs(graph_data)
-            self.mc2_tab.update_graphs(graph_data)
-            self.pack1_tab.update_graphs(graph_data)
-            self.pack2_tab.update_graphs(graph_data)
-            self.remaining_tab.update_graphs(graph_data)
-            self.insights_tab.update_graphs(graph_data)
-            self.data_table_tab.update_data(enriched_data)
-            self.data_display_tab.update_display(enriched_data)
-            self.custom_data_table_tab.update_data(enriched_data)
+            # Graph buffers always ingest so history is complete; widget
+            # repaints for hidden pages wait in the render scheduler.
+            scheduler = self.render_scheduler
+            self._record_graph_sample(enriched_data, timestamp)
+            for graph_tab in self._graph_tab_list():
+                scheduler.submit(graph_tab, graph_tab.render_graphs)
+            scheduler.submit(self.dashboard_tab, lambda: self.dashboard_tab.update_data(enriched_data))
+            scheduler.submit(self.data_table_tab, lambda: self.data_table_tab.update_data(enriched_data))
+            scheduler.submit(
+                self.custom_data_table_tab,
+                lambda: self.custom_data_table_tab.update_data(enriched_data),
+            )
+            self.data_display_tab.queue_display(enriched_data)
+            scheduler.submit(self.data_display_tab, self.data_display_tab.flush_pending)
 
             # Feed battery temperature probe updates into the Battery Image tab
             try:
@@ -806,6 +838,77 @@ class TelemetryGUI(QWidget):
         except Exception as e:
             self.logger.error(f"Error updating all tabs: {e}")
 
+    def begin_replay_session(self):
+        """
+        Route turbo replay samples into their own graph buffers and history.
+
+        Recorded timestamps are older than the live ones already graphed, and
+        both the ring buffers and the history store need times that never go
+        backwards, so the live session is set aside until live data resumes.
+        """
+        if not self._replaying:
+            self._live_history_store = self.history_store
+            self._replaying = True
+        elif self.history_store is not None:
+            self.history_store.flush()
+        self._replay_last_time = None
+        try:
+            store = SessionHistoryStore.create_session(
+                self.history_root, self.history_keys, keep_sessions=2, prefix='replay_',
+            )
+        except OSError as e:
+            self.logger.error(f"Replay history unavailable: {e}")
+            store = None
+        self._attach_graph_history(store)
+
+    def end_replay_session(self):
+        """Flush the replay history and put the live session back on the graphs."""
+        if not self._replaying:
+            return
+        if self.history_store is not None:
+            self.history_store.flush()
+        self._replaying = False
+        self._replay_last_time = None
+        live_store, self._live_history_store = self._live_history_store, None
+        self._attach_graph_history(live_store)
+
+    def _attach_graph_history(self, store):
+        self.history_store = store
+        for graph_tab in self._graph_tab_list():
+            graph_tab.clear_graphs()
+            graph_tab.set_history_store(store)
+
+    def _record_graph_sample(self, snapshot, timestamp=None):
+        """Append one tick to the session history and every graph buffer."""
+        now = self._graph_sample_time(timestamp)
+        if self.history_store is not None:
+            self.history_store.append(now, snapshot)
+        for graph_tab in self._graph_tab_list():
+            graph_tab.update_graphs(snapshot, render=False, timestamp=now)
+
+    def _graph_sample_time(self, timestamp):
+        # Live ticks (no timestamp) end any replay; replay ticks keep their
+        # recorded spacing but are never allowed to step backwards.
+        if timestamp is None:
+            self.end_replay_session()
+            return time.time()
+        if not self._replaying:
+            self.begin_replay_session()
+        if self._replay_last_time is not None:
+            timestamp = max(timestamp, self._replay_last_time)
+        self._replay_last_time = timestamp
+        return timestamp
+
+    def _graph_tab_list(self):
+        return (
+            self.mc1_tab,
+            self.mc2_tab,
+            self.pack1_tab,
+            self.pack2_tab,
+            self.remaining_tab,
+            self.insights_tab,
+        )
+
     def update_color_mapping(self, key: str, color: str):
         """
         Update the color mapping for a specific key and reflect it in all graph tabs.
@@ -864,9 +967,9 @@ class TelemetryGUI(QWidget):
                     self.insights_tab):
             if hasattr(tab, 'set_units_map'):
                 tab.set_units_map(self.units, self.units_mode)
-
-        if hasattr(self, 'last_telemetry_data'):
-            self.update_all_tabs(self.last_telemetry_data)
+        # Each tab redraws its last snapshot in set_units_map. Re-sending the
+        # snapshot through update_all_tabs would append it to the session
+        # history and graph buffers a second time.
 
         self.logger.info(f"Units changed to {units_choice}. Updated units: {self.units}")
 
@@ -951,6 +1054,9 @@ class TelemetryGUI(QWidget):
         """
         self.save_gui_state()
         self.save_color_mapping()
+        for store in (self.history_store, self._live_history_store):
+            if store is not None:
+                store.flush()
         # Persist image annotations if present
         try:
             for tab in (getattr(self, 'battery_image_tab', None), getattr(self, 'array_image_tab', None)):
@@ -1,12 +1,12 @@
 import json
+import logging
 import math
 import os
 import time
-import xml.etree.ElementTree as ET
-from collections import OrderedDict
+from collections import deque
 
-from PyQt6.QtCore import QSettings, QStandardPaths, Qt, QUrl
-from PyQt6.QtGui import QBrush, QColor, QFont, QPainter, QPainterPath, QPen, QPixmap, QPixmapCache
+from PyQt6.QtCore import QSettings, QStandardPaths, Qt, QTimer, QUrl
+from PyQt6.QtGui import QBrush, QColor, QFont, QPainter, QPainterPath, QPen, QPixmap
 from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkDiskCache, QNetworkReply, QNetworkRequest
 from PyQt6.QtWidgets import (
     QCheckBox,
@@ -33,7 +33,18 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from gui_files.map_tile_cache import TileCache, tiles_ahead
+from gui_files.map_tile_pack import MBTilesPack, corridor_tiles, tile_source_error
+from gui_files.map_trail import MapTrail, world_pixels
 from key_name_definitions import TelemetryKey
+from navigation_engine import (
+    NavigationEngine,
+    build_route_segment,
+    format_duration,
+    haversine_miles,
+    parse_gpx_points,
+)
+from navigation_batch import recompute_session_csv
 
 
 class MapGraphicsView(QGraphicsView):
@@ -80,16 +91,34 @@ class GPSMapTab(QWidget):
     TILE_SIZE = 256
     TILE_RADIUS = 3
     MAX_MEMORY_TILES = 384
+    MAX_COMPRESSED_TILE_BYTES = 64 * 1024 * 1024
+    PREFETCH_SECONDS = 45.0
+    PREFETCH_MAX_TILES = 24
+    PREFETCH_MIN_SPEED_MPH = 3.0
+    RENDER_INTERVAL_MS = 100
+    FOLLOW_DEAD_ZONE_TILES = 1.0
+    TILE_URL = "https://tile.openstreetmap.org/{z}/{x}/{y}.png"
+    TILE_PACK_ZOOMS = "12-17"
+    TILE_PACK_BUFFER_TILES = 1
+    TILE_PACK_CONCURRENT_REQUESTS = 2
+    TILE_PACK_COMMIT_EVERY = 50
+    # Packs are built from a separately configured server (map/tile_pack_url);
+    # larger corridors should be narrowed to fewer zoom levels.
+    TILE_PACK_MAX_TILES = 20000
     MAX_DRAW_ROUTE_POINTS_PER_SEGMENT = 1800
-    LAP_CROSSING_COOLDOWN_SECONDS = 8.0
-    MINIMUM_LAP_SECONDS = 30.0
-    LAP_LINE_REARM_DISTANCE_METERS = 20.0
-    RACE_MODE_FSGP = "FSGP Track"
-    RACE_MODE_ASC = "ASC Route"
-    MINIMUM_DISTANCE_SPEED_MPH = 1.0
-    GPS_SEGMENT_BASE_TOLERANCE_MILES = 0.002
-    GPS_SEGMENT_SPEED_FACTOR = 2.5
-    MAX_MOVING_TIME_SAMPLE_GAP_SECONDS = 5.0
+    # Stacking order of the persistent scene layers.
+    Z_TILES = 0
+    Z_ROUTE = 10
+    Z_LAP_LINE = 20
+    Z_TRAIL = 30
+    Z_MARKER = 40
+    RACE_MODE_FSGP = NavigationEngine.RACE_MODE_FSGP
+    RACE_MODE_ASC = NavigationEngine.RACE_MODE_ASC
+    RECOMPUTE_LAPS_SHOWN = 20
+    TRAIL_MAX_POINTS = 20000
+    TRAIL_MAX_MINUTES = 0.0
+    TRAIL_MIN_STEP_METERS = 1.0
+    METERS_PER_MILE = 1609.344
     KALAMAZOO_LAT = 42.291707
     KALAMAZOO_LON = -85.587229
 
@@ -100,50 +129,43 @@ class GPSMapTab(QWidget):
         self.center_lon = None
         self.vehicle_lat = None
         self.vehicle_lon = None
-        self.trail = []
-        self.route_points = []
-        self.route_segments = []
-        self.route_flat_positions = []
-        self.route_last_flat_index = None
-        self.route_progress_miles = 0.0
-        self.lap_start_point = None
-        self.lap_end_point = None
-        self.previous_lap_point = None
-        self.lap_count = 0
-        self.lap_started_at = None
-        self.last_lap_seconds = None
-        self.best_lap_seconds = None
-        self.completed_lap_seconds = []
-        self.current_lap_distance_miles = 0.0
-        self.completed_lap_distances_miles = []
-        self.last_crossing_at = None
-        self.lap_crossing_direction = None
-        self.lap_crossing_armed = True
-        self.lap_status = "Set start/end line"
+        self.trail = MapTrail(*self._load_trail_settings())
+        # Lap, trip and route state lives in the Qt-free navigation engine;
+        # this tab draws it and edits its setup.
+        self.navigation = NavigationEngine(*self._load_race_settings())
         self.lap_line_placement_mode = None
-        (
-            self.race_mode,
-            self.track_lap_length_miles,
-            self.fsgp_day_duration_hours,
-        ) = self._load_race_settings()
-        if self.race_mode == self.RACE_MODE_ASC:
-            self.lap_status = "ASC route mode"
-        self.trip_distance_miles = 0.0
-        self.trip_started_at = None
-        self.previous_trip_point = None
-        self.previous_trip_at = None
-        self.day_moving_seconds = 0.0
-        self.day_max_speed_mph = 0.0
-        self.tile_cache = OrderedDict()
+        self.tile_cache = TileCache(self.TILE_SIZE, self.MAX_MEMORY_TILES, self.MAX_COMPRESSED_TILE_BYTES)
+        self.prefetch_tile_keys = set()
+        # Scene layers persist between renders; see _render_map().
         self.tile_items = {}
         self.visible_tile_keys = set()
+        self._scene_zoom = None
+        self._route_layer = None
+        self._route_layer_index = None
+        self._lap_layer = []
+        self._lap_layer_points = None
+        self._trail_item = None
+        self._trail_drawn = (None, 0)
+        self._marker_items = None
+        # Tile-space centre the tile layer was last built around.
+        self._layer_center = None
+        self._last_render_at = 0.0
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.timeout.connect(self._flush_map_render)
         self.pending_tiles = set()
         self.pending_replies = {}
+        self.tile_pack = None
+        self.tile_pack_queue = deque()
+        self.tile_pack_replies = {}
+        self.tile_pack_progress = None
+        self.tile_pack_url = None
         self.saved_locations = self._load_saved_locations()
 
         self.network = QNetworkAccessManager(self)
         self.network.setCache(self._create_tile_disk_cache())
         self.network.finished.connect(self._on_tile_reply)
+        self._open_saved_tile_pack()
 
         self._build_ui()
         self._set_location(
@@ -251,6 +273,17 @@ class GPSMapTab(QWidget):
         reset_laps_button = QPushButton("Reset Laps")
         reset_laps_button.clicked.connect(self._reset_laps)
         route_row.addWidget(reset_laps_button)
+        build_tile_pack_button = QPushButton("Build Tile Pack")
+        build_tile_pack_button.setToolTip(
+            "Download the map tiles along the loaded GPX routes from a tile server that allows "
+            "offline use into a tile pack file."
+        )
+        build_tile_pack_button.clicked.connect(self._build_tile_pack)
+        route_row.addWidget(build_tile_pack_button)
+        open_tile_pack_button = QPushButton("Open Tile Pack")
+        open_tile_pack_button.setToolTip("Serve map tiles from an offline tile pack before the network.")
+        open_tile_pack_button.clicked.connect(self._open_tile_pack)
+        route_row.addWidget(open_tile_pack_button)
         self.follow_vehicle_checkbox = QCheckBox("Follow vehicle")
         self.follow_vehicle_checkbox.setChecked(True)
         route_row.addWidget(self.follow_vehicle_checkbox)
@@ -260,7 +293,7 @@ class GPSMapTab(QWidget):
         race_row.addWidget(QLabel("Race mode:"))
         self.race_mode_combo = QComboBox()
         self.race_mode_combo.addItems([self.RACE_MODE_FSGP, self.RACE_MODE_ASC])
-        self.race_mode_combo.setCurrentText(self.race_mode)
+        self.race_mode_combo.setCurrentText(self.navigation.race_mode)
         self.race_mode_combo.setToolTip(
             "FSGP uses lap timing and official lap mileage; ASC uses continuous GPX route progress."
         )
@@ -273,11 +306,11 @@ class GPSMapTab(QWidget):
         self.track_length_input.setSingleStep(0.001)
         self.track_length_input.setSuffix(" mi")
         self.track_length_input.setSpecialValueText("Use GPS")
-        self.track_length_input.setValue(self.track_lap_length_miles)
+        self.track_length_input.setValue(self.navigation.track_lap_length_miles)
         self.track_length_input.setToolTip(
             "For FSGP, completed official distance is laps times this value. Zero uses filtered GPS lap distance."
         )
-        self.track_length_input.setEnabled(self.race_mode == self.RACE_MODE_FSGP)
+        self.track_length_input.setEnabled(self.navigation.race_mode == self.RACE_MODE_FSGP)
         self.track_length_input.valueChanged.connect(self._track_length_changed)
         race_row.addWidget(self.track_length_input)
         race_row.addWidget(QLabel("Race-day duration:"))
@@ -287,11 +320,11 @@ class GPSMapTab(QWidget):
         self.day_duration_input.setSingleStep(0.5)
         self.day_duration_input.setSuffix(" h")
         self.day_duration_input.setSpecialValueText("Set hours")
-        self.day_duration_input.setValue(self.fsgp_day_duration_hours)
+        self.day_duration_input.setValue(self.navigation.fsgp_day_duration_hours)
         self.day_duration_input.setToolTip(
             "Scheduled FSGP driving time for this day. The timer starts with the first movement after Reset Day; zero disables projected possible laps."
         )
-        self.day_duration_input.setEnabled(self.race_mode == self.RACE_MODE_FSGP)
+        self.day_duration_input.setEnabled(self.navigation.race_mode == self.RACE_MODE_FSGP)
         self.day_duration_input.valueChanged.connect(self._day_duration_changed)
         race_row.addWidget(self.day_duration_input)
         reset_trip_button = QPushButton("Reset Trip")
@@ -302,6 +335,13 @@ class GPSMapTab(QWidget):
         reset_day_button.setToolTip("Reset trip, daily speed statistics, route progress, and lap results.")
         reset_day_button.clicked.connect(self._reset_day)
         race_row.addWidget(reset_day_button)
+        recompute_laps_button = QPushButton("Recompute Session")
+        recompute_laps_button.setToolTip(
+            "Re-derive laps, trip distance, and route progress for a saved session CSV "
+            "using the current lap line and GPX routes."
+        )
+        recompute_laps_button.clicked.connect(self._recompute_session)
+        race_row.addWidget(recompute_laps_button)
         race_row.addStretch()
 
         manual_layout.addLayout(location_row, 0, 0)
@@ -422,7 +462,15 @@ class GPSMapTab(QWidget):
         self._refresh_lap_label()
         self._refresh_distance_labels()
 
-    def update_data(self, telemetry_data, update_laps=True):
+    def update_data(self, telemetry_data, update_laps=True, compute_metrics=True):
+        """
+        Draw one telemetry snapshot and return its NAV_* metrics.
+
+        When the application has already run the snapshot through the shared
+        navigation engine, pass compute_metrics=False: the map and labels are
+        refreshed from the NAV_* fields already present and no metrics are
+        returned, so trip and lap state is advanced exactly once per tick.
+        """
         lat = self._as_float(telemetry_data.get(TelemetryKey.NAV_LATITUDE.value[0]))
         lon = self._as_float(telemetry_data.get(TelemetryKey.NAV_LONGITUDE.value[0]))
         valid = self._as_int(telemetry_data.get(TelemetryKey.NAV_GPS_VALID.value[0]))
@@ -442,7 +490,7 @@ class GPSMapTab(QWidget):
             self.elevation_label.setText("Elevation: invalid")
 
         if lat is None or lon is None:
-            return self._build_navigation_metrics(speed or 0.0, update_laps=False)
+            return self._navigation_result(telemetry_data, speed, compute_metrics)
 
         self.coord_label.setText(f"Lat: {lat:.6f}  Lon: {lon:.6f}")
         self.speed_label.setText(f"Speed: {speed or 0.0:.2f} mph")
@@ -451,7 +499,7 @@ class GPSMapTab(QWidget):
         if not has_location:
             self.status_label.setText(f"GPS invalid | fix {fix} | source {source} | age {age_ms} ms")
             self._render_empty_state(lat, lon)
-            return self._build_navigation_metrics(speed or 0.0, update_laps=False)
+            return self._navigation_result(telemetry_data, speed, compute_metrics)
 
         self._set_vehicle_location(
             lat,
@@ -461,28 +509,16 @@ class GPSMapTab(QWidget):
             reset_trail=False,
             recenter=self.follow_vehicle_checkbox.isChecked(),
         )
-        return self._build_navigation_metrics(speed or 0.0, update_laps=update_laps, lat=lat, lon=lon)
-
-    def build_navigation_metrics_for_snapshot(self, telemetry_data, update_laps=True):
-        lat = self._as_float(telemetry_data.get(TelemetryKey.NAV_LATITUDE.value[0]))
-        lon = self._as_float(telemetry_data.get(TelemetryKey.NAV_LONGITUDE.value[0]))
-        valid = self._as_int(telemetry_data.get(TelemetryKey.NAV_GPS_VALID.value[0]))
-        fix = self._as_int(telemetry_data.get(TelemetryKey.NAV_FIX.value[0]))
-        speed = self._as_float(telemetry_data.get(TelemetryKey.NAV_VEHICLE_MPH.value[0])) or 0.0
-        has_location = (
-            lat is not None
-            and lon is not None
-            and valid == 1
-            and fix > 0
-            and not (abs(lat) < 0.000001 and abs(lon) < 0.000001)
-        )
-        return self._build_navigation_metrics(
-            speed,
-            update_laps=bool(update_laps and has_location),
-            lat=lat,
-            lon=lon,
+        return self._navigation_result(
+            telemetry_data, speed, compute_metrics, update_laps=update_laps, lat=lat, lon=lon
         )
 
+    def _navigation_result(self, telemetry_data, speed, compute_metrics, update_laps=False, lat=None, lon=None):
+        if not compute_metrics:
+            self._refresh_navigation_labels(telemetry_data)
+            return {}
+        return self._build_navigation_metrics(speed or 0.0, update_laps=update_laps, lat=lat, lon=lon)
+
     def _set_zoom(self, zoom):
         self.zoom = max(2, min(19, zoom))
         self._update_zoom_controls()
@@ -512,11 +548,61 @@ class GPSMapTab(QWidget):
             self.center_lon = lon
         self._refresh_location_labels(lat, lon, speed, status)
         if reset_trail:
-            self.trail = []
-        if reset_trail or not self.trail or self._distance_px(self.trail[-1], (lat, lon)) >= 2:
-            self.trail.append((lat, lon))
-            self.trail = self.trail[-250:]
-        self._render_map()
+            self.trail.clear()
+        last = self.trail.last_point()
+        # Fixes are kept at full detail; the trail is simplified per zoom when
+        # drawn, so only stationary GPS jitter is dropped here.
+        moved = last is None or (
+            haversine_miles(last[0], last[1], lat, lon) * self.METERS_PER_MILE
+            >= self.TRAIL_MIN_STEP_METERS
+        )
+        if moved:
+            self.trail.append(lat, lon)
+        self._schedule_map_render()
+        if moved and last is not None:
+            self._prefetch_ahead(last, (lat, lon), speed)
+
+    def _schedule_map_render(self):
+        # GPS fixes can arrive faster than the map needs to redraw. Render at
+        # most once per RENDER_INTERVAL_MS; fixes in between only update state
+        # and the next flush draws the latest one.
+        if self._render_timer.isActive():
+            return
+        elapsed_ms = (time.monotonic() - self._last_render_at) * 1000.0
+        if elapsed_ms >= self.RENDER_INTERVAL_MS:
+            self._flush_map_render()
+        else:
+            self._render_timer.start(int(math.ceil(self.RENDER_INTERVAL_MS - elapsed_ms)))
+
+    def _flush_map_render(self):
+        self._render_timer.stop()
+        if self.center_lat is None or self.center_lon is None:
+            return
+        center_tile_x, center_tile_y = self._latlon_to_tile_fraction(self.center_lat, self.center_lon, self.zoom)
+        if (
+            self._scene_zoom == self.zoom
+            and self._layer_center is not None
+            and max(
+                abs(center_tile_x - self._layer_center[0]),
+                abs(center_tile_y - self._layer_center[1]),
+            ) < self.FOLLOW_DEAD_ZONE_TILES
+        ):
+            self._follow_in_place(center_tile_x, center_tile_y)
+        else:
+            self._render_map()
+
+    def _follow_in_place(self, center_tile_x, center_tile_y):
+        # The centre is still inside the dead zone of the built tile layer, so
+        # the tiles, route and lap line are unchanged: extend the trail, move
+        # the marker and scroll the view.
+        self._draw_trail()
+        marker_x, marker_y = self._latlon_to_scene_point(self.vehicle_lat, self.vehicle_lon)
+        self._draw_vehicle_marker(marker_x, marker_y)
+        self.view.centerOn(
+            (center_tile_x - self.base_tile_x) * self.TILE_SIZE,
+            (center_tile_y - self.base_tile_y) * self.TILE_SIZE,
+        )
+        self._last_render_at = time.monotonic()
 
     def _set_map_center(self, lat, lon, status="Map browse"):
         self.center_lat = lat
@@ -564,59 +650,93 @@ class GPSMapTab(QWidget):
             day_duration = 0.0
         return mode, track_length, day_duration
 
+    def _load_trail_settings(self):
+        # Cap the drawn trail by fix count and, optionally, by age in minutes
+        # (0 keeps fixes until the count cap trims them).
+        settings = QSettings("SunseekerSolarCarProject", "Python-Telem")
+        max_points = self._as_int(settings.value("map/trail_max_points", self.TRAIL_MAX_POINTS))
+        if max_points <= 0:
+            max_points = self.TRAIL_MAX_POINTS
+        max_minutes = self._as_float(settings.value("map/trail_max_minutes", self.TRAIL_MAX_MINUTES))
+        max_age_seconds = max_minutes * 60.0 if max_minutes and max_minutes > 0 else None
+        return max_points, max_age_seconds
+
     def _race_mode_changed(self, mode):
         if mode not in {self.RACE_MODE_FSGP, self.RACE_MODE_ASC}:
             return
-        previous_mode = self.race_mode
-        self.race_mode = mode
+        self.navigation.set_race_mode(mode)
         QSettings("SunseekerSolarCarProject", "Python-Telem").setValue("map/race_mode", mode)
         self.track_length_input.setEnabled(mode == self.RACE_MODE_FSGP)
         self.day_duration_input.setEnabled(mode == self.RACE_MODE_FSGP)
-        if mode != previous_mode:
-            # Completed laps remain available, but a partial circuit cannot be
-            # meaningfully resumed after operating in point-to-point mode.
-            self.lap_started_at = None
-            self.previous_lap_point = None
-            self.current_lap_distance_miles = 0.0
-            self.lap_crossing_armed = True
-            self.lap_status = (
-                "ASC route mode"
-                if mode == self.RACE_MODE_ASC
-                else ("Ready" if self._lap_line_ready() else "Set start/end line")
-            )
         self._refresh_lap_label()
         self._refresh_distance_labels()
 
     def _track_length_changed(self, miles):
-        self.track_lap_length_miles = max(0.0, float(miles))
+        self.navigation.track_lap_length_miles = max(0.0, float(miles))
         QSettings("SunseekerSolarCarProject", "Python-Telem").setValue(
-            "map/fsgp_lap_length_miles", self.track_lap_length_miles
+            "map/fsgp_lap_length_miles", self.navigation.track_lap_length_miles
         )
         self._refresh_lap_label()
         self._refresh_distance_labels()
 
     def _day_duration_changed(self, hours):
-        self.fsgp_day_duration_hours = max(0.0, float(hours))
+        self.navigation.fsgp_day_duration_hours = max(0.0, float(hours))
         QSettings("SunseekerSolarCarProject", "Python-Telem").setValue(
-            "map/fsgp_day_duration_hours", self.fsgp_day_duration_hours
+            "map/fsgp_day_duration_hours", self.navigation.fsgp_day_duration_hours
         )
         self._refresh_distance_labels()
 
     def _reset_trip(self):
-        self.trip_distance_miles = 0.0
-        self.trip_started_at = None
-        self.previous_trip_point = None
-        self.previous_trip_at = None
-        self.day_moving_seconds = 0.0
-        self.day_max_speed_mph = 0.0
-        self.route_progress_miles = 0.0
-        self.route_last_flat_index = None
+        self.navigation.reset_trip()
         self._refresh_distance_labels()
 
     def _reset_day(self):
         self._reset_trip()
         self._reset_laps(keep_line=True)
 
+    def _recompute_session(self):
+        navigation = self.navigation
+        if not navigation.lap_line_ready() and not navigation.route_segments:
+            QMessageBox.warning(self, "Recompute Session", "Set a lap line or load GPX routes first.")
+            return
+        csv_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Recompute Session CSV",
+            "",
+            "CSV Files (*.csv);;All Files (*)",
+        )
+        if not csv_path:
+            return
+
+        try:
+            result = recompute_session_csv(
+                csv_path,
+                lap_line=(navigation.lap_start_point, navigation.lap_end_point)
+                if navigation.lap_line_ready()
+                else None,
+                route_segments=navigation.route_segments,
+                race_mode=navigation.race_mode,
+                track_lap_length_miles=navigation.track_lap_length_miles,
+            )
+        except Exception as exc:
+            QMessageBox.warning(self, "Recompute Session", f"Could not recompute session:\n{exc}")
+            return
+
+        lines = [
+            f"GPS trip distance: {result.trip_miles[-1] if len(result.trip_miles) else 0.0:.2f} mi",
+            f"Moving time: {format_duration(result.moving_seconds[-1] if len(result.moving_seconds) else 0.0)}",
+        ]
+        if navigation.race_mode == self.RACE_MODE_FSGP and navigation.lap_line_ready():
+            lines.append(f"Laps: {result.lap_count} | best {format_duration(result.best_lap_seconds)}")
+            # The last laps are the ones an operator usually needs to confirm.
+            lines.extend(
+                f"  Lap {lap['lap']}: {format_duration(lap['seconds'])}, {lap['distance_miles']:.2f} mi"
+                for lap in result.laps[-self.RECOMPUTE_LAPS_SHOWN:]
+            )
+        if result.route_progress_miles is not None and len(result.route_progress_miles):
+            lines.append(f"Route progress: {result.route_progress_miles[-1]:.1f} mi")
+        QMessageBox.information(self, "Recompute Session", "\n".join(lines))
+
     def _load_saved_locations(self):
         settings = QSettings("SunseekerSolarCarProject", "Python-Telem")
         raw = settings.value("map/saved_locations", "{}")
@@ -720,7 +840,7 @@ class GPSMapTab(QWidget):
         self._set_lap_line_placement_mode("start")
 
     def _set_lap_end(self):
-        if self.lap_start_point is None:
+        if self.navigation.lap_start_point is None:
             QMessageBox.information(self, "Lap Line", "Place the start point first.")
             return
         self._set_lap_line_placement_mode("end")
@@ -736,11 +856,11 @@ class GPSMapTab(QWidget):
         self.set_lap_end_button.setText("Cancel End" if mode == "end" else "Set End")
         if mode:
             self.view.viewport().setCursor(Qt.CursorShape.CrossCursor)
-            self.lap_status = f"Double-click map to place {mode} point"
+            self.navigation.lap_status = f"Double-click map to place {mode} point"
             self.status_label.setText(f"Lap line: double-click the map to place the {mode} point")
         else:
             self.view.viewport().unsetCursor()
-            self.lap_status = "Ready" if self._lap_line_ready() else "Set start/end line"
+            self.navigation.lap_status = "Ready" if self.navigation.lap_line_ready() else "Set start/end line"
             self.status_label.setText("Lap-line placement canceled")
         self._refresh_lap_label()
 
@@ -753,9 +873,9 @@ class GPSMapTab(QWidget):
             return True
 
         point = self._scene_point_to_latlon(scene_x, scene_y)
-        if mode == "end" and self.lap_start_point and self._haversine_miles(
-            self.lap_start_point[0],
-            self.lap_start_point[1],
+        if mode == "end" and self.navigation.lap_start_point and haversine_miles(
+            self.navigation.lap_start_point[0],
+            self.navigation.lap_start_point[1],
             point[0],
             point[1],
         ) < 0.003:
@@ -767,24 +887,24 @@ class GPSMapTab(QWidget):
             return True
 
         if mode == "start":
-            self.lap_start_point = point
             # Replacing the start invalidates an existing end until the user
             # deliberately places the second endpoint again.
-            self.lap_end_point = None
+            self.navigation.set_lap_line(point, None)
         else:
-            self.lap_end_point = point
-        self._reset_laps(keep_line=True)
+            self.navigation.set_lap_line(self.navigation.lap_start_point, point)
+        self._refresh_lap_label()
+        self._refresh_distance_labels()
         self.lap_line_placement_mode = None
         self.set_lap_start_button.setText("Set Start")
         self.set_lap_end_button.setText("Set End")
         self.view.viewport().unsetCursor()
         if mode == "start":
-            self.lap_status = "Start set; click Set End"
+            self.navigation.lap_status = "Start set; click Set End"
             self.status_label.setText(
                 f"Lap-line start placed at {point[0]:.6f}, {point[1]:.6f}; now click Set End"
             )
         else:
-            self.lap_status = "Ready"
+            self.navigation.lap_status = "Ready"
             self.status_label.setText(
                 f"Lap line ready: {point[0]:.6f}, {point[1]:.6f} is the end point"
             )
@@ -793,18 +913,7 @@ class GPSMapTab(QWidget):
         return True
 
     def _reset_laps(self, keep_line=False):
-        self.previous_lap_point = None
-        self.lap_count = 0
-        self.lap_started_at = None
-        self.last_lap_seconds = None
-        self.best_lap_seconds = None
-        self.completed_lap_seconds = []
-        self.current_lap_distance_miles = 0.0
-        self.completed_lap_distances_miles = []
-        self.last_crossing_at = None
-        self.lap_crossing_direction = None
-        self.lap_crossing_armed = True
-        self.lap_status = "Ready" if self._lap_line_ready() else "Set start/end line"
+        self.navigation.reset_laps()
         self._refresh_lap_label()
         self._refresh_distance_labels()
 
@@ -826,7 +935,7 @@ class GPSMapTab(QWidget):
         self._set_map_center(lat, lon)
 
     def _render_empty_state(self, lat=None, lon=None):
-        self.scene.clear()
+        self._clear_scene()
         self.scene.setSceneRect(0, 0, self.TILE_SIZE * 3, self.TILE_SIZE * 3)
         text = "Waiting for valid GPS fix"
         if lat is not None and lon is not None:
@@ -840,59 +949,99 @@ class GPSMapTab(QWidget):
         self.view.fitInView(self.scene.sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
 
     def _render_map(self):
-        # Render the map from scratch so stale tiles, trails, and route paths do
-        # not survive zoom/pan changes. Tile requests are async; placeholders
-        # are replaced in _on_tile_reply as network replies arrive.
-        self.scene.clear()
-        self.tile_items = {}
-        self.visible_tile_keys = set()
+        # The scene is persistent. Its origin is fixed for the current zoom, so
+        # panning only adds and removes tiles at the edges, the route path is
+        # rebuilt only when the zoom or route changes, the trail path is
+        # extended, and the vehicle marker is moved. Tile requests are async;
+        # placeholders are replaced in _on_tile_reply as network replies arrive.
+        # GPS-driven updates go through _schedule_map_render() instead.
+        self._render_timer.stop()
         self.TILE_RADIUS = self._tile_radius_for_view()
         center_tile_x, center_tile_y = self._latlon_to_tile_fraction(
             self.center_lat, self.center_lon, self.zoom
         )
-        self.base_tile_x = int(math.floor(center_tile_x)) - self.TILE_RADIUS
-        self.base_tile_y = int(math.floor(center_tile_y)) - self.TILE_RADIUS
+        first_tile_x = int(math.floor(center_tile_x)) - self.TILE_RADIUS
+        first_tile_y = int(math.floor(center_tile_y)) - self.TILE_RADIUS
+        if self._scene_zoom != self.zoom:
+            self._clear_scene()
+            self._scene_zoom = self.zoom
+            self.base_tile_x = first_tile_x
+            self.base_tile_y = first_tile_y
 
         tile_count = self.TILE_RADIUS * 2 + 1
-        for dx in range(tile_count):
-            for dy in range(tile_count):
-                tile_x = self.base_tile_x + dx
-                tile_y = self.base_tile_y + dy
-                scene_x = dx * self.TILE_SIZE
-                scene_y = dy * self.TILE_SIZE
-                key = self._tile_key(tile_x, tile_y)
-                self.visible_tile_keys.add(key)
-                pixmap = self._get_cached_tile(key) or self._placeholder_pixmap()
-                item = QGraphicsPixmapItem(pixmap)
-                item.setPos(scene_x, scene_y)
-                item.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
-                self.scene.addItem(item)
-                self.tile_items[key] = item
-                if key not in self.tile_cache:
-                    self._request_tile(tile_x, tile_y)
+        self._update_tile_layer(first_tile_x, first_tile_y, tile_count)
         self._cancel_hidden_tile_requests()
 
-        center_scene_x = (center_tile_x - self.base_tile_x) * self.TILE_SIZE
-        center_scene_y = (center_tile_y - self.base_tile_y) * self.TILE_SIZE
-        marker_x, marker_y = self._latlon_to_scene_point(self.vehicle_lat, self.vehicle_lon)
         self._draw_route()
         self._draw_lap_line()
-        self._draw_trail(self.base_tile_x, self.base_tile_y)
-        if marker_x is not None and marker_y is not None:
-            self._draw_vehicle_marker(marker_x, marker_y)
+        self._draw_trail()
+        marker_x, marker_y = self._latlon_to_scene_point(self.vehicle_lat, self.vehicle_lon)
+        self._draw_vehicle_marker(marker_x, marker_y)
 
-        self.scene.setSceneRect(0, 0, self.TILE_SIZE * tile_count, self.TILE_SIZE * tile_count)
-        self.view.centerOn(center_scene_x, center_scene_y)
+        self.scene.setSceneRect(
+            (first_tile_x - self.base_tile_x) * self.TILE_SIZE,
+            (first_tile_y - self.base_tile_y) * self.TILE_SIZE,
+            self.TILE_SIZE * tile_count,
+            self.TILE_SIZE * tile_count,
+        )
+        self.view.centerOn(
+            (center_tile_x - self.base_tile_x) * self.TILE_SIZE,
+            (center_tile_y - self.base_tile_y) * self.TILE_SIZE,
+        )
+        self._layer_center = (center_tile_x, center_tile_y)
+        self._last_render_at = time.monotonic()
         self._update_tile_status()
 
+    def _clear_scene(self):
+        self.scene.clear()
+        self.tile_items = {}
+        self.visible_tile_keys = set()
+        self._scene_zoom = None
+        self._route_layer = None
+        self._route_layer_index = None
+        self._lap_layer = []
+        self._lap_layer_points = None
+        self._trail_item = None
+        self._trail_drawn = (None, 0)
+        self._marker_items = None
+        self._layer_center = None
+
+    def _update_tile_layer(self, first_tile_x, first_tile_y, tile_count):
+        wanted = {
+            (first_tile_x + dx, first_tile_y + dy)
+            for dx in range(tile_count)
+            for dy in range(tile_count)
+        }
+        for position in [position for position in self.tile_items if position not in wanted]:
+            self.scene.removeItem(self.tile_items.pop(position))
+
+        self.visible_tile_keys = {self._tile_key(tile_x, tile_y) for tile_x, tile_y in wanted}
+        self.tile_cache.protect(self.visible_tile_keys)
+        for tile_x, tile_y in wanted:
+            key = self._tile_key(tile_x, tile_y)
+            if (tile_x, tile_y) in self.tile_items:
+                continue
+            pixmap = self._get_cached_tile(key) or self._placeholder_pixmap()
+            item = QGraphicsPixmapItem(pixmap)
+            item.setPos(
+                (tile_x - self.base_tile_x) * self.TILE_SIZE,
+                (tile_y - self.base_tile_y) * self.TILE_SIZE,
+            )
+            item.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+            item.setZValue(self.Z_TILES)
+            self.scene.addItem(item)
+            self.tile_items[(tile_x, tile_y)] = item
+            if key not in self.tile_cache:
+                self._request_tile(tile_x, tile_y)
+
     def _tile_radius_for_view(self):
         viewport = self.view.viewport().size()
         widest = max(viewport.width(), viewport.height(), self.TILE_SIZE)
         return max(3, int(math.ceil(widest / self.TILE_SIZE / 2.0)) + 3)
 
     def _create_tile_disk_cache(self):
-        # Qt owns the persistent disk cache. The OrderedDict tile_cache above is
-        # only a bounded memory cache for the visible neighborhood.
+        # Qt owns the persistent disk cache. The TileCache above is only a
+        # bounded memory cache for the visible neighborhood and recent tiles.
         cache = QNetworkDiskCache(self)
         cache_root = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
         if not cache_root:
@@ -925,27 +1074,46 @@ class GPSMapTab(QWidget):
         )
 
     def _draw_vehicle_marker(self, x, y):
-        label = QGraphicsTextItem("Vehicle")
-        label.setDefaultTextColor(QColor("#ffffff"))
-        label.setFont(QFont("", 10, QFont.Weight.Bold))
-        label.setPos(x + 14, y - 20)
-        self.scene.addItem(label)
-
-        outer = QGraphicsEllipseItem(x - 12, y - 12, 24, 24)
-        outer.setPen(QPen(QColor("#ffffff"), 3))
-        outer.setBrush(QBrush(QColor("#bf616a")))
-        self.scene.addItem(outer)
+        if self._marker_items is None:
+            label = QGraphicsTextItem("Vehicle")
+            label.setDefaultTextColor(QColor("#ffffff"))
+            label.setFont(QFont("", 10, QFont.Weight.Bold))
+
+            outer = QGraphicsEllipseItem(-12, -12, 24, 24)
+            outer.setPen(QPen(QColor("#ffffff"), 3))
+            outer.setBrush(QBrush(QColor("#bf616a")))
+
+            inner = QGraphicsEllipseItem(-4, -4, 8, 8)
+            inner.setPen(QPen(QColor("#ffffff"), 1))
+            inner.setBrush(QBrush(QColor("#ffffff")))
+
+            self._marker_items = (label, outer, inner)
+            for item in self._marker_items:
+                item.setZValue(self.Z_MARKER)
+                self.scene.addItem(item)
 
-        inner = QGraphicsEllipseItem(x - 4, y - 4, 8, 8)
-        inner.setPen(QPen(QColor("#ffffff"), 1))
-        inner.setBrush(QBrush(QColor("#ffffff")))
-        self.scene.addItem(inner)
+        label, outer, inner = self._marker_items
+        visible = x is not None and y is not None
+        for item in self._marker_items:
+            item.setVisible(visible)
+        if not visible:
+            return
+        label.setPos(x + 14, y - 20)
+        outer.setPos(x, y)
+        inner.setPos(x, y)
 
     def _draw_route(self):
-        if not self.route_segments:
+        # Route paths depend only on the route and the zoom (a zoom change
+        # clears the scene), so they are built once and then left alone.
+        route_index = self.navigation.current_route_index()
+        if self._route_layer_index is route_index:
             return
+        for item in self._route_layer or []:
+            self.scene.removeItem(item)
+        self._route_layer = []
+        self._route_layer_index = route_index
 
-        for segment in self.route_segments:
+        for segment in self.navigation.route_segments:
             path = QPainterPath()
             started = False
             for lat, lon in self._sample_points_for_drawing(segment["points"]):
@@ -962,66 +1130,99 @@ class GPSMapTab(QWidget):
 
             shadow = QGraphicsPathItem(path)
             shadow.setPen(QPen(QColor("#111827"), 7))
-            self.scene.addItem(shadow)
-
             route = QGraphicsPathItem(path)
             route.setPen(QPen(QColor("#f59e0b"), 4))
-            self.scene.addItem(route)
+            for item in (shadow, route):
+                item.setZValue(self.Z_ROUTE)
+                self.scene.addItem(item)
+                self._route_layer.append(item)
 
     def _draw_lap_line(self):
-        if not self.lap_start_point:
+        points = (self.navigation.lap_start_point, self.navigation.lap_end_point)
+        if points == self._lap_layer_points:
+            return
+        for item in self._lap_layer:
+            self.scene.removeItem(item)
+        self._lap_layer = []
+        self._lap_layer_points = points
+
+        if not self.navigation.lap_start_point:
             return
-        start_x, start_y = self._latlon_to_scene_point(*self.lap_start_point)
+        start_x, start_y = self._latlon_to_scene_point(*self.navigation.lap_start_point)
         if start_x is None or start_y is None:
             return
 
         start_marker = QGraphicsEllipseItem(start_x - 7, start_y - 7, 14, 14)
         start_marker.setPen(QPen(QColor("#ffffff"), 2))
         start_marker.setBrush(QBrush(QColor("#22c55e")))
-        self.scene.addItem(start_marker)
+        self._add_lap_item(start_marker)
         start_label = QGraphicsTextItem("Start")
         start_label.setDefaultTextColor(QColor("#ffffff"))
         start_label.setFont(QFont("", 9, QFont.Weight.Bold))
         start_label.setPos(start_x + 9, start_y - 22)
-        self.scene.addItem(start_label)
+        self._add_lap_item(start_label)
 
-        if not self.lap_end_point:
+        if not self.navigation.lap_end_point:
             return
-        end_x, end_y = self._latlon_to_scene_point(*self.lap_end_point)
+        end_x, end_y = self._latlon_to_scene_point(*self.navigation.lap_end_point)
         if end_x is None or end_y is None:
             return
 
         line = QGraphicsLineItem(start_x, start_y, end_x, end_y)
         line.setPen(QPen(QColor("#22c55e"), 5))
-        self.scene.addItem(line)
+        self._add_lap_item(line)
 
         end_marker = QGraphicsEllipseItem(end_x - 7, end_y - 7, 14, 14)
         end_marker.setPen(QPen(QColor("#ffffff"), 2))
         end_marker.setBrush(QBrush(QColor("#16a34a")))
-        self.scene.addItem(end_marker)
+        self._add_lap_item(end_marker)
         end_label = QGraphicsTextItem("End")
         end_label.setDefaultTextColor(QColor("#ffffff"))
         end_label.setFont(QFont("", 9, QFont.Weight.Bold))
         end_label.setPos(end_x + 9, end_y - 22)
-        self.scene.addItem(end_label)
+        self._add_lap_item(end_label)
 
-    def _draw_trail(self, base_tile_x, base_tile_y):
-        if len(self.trail) < 2:
+    def _add_lap_item(self, item):
+        item.setZValue(self.Z_LAP_LINE)
+        self.scene.addItem(item)
+        self._lap_layer.append(item)
+
+    def _draw_trail(self):
+        # One path item for the whole trail, drawn from the zoom's simplified
+        # points. New raw fixes extend the existing path; it is rebuilt only
+        # when a trail block is simplified, the trail is trimmed, or reset.
+        if self._trail_item is None:
+            self._trail_item = QGraphicsPathItem()
+            self._trail_item.setPen(QPen(QColor("#88c0d0"), 3))
+            self._trail_item.setZValue(self.Z_TRAIL)
+            self.scene.addItem(self._trail_item)
+
+        lats, lons, sealed = self.trail.drawing_points(self.zoom)
+        layout = (self.trail.revision, sealed)
+        drawn_layout, drawn = self._trail_drawn
+        if len(lats) < 2:
+            if drawn:
+                self._trail_item.setPath(QPainterPath())
+            self._trail_drawn = (layout, 0)
             return
-
-        pen = QPen(QColor("#88c0d0"), 3)
-        previous = None
-        for lat, lon in self.trail:
-            tile_x, tile_y = self._latlon_to_tile_fraction(lat, lon, self.zoom)
-            point = (
-                (tile_x - base_tile_x) * self.TILE_SIZE,
-                (tile_y - base_tile_y) * self.TILE_SIZE,
-            )
-            if previous is not None:
-                line = QGraphicsLineItem(previous[0], previous[1], point[0], point[1])
-                line.setPen(pen)
-                self.scene.addItem(line)
-            previous = point
+        if layout == drawn_layout and 2 <= drawn <= len(lats):
+            if drawn == len(lats):
+                return
+            path = self._trail_item.path()
+        else:
+            path = QPainterPath()
+            drawn = 0
+
+        tile_x, tile_y = world_pixels(lats[drawn:], lons[drawn:], self.zoom, self.TILE_SIZE)
+        xs = (tile_x - self.base_tile_x * self.TILE_SIZE).tolist()
+        ys = (tile_y - self.base_tile_y * self.TILE_SIZE).tolist()
+        if drawn == 0:
+            path.moveTo(xs[0], ys[0])
+            xs, ys = xs[1:], ys[1:]
+        for x, y in zip(xs, ys):
+            path.lineTo(x, y)
+        self._trail_item.setPath(path)
+        self._trail_drawn = (layout, len(lats))
 
     def _sample_points_for_drawing(self, points):
         if len(points) <= self.MAX_DRAW_ROUTE_POINTS_PER_SEGMENT:
@@ -1040,86 +1241,288 @@ class GPSMapTab(QWidget):
         if key in self.tile_cache or key in self.pending_tiles:
             return
 
+        # The tile pack is a local SQLite read, so packed tiles are shown
+        # immediately without going through the network or its disk cache.
+        if self.tile_pack is not None:
+            data = self.tile_pack.get(*key)
+            if data is not None and self._show_tile(key, data):
+                self._update_tile_status()
+                return
+
         self.pending_tiles.add(key)
-        _zoom, normalized_x, normalized_y = key
-        url = QUrl(f"https://tile.openstreetmap.org/{self.zoom}/{normalized_x}/{normalized_y}.png")
-        request = QNetworkRequest(url)
-        request.setRawHeader(b"User-Agent", b"Python-Telem/1.0")
-        request.setAttribute(QNetworkRequest.Attribute.CacheLoadControlAttribute, QNetworkRequest.CacheLoadControl.PreferCache)
-        request.setAttribute(QNetworkRequest.Attribute.CacheSaveControlAttribute, True)
-        reply = self.network.get(request)
+        reply = self.network.get(self._tile_request(key))
         reply.setProperty("tile_key", key)
         self.pending_replies[key] = reply
         self._update_tile_status()
 
+    def _tile_request(self, key, url_template=None):
+        zoom, tile_x, tile_y = key
+        url = (url_template or self.TILE_URL).format(z=zoom, x=tile_x, y=tile_y)
+        request = QNetworkRequest(QUrl(url))
+        request.setRawHeader(b"User-Agent", b"Python-Telem/1.0")
+        request.setAttribute(QNetworkRequest.Attribute.CacheLoadControlAttribute, QNetworkRequest.CacheLoadControl.PreferCache)
+        request.setAttribute(QNetworkRequest.Attribute.CacheSaveControlAttribute, True)
+        return request
+
+    def _show_tile(self, key, data):
+        pixmap = self.tile_cache.put(key, data)
+        if pixmap is None:
+            return False
+        if key in self.visible_tile_keys:
+            # At low zooms the view can show one tile more than once.
+            for position, item in self.tile_items.items():
+                if self._tile_key(*position) == key:
+                    item.setPixmap(pixmap)
+        return True
+
     def _on_tile_reply(self, reply):
+        pack_key = reply.property("tile_pack_key")
+        if pack_key is not None:
+            self._on_tile_pack_reply(reply, pack_key)
+            return
         key = reply.property("tile_key")
         self.pending_tiles.discard(key)
         self.pending_replies.pop(key, None)
         if reply.error() == QNetworkReply.NetworkError.NoError:
-            pixmap = QPixmap()
-            if pixmap.loadFromData(reply.readAll()):
-                if pixmap.width() != self.TILE_SIZE or pixmap.height() != self.TILE_SIZE:
-                    pixmap = pixmap.scaled(
-                        self.TILE_SIZE,
-                        self.TILE_SIZE,
-                        Qt.AspectRatioMode.IgnoreAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation,
-                    )
-                self._store_cached_tile(key, pixmap)
-                if key in self.visible_tile_keys:
-                    item = self.tile_items.get(key)
-                    if item is not None:
-                        item.setPixmap(pixmap)
+            self._show_tile(key, reply.readAll())
         reply.deleteLater()
         self._update_tile_status()
 
     def _cancel_hidden_tile_requests(self):
         for key, reply in list(self.pending_replies.items()):
-            if key not in self.visible_tile_keys:
+            if key not in self.visible_tile_keys and key not in self.prefetch_tile_keys:
                 reply.abort()
 
+    def _prefetch_ahead(self, previous, current, speed_mph):
+        # Request the tiles the vehicle will reach within PREFETCH_SECONDS at
+        # its current speed and heading, starting at the edge of the visible
+        # tiles, so following the car does not show placeholders.
+        speed_mph = self._safe_float(speed_mph)
+        if speed_mph < self.PREFETCH_MIN_SPEED_MPH:
+            return
+        start_x, start_y = self._latlon_to_tile_fraction(previous[0], previous[1], self.zoom)
+        tile_x, tile_y = self._latlon_to_tile_fraction(current[0], current[1], self.zoom)
+        meters_per_tile = 40075016.686 * math.cos(math.radians(current[0])) / (1 << self.zoom)
+        ahead_tiles = speed_mph * self.METERS_PER_MILE / 3600.0 * self.PREFETCH_SECONDS / meters_per_tile
+        center_x, center_y = self._latlon_to_tile_fraction(self.center_lat, self.center_lon, self.zoom)
+        # The visible square spans TILE_RADIUS tiles around the view centre.
+        offset = math.hypot(tile_x - center_x, tile_y - center_y)
+        positions = tiles_ahead(
+            tile_x,
+            tile_y,
+            tile_x - start_x,
+            tile_y - start_y,
+            self.TILE_RADIUS * math.sqrt(2.0) + offset + ahead_tiles,
+            limit=self.PREFETCH_MAX_TILES * 4,
+            start_tiles=max(0.0, self.TILE_RADIUS - offset),
+        )
+        self.prefetch_tile_keys = set()
+        for position in positions:
+            key = self._tile_key(*position)
+            if key in self.visible_tile_keys:
+                continue
+            self.prefetch_tile_keys.add(key)
+            self._request_tile(*position)
+            if len(self.prefetch_tile_keys) >= self.PREFETCH_MAX_TILES:
+                break
+
     def _update_tile_status(self):
         if not hasattr(self, "tile_status_label"):
             return
         visible_cached = len(self.visible_tile_keys.intersection(self.tile_cache.keys()))
-        self.tile_status_label.setText(
+        text = (
             f"Map tiles: {visible_cached}/{len(self.visible_tile_keys)} visible cached, "
-            f"{len(self.pending_tiles)} loading, {len(self.tile_cache)} in memory"
+            f"{len(self.pending_tiles)} loading, {len(self.tile_cache.decoded)} decoded, "
+            f"{self.tile_cache.compressed_bytes / (1024 * 1024):.1f} MB compressed"
         )
+        if self.tile_pack_progress is not None:
+            saved, failed, total = self.tile_pack_progress
+            text += f" | Building tile pack: {saved + failed}/{total}"
+            if failed:
+                text += f" ({failed} failed)"
+        elif self.tile_pack is not None:
+            text += f" | Tile pack: {os.path.basename(self.tile_pack.path)}"
+        self.tile_status_label.setText(text)
 
     def _tile_key(self, tile_x, tile_y):
         max_tile = 1 << self.zoom
         return (self.zoom, tile_x % max_tile, tile_y)
 
     def _get_cached_tile(self, key):
-        pixmap = self.tile_cache.get(key)
-        if pixmap is not None:
-            self.tile_cache.move_to_end(key)
-        return pixmap
-
-    def _store_cached_tile(self, key, pixmap):
-        self.tile_cache[key] = pixmap
-        self.tile_cache.move_to_end(key)
-        self._trim_tile_cache()
-
-    def _trim_tile_cache(self):
-        protected = set(self.visible_tile_keys)
-        evicted = False
-        while len(self.tile_cache) > self.MAX_MEMORY_TILES:
-            old_key, _old_pixmap = next(iter(self.tile_cache.items()))
-            if old_key in protected and len(protected) < len(self.tile_cache):
-                self.tile_cache.move_to_end(old_key)
-                continue
-            self.tile_cache.popitem(last=False)
-            evicted = True
-        if evicted:
-            QPixmapCache.clear()
+        return self.tile_cache.get(key)
+
+    def _open_saved_tile_pack(self):
+        path = str(QSettings("SunseekerSolarCarProject", "Python-Telem").value("map/tile_pack_path", "") or "")
+        if path and os.path.isfile(path):
+            try:
+                self._use_tile_pack(path)
+            except Exception as exc:
+                logging.getLogger(__name__).warning("Could not open map tile pack %s: %s", path, exc)
+
+    def _use_tile_pack(self, path):
+        pack = MBTilesPack(path)
+        if self.tile_pack is not None:
+            self.tile_pack.close()
+        self.tile_pack = pack
+        QSettings("SunseekerSolarCarProject", "Python-Telem").setValue("map/tile_pack_path", pack.path)
+
+    def _open_tile_pack(self):
+        if self.tile_pack_progress is not None:
+            QMessageBox.information(self, "Map Tile Pack", "Wait for the tile pack build to finish.")
+            return
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Open Map Tile Pack",
+            self._tile_pack_directory(),
+            "MBTiles Files (*.mbtiles);;All Files (*)",
+        )
+        if not file_path:
+            return
+        try:
+            self._use_tile_pack(file_path)
+        except Exception as exc:
+            QMessageBox.warning(self, "Map Tile Pack", f"Could not open tile pack:\n{exc}")
+            return
+        # Swap placeholders for packed tiles right away.
+        for position in list(self.tile_items):
+            self._request_tile(*position)
+        self._update_tile_status()
+
+    def _tile_pack_directory(self):
+        cache_root = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
+        if not cache_root:
+            cache_root = os.path.join(os.path.expanduser("~"), ".local", "share", "Python-Telem")
+        return os.path.join(cache_root, "tile_packs")
+
+    @staticmethod
+    def _parse_zoom_range(text):
+        # "12-17" or "15" -> range of zooms, or None when it is not valid.
+        parts = [part.strip() for part in str(text).split("-")]
+        if not 1 <= len(parts) <= 2 or not all(part.isdigit() for part in parts):
+            return None
+        low, high = int(parts[0]), int(parts[-1])
+        if not 0 <= low <= high <= 19:
+            return None
+        return range(low, high + 1)
+
+    def _build_tile_pack(self):
+        # Bulk downloads are not allowed from the live map's OpenStreetMap
+        # server, so packs come from a tile server configured here. Tiles are
+        # still fetched a couple at a time and the pack size is capped.
+        if self.tile_pack_progress is not None:
+            QMessageBox.information(self, "Map Tile Pack", "A tile pack is already being built.")
+            return
+        if not self.navigation.route_segments:
+            QMessageBox.information(self, "Map Tile Pack", "Load GPX route files first.")
+            return
+        settings = QSettings("SunseekerSolarCarProject", "Python-Telem")
+        url_template, accepted = QInputDialog.getText(
+            self,
+            "Map Tile Pack",
+            "Tile server URL for the pack, with {z}/{x}/{y} placeholders.\n"
+            "It must allow bulk downloads; tile.openstreetmap.org does not.",
+            text=str(settings.value("map/tile_pack_url", "") or ""),
+        )
+        if not accepted:
+            return
+        url_template = url_template.strip()
+        error = tile_source_error(url_template)
+        if error:
+            QMessageBox.warning(self, "Map Tile Pack", error)
+            return
+        settings.setValue("map/tile_pack_url", url_template)
+        text, accepted = QInputDialog.getText(
+            self, "Map Tile Pack", "Zoom levels (for example 12-17):", text=self.TILE_PACK_ZOOMS
+        )
+        if not accepted:
+            return
+        zooms = self._parse_zoom_range(text)
+        if zooms is None:
+            QMessageBox.warning(self, "Map Tile Pack", "Enter a zoom level or range between 0 and 19.")
+            return
+        default_path = self.tile_pack.path if self.tile_pack is not None else os.path.join(
+            self._tile_pack_directory(), "route.mbtiles"
+        )
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Save Map Tile Pack",
+            default_path,
+            "MBTiles Files (*.mbtiles);;All Files (*)",
+        )
+        if not file_path:
+            return
+
+        try:
+            self._use_tile_pack(file_path)
+        except Exception as exc:
+            QMessageBox.warning(self, "Map Tile Pack", f"Could not open tile pack:\n{exc}")
+            return
+        route_lines = [segment["points"] for segment in self.navigation.route_segments]
+        tiles = corridor_tiles(route_lines, zooms, self.TILE_PACK_BUFFER_TILES, self.TILE_SIZE)
+        missing = self.tile_pack.missing(tiles)
+        if not missing:
+            QMessageBox.information(self, "Map Tile Pack", f"All {len(tiles)} route tiles are already in the pack.")
+            return
+        if len(missing) > self.TILE_PACK_MAX_TILES:
+            QMessageBox.warning(
+                self,
+                "Map Tile Pack",
+                f"{len(missing)} tiles are missing, more than the {self.TILE_PACK_MAX_TILES} allowed "
+                "in one build. Use a narrower zoom range.",
+            )
+            return
+        host = QUrl(url_template).host()
+        answer = QMessageBox.question(
+            self,
+            "Map Tile Pack",
+            f"Download {len(missing)} of {len(tiles)} route tiles for zoom {zooms[0]}-{zooms[-1]} "
+            f"from {host}?",
+        )
+        if answer != QMessageBox.StandardButton.Yes:
+            return
 
-    def _distance_px(self, first, second):
-        first_x, first_y = self._latlon_to_tile_fraction(first[0], first[1], self.zoom)
-        second_x, second_y = self._latlon_to_tile_fraction(second[0], second[1], self.zoom)
-        return math.hypot(first_x - second_x, first_y - second_y) * self.TILE_SIZE
+        lats = [point[0] for points in route_lines for point in points]
+        lons = [point[1] for points in route_lines for point in points]
+        self.tile_pack.set_metadata(
+            name=os.path.splitext(os.path.basename(file_path))[0],
+            format="png",
+            type="baselayer",
+            minzoom=zooms[0],
+            maxzoom=zooms[-1],
+            bounds=f"{min(lons)},{min(lats)},{max(lons)},{max(lats)}",
+            attribution=f"Tiles from {host}",
+        )
+        self.tile_pack_url = url_template
+        self.tile_pack_queue = deque(missing)
+        self.tile_pack_progress = (0, 0, len(missing))
+        self._pump_tile_pack()
+        self._update_tile_status()
+
+    def _pump_tile_pack(self):
+        while self.tile_pack_queue and len(self.tile_pack_replies) < self.TILE_PACK_CONCURRENT_REQUESTS:
+            key = self.tile_pack_queue.popleft()
+            reply = self.network.get(self._tile_request(key, self.tile_pack_url))
+            reply.setProperty("tile_pack_key", key)
+            self.tile_pack_replies[key] = reply
+
+    def _on_tile_pack_reply(self, reply, key):
+        self.tile_pack_replies.pop(key, None)
+        saved, failed, total = self.tile_pack_progress or (0, 0, 0)
+        if reply.error() == QNetworkReply.NetworkError.NoError and self.tile_pack is not None:
+            self.tile_pack.put(*key, bytes(reply.readAll()), commit=False)
+            saved += 1
+            if saved % self.TILE_PACK_COMMIT_EVERY == 0:
+                self.tile_pack.commit()
+        else:
+            failed += 1
+        reply.deleteLater()
+        self.tile_pack_progress = (saved, failed, total)
+        self._pump_tile_pack()
+        if not self.tile_pack_replies and not self.tile_pack_queue:
+            if self.tile_pack is not None:
+                self.tile_pack.commit()
+            self.tile_pack_progress = None
+        self._update_tile_status()
 
     def _latlon_to_scene_point(self, lat, lon):
         if lat is None or lon is None:
@@ -1157,437 +1560,96 @@ class GPSMapTab(QWidget):
             QMessageBox.warning(self, "GPX Route", "The GPX files did not contain enough route or track points.")
             return
 
-        self.route_segments = segments
-        self.route_points = [point for segment in segments for point in segment["points"]]
-        self.route_flat_positions = [
-            (segment_index, point_index, point)
-            for segment_index, segment in enumerate(segments)
-            for point_index, point in enumerate(segment["points"])
-        ]
-        self.route_last_flat_index = None
-        self.route_progress_miles = 0.0
-        total_miles = sum(segment["length_miles"] for segment in segments)
+        self.navigation.set_route(segments)
+        total_miles = self.navigation.route_index.total_miles
         self.route_label.setText(
-            f"Route: {len(segments)} segment(s), {len(self.route_points)} points, {total_miles:.1f} mi"
+            f"Route: {len(segments)} segment(s), {len(self.navigation.route_points)} points, {total_miles:.1f} mi"
         )
         self._center_on_route()
 
     def _center_on_route(self):
-        if not self.route_points:
+        if not self.navigation.route_points:
             return
-        avg_lat = sum(point[0] for point in self.route_points) / len(self.route_points)
-        avg_lon = sum(point[1] for point in self.route_points) / len(self.route_points)
-        self.zoom = self._best_zoom_for_points(self.route_points)
+        avg_lat = sum(point[0] for point in self.navigation.route_points) / len(self.navigation.route_points)
+        avg_lon = sum(point[1] for point in self.navigation.route_points) / len(self.navigation.route_points)
+        self.zoom = self._best_zoom_for_points(self.navigation.route_points)
         self.follow_vehicle_checkbox.setChecked(False)
         self._set_map_center(avg_lat, avg_lon, status="Route preview")
 
     def _build_route_segment(self, file_path, points):
-        cumulative = [0.0]
-        for previous, current in zip(points, points[1:]):
-            cumulative.append(cumulative[-1] + self._haversine_miles(previous[0], previous[1], current[0], current[1]))
-        name = os.path.basename(file_path)
-        if name.lower().endswith(".gpx"):
-            name = name[:-4]
-        return {
-            "name": name,
-            "points": points,
-            "cumulative_miles": cumulative,
-            "length_miles": cumulative[-1],
-        }
+        return build_route_segment(file_path, points)
 
     def _build_route_metrics(self, speed_mph, lat=None, lon=None):
-        # Route metrics are returned as telemetry fields so the normal GUI and
-        # CSV paths can display them without a GPS-map-specific data channel.
-        defaults = {
-            TelemetryKey.NAV_ROUTE_NAME.value[0]: "N/A",
-            TelemetryKey.NAV_CHECKPOINT_NAME.value[0]: "N/A",
-            TelemetryKey.NAV_ROUTE_DISTANCE_REMAINING_MI.value[0]: "N/A",
-            TelemetryKey.NAV_ROUTE_DISTANCE_TRAVELED_MI.value[0]: "N/A",
-            TelemetryKey.NAV_CHECKPOINT_DISTANCE_REMAINING_MI.value[0]: "N/A",
-            TelemetryKey.NAV_CHECKPOINT_ETA.value[0]: "N/A",
-        }
-        route_lat = self.vehicle_lat if lat is None else lat
-        route_lon = self.vehicle_lon if lon is None else lon
-        if route_lat is None or route_lon is None or not self.route_segments:
-            return defaults
-
-        nearest = self._nearest_route_position(route_lat, route_lon)
-        if nearest is None:
-            return defaults
-
-        nearest_segment_index, point_index = nearest
-        miles_before_nearest = sum(
-            item["length_miles"] for item in self.route_segments[:nearest_segment_index]
-        )
-        candidate_progress = (
-            miles_before_nearest
-            + self.route_segments[nearest_segment_index]["cumulative_miles"][point_index]
-        )
-        total_route_miles = sum(item["length_miles"] for item in self.route_segments)
-        if self.race_mode == self.RACE_MODE_ASC:
-            # ASC is point-to-point: never move route progress backwards when
-            # GPS jitters or a route doubles back near an earlier point.
-            self.route_progress_miles = min(
-                total_route_miles, max(self.route_progress_miles, candidate_progress)
-            )
-        else:
-            self.route_progress_miles = min(total_route_miles, candidate_progress)
-
-        segment_index = len(self.route_segments) - 1
-        miles_before_segment = 0.0
-        for index, item in enumerate(self.route_segments):
-            segment_end = miles_before_segment + item["length_miles"]
-            if self.route_progress_miles <= segment_end or index == len(self.route_segments) - 1:
-                segment_index = index
-                break
-            miles_before_segment = segment_end
-
-        segment = self.route_segments[segment_index]
-        segment_progress = max(0.0, self.route_progress_miles - miles_before_segment)
-        checkpoint_remaining = max(0.0, segment["length_miles"] - segment_progress)
-        route_remaining = max(0.0, total_route_miles - self.route_progress_miles)
-        eta = self._format_eta(checkpoint_remaining, speed_mph)
-        route_name = " + ".join(segment["name"] for segment in self.route_segments)
-
-        self.route_label.setText(
-            f"Route: {route_name} | traveled {self.route_progress_miles:.1f} mi | "
-            f"remaining {route_remaining:.1f} mi | next {segment['name']}: "
-            f"{checkpoint_remaining:.1f} mi | ETA {eta}"
-        )
-
-        return {
-            TelemetryKey.NAV_ROUTE_NAME.value[0]: route_name,
-            TelemetryKey.NAV_CHECKPOINT_NAME.value[0]: segment["name"],
-            TelemetryKey.NAV_ROUTE_DISTANCE_REMAINING_MI.value[0]: round(route_remaining, 2),
-            TelemetryKey.NAV_ROUTE_DISTANCE_TRAVELED_MI.value[0]: round(self.route_progress_miles, 2),
-            TelemetryKey.NAV_CHECKPOINT_DISTANCE_REMAINING_MI.value[0]: round(checkpoint_remaining, 2),
-            TelemetryKey.NAV_CHECKPOINT_ETA.value[0]: eta,
-        }
+        if lat is None or lon is None:
+            lat, lon = self.vehicle_lat, self.vehicle_lon
+        metrics = self.navigation.route_metrics(speed_mph, lat=lat, lon=lon)
+        self._refresh_route_label(metrics)
+        return metrics
 
     def _build_navigation_metrics(self, speed_mph, update_laps=False, lat=None, lon=None):
-        distance_increment = 0.0
-        if update_laps and lat is not None and lon is not None:
-            distance_increment = self._update_trip_distance(lat, lon, speed_mph)
-            if self.race_mode == self.RACE_MODE_FSGP:
-                self._update_lap_counter(
-                    lat,
-                    lon,
-                    speed_mph,
-                    distance_increment_miles=distance_increment,
-                )
-        metrics = self._build_route_metrics(speed_mph, lat=lat, lon=lon)
-        metrics.update(self._build_lap_metrics())
-        metrics.update(self._build_distance_metrics())
+        metrics = self.navigation.metrics(speed_mph, update_laps=update_laps, lat=lat, lon=lon)
+        self._refresh_navigation_labels(metrics)
         return metrics
 
-    def _build_lap_metrics(self):
-        current_seconds = None
-        if self.lap_started_at is not None:
-            current_seconds = time.monotonic() - self.lap_started_at
-        average_seconds = self._average_lap_seconds()
-        current_speed = self._current_lap_average_speed(current_seconds)
-        completed_speeds = self._completed_lap_average_speeds()
-        last_speed = completed_speeds[-1] if completed_speeds else None
-        numeric_speeds = [speed for speed in completed_speeds if speed is not None]
-        best_speed = max(numeric_speeds) if numeric_speeds else None
-        average_speed = self._average_completed_lap_speed()
-        self._refresh_lap_label(current_seconds=current_seconds)
-        return {
-            TelemetryKey.NAV_LAP_COUNT.value[0]: self.lap_count,
-            TelemetryKey.NAV_CURRENT_LAP_TIME.value[0]: self._format_duration(current_seconds),
-            TelemetryKey.NAV_LAST_LAP_TIME.value[0]: self._format_duration(self.last_lap_seconds),
-            TelemetryKey.NAV_BEST_LAP_TIME.value[0]: self._format_duration(self.best_lap_seconds),
-            TelemetryKey.NAV_AVERAGE_LAP_TIME.value[0]: self._format_duration(average_seconds),
-            TelemetryKey.NAV_CURRENT_LAP_DISTANCE_MI.value[0]: round(self.current_lap_distance_miles, 3),
-            TelemetryKey.NAV_CURRENT_LAP_AVERAGE_SPEED_MPH.value[0]: self._rounded_or_na(current_speed),
-            TelemetryKey.NAV_LAST_LAP_AVERAGE_SPEED_MPH.value[0]: self._rounded_or_na(last_speed),
-            TelemetryKey.NAV_BEST_LAP_AVERAGE_SPEED_MPH.value[0]: self._rounded_or_na(best_speed),
-            TelemetryKey.NAV_AVERAGE_LAP_SPEED_MPH.value[0]: self._rounded_or_na(average_speed),
-            TelemetryKey.NAV_LAP_STATUS.value[0]: (
-                "ASC route mode" if self.race_mode == self.RACE_MODE_ASC else self.lap_status
-            ),
-        }
-
-    def _average_lap_seconds(self):
-        if len(self.completed_lap_seconds) < 3:
-            return None
-        return sum(self.completed_lap_seconds) / len(self.completed_lap_seconds)
-
-    def _completed_lap_average_speeds(self):
-        speeds = []
-        for index, seconds in enumerate(self.completed_lap_seconds):
-            if seconds <= 0:
-                speeds.append(None)
-                continue
-            distance = self.track_lap_length_miles
-            if distance <= 0 and index < len(self.completed_lap_distances_miles):
-                distance = self.completed_lap_distances_miles[index]
-            speeds.append(distance * 3600.0 / seconds if distance > 0 else None)
-        return speeds
-
-    def _average_completed_lap_speed(self):
-        if len(self.completed_lap_seconds) < 3:
-            return None
-        total_seconds = sum(self.completed_lap_seconds)
-        if total_seconds <= 0:
-            return None
-        if self.track_lap_length_miles > 0:
-            total_distance = self.track_lap_length_miles * len(self.completed_lap_seconds)
-        else:
-            total_distance = sum(self.completed_lap_distances_miles)
-        return total_distance * 3600.0 / total_seconds if total_distance > 0 else None
-
-    def _current_lap_average_speed(self, current_seconds=None):
-        if current_seconds is None or current_seconds <= 0 or self.lap_started_at is None:
-            return None
-        if self.current_lap_distance_miles <= 0:
-            return None
-        return self.current_lap_distance_miles * 3600.0 / current_seconds
-
-    def _build_distance_metrics(self):
-        session_average = self._session_average_speed()
-        moving_average = self._day_moving_average_speed()
-        day_elapsed = self._day_elapsed_seconds()
-        stopped_seconds = max(0.0, day_elapsed - self.day_moving_seconds)
-        official_distance = self._fsgp_official_distance()
-        time_remaining, projected_laps, projected_distance = self._fsgp_projection()
-        self._refresh_distance_labels(session_average=session_average)
-        return {
-            TelemetryKey.NAV_RACE_MODE.value[0]: self.race_mode,
-            TelemetryKey.NAV_GPS_TRIP_DISTANCE_MI.value[0]: round(self.trip_distance_miles, 3),
-            TelemetryKey.NAV_SESSION_AVERAGE_SPEED_MPH.value[0]: self._rounded_or_na(session_average),
-            TelemetryKey.NAV_DAY_MOVING_AVERAGE_SPEED_MPH.value[0]: self._rounded_or_na(moving_average),
-            TelemetryKey.NAV_DAY_MAX_SPEED_MPH.value[0]: round(self.day_max_speed_mph, 2),
-            TelemetryKey.NAV_DAY_ELAPSED_TIME.value[0]: self._format_duration(day_elapsed),
-            TelemetryKey.NAV_DAY_MOVING_TIME.value[0]: self._format_duration(self.day_moving_seconds),
-            TelemetryKey.NAV_DAY_STOPPED_TIME.value[0]: self._format_duration(stopped_seconds),
-            TelemetryKey.NAV_FSGP_LAP_LENGTH_MI.value[0]: round(self.track_lap_length_miles, 3),
-            TelemetryKey.NAV_FSGP_OFFICIAL_DISTANCE_MI.value[0]: round(official_distance, 3),
-            TelemetryKey.NAV_FSGP_DAY_DURATION_H.value[0]: round(self.fsgp_day_duration_hours, 1),
-            TelemetryKey.NAV_FSGP_TIME_REMAINING.value[0]: self._format_duration(time_remaining),
-            TelemetryKey.NAV_FSGP_PROJECTED_TOTAL_LAPS.value[0]: (
-                "N/A" if projected_laps is None else projected_laps
-            ),
-            TelemetryKey.NAV_FSGP_PROJECTED_DISTANCE_MI.value[0]: self._rounded_or_na(
-                projected_distance, digits=2
-            ),
-        }
-
-    def _update_trip_distance(self, lat, lon, speed_mph):
-        """Accumulate filtered GPS distance and return this sample's increment."""
-        current_point = (lat, lon)
-        now = time.monotonic()
-        speed = max(0.0, self._safe_float(speed_mph))
-        self.day_max_speed_mph = max(self.day_max_speed_mph, speed)
-        if self.previous_trip_point is None or self.previous_trip_at is None:
-            self.previous_trip_point = current_point
-            self.previous_trip_at = now
-            if speed >= self.MINIMUM_DISTANCE_SPEED_MPH:
-                self.trip_started_at = now
-            return 0.0
-
-        elapsed = max(0.0, now - self.previous_trip_at)
-        segment_miles = self._haversine_miles(
-            self.previous_trip_point[0],
-            self.previous_trip_point[1],
-            lat,
-            lon,
-        )
-        self.previous_trip_point = current_point
-        self.previous_trip_at = now
-
-        if speed < self.MINIMUM_DISTANCE_SPEED_MPH:
-            return 0.0
-        if self.trip_started_at is None:
-            self.trip_started_at = now
-        elif elapsed <= self.MAX_MOVING_TIME_SAMPLE_GAP_SECONDS:
-            self.day_moving_seconds += elapsed
-
-        max_segment_miles = (
-            self.GPS_SEGMENT_BASE_TOLERANCE_MILES
-            + max(5.0, speed) * self.GPS_SEGMENT_SPEED_FACTOR * max(0.25, elapsed) / 3600.0
-        )
-        if segment_miles > max_segment_miles:
-            return 0.0
-
-        self.trip_distance_miles += segment_miles
-        return segment_miles
-
-    def _session_average_speed(self):
-        if self.trip_started_at is None or self.trip_distance_miles <= 0:
-            return None
-        elapsed = self._day_elapsed_seconds()
-        if elapsed <= 0:
-            return None
-        return self.trip_distance_miles * 3600.0 / elapsed
-
-    def _day_elapsed_seconds(self):
-        if self.trip_started_at is None:
-            return 0.0
-        return max(0.0, time.monotonic() - self.trip_started_at)
-
-    def _day_moving_average_speed(self):
-        if self.trip_distance_miles <= 0 or self.day_moving_seconds <= 0:
-            return None
-        return self.trip_distance_miles * 3600.0 / self.day_moving_seconds
-
-    def _fsgp_official_distance(self):
-        if self.track_lap_length_miles > 0:
-            return self.lap_count * self.track_lap_length_miles
-        return sum(self.completed_lap_distances_miles)
-
-    def _fsgp_projection(self):
-        if self.race_mode != self.RACE_MODE_FSGP or self.fsgp_day_duration_hours <= 0:
-            return None, None, None
-        scheduled_seconds = self.fsgp_day_duration_hours * 3600.0
-        remaining_seconds = max(0.0, scheduled_seconds - self._day_elapsed_seconds())
-        average_lap_seconds = self._average_lap_seconds()
-        if average_lap_seconds is None or average_lap_seconds <= 0:
-            return remaining_seconds, None, None
-
-        current_progress_seconds = 0.0
-        if self.lap_started_at is not None:
-            current_progress_seconds = min(
-                max(0.0, time.monotonic() - self.lap_started_at),
-                average_lap_seconds,
-            )
-        additional_laps = 0
-        if remaining_seconds > 0:
-            additional_laps = int(
-                (remaining_seconds + current_progress_seconds) // average_lap_seconds
-            )
-        projected_total_laps = self.lap_count + additional_laps
-
-        lap_distance = self.track_lap_length_miles
-        if lap_distance <= 0 and self.completed_lap_distances_miles:
-            lap_distance = sum(self.completed_lap_distances_miles) / len(
-                self.completed_lap_distances_miles
-            )
-        projected_distance = (
-            projected_total_laps * lap_distance if lap_distance > 0 else None
-        )
-        return remaining_seconds, projected_total_laps, projected_distance
-
-    @staticmethod
-    def _rounded_or_na(value, digits=2):
-        return "N/A" if value is None else round(value, digits)
-
-    def _update_lap_counter(self, lat, lon, speed_mph, distance_increment_miles=0.0):
-        current_point = (lat, lon)
-        if not self._lap_line_ready():
-            self.previous_lap_point = current_point
-            self.lap_status = "Set start/end line"
-            return
-
-        if self.previous_lap_point is None:
-            self.previous_lap_point = current_point
-            self.lap_status = "Ready"
-            return
-
-        now = time.monotonic()
-        if self._safe_float(speed_mph) < 1.0:
-            self.previous_lap_point = current_point
-            self.lap_status = "Waiting for movement"
-            return
-
-        if self.lap_started_at is not None and distance_increment_miles > 0:
-            self.current_lap_distance_miles += distance_increment_miles
-
-        if (
-            self.lap_started_at is not None
-            and not self.lap_crossing_armed
-            and self._distance_to_lap_line_meters(current_point)
-            >= self.LAP_LINE_REARM_DISTANCE_METERS
-        ):
-            self.lap_crossing_armed = True
-
-        crossed = self._movement_crossed_lap_line(self.previous_lap_point, current_point)
-        crossing_direction = self._lap_line_crossing_direction(self.previous_lap_point, current_point)
-        self.previous_lap_point = current_point
-        if not crossed:
-            if self.lap_started_at is not None:
-                self.lap_status = "Timing"
-            return
-
-        if not self.lap_crossing_armed:
-            self.lap_status = "Crossing ignored: lap gate not rearmed"
-            return
-
-        if (
-            self.lap_crossing_direction is not None
-            and crossing_direction != 0
-            and crossing_direction != self.lap_crossing_direction
-        ):
-            self.lap_crossing_armed = False
-            self.lap_status = "Crossing ignored: wrong direction"
-            return
-
-        if (
-            self.last_crossing_at is not None
-            and now - self.last_crossing_at < self.LAP_CROSSING_COOLDOWN_SECONDS
-        ):
-            self.lap_status = "Crossing cooldown"
-            return
+    def _refresh_navigation_labels(self, metrics):
+        self._refresh_route_label(metrics)
+        self._refresh_lap_label()
+        self._refresh_distance_labels()
 
-        self.last_crossing_at = now
-        self.lap_crossing_armed = False
-        if self.lap_started_at is None:
-            self.lap_started_at = now
-            self.current_lap_distance_miles = 0.0
-            if crossing_direction != 0:
-                self.lap_crossing_direction = crossing_direction
-            self.lap_status = "Timing started"
+    def _refresh_route_label(self, metrics):
+        traveled = metrics.get(TelemetryKey.NAV_ROUTE_DISTANCE_TRAVELED_MI.value[0], "N/A")
+        if traveled == "N/A" or traveled is None:
             return
+        self.route_label.setText(
+            f"Route: {metrics.get(TelemetryKey.NAV_ROUTE_NAME.value[0])} | traveled {traveled:.1f} mi | "
+            f"remaining {metrics.get(TelemetryKey.NAV_ROUTE_DISTANCE_REMAINING_MI.value[0]):.1f} mi | "
+            f"next {metrics.get(TelemetryKey.NAV_CHECKPOINT_NAME.value[0])}: "
+            f"{metrics.get(TelemetryKey.NAV_CHECKPOINT_DISTANCE_REMAINING_MI.value[0]):.1f} mi | "
+            f"ETA {metrics.get(TelemetryKey.NAV_CHECKPOINT_ETA.value[0])}"
+        )
 
-        lap_seconds = now - self.lap_started_at
-        if lap_seconds < self.MINIMUM_LAP_SECONDS:
-            self.lap_status = (
-                f"Lap ignored: under {self.MINIMUM_LAP_SECONDS:.0f} seconds"
-            )
-            return
+    def _build_lap_metrics(self):
+        metrics = self.navigation.lap_metrics()
+        self._refresh_lap_label()
+        return metrics
 
-        self.lap_count += 1
-        self.last_lap_seconds = lap_seconds
-        self.completed_lap_seconds.append(lap_seconds)
-        self.completed_lap_distances_miles.append(self.current_lap_distance_miles)
-        if self.best_lap_seconds is None or lap_seconds < self.best_lap_seconds:
-            self.best_lap_seconds = lap_seconds
-        self.lap_started_at = now
-        self.current_lap_distance_miles = 0.0
-        self.lap_status = f"Lap {self.lap_count} complete"
+    def _build_distance_metrics(self):
+        metrics = self.navigation.distance_metrics()
+        self._refresh_distance_labels()
+        return metrics
 
     def _refresh_lap_label(self, current_seconds=None):
         if not hasattr(self, "lap_label"):
             return
-        if self.race_mode == self.RACE_MODE_ASC:
+        if self.navigation.race_mode == self.RACE_MODE_ASC:
             self.lap_label.setText("Laps: paused in ASC route mode")
             if hasattr(self, "lap_speed_label"):
                 self.lap_speed_label.setText("Lap speeds: N/A in ASC route mode")
             self._refresh_compact_summary()
             return
-        line_state = "line set" if self._lap_line_ready() else "set start/end line"
-        current = self._format_duration(current_seconds)
-        last = self._format_duration(self.last_lap_seconds)
-        best = self._format_duration(self.best_lap_seconds)
-        average = self._format_duration(self._average_lap_seconds())
+        line_state = "line set" if self.navigation.lap_line_ready() else "set start/end line"
+        current = format_duration(current_seconds)
+        last = format_duration(self.navigation.last_lap_seconds)
+        best = format_duration(self.navigation.best_lap_seconds)
+        average = format_duration(self.navigation.average_lap_seconds())
         self.lap_label.setText(
-            f"Laps: {self.lap_count} | Current {current} | Last {last} | "
-            f"Best {best} | Average {average} | {line_state} | {self.lap_status}"
+            f"Laps: {self.navigation.lap_count} | Current {current} | Last {last} | "
+            f"Best {best} | Average {average} | {line_state} | {self.navigation.lap_status}"
         )
         if hasattr(self, "lap_speed_label"):
-            completed_speeds = self._completed_lap_average_speeds()
-            current_speed = self._current_lap_average_speed(current_seconds)
+            completed_speeds = self.navigation.completed_lap_average_speeds()
+            current_speed = self.navigation.current_lap_average_speed(current_seconds)
             last_speed = completed_speeds[-1] if completed_speeds else None
             numeric_speeds = [speed for speed in completed_speeds if speed is not None]
             best_speed = max(numeric_speeds) if numeric_speeds else None
-            average_speed = self._average_completed_lap_speed()
+            average_speed = self.navigation.average_completed_lap_speed()
             self.lap_speed_label.setText(
                 "Lap speeds: Current {} | Last {} | Best {} | Average {} | Current distance {:.3f} mi".format(
                     self._format_speed(current_speed),
                     self._format_speed(last_speed),
                     self._format_speed(best_speed),
                     self._format_speed(average_speed),
-                    self.current_lap_distance_miles,
+                    self.navigation.current_lap_distance_miles,
                 )
             )
         self._refresh_compact_summary()
@@ -1596,24 +1658,24 @@ class GPSMapTab(QWidget):
         if not hasattr(self, "distance_label"):
             return
         if session_average is None:
-            session_average = self._session_average_speed()
+            session_average = self.navigation.session_average_speed()
         average_text = self._format_speed(session_average)
-        moving_average_text = self._format_speed(self._day_moving_average_speed())
-        elapsed_text = self._format_duration(self._day_elapsed_seconds())
-        moving_text = self._format_duration(self.day_moving_seconds)
+        moving_average_text = self._format_speed(self.navigation.day_moving_average_speed())
+        elapsed_text = format_duration(self.navigation.day_elapsed_seconds())
+        moving_text = format_duration(self.navigation.day_moving_seconds)
         if hasattr(self, "day_summary_label"):
             self.day_summary_label.setText(
                 f"Day averages: Overall {average_text} | Moving {moving_average_text} | "
-                f"Max {self.day_max_speed_mph:.2f} mph | Elapsed {elapsed_text} | Moving {moving_text}"
+                f"Max {self.navigation.day_max_speed_mph:.2f} mph | Elapsed {elapsed_text} | Moving {moving_text}"
             )
-        if self.race_mode == self.RACE_MODE_ASC:
+        if self.navigation.race_mode == self.RACE_MODE_ASC:
             route_text = (
-                f"{self.route_progress_miles:.2f} mi"
-                if self.route_segments
+                f"{self.navigation.route_progress_miles:.2f} mi"
+                if self.navigation.route_segments
                 else "no GPX loaded"
             )
             self.distance_label.setText(
-                f"Distance: GPS trip {self.trip_distance_miles:.2f} mi | "
+                f"Distance: GPS trip {self.navigation.trip_distance_miles:.2f} mi | "
                 f"ASC route progress {route_text} | Session average {average_text}"
             )
             if hasattr(self, "fsgp_projection_label"):
@@ -1624,23 +1686,23 @@ class GPSMapTab(QWidget):
             return
 
         source = (
-            f"{self.track_lap_length_miles:.3f} mi official lap"
-            if self.track_lap_length_miles > 0
+            f"{self.navigation.track_lap_length_miles:.3f} mi official lap"
+            if self.navigation.track_lap_length_miles > 0
             else "filtered GPS laps"
         )
         self.distance_label.setText(
-            f"Distance: GPS trip {self.trip_distance_miles:.2f} mi | "
-            f"FSGP completed {self._fsgp_official_distance():.2f} mi | "
+            f"Distance: GPS trip {self.navigation.trip_distance_miles:.2f} mi | "
+            f"FSGP completed {self.navigation.fsgp_official_distance():.2f} mi | "
             f"{source} | Session average {average_text}"
         )
         if hasattr(self, "fsgp_projection_label"):
-            time_remaining, projected_laps, projected_distance = self._fsgp_projection()
-            if self.fsgp_day_duration_hours <= 0:
+            time_remaining, projected_laps, projected_distance = self.navigation.fsgp_projection()
+            if self.navigation.fsgp_day_duration_hours <= 0:
                 projection_text = "set race-day duration"
             elif projected_laps is None:
                 projection_text = (
                     f"waiting for 3 completed laps | Time remaining "
-                    f"{self._format_duration(time_remaining)}"
+                    f"{format_duration(time_remaining)}"
                 )
             else:
                 distance_text = (
@@ -1648,7 +1710,7 @@ class GPSMapTab(QWidget):
                 )
                 projection_text = (
                     f"{projected_laps} total laps possible | {distance_text} | "
-                    f"Time remaining {self._format_duration(time_remaining)}"
+                    f"Time remaining {format_duration(time_remaining)}"
                 )
             self.fsgp_projection_label.setText(f"FSGP projection: {projection_text}")
         self._refresh_compact_summary()
@@ -1656,30 +1718,30 @@ class GPSMapTab(QWidget):
     def _refresh_compact_summary(self):
         if not hasattr(self, "compact_summary_label"):
             return
-        day_average = self._format_speed(self._session_average_speed())
-        if self.race_mode == self.RACE_MODE_ASC:
-            if self.route_segments:
-                route_total = sum(item["length_miles"] for item in self.route_segments)
-                route_progress = f"{self.route_progress_miles:.1f}/{route_total:.1f} mi"
+        day_average = self._format_speed(self.navigation.session_average_speed())
+        if self.navigation.race_mode == self.RACE_MODE_ASC:
+            if self.navigation.route_segments:
+                route_total = self.navigation.current_route_index().total_miles
+                route_progress = f"{self.navigation.route_progress_miles:.1f}/{route_total:.1f} mi"
             else:
                 route_progress = "no GPX"
             self.compact_summary_label.setText(
                 f"<b>ASC</b> &nbsp; Route {route_progress} &nbsp;|&nbsp; "
-                f"GPS trip {self.trip_distance_miles:.1f} mi &nbsp;|&nbsp; "
+                f"GPS trip {self.navigation.trip_distance_miles:.1f} mi &nbsp;|&nbsp; "
                 f"Day average {day_average}"
             )
             return
 
         current_seconds = (
-            None if self.lap_started_at is None else time.monotonic() - self.lap_started_at
+            None if self.navigation.lap_started_at is None else time.monotonic() - self.navigation.lap_started_at
         )
-        _remaining, projected_laps, _projected_distance = self._fsgp_projection()
+        _remaining, projected_laps, _projected_distance = self.navigation.fsgp_projection()
         projection = "--" if projected_laps is None else str(projected_laps)
         self.compact_summary_label.setText(
-            f"<b>FSGP</b> &nbsp; Lap {self.lap_count} &nbsp;|&nbsp; "
-            f"Current {self._format_duration(current_seconds)} &nbsp;|&nbsp; "
+            f"<b>FSGP</b> &nbsp; Lap {self.navigation.lap_count} &nbsp;|&nbsp; "
+            f"Current {format_duration(current_seconds)} &nbsp;|&nbsp; "
             f"Day average {day_average} &nbsp;|&nbsp; "
-            f"Official {self._fsgp_official_distance():.1f} mi &nbsp;|&nbsp; "
+            f"Official {self.navigation.fsgp_official_distance():.1f} mi &nbsp;|&nbsp; "
             f"Projected laps {projection}"
         )
 
@@ -1687,113 +1749,6 @@ class GPSMapTab(QWidget):
     def _format_speed(speed):
         return "N/A" if speed is None else f"{speed:.2f} mph"
 
-    def _lap_line_ready(self):
-        return self.lap_start_point is not None and self.lap_end_point is not None
-
-    def _movement_crossed_lap_line(self, previous_point, current_point):
-        ref_lat = (self.lap_start_point[0] + self.lap_end_point[0] + previous_point[0] + current_point[0]) / 4.0
-        ref_lon = (self.lap_start_point[1] + self.lap_end_point[1] + previous_point[1] + current_point[1]) / 4.0
-        a = self._project_to_meters(previous_point, ref_lat, ref_lon)
-        b = self._project_to_meters(current_point, ref_lat, ref_lon)
-        c = self._project_to_meters(self.lap_start_point, ref_lat, ref_lon)
-        d = self._project_to_meters(self.lap_end_point, ref_lat, ref_lon)
-        return self._segments_intersect(a, b, c, d)
-
-    def _lap_line_crossing_direction(self, previous_point, current_point):
-        """Return the side-to-side direction of a lap-line crossing."""
-        ref_lat = (self.lap_start_point[0] + self.lap_end_point[0]) / 2.0
-        ref_lon = (self.lap_start_point[1] + self.lap_end_point[1]) / 2.0
-        start = self._project_to_meters(self.lap_start_point, ref_lat, ref_lon)
-        end = self._project_to_meters(self.lap_end_point, ref_lat, ref_lon)
-        previous = self._project_to_meters(previous_point, ref_lat, ref_lon)
-        current = self._project_to_meters(current_point, ref_lat, ref_lon)
-
-        def side(point):
-            return (
-                (end[0] - start[0]) * (point[1] - start[1])
-                - (end[1] - start[1]) * (point[0] - start[0])
-            )
-
-        previous_side = side(previous)
-        current_side = side(current)
-        if previous_side < 0.0 < current_side:
-            return 1
-        if previous_side > 0.0 > current_side:
-            return -1
-        return 0
-
-    def _distance_to_lap_line_meters(self, point):
-        """Return the shortest distance from a GPS point to the timing segment."""
-        ref_lat = (self.lap_start_point[0] + self.lap_end_point[0] + point[0]) / 3.0
-        ref_lon = (self.lap_start_point[1] + self.lap_end_point[1] + point[1]) / 3.0
-        start = self._project_to_meters(self.lap_start_point, ref_lat, ref_lon)
-        end = self._project_to_meters(self.lap_end_point, ref_lat, ref_lon)
-        projected_point = self._project_to_meters(point, ref_lat, ref_lon)
-        line_x = end[0] - start[0]
-        line_y = end[1] - start[1]
-        line_length_squared = line_x * line_x + line_y * line_y
-        if line_length_squared <= 0.0:
-            return math.hypot(projected_point[0] - start[0], projected_point[1] - start[1])
-        fraction = (
-            (projected_point[0] - start[0]) * line_x
-            + (projected_point[1] - start[1]) * line_y
-        ) / line_length_squared
-        fraction = max(0.0, min(1.0, fraction))
-        nearest_x = start[0] + fraction * line_x
-        nearest_y = start[1] + fraction * line_y
-        return math.hypot(projected_point[0] - nearest_x, projected_point[1] - nearest_y)
-
-    @staticmethod
-    def _project_to_meters(point, ref_lat, ref_lon):
-        radius_meters = 6371008.8
-        lat, lon = point
-        x = math.radians(lon - ref_lon) * math.cos(math.radians(ref_lat)) * radius_meters
-        y = math.radians(lat - ref_lat) * radius_meters
-        return x, y
-
-    @staticmethod
-    def _segments_intersect(a, b, c, d):
-        def orientation(p, q, r):
-            value = (q[1] - p[1]) * (r[0] - q[0]) - (q[0] - p[0]) * (r[1] - q[1])
-            if abs(value) < 1e-9:
-                return 0
-            return 1 if value > 0 else 2
-
-        def on_segment(p, q, r):
-            return (
-                min(p[0], r[0]) <= q[0] <= max(p[0], r[0])
-                and min(p[1], r[1]) <= q[1] <= max(p[1], r[1])
-            )
-
-        o1 = orientation(a, b, c)
-        o2 = orientation(a, b, d)
-        o3 = orientation(c, d, a)
-        o4 = orientation(c, d, b)
-
-        if o1 != o2 and o3 != o4:
-            return True
-        if o1 == 0 and on_segment(a, c, b):
-            return True
-        if o2 == 0 and on_segment(a, d, b):
-            return True
-        if o3 == 0 and on_segment(c, a, d):
-            return True
-        if o4 == 0 and on_segment(c, b, d):
-            return True
-        return False
-
-    @staticmethod
-    def _format_duration(seconds):
-        if seconds is None:
-            return "N/A"
-        try:
-            total_seconds = int(max(0, round(float(seconds))))
-        except (TypeError, ValueError):
-            return "N/A"
-        hours, remainder = divmod(total_seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-
     @staticmethod
     def _safe_float(value, default=0.0):
         try:
@@ -1801,75 +1756,6 @@ class GPSMapTab(QWidget):
         except (TypeError, ValueError):
             return default
 
-    def _nearest_route_position(self, lat, lon):
-        if not self.route_flat_positions:
-            self.route_flat_positions = [
-                (segment_index, point_index, point)
-                for segment_index, segment in enumerate(self.route_segments)
-                for point_index, point in enumerate(segment["points"])
-            ]
-        if not self.route_flat_positions:
-            return None
-
-        # ASC route files can contain many thousands of points. After the first
-        # fix, search near the last match and only fall back to the full route
-        # if the car is more than two miles from that local window.
-        start = 0
-        end = len(self.route_flat_positions)
-        if self.race_mode == self.RACE_MODE_ASC and self.route_last_flat_index is not None:
-            start = max(0, self.route_last_flat_index - 500)
-            end = min(len(self.route_flat_positions), self.route_last_flat_index + 501)
-
-        best = None
-        best_flat_index = None
-        best_distance = float("inf")
-        for flat_index in range(start, end):
-            segment_index, point_index, point = self.route_flat_positions[flat_index]
-            distance = self._haversine_miles(lat, lon, point[0], point[1])
-            if distance < best_distance:
-                best_distance = distance
-                best = (segment_index, point_index)
-                best_flat_index = flat_index
-
-        if (start != 0 or end != len(self.route_flat_positions)) and best_distance > 2.0:
-            best = None
-            best_flat_index = None
-            best_distance = float("inf")
-            for flat_index, (segment_index, point_index, point) in enumerate(self.route_flat_positions):
-                distance = self._haversine_miles(lat, lon, point[0], point[1])
-                if distance < best_distance:
-                    best_distance = distance
-                    best = (segment_index, point_index)
-                    best_flat_index = flat_index
-        self.route_last_flat_index = best_flat_index
-        return best
-
-    @staticmethod
-    def _format_eta(distance_miles, speed_mph):
-        try:
-            speed = float(speed_mph)
-        except (TypeError, ValueError):
-            speed = 0.0
-        if speed <= 0:
-            return "N/A"
-        total_seconds = int(round((distance_miles / speed) * 3600))
-        hours, remainder = divmod(total_seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-
-    @staticmethod
-    def _haversine_miles(lat1, lon1, lat2, lon2):
-        radius_miles = 3958.7613
-        phi1 = math.radians(lat1)
-        phi2 = math.radians(lat2)
-        d_phi = math.radians(lat2 - lat1)
-        d_lambda = math.radians(lon2 - lon1)
-        a = (
-            math.sin(d_phi / 2.0) ** 2
-            + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2.0) ** 2
-        )
-        return radius_miles * 2.0 * math.atan2(math.sqrt(a), math.sqrt(1.0 - a))
-
     def _best_zoom_for_points(self, points):
         if len(points) < 2:
             return self.zoom
@@ -1888,18 +1774,7 @@ class GPSMapTab(QWidget):
 
     @staticmethod
     def _parse_gpx_points(file_path):
-        root = ET.parse(file_path).getroot()
-        points = []
-        for element in root.iter():
-            tag = element.tag.split("}", 1)[-1].lower()
-            if tag not in {"trkpt", "rtept", "wpt"}:
-                continue
-            lat = element.attrib.get("lat")
-            lon = element.attrib.get("lon")
-            if lat is None or lon is None:
-                continue
-            points.append((float(lat), float(lon)))
-        return points
+        return parse_gpx_points(file_path)
 
     @staticmethod
     def _latlon_to_tile_fraction(lat, lon, zoom):
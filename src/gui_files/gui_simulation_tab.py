@@ -11,6 +11,7 @@ from PyQt6.QtWidgets import (
     QScrollArea,
     QDoubleSpinBox,
     QComboBox,
+    QCheckBox,
 )
 
 
@@ -19,7 +20,7 @@ class SimulationTab(QWidget):
     Telemetry simulation controls: replay recorded CSVs or run tunable synthetic scenarios.
     """
 
-    start_replay = pyqtSignal(str, float)
+    start_replay = pyqtSignal(str, float, bool)
     replay_speed_changed = pyqtSignal(float)
     start_scenario = pyqtSignal(str, float, dict)
     stop_requested = pyqtSignal()
@@ -29,6 +30,7 @@ class SimulationTab(QWidget):
         self.units_mode = "metric"
         self.file_path_edit = QLineEdit()
         self.speed_spin = QDoubleSpinBox()
+        self.turbo_check = QCheckBox("Turbo (no delay)")
         self.status_label = QLabel("Simulation idle.")
         self._scenario_defaults = self._build_defaults()
         self._init_ui()
@@ -72,6 +74,13 @@ class SimulationTab(QWidget):
         replay_help.setWordWrap(True)
         replay_layout.addWidget(replay_help)
 
+        self.turbo_check.setToolTip(
+            "Replay as fast as the pipeline can process rows, for regression runs and annotation. "
+            "Laps and graphs follow the recorded timestamps."
+        )
+        self.turbo_check.toggled.connect(lambda checked: self.speed_spin.setEnabled(not checked))
+        replay_layout.addWidget(self.turbo_check)
+
         start_replay_btn = QPushButton("Start Replay")
         start_replay_btn.clicked.connect(self._emit_replay)
         replay_layout.addWidget(start_replay_btn)
@@ -169,8 +178,12 @@ class SimulationTab(QWidget):
 
     def _emit_replay(self):
         speed = float(self.speed_spin.value())
-        self.set_status(f"Starting replay at {speed:g}× using recorded CSV timestamp spacing.")
-        self.start_replay.emit(self.file_path_edit.text().strip(), speed)
+        turbo = self.turbo_check.isChecked()
+        if turbo:
+            self.set_status("Starting turbo replay without delays, timed by recorded CSV timestamps.")
+        else:
+            self.set_status(f"Starting replay at {speed:g}× using recorded CSV timestamp spacing.")
+        self.start_replay.emit(self.file_path_edit.text().strip(), speed, turbo)
 
     def _emit_scenario(self):
         scenario = self.scenario_combo.currentText()
@@ -0,0 +1,141 @@
+# src/gui_files/map_tile_cache.py
+
+import math
+from collections import OrderedDict
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPixmap
+
+
+def tiles_ahead(tile_x, tile_y, heading_x, heading_y, distance_tiles, limit, width=1, start_tiles=0.0):
+    """
+    Tile positions along a ray from the fractional tile (tile_x, tile_y).
+
+    The ray follows the (heading_x, heading_y) direction in tile space from
+    `start_tiles` to `distance_tiles` away; each step also covers `width` tiles either side of it so
+    a bend in the road stays inside the prefetched strip. Positions are
+    returned nearest first, without duplicates, at most `limit` of them.
+    """
+    norm = math.hypot(heading_x, heading_y)
+    if norm == 0.0 or distance_tiles <= 0.0 or limit <= 0:
+        return []
+    ux, uy = heading_x / norm, heading_y / norm
+    found = []
+    seen = set()
+    steps = int(math.ceil(max(0.0, distance_tiles - start_tiles) / 0.5))
+    for step in range(steps + 1):
+        along = min(start_tiles + step * 0.5, distance_tiles)
+        for side in range(-width, width + 1):
+            position = (
+                int(math.floor(tile_x + ux * along - uy * side)),
+                int(math.floor(tile_y + uy * along + ux * side)),
+            )
+            if position in seen:
+                continue
+            seen.add(position)
+            found.append(position)
+            if len(found) >= limit:
+                return found
+    return found
+
+
+class TileCache:
+    """
+    Two-tier memory cache for map tiles.
+
+    Compressed tile bytes (PNG as served) are kept in a large LRU bounded by
+    total size; decoded pixmaps, which cost about 256 KB each, are kept in a
+    smaller LRU bounded by count. Dropping a decoded tile keeps its bytes, so
+    revisiting it is a local decode instead of a placeholder and a network
+    round trip. Tiles passed to protect() are never evicted from either tier.
+    """
+
+    def __init__(self, tile_size=256, max_decoded=384, max_compressed_bytes=64 * 1024 * 1024):
+        self.tile_size = tile_size
+        self.max_decoded = max_decoded
+        self.max_compressed_bytes = max_compressed_bytes
+        self.decoded = OrderedDict()
+        self.compressed = OrderedDict()
+        self.compressed_bytes = 0
+        self.protected = set()
+
+    def __contains__(self, key):
+        return key in self.decoded or key in self.compressed
+
+    def __len__(self):
+        return len(self.keys())
+
+    def keys(self):
+        return self.decoded.keys() | self.compressed.keys()
+
+    def clear(self):
+        self.decoded.clear()
+        self.compressed.clear()
+        self.compressed_bytes = 0
+
+    def protect(self, keys):
+        self.protected = set(keys)
+
+    def get(self, key):
+        """Decoded pixmap for `key`, decoding stored bytes if needed, or None."""
+        pixmap = self.decoded.get(key)
+        if pixmap is not None:
+            self.decoded.move_to_end(key)
+            return pixmap
+        data = self.compressed.get(key)
+        if data is None:
+            return None
+        self.compressed.move_to_end(key)
+        pixmap = self._decode(data)
+        if pixmap is not None:
+            self._store_decoded(key, pixmap)
+        return pixmap
+
+    def put(self, key, data):
+        """Store tile bytes and return the decoded pixmap, or None if invalid."""
+        data = bytes(data)
+        pixmap = self._decode(data)
+        if pixmap is None:
+            return None
+        previous = self.compressed.pop(key, None)
+        if previous is not None:
+            self.compressed_bytes -= len(previous)
+        self.compressed[key] = data
+        self.compressed_bytes += len(data)
+        self._trim_compressed()
+        self._store_decoded(key, pixmap)
+        return pixmap
+
+    def _decode(self, data):
+        pixmap = QPixmap()
+        if not pixmap.loadFromData(data):
+            return None
+        if pixmap.width() != self.tile_size or pixmap.height() != self.tile_size:
+            pixmap = pixmap.scaled(
+                self.tile_size,
+                self.tile_size,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+        return pixmap
+
+    def _store_decoded(self, key, pixmap):
+        self.decoded[key] = pixmap
+        self.decoded.move_to_end(key)
+        while len(self.decoded) > self.max_decoded:
+            if self._evict_oldest(self.decoded) is None:
+                break
+
+    def _trim_compressed(self):
+        while self.compressed_bytes > self.max_compressed_bytes:
+            data = self._evict_oldest(self.compressed)
+            if data is None:
+                break
+            self.compressed_bytes -= len(data)
+
+    def _evict_oldest(self, tier):
+        # Pop the least recently used unprotected entry; None if all are protected.
+        for key in tier:
+            if key not in self.protected:
+                return tier.pop(key)
+        return None
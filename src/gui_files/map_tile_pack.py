@@ -0,0 +1,146 @@
+# src/gui_files/map_tile_pack.py
+
+import os
+import sqlite3
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from gui_files.map_trail import world_pixels
+
+
+# Tile servers whose usage policy forbids bulk downloads and offline packs.
+# The live map may still browse them; packs must come from another server.
+NO_BULK_TILE_HOSTS = ("openstreetmap.org",)
+
+
+def tile_source_error(url_template):
+    """
+    Why `url_template` cannot be used to build a tile pack, or None if it can.
+
+    The template must be an http(s) URL with {z}, {x} and {y} placeholders
+    and must not point at a server listed in NO_BULK_TILE_HOSTS.
+    """
+    template = (url_template or "").strip()
+    parts = urlsplit(template)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        return "Enter an http or https tile server URL."
+    if not all(field in template for field in ("{z}", "{x}", "{y}")):
+        return "The tile server URL needs {z}, {x} and {y} placeholders."
+    host = parts.hostname.lower()
+    for blocked in NO_BULK_TILE_HOSTS:
+        if host == blocked or host.endswith(f".{blocked}"):
+            return (
+                f"{blocked} does not allow bulk or offline tile downloads. "
+                "Use a tile provider or self-hosted server that permits them."
+            )
+    return None
+
+
+def corridor_tiles(segments, zooms, buffer_tiles=1, tile_size=256):
+    """
+    Tiles (zoom, x, y) covering the route polylines in `segments`.
+
+    Each route line is sampled at half-tile steps so no crossed tile is
+    skipped, then widened by `buffer_tiles` on every side so the map still
+    has imagery around the car when it is not centred on the route.
+    """
+    tiles = set()
+    offsets = np.arange(-buffer_tiles, buffer_tiles + 1)
+    for zoom in zooms:
+        limit = 1 << zoom
+        for points in segments:
+            if not len(points):
+                continue
+            coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+            x, y = world_pixels(coords[:, 0], coords[:, 1], zoom, tile_size)
+            x, y = x / tile_size, y / tile_size
+            if len(x) > 1:
+                steps = np.maximum(1, np.ceil(np.hypot(np.diff(x), np.diff(y)) / 0.5)).astype(np.int64)
+                line = np.repeat(np.arange(len(steps)), steps)
+                first = np.repeat(np.cumsum(steps) - steps, steps)
+                fraction = (np.arange(len(line)) - first) / np.repeat(steps, steps)
+                x = np.concatenate((x[line] + fraction * (x[line + 1] - x[line]), x[-1:]))
+                y = np.concatenate((y[line] + fraction * (y[line + 1] - y[line]), y[-1:]))
+            cells = np.unique(np.stack((np.floor(x), np.floor(y)), axis=1).astype(np.int64), axis=0)
+            grown_x = (cells[:, 0, None, None] + offsets[None, :, None]) % limit
+            grown_y = cells[:, 1, None, None] + offsets[None, None, :]
+            grown_x, grown_y = np.broadcast_arrays(grown_x, grown_y)
+            valid = (grown_y >= 0) & (grown_y < limit)
+            tiles.update(
+                (zoom, int(tile_x), int(tile_y))
+                for tile_x, tile_y in zip(grown_x[valid].tolist(), grown_y[valid].tolist())
+            )
+    return sorted(tiles)
+
+
+class MBTilesPack:
+    """
+    Offline tile store in the MBTiles layout (one SQLite file).
+
+    Tiles are addressed with the map's XYZ scheme; rows are stored flipped
+    to the TMS scheme MBTiles uses, so packs open in other MBTiles tools.
+    All access happens on the GUI thread, so one connection is enough.
+    """
+
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.execute("CREATE TABLE IF NOT EXISTS metadata (name TEXT PRIMARY KEY, value TEXT)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS tiles ("
+            "zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_data BLOB, "
+            "PRIMARY KEY (zoom_level, tile_column, tile_row))"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def _tms_row(zoom, y):
+        return (1 << zoom) - 1 - y
+
+    def get(self, zoom, x, y):
+        row = self._db.execute(
+            "SELECT tile_data FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+            (zoom, x, self._tms_row(zoom, y)),
+        ).fetchone()
+        return bytes(row[0]) if row else None
+
+    def has(self, zoom, x, y):
+        return self._db.execute(
+            "SELECT 1 FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+            (zoom, x, self._tms_row(zoom, y)),
+        ).fetchone() is not None
+
+    def put(self, zoom, x, y, data, commit=True):
+        self._db.execute(
+            "INSERT OR REPLACE INTO tiles (zoom_level, tile_column, tile_row, tile_data) VALUES (?, ?, ?, ?)",
+            (zoom, x, self._tms_row(zoom, y), sqlite3.Binary(bytes(data))),
+        )
+        if commit:
+            self._db.commit()
+
+    def commit(self):
+        self._db.commit()
+
+    def missing(self, tiles):
+        """The subset of (zoom, x, y) tiles not stored yet, in input order."""
+        return [tile for tile in tiles if not self.has(*tile)]
+
+    def tile_count(self):
+        return self._db.execute("SELECT COUNT(*) FROM tiles").fetchone()[0]
+
+    def set_metadata(self, **values):
+        self._db.executemany(
+            "INSERT OR REPLACE INTO metadata (name, value) VALUES (?, ?)",
+            [(name, str(value)) for name, value in values.items()],
+        )
+        self._db.commit()
+
+    def metadata(self):
+        return dict(self._db.execute("SELECT name, value FROM metadata").fetchall())
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,183 @@
+# src/gui_files/map_trail.py
+
+import math
+import time
+
+import numpy as np
+
+
+def world_pixels(lat, lon, zoom, tile_size=256):
+    """Web-Mercator pixel coordinates of degree arrays at `zoom`."""
+    lat = np.clip(np.asarray(lat, dtype=np.float64), -85.05112878, 85.05112878)
+    lon = ((np.asarray(lon, dtype=np.float64) + 180.0) % 360.0) - 180.0
+    scale = float(1 << zoom) * tile_size
+    lat_rad = np.radians(lat)
+    x = (lon + 180.0) / 360.0 * scale
+    y = (1.0 - np.log(np.tan(lat_rad) + 1.0 / np.cos(lat_rad)) / math.pi) / 2.0 * scale
+    return x, y
+
+
+def douglas_peucker(x, y, tolerance):
+    """Indices of the points Douglas-Peucker keeps for a polyline."""
+    count = len(x)
+    if count <= 2:
+        return np.arange(count)
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        xs = x[first + 1:last] - x[first]
+        ys = y[first + 1:last] - y[first]
+        dx = x[last] - x[first]
+        dy = y[last] - y[first]
+        norm = math.hypot(dx, dy)
+        if norm == 0.0:
+            distance = np.hypot(xs, ys)
+        else:
+            distance = np.abs(dy * xs - dx * ys) / norm
+        farthest = int(np.argmax(distance))
+        if distance[farthest] > tolerance:
+            middle = first + 1 + farthest
+            keep[middle] = True
+            stack.append((first, middle))
+            stack.append((middle, last))
+    return np.flatnonzero(keep)
+
+
+class MapTrail:
+    """
+    Bounded vehicle trail with per-zoom simplified drawing points.
+
+    Fixes are stored in NumPy arrays and trimmed to `max_points` and, when
+    set, `max_age_seconds`. The trail is split into fixed blocks of
+    BLOCK_POINTS fixes; each completed block is simplified once per zoom with
+    Douglas-Peucker at about one screen pixel and cached, so drawing a long
+    trail costs what is visible at that zoom rather than the drive length.
+    Fixes after the last completed block are drawn as-is. Trimming always
+    drops whole blocks, which keeps the cached blocks valid.
+    """
+    BLOCK_POINTS = 256
+    TOLERANCE_PX = 1.0
+    MAX_CACHED_ZOOMS = 4
+
+    def __init__(self, max_points=20000, max_age_seconds=None):
+        self.max_points = max(self.BLOCK_POINTS, int(max_points))
+        self.max_age_seconds = max_age_seconds
+        self.clear()
+
+    def clear(self):
+        capacity = self.BLOCK_POINTS * 4
+        self._lat = np.empty(capacity, dtype=np.float64)
+        self._lon = np.empty(capacity, dtype=np.float64)
+        self._time = np.empty(capacity, dtype=np.float64)
+        # Storage slot i holds absolute fix number self._offset + i.
+        self._offset = 0
+        self._start = 0
+        self._stop = 0
+        self._simplified = {}
+        # Bumped whenever previously returned drawing points stop being valid.
+        self.revision = getattr(self, "revision", 0) + 1
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def last_point(self):
+        if not len(self):
+            return None
+        return float(self._lat[self._stop - 1]), float(self._lon[self._stop - 1])
+
+    def points(self):
+        """(lat, lon) arrays of every stored fix, oldest first."""
+        return self._lat[self._start:self._stop], self._lon[self._start:self._stop]
+
+    def append(self, lat, lon, timestamp=None):
+        if self._stop == len(self._lat):
+            self._make_room()
+        slot = self._stop
+        self._lat[slot] = lat
+        self._lon[slot] = lon
+        self._time[slot] = time.monotonic() if timestamp is None else float(timestamp)
+        self._stop += 1
+        self._trim()
+
+    def _make_room(self):
+        live = len(self)
+        if live * 2 > len(self._lat):
+            capacity = len(self._lat) * 2
+            for name in ("_lat", "_lon", "_time"):
+                grown = np.empty(capacity, dtype=np.float64)
+                grown[:live] = getattr(self, name)[self._start:self._stop]
+                setattr(self, name, grown)
+        else:
+            for array in (self._lat, self._lon, self._time):
+                array[:live] = array[self._start:self._stop]
+        self._offset += self._start
+        self._start, self._stop = 0, live
+
+    def _trim(self):
+        first = self._offset + self._start
+        end = self._offset + self._stop
+        block = self.BLOCK_POINTS
+        new_first = first
+        if end - first > self.max_points:
+            new_first = -(-(end - self.max_points) // block) * block
+        if self.max_age_seconds is not None:
+            cutoff = self._time[self._stop - 1] - self.max_age_seconds
+            expired = int(np.searchsorted(self._time[self._start:self._stop], cutoff))
+            new_first = max(new_first, (first + expired) // block * block)
+        new_first = min(new_first, end - 1)
+        if new_first <= first:
+            return
+        self._start += new_first - first
+        for cache in self._simplified.values():
+            for index in [index for index in cache if index * block < new_first]:
+                del cache[index]
+        self.revision += 1
+
+    def drawing_points(self, zoom):
+        """
+        Return (lat, lon, sealed) for drawing at `zoom`.
+
+        The first `sealed` points come from simplified completed blocks and
+        only change when a block completes or `revision` changes; points after
+        them are raw fixes, so a caller can extend an existing path with just
+        the newly appended ones.
+        """
+        first = self._offset + self._start
+        end = self._offset + self._stop
+        if end - first < 2:
+            lat, lon = self.points()
+            return lat.copy(), lon.copy(), 0
+
+        cache = self._simplified.get(zoom)
+        if cache is None:
+            if len(self._simplified) >= self.MAX_CACHED_ZOOMS:
+                self._simplified.clear()
+            cache = self._simplified[zoom] = {}
+
+        block = self.BLOCK_POINTS
+        pieces = []
+        index = first // block
+        # A block is complete once the fix that starts the next one exists.
+        while (index + 1) * block < end:
+            kept = cache.get(index)
+            if kept is None:
+                low = max(index * block, first) - self._offset
+                high = (index + 1) * block + 1 - self._offset
+                x, y = world_pixels(self._lat[low:high], self._lon[low:high], zoom)
+                kept = cache[index] = douglas_peucker(x, y, self.TOLERANCE_PX) + low + self._offset
+            # Consecutive blocks share their boundary fix.
+            pieces.append(kept if not pieces else kept[1:])
+            index += 1
+
+        if pieces:
+            sealed_indices = np.concatenate(pieces)
+            tail_from = sealed_indices[-1] + 1
+        else:
+            sealed_indices = np.empty(0, dtype=np.int64)
+            tail_from = first
+        indices = np.concatenate((sealed_indices, np.arange(tail_from, end))) - self._offset
+        return self._lat[indices], self._lon[indices], len(sealed_indices)
@@ -0,0 +1,156 @@
+# src/gui_files/plot_decimation.py
+
+import math
+
+import numpy as np
+
+
+def _extreme_positions(low_grid, high_grid):
+    """Row-wise argmin of `low_grid` and argmax of `high_grid`, ignoring NaN."""
+    low = np.argmin(np.where(np.isnan(low_grid), np.inf, low_grid), axis=1)
+    high = np.argmax(np.where(np.isnan(high_grid), -np.inf, high_grid), axis=1)
+    return low, high
+
+
+def minmax_decimate(times, values, max_points):
+    """
+    Reduce a series to at most `max_points` points while keeping its extremes.
+
+    Samples are split into max_points // 2 equal-count buckets and each bucket
+    contributes its minimum and maximum sample in time order, so a one-sample
+    spike stays visible however far the plot is zoomed out. Buckets with no
+    finite value contribute NaN so gaps still break the line under
+    connect='finite'. Series already within the limit are returned unchanged.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    count = len(values)
+    buckets = max(1, int(max_points) // 2)
+    if count <= buckets * 2:
+        return times, values
+
+    bucket_size = math.ceil(count / buckets)
+    rows = math.ceil(count / bucket_size)
+    padded = rows * bucket_size
+    padded_times = np.empty(padded, dtype=np.float64)
+    padded_values = np.full(padded, np.nan, dtype=np.float64)
+    padded_times[:count] = times
+    padded_times[count:] = times[-1]
+    padded_values[:count] = values
+
+    grid = padded_values.reshape(rows, bucket_size)
+    low, high = _extreme_positions(grid, grid)
+
+    offsets = np.arange(rows) * bucket_size
+    picks = np.empty((rows, 2), dtype=np.int64)
+    picks[:, 0] = np.minimum(low, high) + offsets
+    picks[:, 1] = np.maximum(low, high) + offsets
+    picks = picks.ravel()
+    return padded_times[picks], padded_values[picks]
+
+
+class MinMaxPyramid:
+    """
+    Multi-resolution min/max summary of an append-only series.
+
+    Level 0 buckets cover BASE_BUCKET samples and every level above merges
+    FACTOR buckets of the one below. Each bucket records the row index and
+    value of its minimum and maximum, so select() can answer "which rows
+    should be drawn for this span" from the coarsest adequate level without
+    touching the raw samples. update() only summarizes buckets completed since
+    the previous call, which keeps full-session history cheap to extend.
+    """
+    BASE_BUCKET = 32
+    FACTOR = 8
+
+    def __init__(self):
+        # Per level: low rows, high rows, low values, high values.
+        self._levels = []
+
+    def bucket_size(self, level):
+        return self.BASE_BUCKET * self.FACTOR ** level
+
+    def update(self, values):
+        """Summarize complete buckets of `values` (an array or memmap)."""
+        complete = len(values) // self.BASE_BUCKET
+        done = len(self._levels[0][0]) if self._levels else 0
+        if complete > done:
+            chunk = np.asarray(
+                values[done * self.BASE_BUCKET:complete * self.BASE_BUCKET],
+                dtype=np.float64,
+            ).reshape(-1, self.BASE_BUCKET)
+            rows = done * self.BASE_BUCKET + np.arange(chunk.size, dtype=np.int64)
+            rows = rows.reshape(chunk.shape)
+            self._extend(0, chunk, chunk, rows, rows)
+
+        level = 0
+        while level < len(self._levels) and len(self._levels[level][0]) >= self.FACTOR:
+            low_rows, high_rows, low_values, high_values = self._levels[level]
+            complete = len(low_rows) // self.FACTOR
+            done = len(self._levels[level + 1][0]) if level + 1 < len(self._levels) else 0
+            if complete > done:
+                span = slice(done * self.FACTOR, complete * self.FACTOR)
+                shape = (-1, self.FACTOR)
+                self._extend(
+                    level + 1,
+                    low_values[span].reshape(shape),
+                    high_values[span].reshape(shape),
+                    low_rows[span].reshape(shape),
+                    high_rows[span].reshape(shape),
+                )
+            level += 1
+
+    def _extend(self, level, low_grid, high_grid, low_row_grid, high_row_grid):
+        low, high = _extreme_positions(low_grid, high_grid)
+        index = np.arange(len(low_grid))
+        new = (
+            low_row_grid[index, low],
+            high_row_grid[index, high],
+            low_grid[index, low],
+            high_grid[index, high],
+        )
+        if level == len(self._levels):
+            self._levels.append(new)
+        else:
+            self._levels[level] = tuple(
+                np.concatenate((old, extra)) for old, extra in zip(self._levels[level], new)
+            )
+
+    def select(self, start, stop, max_points):
+        """
+        Return sorted row indices that draw rows [start, stop) in about
+        `max_points` points, keeping each bucket's minimum and maximum.
+
+        Rows past the last summarized bucket are returned individually or
+        through a finer level, so the newest samples are never dropped.
+        """
+        start, stop = max(0, int(start)), int(stop)
+        if stop <= start:
+            return np.empty(0, dtype=np.int64)
+        max_points = max(2, int(max_points))
+        if stop - start <= max_points or not self._levels:
+            return np.arange(start, stop, dtype=np.int64)
+
+        budget = max_points // 2
+        level = 0
+        while level + 1 < len(self._levels) and (stop - start) / self.bucket_size(level) > budget:
+            level += 1
+        while level >= 0 and start // self.bucket_size(level) >= len(self._levels[level][0]):
+            level -= 1
+        if level < 0:
+            return np.arange(start, stop, dtype=np.int64)
+
+        size = self.bucket_size(level)
+        low_rows, high_rows, _low_values, _high_values = self._levels[level]
+        first = start // size
+        last = min(len(low_rows), -(-stop // size))
+        picks = np.empty((last - first, 2), dtype=np.int64)
+        picks[:, 0] = np.minimum(low_rows[first:last], high_rows[first:last])
+        picks[:, 1] = np.maximum(low_rows[first:last], high_rows[first:last])
+        picks = picks.ravel()
+
+        covered = last * size
+        if covered >= stop:
+            return picks
+        tail_points = max(2, int(max_points * (stop - covered) / (stop - start)))
+        return np.concatenate((picks, self.select(covered, stop, tail_points)))
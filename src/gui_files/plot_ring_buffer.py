@@ -0,0 +1,124 @@
+# src/gui_files/plot_ring_buffer.py
+
+import math
+
+import numpy as np
+
+
+class PlotRingBuffer:
+    """
+    Preallocated value + timestamp ring for one live plot series.
+
+    Every sample is written twice, at slot i and i + capacity, so the newest
+    `size` samples are always one contiguous slice. view() hands pyqtgraph
+    array views without copying or trimming Python lists on each tick.
+    Invalid values are stored as NaN so plots can draw gaps with
+    connect='finite' instead of filtering points.
+
+    Timestamps never decrease, so callers can bisect the time view. With
+    `min_interval` set, a sample arriving within that long of the time the
+    newest slot was opened replaces it instead of taking a new slot; this bounds how many slots
+    a time window needs no matter how fast snapshots arrive.
+    """
+
+    def __init__(self, capacity, min_interval=0.0):
+        self.capacity = max(1, int(capacity))
+        self.min_interval = max(0.0, float(min_interval))
+        self._times = np.full(self.capacity * 2, np.nan, dtype=np.float64)
+        self._values = np.full(self.capacity * 2, np.nan, dtype=np.float64)
+        self._next = 0
+        self._size = 0
+        self._slot_opened = None
+
+    def __len__(self):
+        return self._size
+
+    @staticmethod
+    def coerce(value):
+        """Return a finite float for plotting, or NaN for anything else."""
+        if isinstance(value, (int, float)):
+            value = float(value)
+            return value if math.isfinite(value) else math.nan
+        return math.nan
+
+    @classmethod
+    def for_duration(cls, seconds, max_rate_hz):
+        """Size a buffer to hold `seconds` of samples at up to `max_rate_hz`."""
+        rate = max(float(max_rate_hz), 1e-6)
+        return cls(math.ceil(float(seconds) * rate) + 1, min_interval=1.0 / rate)
+
+    def newest_time(self):
+        if not self._size:
+            return None
+        return float(self._times[self._next + self.capacity - 1])
+
+    def append(self, timestamp, value):
+        value = self.coerce(value)
+        timestamp = float(timestamp)
+        newest = self.newest_time()
+        if newest is not None:
+            # Clock steps backwards (NTP, replay seams) would break bisecting.
+            timestamp = max(timestamp, newest)
+            # The microsecond slack keeps samples spaced exactly min_interval
+            # apart from merging through floating-point rounding.
+            if timestamp - self._slot_opened < self.min_interval - 1e-6:
+                self._next = (self._next - 1) % self.capacity
+                self._size -= 1
+            else:
+                self._slot_opened = timestamp
+        else:
+            self._slot_opened = timestamp
+        slot = self._next
+        self._times[slot] = timestamp
+        self._times[slot + self.capacity] = timestamp
+        self._values[slot] = value
+        self._values[slot + self.capacity] = value
+        self._next = (slot + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def view(self):
+        """Return (times, values) views of the retained samples, oldest first."""
+        end = self._next + self.capacity
+        start = end - self._size
+        return self._times[start:end], self._values[start:end]
+
+    def window(self, seconds, end_time=None):
+        """
+        Return (times, values) views covering the last `seconds`.
+
+        The window ends at `end_time`, or at the newest sample when omitted.
+        """
+        times, values = self.view()
+        if not len(times):
+            return times, values
+        if end_time is None:
+            end_time = times[-1]
+        start = int(np.searchsorted(times, end_time - float(seconds), side="left"))
+        return times[start:], values[start:]
+
+    def clear(self):
+        self._times.fill(np.nan)
+        self._values.fill(np.nan)
+        self._next = 0
+        self._size = 0
+        self._slot_opened = None
+
+    def resize(self, capacity):
+        """Change capacity while keeping the newest samples."""
+        capacity = max(1, int(capacity))
+        if capacity == self.capacity:
+            return
+        times, values = self.view()
+        keep = min(len(values), capacity)
+        times = times[len(times) - keep:].copy()
+        values = values[len(values) - keep:].copy()
+        self.capacity = capacity
+        self._times = np.full(capacity * 2, np.nan, dtype=np.float64)
+        self._values = np.full(capacity * 2, np.nan, dtype=np.float64)
+        self._times[:keep] = times
+        self._times[capacity:capacity + keep] = times
+        self._values[:keep] = values
+        self._values[capacity:capacity + keep] = values
+        self._next = keep % capacity
+        self._size = keep
+        self._slot_opened = float(times[-1]) if keep else None
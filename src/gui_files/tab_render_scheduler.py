@@ -0,0 +1,62 @@
+# src/gui_files/tab_render_scheduler.py
+
+import logging
+
+from PyQt6.QtWidgets import QTabWidget
+
+
+class TabRenderScheduler:
+    """
+    Defer widget repaint work for tab pages the operator cannot see.
+
+    TelemetryGUI still feeds every page's data model on each tick so graph
+    history stays complete, but the expensive part (setData, table cell
+    writes, text formatting) is submitted here. Work for the visible page
+    runs immediately; work for hidden pages is parked, one callable per page
+    with the newest submission winning, and runs when the page is selected.
+    """
+
+    def __init__(self, root_tabs: QTabWidget):
+        self.logger = logging.getLogger(__name__)
+        self.root_tabs = root_tabs
+        self._pending = {}
+        self.watch(root_tabs)
+
+    def watch(self, tab_widget: QTabWidget):
+        """Flush parked work whenever `tab_widget` switches pages."""
+        tab_widget.currentChanged.connect(self._on_current_changed)
+
+    def is_visible(self, page) -> bool:
+        """True when `page` is on the current tab path from the root widget."""
+        current = self.root_tabs.currentWidget()
+        while current is not None:
+            if current is page:
+                return True
+            if not isinstance(current, QTabWidget):
+                return False
+            current = current.currentWidget()
+        return False
+
+    def submit(self, page, render):
+        if self.is_visible(page):
+            self._pending.pop(page, None)
+            self._run(render)
+        else:
+            self._pending[page] = render
+
+    def has_pending(self, page) -> bool:
+        return page in self._pending
+
+    def flush_visible(self):
+        for page in list(self._pending):
+            if self.is_visible(page):
+                self._run(self._pending.pop(page))
+
+    def _on_current_changed(self, _index):
+        self.flush_visible()
+
+    def _run(self, render):
+        try:
+            render()
+        except Exception as e:
+            self.logger.error(f"Deferred tab render failed: {e}")
@@ -0,0 +1,203 @@
+# src/gui_files/telemetry_table_model.py
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QBrush, QColor, QFont
+
+from unit_conversion import convert_value
+
+
+class TelemetryTableModel(QAbstractTableModel):
+    """
+    Parameter / Value / Unit rows grouped under header rows.
+
+    The row layout is rebuilt only when the groups change. Each telemetry
+    tick goes through update_values(), which formats every parameter row,
+    compares the text against what is already displayed, and emits
+    dataChanged only for rows whose value, unit, or highlight changed. No Qt
+    item objects are created per tick. Rows whose raw value and unit are
+    identical to the previous tick are skipped before formatting, so a tick
+    costs roughly what changed rather than the size of the table.
+    """
+    HEADERS = ("Parameter", "Value", "Unit")
+    PARAMETER, VALUE, UNIT = range(3)
+    EMPTY_VALUE = "--"
+
+    ROW_GROUP = "group"
+    ROW_KEY = "key"
+    ROW_SPACER = "spacer"
+    _UNSET = object()
+
+    def __init__(
+        self,
+        parent=None,
+        header_background=None,
+        spacer_rows=False,
+        value_background=None,
+    ):
+        super().__init__(parent)
+        self.spacer_rows = spacer_rows
+        # value_background(key, raw) -> QColor or None highlights value cells.
+        self.value_background = value_background
+        self._header_brush = QBrush(QColor(header_background)) if header_background else None
+        self._header_foreground = QBrush(QColor("#FFD400"))
+        self._header_font = QFont("Arial", 14, QFont.Weight.Bold)
+        self._foreground = QBrush(QColor("#FFF"))
+        self._highlight_brushes = {}
+
+        self._signature = None
+        # Per row: (kind, label, (group, index) or None)
+        self._rows = []
+        self._raws = []
+        self._values = []
+        self._units = []
+        self._backgrounds = []
+
+    # ------------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------------
+    def set_groups(self, groups) -> bool:
+        """Rebuild rows for `groups`; returns False when nothing changed."""
+        signature = tuple((group, tuple(keys)) for group, keys in groups.items())
+        if signature == self._signature:
+            return False
+        self.beginResetModel()
+        self._rows = []
+        for group, keys in groups.items():
+            self._rows.append((self.ROW_GROUP, group, None))
+            for index, key in enumerate(keys):
+                self._rows.append((self.ROW_KEY, key, (group, index)))
+            if self.spacer_rows:
+                self._rows.append((self.ROW_SPACER, "", None))
+        count = len(self._rows)
+        self._raws = [self._UNSET] * count
+        self._values = [self.EMPTY_VALUE] * count
+        self._units = [""] * count
+        self._backgrounds = [None] * count
+        self._signature = signature
+        self.endResetModel()
+        return True
+
+    def group_rows(self):
+        return [row for row, entry in enumerate(self._rows) if entry[0] == self.ROW_GROUP]
+
+    def key_at(self, row):
+        if 0 <= row < len(self._rows) and self._rows[row][0] == self.ROW_KEY:
+            return self._rows[row][1]
+        return None
+
+    def position_at(self, row):
+        """(group, index) of the parameter on `row`, or None for other rows."""
+        if 0 <= row < len(self._rows):
+            return self._rows[row][2]
+        return None
+
+    # ------------------------------------------------------------------
+    # Values
+    # ------------------------------------------------------------------
+    def update_values(self, telemetry_data, unit_for_key):
+        """Refresh displayed text from `telemetry_data`; returns changed row count."""
+        changed = []
+        for row, (kind, key, _position) in enumerate(self._rows):
+            if kind != self.ROW_KEY:
+                continue
+            raw = telemetry_data.get(key)
+            target = unit_for_key(key)
+            last_raw = self._raws[row]
+            if target == self._units[row] and type(raw) is type(last_raw) and raw == last_raw:
+                continue
+            self._raws[row] = raw
+            value_text = str(convert_value(key, raw, target))
+            background = self.value_background(key, raw) if self.value_background else None
+            if (
+                value_text != self._values[row]
+                or target != self._units[row]
+                or background != self._backgrounds[row]
+            ):
+                self._values[row] = value_text
+                self._units[row] = target
+                self._backgrounds[row] = background
+                changed.append(row)
+
+        # Coalesce adjacent rows so a full refresh is one signal per group.
+        start = previous = None
+        for row in changed:
+            if start is None:
+                start = previous = row
+            elif row == previous + 1:
+                previous = row
+            else:
+                self._emit_rows_changed(start, previous)
+                start = previous = row
+        if start is not None:
+            self._emit_rows_changed(start, previous)
+        return len(changed)
+
+    def _emit_rows_changed(self, first, last):
+        self.dataChanged.emit(self.index(first, self.VALUE), self.index(last, self.UNIT))
+
+    def _highlight_brush(self, color):
+        name = color.name()
+        brush = self._highlight_brushes.get(name)
+        if brush is None:
+            brush = self._highlight_brushes[name] = QBrush(color)
+        return brush
+
+    # ------------------------------------------------------------------
+    # QAbstractTableModel
+    # ------------------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        kind, label, _position = self._rows[row]
+
+        if kind == self.ROW_GROUP:
+            if column != self.PARAMETER:
+                return None
+            if role == Qt.ItemDataRole.DisplayRole:
+                return label
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self._header_foreground
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return self._header_brush
+            if role == Qt.ItemDataRole.FontRole:
+                return self._header_font
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+            return None
+
+        if kind == self.ROW_SPACER:
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == self.PARAMETER:
+                return label
+            if column == self.VALUE:
+                return self._values[row]
+            return self._units[row]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._foreground
+        if role == Qt.ItemDataRole.BackgroundRole and column == self.VALUE:
+            background = self._backgrounds[row]
+            return self._highlight_brush(background) if background is not None else None
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if column == self.PARAMETER:
+                return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+            return Qt.AlignmentFlag.AlignCenter
+        return None
@@ -11,6 +11,8 @@ returns both a value and diagnostics so the GUI can display "unavailable",
 uncertainty, stale/unfitted flags, or out-of-range warnings without guessing.
 """
 
+import copy
+import io
 import os
 import logging
 import threading
@@ -26,6 +28,8 @@ from sklearn.metrics import mean_absolute_error, r2_score
 from sklearn.utils.validation import check_is_fitted
 from sklearn.base import TransformerMixin, BaseEstimator
 
+from learning_datasets.training_store import TrainingStore
+
 
 class MovingAverage(TransformerMixin, BaseEstimator):
     """
@@ -104,13 +108,30 @@ class MachineLearningModel:
     MIN_BREAK_EVEN_TRAINING_ROWS = 20
     MIN_BREAK_EVEN_SPEED_MPH = 5.0
     STEADY_STATE_MAX_ABS_FORWARD_G = 0.03
+    # Incremental break-even updates grow this many trees on the newest labels
+    # and retire the same number of oldest trees, so the forest slides forward
+    # through the corpus instead of being refit from scratch.
+    BREAK_EVEN_INCREMENTAL_TREES = 10
+    BREAK_EVEN_INCREMENTAL_WINDOW_ROWS = 2000
 
-    def __init__(self, model_dir: str = None):
+    def __init__(self, model_dir: str = None, lazy_load: bool = False, mmap_mode: str | None = None):
+        """
+        :param model_dir: Folder holding the .pkl artifacts and training cache.
+        :param lazy_load: Defer loading saved models until the first prediction
+            or prewarm_async(), so app startup is not blocked by unpickling.
+        :param mmap_mode: Optional joblib mmap_mode (e.g. 'r') for loading the
+            forest arrays from the uncompressed .pkl files.
+        """
         # --- Logger ---
         self.log = logging.getLogger(self.__class__.__name__)
         self.log.setLevel(logging.INFO)
         self._model_lock = threading.RLock()
         self._training_lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._models_loaded = False
+        self._load_failed = False
+        self._prewarm_thread = None
+        self.mmap_mode = mmap_mode
 
         # --- Model directory & paths ---
         base = os.path.dirname(os.path.abspath(__file__))
@@ -123,6 +144,14 @@ class MachineLearningModel:
         self.batt_path = os.path.join(model_dir, 'battery_life_model.pkl')
         self.be_path   = os.path.join(model_dir, 'break_even_model.pkl')
 
+        # Normalized binary mirror of the training CSVs; retraining reads these
+        # columns instead of re-parsing the growing text corpus.
+        self.training_store = TrainingStore(
+            os.path.join(model_dir, 'training_store'),
+            self.TRAINING_COLUMNS,
+            self._normalize_training_frame,
+        )
+
         # --- Build pipelines ---
         self._build_battery_pipeline()
         self._build_break_even_pipeline()
@@ -136,14 +165,74 @@ class MachineLearningModel:
         # --- Load or train on startup ---
         # Startup should prefer existing fitted .pkl files. If a model is
         # missing/corrupt and training_data.csv exists, attempt a local rebuild.
-        self._load_or_train(self.batt_pipe, self.batt_path, self.train_battery_life_model, self.batt_meta)
-        self._load_or_train(
-            self.be_pipe,
-            self.be_path,
-            self.train_break_even_model,
-            self.be_meta,
-            expected_model_version=self.BREAK_EVEN_MODEL_VERSION,
-        )
+        # The app defers this to a background prewarm after the GUI is shown.
+        if not lazy_load:
+            self.ensure_models_loaded()
+
+
+    def ensure_models_loaded(self, wait: bool = True) -> bool:
+        """
+        Load (or rebuild) both saved models once and report whether they are loaded.
+
+        Safe to call from any thread. With wait=True, callers that arrive while
+        a prewarm is running wait for it instead of loading the files a second
+        time. With wait=False they return False at once; live predictions use
+        this so the GUI thread never blocks on a prewarm or startup retrain.
+        """
+        if self._models_loaded:
+            return True
+        if not self._load_lock.acquire(blocking=wait):
+            return False
+        try:
+            if self._models_loaded:
+                return True
+            if not wait and self._load_failed:
+                # Predictions report not_fitted rather than retrying a failed
+                # load on every snapshot; prewarm_async() tries again.
+                return False
+            try:
+                self._load_or_train(self.batt_pipe, self.batt_path, self.train_battery_life_model, self.batt_meta)
+                self._load_or_train(
+                    self.be_pipe,
+                    self.be_path,
+                    self.train_break_even_model,
+                    self.be_meta,
+                    expected_model_version=self.BREAK_EVEN_MODEL_VERSION,
+                )
+            except Exception as e:
+                self._load_failed = True
+                self.log.error(f"Could not load saved models: {e}")
+                return False
+            self._load_failed = False
+            self._models_loaded = True
+            return True
+        finally:
+            self._load_lock.release()
+
+    def prewarm_async(self):
+        """Start loading saved models on a daemon thread and return it."""
+        if self._models_loaded:
+            return None
+        if self._prewarm_thread is None or not self._prewarm_thread.is_alive():
+            self._prewarm_thread = threading.Thread(
+                target=self.ensure_models_loaded,
+                name="ml-model-prewarm",
+                daemon=True,
+            )
+            self._prewarm_thread.start()
+        return self._prewarm_thread
+
+
+    def _dump_model_bundle(self, bundle: dict, path: str):
+        """
+        Write a model bundle beside `path` and atomically move it into place.
+
+        Bundles stay uncompressed so they can be loaded with mmap_mode, and a
+        reader never sees a half-written file.
+        """
+        tmp_path = f"{path}.tmp"
+        joblib.dump(bundle, tmp_path)
+        os.replace(tmp_path, path)
 
 
     def _load_model_bundle(self, obj):
@@ -175,7 +264,7 @@ class MachineLearningModel:
         """
         if os.path.exists(path):
             try:
-                loaded = joblib.load(path)
+                loaded = joblib.load(path, mmap_mode=self.mmap_mode)
                 pipeline, meta = self._load_model_bundle(loaded)
                 if (
                     expected_model_version is not None
@@ -213,6 +302,36 @@ class MachineLearningModel:
         self.log.warning(f"No training_data.csv found near {os.path.dirname(path)} to train model.")
 
 
+    def _read_training_csv(self, csv_path: str, byte_limit: int | None = None) -> pd.DataFrame:
+        """
+        Read a training CSV, optionally only up to a recorded byte offset.
+
+        Auto-retrain records the offset under the CSV write lock and then reads
+        without it, so rows appended after the snapshot are simply ignored.
+        """
+        if byte_limit is None:
+            return pd.read_csv(csv_path)
+        with open(csv_path, 'rb') as fh:
+            payload = fh.read(max(0, int(byte_limit)))
+        return pd.read_csv(io.BytesIO(payload))
+
+
+    def _load_training_frame(self, csv_path: str, byte_limit: int | None = None) -> pd.DataFrame:
+        """
+        Return normalized training rows for `csv_path`.
+
+        Rows come from the binary TrainingStore, which only parses CSV text
+        appended since the previous retrain. If the cache cannot be used, fall
+        back to parsing and normalizing the whole file.
+        """
+        try:
+            return self.training_store.load(csv_path, byte_limit)
+        except Exception as exc:
+            self.log.warning(f"Training cache unavailable for {csv_path}; reading CSV text: {exc}")
+        raw = self._read_training_csv(csv_path, byte_limit)
+        return self._normalize_training_frame(raw, csv_path)
+
+
     def _clean_data(self, df: pd.DataFrame, cols: list) -> pd.DataFrame:
         """
         Replace infinities with NaN and drop any rows lacking required columns.
@@ -278,13 +397,17 @@ class MachineLearningModel:
         }
 
 
-    def train_battery_life_model(self, csv_path: str):
+    def train_battery_life_model(self, csv_path: str, byte_limit: int | None = None):
         """
         Train battery-life model:
           features = [ 'BP_PVS_milliamp*s', 'BP_PVS_Ah', 'BP_PVS_Voltage' ]
           target   =   'Used_Ah_Remaining_Time'
         """
-        df = pd.read_csv(csv_path)
+        df = self._load_training_frame(csv_path, byte_limit)
+        return self._fit_battery_life_model(df)
+
+    def _fit_battery_life_model(self, df: pd.DataFrame):
+        """Fit and save the battery-life pipeline from normalized rows."""
         feats  = ['BP_PVS_milliamp*s', 'BP_PVS_Ah', 'BP_PVS_Voltage']
         target = 'Used_Ah_Remaining_Time'
 
@@ -312,7 +435,7 @@ class MachineLearningModel:
         }
         # Save both the fitted pipeline and its metadata together. Legacy loaders
         # still accept pipeline-only dumps, but metadata powers quality flags.
-        joblib.dump({"pipeline": self.batt_pipe, "meta": meta}, self.batt_path)
+        self._dump_model_bundle({"pipeline": self.batt_pipe, "meta": meta}, self.batt_path)
         self.batt_meta.clear()
         self.batt_meta.update(meta)
         self.log.info(f"Trained battery-life model -> {self.batt_path}")
@@ -337,6 +460,10 @@ class MachineLearningModel:
             "invalid_features": [],
             "out_of_range": {},
         }
+        if not self.ensure_models_loaded(wait=False):
+            # Still loading in the background (or the load failed).
+            details["not_fitted"] = True
+            return details
 
         missing = [k for k in feats if k not in data]
         if missing:
@@ -421,18 +548,20 @@ class MachineLearningModel:
         ])
 
 
-    def train_break_even_model(self, csv_path: str):
+    def train_break_even_model(self, csv_path: str, byte_limit: int | None = None):
         """Serialize manual and automatic break-even training runs."""
         with self._training_lock:
-            return self._train_break_even_model_unlocked(csv_path)
+            # `byte_limit` restricts training to rows written before a CSV
+            # snapshot so live appends can continue during the fit.
+            df = self._load_training_frame(csv_path, byte_limit)
+            return self._fit_break_even_model(df)
 
-    def _train_break_even_model_unlocked(self, csv_path: str):
+    def _fit_break_even_model(self, df: pd.DataFrame):
         """
         Train break-even model:
           features = [ 'BreakEven_Power_W', 'BP_PVS_Voltage' ]
           target   = observed speed during steady-state driving
         """
-        df = pd.read_csv(csv_path)
         feats = self.BREAK_EVEN_FEATURES
         target = 'BreakEvenSpeed'
 
@@ -476,6 +605,8 @@ class MachineLearningModel:
         candidate_pipe = self._new_break_even_pipeline()
         candidate_pipe.fit(X, y)
         meta = {
+            "update_mode": "full",
+            "incremental_updates": 0,
             "feature_ranges": self._collect_feature_ranges(X, feats),
             "target_stats": self._target_stats(y),
             "trained_at": datetime.now(timezone.utc).isoformat(timespec='seconds'),
@@ -488,13 +619,121 @@ class MachineLearningModel:
             ),
             "validation": validation,
         }
-        joblib.dump({"pipeline": candidate_pipe, "meta": meta}, self.be_path)
+        self._publish_break_even_model(candidate_pipe, meta)
+        self.log.info(f"Trained break-even model -> {self.be_path}")
+        return True
+
+    def _publish_break_even_model(self, pipe: Pipeline, meta: dict):
+        """Save a fitted break-even pipeline and swap it in for predictions."""
+        self._dump_model_bundle({"pipeline": pipe, "meta": meta}, self.be_path)
         with self._model_lock:
-            self.be_pipe = candidate_pipe
+            self.be_pipe = pipe
             self.be_meta.clear()
             self.be_meta.update(meta)
-        self.log.info(f"Trained break-even model -> {self.be_path}")
-        return True
+
+
+    def update_break_even_model(self, csv_path: str, byte_limit: int | None = None):
+        """
+        Incrementally refresh the break-even forest with newly labelled rows.
+
+        New trees are grown with warm_start on the most recent window of valid
+        rows and the oldest trees are retired, keeping the forest size fixed.
+        Cost scales with the window rather than the whole corpus. Falls back
+        to a full train when no compatible fitted forest exists or the corpus
+        no longer extends the rows the current model was trained on.
+        """
+        self.ensure_models_loaded()
+        with self._training_lock:
+            df = self._load_training_frame(csv_path, byte_limit)
+            with self._model_lock:
+                candidate_pipe = copy.deepcopy(self.be_pipe)
+                previous_meta = dict(self.be_meta)
+
+            feats = self.BREAK_EVEN_FEATURES
+            target = 'BreakEvenSpeed'
+            missing = [c for c in feats + [target] if c not in df.columns]
+            if missing:
+                self.log.warning(f"Skipping break-even update, missing required columns: {missing}")
+                return
+
+            for column in feats + [target]:
+                df[column] = pd.to_numeric(df[column], errors='coerce')
+            df = self._clean_data(df, feats + [target])
+
+            previous_rows = previous_meta.get("row_count")
+            try:
+                check_is_fitted(candidate_pipe)
+                forest = candidate_pipe.steps[-1][1]
+                compatible = (
+                    previous_meta.get("model_version") == self.BREAK_EVEN_MODEL_VERSION
+                    and isinstance(previous_rows, int)
+                    and 0 < previous_rows <= len(df)
+                    and len(getattr(forest, "estimators_", [])) > 0
+                )
+            except NotFittedError:
+                compatible = False
+            if not compatible:
+                self.log.info("Break-even incremental update unavailable; running a full train.")
+                return self._fit_break_even_model(df)
+
+            new_rows = df.iloc[previous_rows:]
+            if new_rows.empty:
+                return True
+
+            # Score the current forest on labels it has never seen before
+            # growing new trees: a chronological, out-of-sample check.
+            new_predictions = candidate_pipe.predict(new_rows[feats])
+            validation = {
+                "method": "prequential",
+                "rows": int(len(new_rows)),
+                "mae_mph": float(mean_absolute_error(new_rows[target], new_predictions)),
+                "r2": (
+                    float(r2_score(new_rows[target], new_predictions))
+                    if len(new_rows) >= 2
+                    else None
+                ),
+            }
+
+            updates = int(previous_meta.get("incremental_updates") or 0) + 1
+            window = df.iloc[-self.BREAK_EVEN_INCREMENTAL_WINDOW_ROWS:]
+            tree_count = len(forest.estimators_)
+            grow = min(self.BREAK_EVEN_INCREMENTAL_TREES, tree_count)
+            # Vary the seed per update so new trees do not repeat the bootstrap
+            # draws of the trees they replace.
+            forest.set_params(
+                warm_start=True,
+                n_estimators=tree_count + grow,
+                random_state=42 + updates,
+            )
+            candidate_pipe.fit(window[feats], window[target])
+            forest.estimators_ = forest.estimators_[grow:]
+            forest.set_params(warm_start=False, n_estimators=len(forest.estimators_))
+
+            feature_ranges = dict(previous_meta.get("feature_ranges") or {})
+            for col, (mn, mx) in self._collect_feature_ranges(new_rows, feats).items():
+                if col in feature_ranges:
+                    old_mn, old_mx = feature_ranges[col]
+                    mn, mx = min(mn, float(old_mn)), max(mx, float(old_mx))
+                feature_ranges[col] = (mn, mx)
+
+            meta = dict(previous_meta)
+            meta.update({
+                "update_mode": "incremental",
+                "incremental_updates": updates,
+                "feature_ranges": feature_ranges,
+                "target_stats": self._target_stats(df[target]),
+                "trained_at": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                "row_count": int(len(df)),
+                "window_rows": int(len(window)),
+                "trees_replaced": int(grow),
+                "validation": validation,
+            })
+            self._publish_break_even_model(candidate_pipe, meta)
+            self.log.info(
+                f"Updated break-even model with {len(new_rows)} new rows "
+                f"({grow} trees replaced) -> {self.be_path}"
+            )
+            return True
 
 
     def predict_break_even_speed_details(self, data: dict) -> dict:
@@ -513,6 +752,10 @@ class MachineLearningModel:
             "invalid_features": [],
             "out_of_range": {},
         }
+        if not self.ensure_models_loaded(wait=False):
+            # Still loading in the background (or the load failed).
+            details["not_fitted"] = True
+            return details
 
         missing = [k for k in feats if k not in data]
         if missing:
@@ -607,6 +850,154 @@ class MachineLearningModel:
         return mean, std
 
 
+    # -------------------------------------------------------------------------
+    # SECTION: BATCH PREDICTION
+    # -------------------------------------------------------------------------
+    BATTERY_LIFE_FEATURES = ['BP_PVS_milliamp*s', 'BP_PVS_Ah', 'BP_PVS_Voltage']
+    BATCH_RESULT_COLUMNS = ['prediction', 'sigma', 'uncertainty', 'out_of_range', 'out_of_range_features']
+
+    def _empty_batch_result(self, index) -> pd.DataFrame:
+        return pd.DataFrame({
+            'prediction': np.nan,
+            'sigma': np.nan,
+            'uncertainty': np.nan,
+            'out_of_range': False,
+            'out_of_range_features': '',
+        }, index=index)[self.BATCH_RESULT_COLUMNS]
+
+    def _predict_batch_with_uncertainty(self, pipeline: Pipeline, X: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized counterpart of _predict_with_uncertainty for N rows.
+
+        Live predictions are always single rows, so the MovingAverage step is
+        effectively the identity there. It is skipped here so each batch row
+        gets exactly the value live prediction would have produced.
+        """
+        transformed = X
+        for name, step in pipeline.steps[:-1]:
+            if isinstance(step, MovingAverage):
+                continue
+            transformed = step.transform(transformed)
+
+        model = pipeline.steps[-1][1]
+        arr = transformed.to_numpy() if hasattr(transformed, "to_numpy") else np.asarray(transformed)
+        mean = np.asarray(model.predict(transformed), dtype=float)
+        estimators = getattr(model, "estimators_", None)
+        if not estimators or len(estimators) < 2:
+            return mean, np.zeros_like(mean)
+        # One predict call per tree over all rows instead of one per tree per row.
+        per_tree = np.stack([estimator.predict(arr) for estimator in estimators])
+        return mean, per_tree.std(axis=0, ddof=1)
+
+    def _predict_batch(self, df: pd.DataFrame, feats: list[str], pipeline: Pipeline,
+                       ranges: dict, label: str) -> pd.DataFrame:
+        """Shared batch path: validate features, predict valid rows, flag ranges."""
+        result = self._empty_batch_result(df.index)
+        missing = [k for k in feats if k not in df.columns]
+        if missing:
+            self.log.error(f"Missing features for {label} batch: {missing}")
+            return result
+
+        X = df[feats].apply(pd.to_numeric, errors='coerce')
+        # Non-numeric rows stay NaN, matching the live "unavailable" result.
+        valid = X.notna().all(axis=1).to_numpy()
+        if not valid.any():
+            return result
+        X_valid = X.loc[valid]
+
+        try:
+            pred, sigma = self._predict_batch_with_uncertainty(pipeline, X_valid)
+        except NotFittedError:
+            self.log.warning(f"{label} model not fitted yet, skipping batch prediction.")
+            return result
+
+        result.loc[valid, 'prediction'] = pred
+        result.loc[valid, 'sigma'] = sigma
+        result.loc[valid, 'uncertainty'] = 1.96 * sigma
+
+        flagged = pd.Series('', index=X_valid.index, dtype=object)
+        for col in feats:
+            rng = ranges.get(col)
+            if not rng:
+                continue
+            mn, mx = self._diagnostic_feature_range(col, rng)
+            outside = (X_valid[col] < mn) | (X_valid[col] > mx)
+            separator = np.where(flagged == '', '', ';')
+            flagged = flagged.mask(outside, flagged + separator + col)
+        result.loc[valid, 'out_of_range_features'] = flagged
+        result['out_of_range'] = result['out_of_range_features'] != ''
+        return result
+
+    def predict_battery_life_batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Predict remaining time (hours) for every row of `df` in one call.
+
+        Returns a frame aligned to df.index with prediction, sigma,
+        uncertainty (~95% band), out_of_range, and out_of_range_features.
+        Rows with missing or non-numeric features get NaN predictions.
+        """
+        self.ensure_models_loaded()
+        ranges = self.batt_meta.get("feature_ranges", {}) if isinstance(self.batt_meta, dict) else {}
+        return self._predict_batch(df, self.BATTERY_LIFE_FEATURES, self.batt_pipe, ranges, "Battery-life")
+
+    def predict_break_even_batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Predict break-even speed (mph) for every row of `df` in one call."""
+        self.ensure_models_loaded()
+        with self._model_lock:
+            pipeline = self.be_pipe
+            ranges = dict(self.be_meta.get("feature_ranges", {}))
+        return self._predict_batch(df, self.BREAK_EVEN_FEATURES, pipeline, ranges, "Break-even")
+
+    def annotate_session_csv(self, csv_path: str, output_path: str | None = None) -> str | None:
+        """
+        Add offline model predictions to a recorded telemetry CSV.
+
+        Features are built the same way TelemetryApplication.process_data builds
+        them live, and results are written to Offline_* columns so the values
+        recorded during the drive are preserved. Returns the output path.
+        """
+        try:
+            session = pd.read_csv(csv_path, low_memory=False)
+        except Exception as exc:
+            self.log.error(f"Could not read session CSV {csv_path}: {exc}")
+            return None
+
+        def numeric(column, default=np.nan):
+            if column not in session.columns:
+                return pd.Series(default, index=session.index, dtype=float)
+            return pd.to_numeric(session[column], errors='coerce').fillna(default)
+
+        # Live prediction feeds safe_float(..., 0) battery features and uses
+        # the net array estimate as the break-even power query.
+        battery_features = pd.DataFrame({
+            col: numeric(col, 0.0) for col in self.BATTERY_LIFE_FEATURES
+        })
+        break_even_features = pd.DataFrame({
+            'BreakEven_Power_W': numeric('Array_Estimated_Power_W'),
+            'BP_PVS_Voltage': battery_features['BP_PVS_Voltage'],
+        })
+
+        battery = self.predict_battery_life_batch(battery_features)
+        break_even = self.predict_break_even_batch(break_even_features)
+
+        annotated = session.copy()
+        annotated['Offline_Predicted_Remaining_Time'] = battery['prediction']
+        annotated['Offline_Predicted_Remaining_Time_Uncertainty'] = battery['uncertainty']
+        annotated['Offline_Predicted_BreakEven_Speed'] = break_even['prediction']
+        annotated['Offline_Predicted_BreakEven_Speed_Uncertainty'] = break_even['uncertainty']
+        annotated['Offline_Prediction_Out_Of_Range'] = (
+            battery['out_of_range_features'].str.cat(break_even['out_of_range_features'], sep=';')
+            .str.strip(';')
+        )
+
+        if output_path is None:
+            stem, ext = os.path.splitext(os.path.abspath(csv_path))
+            output_path = f"{stem}_annotated{ext or '.csv'}"
+        annotated.to_csv(output_path, index=False)
+        self.log.info(f"Annotated {len(annotated)} session rows -> {output_path}")
+        return output_path
+
+
     # -------------------------------------------------------------------------
     # SECTION: COMBINING & RETRAINING
     # -------------------------------------------------------------------------
@@ -730,14 +1121,18 @@ class MachineLearningModel:
                     continue
 
                 try:
-                    raw = pd.read_csv(file_path)
+                    # The live corpus is mirrored incrementally; imported files
+                    # are cached by identity so repeat imports skip parsing.
+                    if old_file and file_path == os.path.abspath(old_file):
+                        normalized = self._load_training_frame(file_path)
+                    else:
+                        normalized = self.training_store.load_import(file_path)
                 except Exception as exc:
                     # Continue through the rest of the selected files; one bad
                     # export should not block the whole retrain attempt.
                     self.log.warning(f"Skipping unreadable CSV {file_path}: {exc}")
                     continue
 
-                normalized = self._normalize_training_frame(raw, file_path)
                 if normalized.empty:
                     self.log.warning(f"No usable training rows found in {file_path}")
                     continue
@@ -763,8 +1158,10 @@ class MachineLearningModel:
             combined.to_csv(out, index=False)
             self.log.info(f"Combined {len(combined)} usable training rows -> {out}")
 
-            batt_ok = self.train_battery_life_model(out)
-            be_ok = self.train_break_even_model(out)
+            # Fit from the in-memory merged rows; the audit CSV is not re-read.
+            batt_ok = self._fit_battery_life_model(combined)
+            with self._training_lock:
+                be_ok = self._fit_break_even_model(combined)
             if not batt_ok or not be_ok:
                 # Do not promote a merged corpus unless both model artifacts
                 # were actually refreshed from it.
@@ -779,6 +1176,11 @@ class MachineLearningModel:
                 combined.to_csv(tmp_training_path, index=False)
                 os.replace(tmp_training_path, training_path)
                 self.log.info(f"Promoted combined training rows -> {training_path}")
+                try:
+                    self.training_store.replace(training_path, combined)
+                except Exception as exc:
+                    # The next retrain detects the rewrite and rebuilds anyway.
+                    self.log.warning(f"Could not seed training cache for {training_path}: {exc}")
 
             return out
 
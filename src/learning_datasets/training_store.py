@@ -0,0 +1,345 @@
+# src/learning_datasets/training_store.py
+
+"""
+Append-only binary cache of normalized training rows.
+
+training_data.csv stays the human-readable master corpus, but re-parsing the
+whole text file on every retrain gets slower each race day. TrainingStore keeps
+a mirror of that CSV as NumPy .npy segments holding the already-normalized
+TRAINING_COLUMNS. Each sync only parses the CSV bytes appended since the last
+sync, so retraining reads binary columns and never re-parses old text.
+
+Imported CSVs used by combine_and_retrain are cached the same way, keyed by
+path, size, and modification time, so repeated imports skip normalization.
+Only the newest cache file per imported path is kept.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+
+class TrainingStore:
+    """
+    Mirror one CSV file as normalized float64 segments.
+
+    `normalize` is called as normalize(raw_frame, source) and must return a
+    frame containing exactly `columns`; MachineLearningModel passes its own
+    _normalize_training_frame so the cache and the text path agree.
+    """
+    MANIFEST_NAME = 'manifest.json'
+    STORE_VERSION = 2
+    # Auto-retrain syncs every few labels. Merge the small tail segments once
+    # there are enough of them that opening files dominates the load.
+    MAX_SEGMENTS = 32
+    # Bytes hashed at the start and just before the consumed offset to detect
+    # a CSV that was rewritten in place rather than appended to.
+    FINGERPRINT_BYTES = 4096
+
+    def __init__(self, store_dir: str, columns: list[str], normalize):
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.store_dir = os.path.abspath(store_dir)
+        self.columns = list(columns)
+        self.normalize = normalize
+        self._lock = threading.RLock()
+        os.makedirs(self.store_dir, exist_ok=True)
+
+
+    # -------------------------------------------------------------------------
+    # SECTION: PATHS & MANIFEST
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _path_key(path: str) -> str:
+        return hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()[:16]
+
+    def _source_dir(self, csv_path: str) -> str:
+        return os.path.join(self.store_dir, self._path_key(csv_path))
+
+    def _empty_manifest(self, csv_path: str) -> dict:
+        return {
+            "version": self.STORE_VERSION,
+            "source": os.path.abspath(csv_path),
+            "columns": list(self.columns),
+            "header": None,
+            "consumed_bytes": 0,
+            "head_digest": None,
+            "tail_digest": None,
+            "segments": [],
+            "next_segment": 0,
+        }
+
+    def _load_manifest(self, csv_path: str) -> dict:
+        path = os.path.join(self._source_dir(csv_path), self.MANIFEST_NAME)
+        try:
+            with open(path, 'r', encoding='utf-8') as fh:
+                manifest = json.load(fh)
+        except (OSError, ValueError):
+            return self._empty_manifest(csv_path)
+        if (
+            manifest.get("version") != self.STORE_VERSION
+            or manifest.get("columns") != self.columns
+        ):
+            # A schema change invalidates every cached segment.
+            self._clear_source(csv_path)
+            return self._empty_manifest(csv_path)
+        return manifest
+
+    def _save_manifest(self, csv_path: str, manifest: dict):
+        source_dir = self._source_dir(csv_path)
+        os.makedirs(source_dir, exist_ok=True)
+        path = os.path.join(source_dir, self.MANIFEST_NAME)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as fh:
+            json.dump(manifest, fh, indent=2)
+        # The manifest is only replaced after its segments are on disk, so a
+        # crash mid-sync leaves the previous consistent view.
+        os.replace(tmp_path, path)
+
+    def _clear_source(self, csv_path: str):
+        source_dir = self._source_dir(csv_path)
+        if not os.path.isdir(source_dir):
+            return
+        for name in os.listdir(source_dir):
+            if name.endswith('.npy') or name == self.MANIFEST_NAME:
+                try:
+                    os.remove(os.path.join(source_dir, name))
+                except OSError:
+                    pass
+
+
+    # -------------------------------------------------------------------------
+    # SECTION: SEGMENTS
+    # -------------------------------------------------------------------------
+    def _to_array(self, frame: pd.DataFrame) -> np.ndarray:
+        return frame[self.columns].to_numpy(dtype=np.float64, copy=True)
+
+    def _write_segment(self, csv_path: str, manifest: dict, array: np.ndarray, start: int, end: int):
+        # start/end are the CSV byte range the rows were parsed from, so a
+        # byte-limited load can tell which segments lie before its limit.
+        name = f"segment_{manifest['next_segment']:06d}.npy"
+        np.save(os.path.join(self._source_dir(csv_path), name), array)
+        manifest["segments"].append({
+            "file": name,
+            "rows": int(array.shape[0]),
+            "start_bytes": int(start),
+            "end_bytes": int(end),
+        })
+        manifest["next_segment"] += 1
+
+    def _read_segments(self, csv_path: str, segments: list[dict]) -> np.ndarray:
+        source_dir = self._source_dir(csv_path)
+        arrays = [
+            np.load(os.path.join(source_dir, segment["file"]), mmap_mode='r')
+            for segment in segments
+            if segment.get("rows")
+        ]
+        if not arrays:
+            return np.empty((0, len(self.columns)), dtype=np.float64)
+        return np.concatenate(arrays, axis=0)
+
+    def _compact(self, csv_path: str, manifest: dict):
+        segments = manifest["segments"]
+        merged = self._read_segments(csv_path, segments)
+        old_files = [segment["file"] for segment in segments]
+        manifest["segments"] = []
+        self._write_segment(
+            csv_path, manifest, merged, segments[0]["start_bytes"], segments[-1]["end_bytes"]
+        )
+        self._save_manifest(csv_path, manifest)
+        source_dir = self._source_dir(csv_path)
+        for name in old_files:
+            try:
+                os.remove(os.path.join(source_dir, name))
+            except OSError:
+                pass
+
+    def _frame(self, array: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(np.asarray(array), columns=self.columns)
+
+
+    # -------------------------------------------------------------------------
+    # SECTION: CSV MIRROR
+    # -------------------------------------------------------------------------
+    def _digest(self, fh, start: int, stop: int) -> str:
+        start = max(0, start)
+        fh.seek(start)
+        return hashlib.sha1(fh.read(max(0, stop - start))).hexdigest()
+
+    def _fingerprints(self, fh, consumed: int) -> tuple[str, str]:
+        head = self._digest(fh, 0, min(consumed, self.FINGERPRINT_BYTES))
+        tail = self._digest(fh, consumed - self.FINGERPRINT_BYTES, consumed)
+        return head, tail
+
+    def sync(self, csv_path: str, byte_limit: int | None = None) -> dict:
+        """
+        Append any CSV rows written since the last sync and return the manifest.
+
+        `byte_limit` caps the read at a CSVHandler.snapshot_csv offset. A CSV
+        that shrank or whose already-consumed bytes changed is re-mirrored from
+        scratch; otherwise only the new tail is parsed.
+        """
+        with self._lock:
+            manifest = self._load_manifest(csv_path)
+            size = os.path.getsize(csv_path)
+            end = size if byte_limit is None else min(size, int(byte_limit))
+
+            with open(csv_path, 'rb') as fh:
+                header = fh.readline()
+                header_text = header.decode('utf-8', errors='replace').strip()
+                consumed = int(manifest.get("consumed_bytes") or 0)
+                if consumed:
+                    rewritten = (
+                        consumed > size
+                        or manifest.get("header") != header_text
+                        or self._fingerprints(fh, consumed)
+                        != (manifest.get("head_digest"), manifest.get("tail_digest"))
+                    )
+                    if rewritten:
+                        self.log.info(f"Training CSV {csv_path} was rewritten; rebuilding binary cache.")
+                        self._clear_source(csv_path)
+                        manifest = self._empty_manifest(csv_path)
+                        consumed = 0
+
+                start = max(consumed, len(header))
+                if end <= start:
+                    return manifest
+
+                fh.seek(start)
+                payload = fh.read(end - start)
+                # Only consume whole rows; a partially written line is picked
+                # up by the next sync.
+                last_newline = payload.rfind(b'\n')
+                if last_newline < 0:
+                    return manifest
+                payload = payload[:last_newline + 1]
+                new_consumed = start + len(payload)
+
+                raw = pd.read_csv(io.BytesIO(header + payload))
+                normalized = self.normalize(raw, csv_path)
+                os.makedirs(self._source_dir(csv_path), exist_ok=True)
+                if not normalized.empty:
+                    self._write_segment(
+                        csv_path, manifest, self._to_array(normalized), start, new_consumed
+                    )
+
+                head, tail = self._fingerprints(fh, new_consumed)
+                manifest.update({
+                    "header": header_text,
+                    "consumed_bytes": new_consumed,
+                    "head_digest": head,
+                    "tail_digest": tail,
+                })
+            self._save_manifest(csv_path, manifest)
+            if len(manifest["segments"]) > self.MAX_SEGMENTS:
+                self._compact(csv_path, manifest)
+            return manifest
+
+    def load(self, csv_path: str, byte_limit: int | None = None) -> pd.DataFrame:
+        """
+        Sync `csv_path` and return its normalized rows, up to `byte_limit`.
+
+        An earlier unlimited sync may already have mirrored rows past the
+        limit. Segments that end before it are read as-is; the one segment
+        straddling it, if any, has its bytes up to the limit parsed again.
+        """
+        with self._lock:
+            manifest = self.sync(csv_path, byte_limit)
+            segments = manifest["segments"]
+            if byte_limit is None:
+                return self._frame(self._read_segments(csv_path, segments))
+            limit = int(byte_limit)
+            frame = self._frame(self._read_segments(
+                csv_path, [segment for segment in segments if segment["end_bytes"] <= limit]
+            ))
+            straddling = [
+                segment for segment in segments
+                if segment["start_bytes"] < limit < segment["end_bytes"]
+            ]
+            if not straddling:
+                return frame
+            partial = self._parse_range(csv_path, straddling[0]["start_bytes"], limit)
+            if partial.empty:
+                return frame
+            return pd.concat([frame, self._frame(self._to_array(partial))], ignore_index=True)
+
+    def _parse_range(self, csv_path: str, start: int, stop: int) -> pd.DataFrame:
+        # Whole rows between two byte offsets, normalized but not cached.
+        with open(csv_path, 'rb') as fh:
+            header = fh.readline()
+            fh.seek(start)
+            payload = fh.read(max(0, stop - start))
+        last_newline = payload.rfind(b'\n')
+        if last_newline < 0:
+            return pd.DataFrame(columns=self.columns)
+        raw = pd.read_csv(io.BytesIO(header + payload[:last_newline + 1]))
+        return self.normalize(raw, csv_path).reset_index(drop=True)
+
+    def replace(self, csv_path: str, frame: pd.DataFrame):
+        """
+        Record `frame` as the complete normalized content of `csv_path`.
+
+        combine_and_retrain already holds the merged normalized rows when it
+        promotes them into training_data.csv, so it can seed the mirror without
+        parsing the text it just wrote.
+        """
+        with self._lock:
+            self._clear_source(csv_path)
+            manifest = self._empty_manifest(csv_path)
+            os.makedirs(self._source_dir(csv_path), exist_ok=True)
+            with open(csv_path, 'rb') as fh:
+                header = fh.readline()
+                fh.seek(0, os.SEEK_END)
+                consumed = fh.tell()
+                head, tail = self._fingerprints(fh, consumed)
+            if not frame.empty:
+                self._write_segment(csv_path, manifest, self._to_array(frame), len(header), consumed)
+            manifest.update({
+                "header": header.decode('utf-8', errors='replace').strip(),
+                "consumed_bytes": consumed,
+                "head_digest": head,
+                "tail_digest": tail,
+            })
+            self._save_manifest(csv_path, manifest)
+
+
+    # -------------------------------------------------------------------------
+    # SECTION: IMPORTED FILE CACHE
+    # -------------------------------------------------------------------------
+    def load_import(self, csv_path: str) -> pd.DataFrame:
+        """
+        Return normalized rows for an imported CSV, parsing it at most once.
+
+        Imported sessions do not grow, so the cache key is the file identity
+        (path, size, mtime) rather than a byte offset. Writing a new entry
+        removes older entries for the same path.
+        """
+        stat = os.stat(csv_path)
+        identity = f"{os.path.abspath(csv_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        digest = hashlib.sha1(identity.encode('utf-8')).hexdigest()[:16]
+        prefix = f"{self._path_key(csv_path)}_"
+        imports_dir = os.path.join(self.store_dir, 'imports')
+        cache_path = os.path.join(imports_dir, f"{prefix}{digest}.npy")
+        with self._lock:
+            if os.path.exists(cache_path):
+                try:
+                    array = np.load(cache_path)
+                    if array.ndim == 2 and array.shape[1] == len(self.columns):
+                        return self._frame(array)
+                except (OSError, ValueError):
+                    pass
+            normalized = self.normalize(pd.read_csv(csv_path), csv_path)
+            os.makedirs(imports_dir, exist_ok=True)
+            np.save(cache_path, self._to_array(normalized))
+            for name in os.listdir(imports_dir):
+                if name.startswith(prefix) and name != os.path.basename(cache_path):
+                    try:
+                        os.remove(os.path.join(imports_dir, name))
+                    except OSError:
+                        pass
+            return normalized.reset_index(drop=True)
@@ -0,0 +1,356 @@
+# src/navigation_batch.py
+
+"""
+Offline recomputation of GPS trip distance, FSGP laps and route progress.
+
+The live NavigationEngine sees one snapshot at a time. This module replays a
+whole session at once from its lat/lon/speed arrays, using the same rules
+and constants, so a misplaced lap line or a late GPX route can be fixed after
+the fact and a day's laps re-derived from the session CSV.
+
+Everything per sample is vectorized: distance filtering and moving time,
+lap-line intersection and crossing direction for every movement segment,
+distance to the lap line, and nearest-route matching. Only the lap gate
+rules (rearm, direction, cooldown, minimum lap) run in a Python loop, over
+the few samples that actually cross the line.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from key_name_definitions import TelemetryKey
+from navigation_engine import NavigationEngine
+from route_index import EARTH_RADIUS_METERS, RouteIndex, haversine_miles
+from unit_conversion import build_imperial_units_dict, build_metric_units_dict, conversion_plan
+
+
+SPEED_KEY = TelemetryKey.NAV_VEHICLE_MPH.value[0]
+SESSION_COLUMNS = (
+    TelemetryKey.TIMESTAMP.value[0],
+    TelemetryKey.NAV_LATITUDE.value[0],
+    TelemetryKey.NAV_LONGITUDE.value[0],
+    TelemetryKey.NAV_GPS_VALID.value[0],
+    TelemetryKey.NAV_FIX.value[0],
+    SPEED_KEY,
+)
+
+
+@dataclass
+class SessionNavigation:
+    """Recomputed navigation for one session; arrays hold one entry per valid fix."""
+
+    rows: np.ndarray
+    seconds: np.ndarray
+    trip_miles: np.ndarray
+    moving_seconds: np.ndarray
+    route_progress_miles: np.ndarray | None = None
+    crossings: list[dict] = field(default_factory=list)
+    laps: list[dict] = field(default_factory=list)
+
+    @property
+    def lap_count(self):
+        return len(self.laps)
+
+    @property
+    def best_lap_seconds(self):
+        return min((lap["seconds"] for lap in self.laps), default=None)
+
+
+def load_session_csv(csv_path):
+    """
+    Read the GPS columns of a primary session CSV.
+
+    Returns (seconds, lat, lon, speed_mph, valid) arrays, one entry per row.
+    `seconds` counts from the first row's timestamp; speed is converted back
+    to mph when the CSV was written in metric units.
+    """
+    frame = pd.read_csv(
+        csv_path,
+        usecols=lambda column: column in SESSION_COLUMNS or column == "csv_units_mode",
+        low_memory=False,
+    )
+    times = pd.to_datetime(frame[TelemetryKey.TIMESTAMP.value[0]], errors="coerce")
+    seconds = (times - times.min()).dt.total_seconds().to_numpy(dtype=np.float64)
+
+    def numeric(key):
+        if key not in frame:
+            return np.full(len(frame), np.nan)
+        return pd.to_numeric(frame[key], errors="coerce").to_numpy(dtype=np.float64, copy=True)
+
+    speed = numeric(SPEED_KEY)
+    if "csv_units_mode" in frame:
+        # Rows carry the units they were written in; undo any speed conversion.
+        for units_mode in frame["csv_units_mode"].dropna().unique():
+            rows = (frame["csv_units_mode"] == units_mode).to_numpy()
+            speed[rows] = _speed_to_mph(speed[rows], units_mode)
+
+    lat = numeric(TelemetryKey.NAV_LATITUDE.value[0])
+    lon = numeric(TelemetryKey.NAV_LONGITUDE.value[0])
+    valid = (
+        (numeric(TelemetryKey.NAV_GPS_VALID.value[0]) == 1)
+        & (numeric(TelemetryKey.NAV_FIX.value[0]) > 0)
+        & np.isfinite(seconds)
+    )
+    return seconds, lat, lon, speed, valid
+
+
+def _speed_to_mph(values, units_mode):
+    units = build_metric_units_dict() if units_mode == "metric" else build_imperial_units_dict()
+    plan = conversion_plan(SPEED_KEY, units.get(SPEED_KEY, ""))
+    if plan.is_identity or not plan.affine or plan.scale == 0.0:
+        return values
+    return (values - plan.offset) / plan.scale
+
+
+def recompute_session(
+    seconds,
+    lat,
+    lon,
+    speed_mph,
+    valid=None,
+    lap_line=None,
+    route_segments=None,
+    race_mode=NavigationEngine.RACE_MODE_FSGP,
+    track_lap_length_miles=0.0,
+):
+    """
+    Recompute trip distance, laps and route progress for a whole session.
+
+    `lap_line` is ((lat, lon), (lat, lon)) and `route_segments` come from
+    build_route_segment(); either may be None. Samples are fed in order
+    exactly as NavigationEngine.update() would see them with `now` set to
+    `seconds`, and the result matches what a live session with this setup
+    would have produced.
+    """
+    seconds = np.asarray(seconds, dtype=np.float64).reshape(-1)
+    lat = np.asarray(lat, dtype=np.float64).reshape(-1)
+    lon = np.asarray(lon, dtype=np.float64).reshape(-1)
+    speed = np.nan_to_num(np.asarray(speed_mph, dtype=np.float64).reshape(-1), nan=0.0)
+    keep = np.isfinite(lat) & np.isfinite(lon) & ~((np.abs(lat) < 0.000001) & (np.abs(lon) < 0.000001))
+    if valid is not None:
+        keep &= np.asarray(valid, dtype=bool).reshape(-1)
+    rows = np.flatnonzero(keep)
+    seconds, lat, lon, speed = seconds[rows], lat[rows], lon[rows], speed[rows]
+
+    increments, moving_seconds = _trip_increments(seconds, lat, lon, speed)
+    trip_miles = np.cumsum(increments)
+    result = SessionNavigation(
+        rows=rows,
+        seconds=seconds,
+        trip_miles=trip_miles,
+        moving_seconds=np.cumsum(moving_seconds),
+    )
+    if lap_line is not None and race_mode == NavigationEngine.RACE_MODE_FSGP:
+        result.crossings, result.laps = _laps(
+            seconds, lat, lon, speed, trip_miles, lap_line, track_lap_length_miles
+        )
+    if route_segments:
+        result.route_progress_miles = _route_progress(lat, lon, route_segments, race_mode)
+    return result
+
+
+def recompute_session_csv(csv_path, **setup):
+    """recompute_session() over a primary session CSV; see load_session_csv()."""
+    seconds, lat, lon, speed, valid = load_session_csv(csv_path)
+    return recompute_session(seconds, lat, lon, speed, valid=valid, **setup)
+
+
+def _trip_increments(seconds, lat, lon, speed):
+    """Per-fix filtered trip miles and moving seconds, as update_trip_distance() adds them."""
+    count = len(seconds)
+    increments = np.zeros(count, dtype=np.float64)
+    moving_seconds = np.zeros(count, dtype=np.float64)
+    if count < 2:
+        return increments, moving_seconds
+
+    engine = NavigationEngine
+    speed = np.maximum(0.0, speed)
+    moving = speed >= engine.MINIMUM_DISTANCE_SPEED_MPH
+    elapsed = np.maximum(0.0, np.diff(seconds))
+    step_miles = haversine_miles(lat[:-1], lon[:-1], lat[1:], lon[1:])
+    tolerance = (
+        engine.GPS_SEGMENT_BASE_TOLERANCE_MILES
+        + np.maximum(5.0, speed[1:]) * engine.GPS_SEGMENT_SPEED_FACTOR * np.maximum(0.25, elapsed) / 3600.0
+    )
+    counted = moving[1:] & (step_miles <= tolerance)
+    increments[1:] = np.where(counted, step_miles, 0.0)
+
+    # The trip starts at the first moving fix; moving time accrues after it.
+    if moving.any():
+        after_start = np.arange(1, count) > int(np.argmax(moving))
+        timed = moving[1:] & after_start & (elapsed <= engine.MAX_MOVING_TIME_SAMPLE_GAP_SECONDS)
+        moving_seconds[1:] = np.where(timed, elapsed, 0.0)
+    return increments, moving_seconds
+
+
+def _project(lat, lon, ref_lat, ref_lon):
+    x = np.radians(lon - ref_lon) * np.cos(np.radians(ref_lat)) * EARTH_RADIUS_METERS
+    y = np.radians(lat - ref_lat) * EARTH_RADIUS_METERS
+    return x, y
+
+
+def _orientation(px, py, qx, qy, rx, ry):
+    value = (qy - py) * (rx - qx) - (qx - px) * (ry - qy)
+    return np.where(np.abs(value) < 1e-9, 0, np.where(value > 0, 1, 2))
+
+
+def _on_segment(px, py, qx, qy, rx, ry):
+    return (
+        (np.minimum(px, rx) <= qx) & (qx <= np.maximum(px, rx))
+        & (np.minimum(py, ry) <= qy) & (qy <= np.maximum(py, ry))
+    )
+
+
+def _lap_line_geometry(lat, lon, lap_line):
+    """Per movement segment: crossed, direction; per fix: distance to the line in metres."""
+    (start_lat, start_lon), (end_lat, end_lon) = lap_line
+
+    # Intersection, projected around the four points as the live check does.
+    ref_lat = (start_lat + end_lat + lat[:-1] + lat[1:]) / 4.0
+    ref_lon = (start_lon + end_lon + lon[:-1] + lon[1:]) / 4.0
+    ax, ay = _project(lat[:-1], lon[:-1], ref_lat, ref_lon)
+    bx, by = _project(lat[1:], lon[1:], ref_lat, ref_lon)
+    cx, cy = _project(start_lat, start_lon, ref_lat, ref_lon)
+    dx, dy = _project(end_lat, end_lon, ref_lat, ref_lon)
+    o1 = _orientation(ax, ay, bx, by, cx, cy)
+    o2 = _orientation(ax, ay, bx, by, dx, dy)
+    o3 = _orientation(cx, cy, dx, dy, ax, ay)
+    o4 = _orientation(cx, cy, dx, dy, bx, by)
+    crossed = (
+        ((o1 != o2) & (o3 != o4))
+        | ((o1 == 0) & _on_segment(ax, ay, cx, cy, bx, by))
+        | ((o2 == 0) & _on_segment(ax, ay, dx, dy, bx, by))
+        | ((o3 == 0) & _on_segment(cx, cy, ax, ay, dx, dy))
+        | ((o4 == 0) & _on_segment(cx, cy, bx, by, dx, dy))
+    )
+
+    # Crossing direction, projected around the line's midpoint.
+    mid_lat = (start_lat + end_lat) / 2.0
+    mid_lon = (start_lon + end_lon) / 2.0
+    sx, sy = _project(start_lat, start_lon, mid_lat, mid_lon)
+    ex, ey = _project(end_lat, end_lon, mid_lat, mid_lon)
+    px, py = _project(lat, lon, mid_lat, mid_lon)
+    side = (ex - sx) * (py - sy) - (ey - sy) * (px - sx)
+    direction = np.where(
+        (side[:-1] < 0.0) & (0.0 < side[1:]), 1, np.where((side[:-1] > 0.0) & (0.0 > side[1:]), -1, 0)
+    )
+
+    # Distance to the timing segment, projected around the line and the fix.
+    ref_lat = (start_lat + end_lat + lat) / 3.0
+    ref_lon = (start_lon + end_lon + lon) / 3.0
+    sx, sy = _project(start_lat, start_lon, ref_lat, ref_lon)
+    ex, ey = _project(end_lat, end_lon, ref_lat, ref_lon)
+    px, py = _project(lat, lon, ref_lat, ref_lon)
+    line_x, line_y = ex - sx, ey - sy
+    length_squared = line_x * line_x + line_y * line_y
+    with np.errstate(invalid="ignore", divide="ignore"):
+        fraction = ((px - sx) * line_x + (py - sy) * line_y) / length_squared
+    fraction = np.clip(np.nan_to_num(fraction, nan=0.0), 0.0, 1.0)
+    distance = np.hypot(px - (sx + fraction * line_x), py - (sy + fraction * line_y))
+    return crossed, direction, distance
+
+
+def _laps(seconds, lat, lon, speed, trip_miles, lap_line, track_lap_length_miles):
+    """Crossings and completed laps under update_lap_counter()'s gate rules."""
+    engine = NavigationEngine
+    count = len(seconds)
+    if count < 2:
+        return [], []
+
+    crossed, direction, distance = _lap_line_geometry(lat, lon, lap_line)
+    moving = speed >= 1.0
+    # Fix i moves from fix i - 1; stopped fixes never count a crossing.
+    candidates = np.flatnonzero(crossed & moving[1:]) + 1
+    rearms = np.concatenate(([0], np.cumsum(moving[1:] & (distance[1:] >= engine.LAP_LINE_REARM_DISTANCE_METERS))))
+
+    crossings = []
+    laps = []
+    armed = True
+    disarmed_at = 0
+    lap_direction = None
+    last_crossing_at = None
+    started = None
+    for index in candidates.tolist():
+        now = float(seconds[index])
+        crossing_direction = int(direction[index - 1])
+        if started is not None and not armed and rearms[index] > rearms[disarmed_at]:
+            armed = True
+        if not armed:
+            status = "not rearmed"
+        elif lap_direction is not None and crossing_direction != 0 and crossing_direction != lap_direction:
+            armed = False
+            disarmed_at = index
+            status = "wrong direction"
+        elif last_crossing_at is not None and now - last_crossing_at < engine.LAP_CROSSING_COOLDOWN_SECONDS:
+            status = "cooldown"
+        else:
+            last_crossing_at = now
+            armed = False
+            disarmed_at = index
+            if started is None:
+                started = index
+                if crossing_direction != 0:
+                    lap_direction = crossing_direction
+                status = "start"
+            elif now - seconds[started] < engine.MINIMUM_LAP_SECONDS:
+                status = "short lap"
+            else:
+                lap_seconds = now - float(seconds[started])
+                distance_miles = float(trip_miles[index] - trip_miles[started])
+                lap_miles = track_lap_length_miles if track_lap_length_miles > 0 else distance_miles
+                laps.append({
+                    "lap": len(laps) + 1,
+                    "start_seconds": float(seconds[started]),
+                    "end_seconds": now,
+                    "seconds": lap_seconds,
+                    "distance_miles": distance_miles,
+                    "average_speed_mph": lap_miles * 3600.0 / lap_seconds if lap_miles > 0 else None,
+                })
+                started = index
+                status = "lap"
+        crossings.append({
+            "index": index,
+            "seconds": now,
+            "direction": crossing_direction,
+            "status": status,
+        })
+    return crossings, laps
+
+
+def _route_progress(lat, lon, route_segments, race_mode):
+    """Route miles travelled at every fix, as route_metrics() tracks it."""
+    route = RouteIndex([segment["points"] for segment in route_segments])
+    lines, fractions, _distance = route.nearest_many(lat, lon)
+    if race_mode == NavigationEngine.RACE_MODE_ASC and len(lines):
+        _keep_asc_matches_local(route, lat, lon, lines, fractions)
+    progress = np.minimum(route.total_miles, route.line_progress_miles(lines, fractions))
+    if race_mode == NavigationEngine.RACE_MODE_ASC:
+        # Point-to-point progress never moves backwards.
+        progress = np.maximum.accumulate(progress)
+    return progress
+
+
+def _keep_asc_matches_local(route, lat, lon, lines, fractions):
+    # ASC matches stay within a window of the previous match, as in
+    # nearest_route_position(); only fixes whose global match falls outside
+    # that window are searched again.
+    window_meters = NavigationEngine.ROUTE_WINDOW_MAX_MILES * NavigationEngine.METERS_PER_MILE
+    flat = route.flat_index[lines]
+    previous = int(flat[0])
+    for index in range(1, len(lines)):
+        if previous - 500 <= flat[index] < previous + 501:
+            previous = int(flat[index])
+            continue
+        best = route.nearest(
+            lat[index],
+            lon[index],
+            flat_range=(previous - 500, previous + 501),
+            max_distance_m=window_meters,
+        )
+        if best is not None:
+            lines[index] = int(np.searchsorted(route.flat_index, best[3]))
+            fractions[index] = best[2]
+            flat[index] = best[3]
+        previous = int(flat[index])
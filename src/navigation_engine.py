@@ -0,0 +1,733 @@
+# src/navigation_engine.py
+
+"""
+Headless GPS navigation metrics: trip distance, FSGP laps and ASC route progress.
+
+NavigationEngine holds the lap, trip and route state and turns telemetry
+snapshots into the NAV_* telemetry fields. It has no Qt dependency, so the
+live ingest path, the map tab and offline replay or batch analysis share one
+implementation and it can be benchmarked on its own. Time-dependent methods
+take an optional `now` in seconds on a monotonic clock: live callers omit it
+and get time.monotonic(), offline callers pass the sample timestamps.
+
+Updates and operator actions (lap line, resets, race mode) take one lock, so
+ingest may run on a worker thread while the map tab edits the setup.
+"""
+
+import math
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+
+from key_name_definitions import TelemetryKey
+from route_index import RouteIndex, cumulative_miles, haversine_miles
+
+
+RACE_MODE_FSGP = "FSGP Track"
+RACE_MODE_ASC = "ASC Route"
+
+
+def format_duration(seconds):
+    if seconds is None:
+        return "N/A"
+    try:
+        total_seconds = int(max(0, round(float(seconds))))
+    except (TypeError, ValueError):
+        return "N/A"
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+def format_eta(distance_miles, speed_mph):
+    try:
+        speed = float(speed_mph)
+    except (TypeError, ValueError):
+        speed = 0.0
+    if speed <= 0:
+        return "N/A"
+    total_seconds = int(round((distance_miles / speed) * 3600))
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+def project_to_meters(point, ref_lat, ref_lon):
+    radius_meters = 6371008.8
+    lat, lon = point
+    x = math.radians(lon - ref_lon) * math.cos(math.radians(ref_lat)) * radius_meters
+    y = math.radians(lat - ref_lat) * radius_meters
+    return x, y
+
+
+def segments_intersect(a, b, c, d):
+    def orientation(p, q, r):
+        value = (q[1] - p[1]) * (r[0] - q[0]) - (q[0] - p[0]) * (r[1] - q[1])
+        if abs(value) < 1e-9:
+            return 0
+        return 1 if value > 0 else 2
+
+    def on_segment(p, q, r):
+        return (
+            min(p[0], r[0]) <= q[0] <= max(p[0], r[0])
+            and min(p[1], r[1]) <= q[1] <= max(p[1], r[1])
+        )
+
+    o1 = orientation(a, b, c)
+    o2 = orientation(a, b, d)
+    o3 = orientation(c, d, a)
+    o4 = orientation(c, d, b)
+
+    if o1 != o2 and o3 != o4:
+        return True
+    if o1 == 0 and on_segment(a, c, b):
+        return True
+    if o2 == 0 and on_segment(a, d, b):
+        return True
+    if o3 == 0 and on_segment(c, a, d):
+        return True
+    if o4 == 0 and on_segment(c, b, d):
+        return True
+    return False
+
+
+def parse_gpx_points(file_path):
+    """(lat, lon) of every track, route and waypoint in a GPX file, in order."""
+    root = ET.parse(file_path).getroot()
+    points = []
+    for element in root.iter():
+        tag = element.tag.split("}", 1)[-1].lower()
+        if tag not in {"trkpt", "rtept", "wpt"}:
+            continue
+        lat = element.attrib.get("lat")
+        lon = element.attrib.get("lon")
+        if lat is None or lon is None:
+            continue
+        points.append((float(lat), float(lon)))
+    return points
+
+
+def build_route_segment(file_path, points):
+    """Route segment dict for one GPX file's points."""
+    cumulative = cumulative_miles(points)
+    name = os.path.basename(file_path)
+    if name.lower().endswith(".gpx"):
+        name = name[:-4]
+    return {
+        "name": name,
+        "points": points,
+        "cumulative_miles": cumulative,
+        "length_miles": float(cumulative[-1]),
+    }
+
+
+def _rounded_or_na(value, digits=2):
+    return "N/A" if value is None else round(value, digits)
+
+
+def _safe_float(value, default=0.0):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _as_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_int(value):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+class NavigationEngine:
+    RACE_MODE_FSGP = RACE_MODE_FSGP
+    RACE_MODE_ASC = RACE_MODE_ASC
+    LAP_CROSSING_COOLDOWN_SECONDS = 8.0
+    MINIMUM_LAP_SECONDS = 30.0
+    LAP_LINE_REARM_DISTANCE_METERS = 20.0
+    MINIMUM_DISTANCE_SPEED_MPH = 1.0
+    GPS_SEGMENT_BASE_TOLERANCE_MILES = 0.002
+    GPS_SEGMENT_SPEED_FACTOR = 2.5
+    MAX_MOVING_TIME_SAMPLE_GAP_SECONDS = 5.0
+    ROUTE_WINDOW_MAX_MILES = 2.0
+    METERS_PER_MILE = 1609.344
+
+    def __init__(self, race_mode=RACE_MODE_FSGP, track_lap_length_miles=0.0, fsgp_day_duration_hours=0.0):
+        self._lock = threading.RLock()
+        self.race_mode = race_mode
+        self.track_lap_length_miles = track_lap_length_miles
+        self.fsgp_day_duration_hours = fsgp_day_duration_hours
+        self.route_segments = []
+        self.route_points = []
+        self.route_index = None
+        self.route_last_flat_index = None
+        self.route_progress_miles = 0.0
+        self.lap_start_point = None
+        self.lap_end_point = None
+        # Last valid fix, used for route metrics when a snapshot has none.
+        self.last_position = None
+        self.reset_laps()
+        self.reset_trip()
+        if self.race_mode == self.RACE_MODE_ASC:
+            self.lap_status = "ASC route mode"
+
+    # -------------------------------------------------------------------------
+    # SECTION: SETUP
+    # -------------------------------------------------------------------------
+    def set_route(self, segments):
+        """Use route segments from build_route_segment() and restart progress."""
+        with self._lock:
+            self.route_segments = segments
+            self.route_points = [point for segment in segments for point in segment["points"]]
+            self.route_index = RouteIndex([segment["points"] for segment in segments])
+            self.route_last_flat_index = None
+            self.route_progress_miles = 0.0
+
+    def clone_setup(self):
+        """
+        A new engine with this engine's route, lap line and race settings but
+        fresh lap and trip state.
+
+        Offline replays run on a clone: their sample timestamps are not on the
+        live monotonic clock, and mixing the two would corrupt live lap timing.
+        The precomputed route index is shared, as it is never modified.
+        """
+        with self._lock:
+            clone = NavigationEngine(self.race_mode, self.track_lap_length_miles, self.fsgp_day_duration_hours)
+            clone.route_segments = self.route_segments
+            clone.route_points = self.route_points
+            clone.route_index = self.route_index
+            clone.set_lap_line(self.lap_start_point, self.lap_end_point)
+            if clone.race_mode == clone.RACE_MODE_ASC:
+                clone.lap_status = "ASC route mode"
+            return clone
+
+    def set_lap_line(self, start_point, end_point):
+        with self._lock:
+            self.lap_start_point = start_point
+            self.lap_end_point = end_point
+            self.reset_laps()
+
+    def set_race_mode(self, mode):
+        if mode not in {self.RACE_MODE_FSGP, self.RACE_MODE_ASC}:
+            return
+        with self._lock:
+            previous_mode = self.race_mode
+            self.race_mode = mode
+            if mode != previous_mode:
+                # Completed laps remain available, but a partial circuit cannot be
+                # meaningfully resumed after operating in point-to-point mode.
+                self.lap_started_at = None
+                self.previous_lap_point = None
+                self.current_lap_distance_miles = 0.0
+                self.lap_crossing_armed = True
+                self.lap_status = (
+                    "ASC route mode"
+                    if mode == self.RACE_MODE_ASC
+                    else ("Ready" if self.lap_line_ready() else "Set start/end line")
+                )
+
+    def reset_laps(self):
+        with self._lock:
+            self.previous_lap_point = None
+            self.lap_count = 0
+            self.lap_started_at = None
+            self.last_lap_seconds = None
+            self.best_lap_seconds = None
+            self.completed_lap_seconds = []
+            self.current_lap_distance_miles = 0.0
+            self.completed_lap_distances_miles = []
+            self.last_crossing_at = None
+            self.lap_crossing_direction = None
+            self.lap_crossing_armed = True
+            self.lap_status = "Ready" if self.lap_line_ready() else "Set start/end line"
+
+    def reset_trip(self):
+        with self._lock:
+            self.trip_distance_miles = 0.0
+            self.trip_started_at = None
+            self.previous_trip_point = None
+            self.previous_trip_at = None
+            self.day_moving_seconds = 0.0
+            self.day_max_speed_mph = 0.0
+            self.route_progress_miles = 0.0
+            self.route_last_flat_index = None
+
+    # -------------------------------------------------------------------------
+    # SECTION: UPDATES
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def fix_from_snapshot(telemetry_data):
+        """Return (lat, lon, speed_mph, has_location) from NAV_* telemetry fields."""
+        lat = _as_float(telemetry_data.get(TelemetryKey.NAV_LATITUDE.value[0]))
+        lon = _as_float(telemetry_data.get(TelemetryKey.NAV_LONGITUDE.value[0]))
+        valid = _as_int(telemetry_data.get(TelemetryKey.NAV_GPS_VALID.value[0]))
+        fix = _as_int(telemetry_data.get(TelemetryKey.NAV_FIX.value[0]))
+        speed = _as_float(telemetry_data.get(TelemetryKey.NAV_VEHICLE_MPH.value[0])) or 0.0
+        has_location = (
+            lat is not None
+            and lon is not None
+            and valid == 1
+            and fix > 0
+            and not (abs(lat) < 0.000001 and abs(lon) < 0.000001)
+        )
+        return lat, lon, speed, has_location
+
+    def update(self, telemetry_data, update_laps=True, now=None):
+        """Advance trip and lap state from one telemetry snapshot; return NAV_* metrics."""
+        lat, lon, speed, has_location = self.fix_from_snapshot(telemetry_data)
+        if not has_location:
+            return self.metrics(speed, now=now)
+        return self.metrics(speed, update_laps=update_laps, lat=lat, lon=lon, now=now)
+
+    def metrics(self, speed_mph, update_laps=False, lat=None, lon=None, now=None):
+        with self._lock:
+            now = time.monotonic() if now is None else now
+            distance_increment = 0.0
+            if lat is not None and lon is not None:
+                self.last_position = (lat, lon)
+                if update_laps:
+                    distance_increment = self.update_trip_distance(lat, lon, speed_mph, now=now)
+                    if self.race_mode == self.RACE_MODE_FSGP:
+                        self.update_lap_counter(
+                            lat,
+                            lon,
+                            speed_mph,
+                            distance_increment_miles=distance_increment,
+                            now=now,
+                        )
+            metrics = self.route_metrics(speed_mph, lat=lat, lon=lon)
+            metrics.update(self.lap_metrics(now=now))
+            metrics.update(self.distance_metrics(now=now))
+            return metrics
+
+    def update_trip_distance(self, lat, lon, speed_mph, now=None):
+        """Accumulate filtered GPS distance and return this sample's increment."""
+        current_point = (lat, lon)
+        now = time.monotonic() if now is None else now
+        speed = max(0.0, _safe_float(speed_mph))
+        self.day_max_speed_mph = max(self.day_max_speed_mph, speed)
+        if self.previous_trip_point is None or self.previous_trip_at is None:
+            self.previous_trip_point = current_point
+            self.previous_trip_at = now
+            if speed >= self.MINIMUM_DISTANCE_SPEED_MPH:
+                self.trip_started_at = now
+            return 0.0
+
+        elapsed = max(0.0, now - self.previous_trip_at)
+        segment_miles = haversine_miles(
+            self.previous_trip_point[0],
+            self.previous_trip_point[1],
+            lat,
+            lon,
+        )
+        self.previous_trip_point = current_point
+        self.previous_trip_at = now
+
+        if speed < self.MINIMUM_DISTANCE_SPEED_MPH:
+            return 0.0
+        if self.trip_started_at is None:
+            self.trip_started_at = now
+        elif elapsed <= self.MAX_MOVING_TIME_SAMPLE_GAP_SECONDS:
+            self.day_moving_seconds += elapsed
+
+        max_segment_miles = (
+            self.GPS_SEGMENT_BASE_TOLERANCE_MILES
+            + max(5.0, speed) * self.GPS_SEGMENT_SPEED_FACTOR * max(0.25, elapsed) / 3600.0
+        )
+        if segment_miles > max_segment_miles:
+            return 0.0
+
+        self.trip_distance_miles += segment_miles
+        return segment_miles
+
+    def update_lap_counter(self, lat, lon, speed_mph, distance_increment_miles=0.0, now=None):
+        current_point = (lat, lon)
+        if not self.lap_line_ready():
+            self.previous_lap_point = current_point
+            self.lap_status = "Set start/end line"
+            return
+
+        if self.previous_lap_point is None:
+            self.previous_lap_point = current_point
+            self.lap_status = "Ready"
+            return
+
+        now = time.monotonic() if now is None else now
+        if _safe_float(speed_mph) < 1.0:
+            self.previous_lap_point = current_point
+            self.lap_status = "Waiting for movement"
+            return
+
+        if self.lap_started_at is not None and distance_increment_miles > 0:
+            self.current_lap_distance_miles += distance_increment_miles
+
+        if (
+            self.lap_started_at is not None
+            and not self.lap_crossing_armed
+            and self.distance_to_lap_line_meters(current_point)
+            >= self.LAP_LINE_REARM_DISTANCE_METERS
+        ):
+            self.lap_crossing_armed = True
+
+        crossed = self.movement_crossed_lap_line(self.previous_lap_point, current_point)
+        crossing_direction = self.lap_line_crossing_direction(self.previous_lap_point, current_point)
+        self.previous_lap_point = current_point
+        if not crossed:
+            if self.lap_started_at is not None:
+                self.lap_status = "Timing"
+            return
+
+        if not self.lap_crossing_armed:
+            self.lap_status = "Crossing ignored: lap gate not rearmed"
+            return
+
+        if (
+            self.lap_crossing_direction is not None
+            and crossing_direction != 0
+            and crossing_direction != self.lap_crossing_direction
+        ):
+            self.lap_crossing_armed = False
+            self.lap_status = "Crossing ignored: wrong direction"
+            return
+
+        if (
+            self.last_crossing_at is not None
+            and now - self.last_crossing_at < self.LAP_CROSSING_COOLDOWN_SECONDS
+        ):
+            self.lap_status = "Crossing cooldown"
+            return
+
+        self.last_crossing_at = now
+        self.lap_crossing_armed = False
+        if self.lap_started_at is None:
+            self.lap_started_at = now
+            self.current_lap_distance_miles = 0.0
+            if crossing_direction != 0:
+                self.lap_crossing_direction = crossing_direction
+            self.lap_status = "Timing started"
+            return
+
+        lap_seconds = now - self.lap_started_at
+        if lap_seconds < self.MINIMUM_LAP_SECONDS:
+            self.lap_status = (
+                f"Lap ignored: under {self.MINIMUM_LAP_SECONDS:.0f} seconds"
+            )
+            return
+
+        self.lap_count += 1
+        self.last_lap_seconds = lap_seconds
+        self.completed_lap_seconds.append(lap_seconds)
+        self.completed_lap_distances_miles.append(self.current_lap_distance_miles)
+        if self.best_lap_seconds is None or lap_seconds < self.best_lap_seconds:
+            self.best_lap_seconds = lap_seconds
+        self.lap_started_at = now
+        self.current_lap_distance_miles = 0.0
+        self.lap_status = f"Lap {self.lap_count} complete"
+
+    # -------------------------------------------------------------------------
+    # SECTION: METRICS
+    # -------------------------------------------------------------------------
+    def route_metrics(self, speed_mph, lat=None, lon=None):
+        # Route metrics are returned as telemetry fields so the normal GUI and
+        # CSV paths can display them without a GPS-map-specific data channel.
+        defaults = {
+            TelemetryKey.NAV_ROUTE_NAME.value[0]: "N/A",
+            TelemetryKey.NAV_CHECKPOINT_NAME.value[0]: "N/A",
+            TelemetryKey.NAV_ROUTE_DISTANCE_REMAINING_MI.value[0]: "N/A",
+            TelemetryKey.NAV_ROUTE_DISTANCE_TRAVELED_MI.value[0]: "N/A",
+            TelemetryKey.NAV_CHECKPOINT_DISTANCE_REMAINING_MI.value[0]: "N/A",
+            TelemetryKey.NAV_CHECKPOINT_ETA.value[0]: "N/A",
+        }
+        if (lat is None or lon is None) and self.last_position is not None:
+            lat, lon = self.last_position
+        if lat is None or lon is None or not self.route_segments:
+            return defaults
+
+        nearest = self.nearest_route_position(lat, lon)
+        if nearest is None:
+            return defaults
+
+        # Progress and checkpoint lookups use the arrays precomputed at load.
+        route = self.route_index
+        candidate_progress = route.progress_miles(*nearest)
+        total_route_miles = route.total_miles
+        if self.race_mode == self.RACE_MODE_ASC:
+            # ASC is point-to-point: never move route progress backwards when
+            # GPS jitters or a route doubles back near an earlier point.
+            self.route_progress_miles = min(
+                total_route_miles, max(self.route_progress_miles, candidate_progress)
+            )
+        else:
+            self.route_progress_miles = min(total_route_miles, candidate_progress)
+
+        segment_index = route.segment_at(self.route_progress_miles)
+        miles_before_segment = float(route.segment_start_miles[segment_index])
+
+        segment = self.route_segments[segment_index]
+        segment_progress = max(0.0, self.route_progress_miles - miles_before_segment)
+        checkpoint_remaining = max(0.0, float(route.segment_miles[segment_index]) - segment_progress)
+        route_remaining = max(0.0, total_route_miles - self.route_progress_miles)
+        return {
+            TelemetryKey.NAV_ROUTE_NAME.value[0]: " + ".join(
+                segment["name"] for segment in self.route_segments
+            ),
+            TelemetryKey.NAV_CHECKPOINT_NAME.value[0]: segment["name"],
+            TelemetryKey.NAV_ROUTE_DISTANCE_REMAINING_MI.value[0]: round(route_remaining, 2),
+            TelemetryKey.NAV_ROUTE_DISTANCE_TRAVELED_MI.value[0]: round(self.route_progress_miles, 2),
+            TelemetryKey.NAV_CHECKPOINT_DISTANCE_REMAINING_MI.value[0]: round(checkpoint_remaining, 2),
+            TelemetryKey.NAV_CHECKPOINT_ETA.value[0]: format_eta(checkpoint_remaining, speed_mph),
+        }
+
+    def lap_metrics(self, now=None):
+        current_seconds = self.current_lap_seconds(now)
+        average_seconds = self.average_lap_seconds()
+        current_speed = self.current_lap_average_speed(current_seconds)
+        completed_speeds = self.completed_lap_average_speeds()
+        last_speed = completed_speeds[-1] if completed_speeds else None
+        numeric_speeds = [speed for speed in completed_speeds if speed is not None]
+        best_speed = max(numeric_speeds) if numeric_speeds else None
+        average_speed = self.average_completed_lap_speed()
+        return {
+            TelemetryKey.NAV_LAP_COUNT.value[0]: self.lap_count,
+            TelemetryKey.NAV_CURRENT_LAP_TIME.value[0]: format_duration(current_seconds),
+            TelemetryKey.NAV_LAST_LAP_TIME.value[0]: format_duration(self.last_lap_seconds),
+            TelemetryKey.NAV_BEST_LAP_TIME.value[0]: format_duration(self.best_lap_seconds),
+            TelemetryKey.NAV_AVERAGE_LAP_TIME.value[0]: format_duration(average_seconds),
+            TelemetryKey.NAV_CURRENT_LAP_DISTANCE_MI.value[0]: round(self.current_lap_distance_miles, 3),
+            TelemetryKey.NAV_CURRENT_LAP_AVERAGE_SPEED_MPH.value[0]: _rounded_or_na(current_speed),
+            TelemetryKey.NAV_LAST_LAP_AVERAGE_SPEED_MPH.value[0]: _rounded_or_na(last_speed),
+            TelemetryKey.NAV_BEST_LAP_AVERAGE_SPEED_MPH.value[0]: _rounded_or_na(best_speed),
+            TelemetryKey.NAV_AVERAGE_LAP_SPEED_MPH.value[0]: _rounded_or_na(average_speed),
+            TelemetryKey.NAV_LAP_STATUS.value[0]: (
+                "ASC route mode" if self.race_mode == self.RACE_MODE_ASC else self.lap_status
+            ),
+        }
+
+    def distance_metrics(self, now=None):
+        session_average = self.session_average_speed(now)
+        moving_average = self.day_moving_average_speed()
+        day_elapsed = self.day_elapsed_seconds(now)
+        stopped_seconds = max(0.0, day_elapsed - self.day_moving_seconds)
+        official_distance = self.fsgp_official_distance()
+        time_remaining, projected_laps, projected_distance = self.fsgp_projection(now)
+        return {
+            TelemetryKey.NAV_RACE_MODE.value[0]: self.race_mode,
+            TelemetryKey.NAV_GPS_TRIP_DISTANCE_MI.value[0]: round(self.trip_distance_miles, 3),
+            TelemetryKey.NAV_SESSION_AVERAGE_SPEED_MPH.value[0]: _rounded_or_na(session_average),
+            TelemetryKey.NAV_DAY_MOVING_AVERAGE_SPEED_MPH.value[0]: _rounded_or_na(moving_average),
+            TelemetryKey.NAV_DAY_MAX_SPEED_MPH.value[0]: round(self.day_max_speed_mph, 2),
+            TelemetryKey.NAV_DAY_ELAPSED_TIME.value[0]: format_duration(day_elapsed),
+            TelemetryKey.NAV_DAY_MOVING_TIME.value[0]: format_duration(self.day_moving_seconds),
+            TelemetryKey.NAV_DAY_STOPPED_TIME.value[0]: format_duration(stopped_seconds),
+            TelemetryKey.NAV_FSGP_LAP_LENGTH_MI.value[0]: round(self.track_lap_length_miles, 3),
+            TelemetryKey.NAV_FSGP_OFFICIAL_DISTANCE_MI.value[0]: round(official_distance, 3),
+            TelemetryKey.NAV_FSGP_DAY_DURATION_H.value[0]: round(self.fsgp_day_duration_hours, 1),
+            TelemetryKey.NAV_FSGP_TIME_REMAINING.value[0]: format_duration(time_remaining),
+            TelemetryKey.NAV_FSGP_PROJECTED_TOTAL_LAPS.value[0]: (
+                "N/A" if projected_laps is None else projected_laps
+            ),
+            TelemetryKey.NAV_FSGP_PROJECTED_DISTANCE_MI.value[0]: _rounded_or_na(
+                projected_distance, digits=2
+            ),
+        }
+
+    def current_lap_seconds(self, now=None):
+        if self.lap_started_at is None:
+            return None
+        now = time.monotonic() if now is None else now
+        return now - self.lap_started_at
+
+    def average_lap_seconds(self):
+        if len(self.completed_lap_seconds) < 3:
+            return None
+        return sum(self.completed_lap_seconds) / len(self.completed_lap_seconds)
+
+    def completed_lap_average_speeds(self):
+        speeds = []
+        for index, seconds in enumerate(self.completed_lap_seconds):
+            if seconds <= 0:
+                speeds.append(None)
+                continue
+            distance = self.track_lap_length_miles
+            if distance <= 0 and index < len(self.completed_lap_distances_miles):
+                distance = self.completed_lap_distances_miles[index]
+            speeds.append(distance * 3600.0 / seconds if distance > 0 else None)
+        return speeds
+
+    def average_completed_lap_speed(self):
+        if len(self.completed_lap_seconds) < 3:
+            return None
+        total_seconds = sum(self.completed_lap_seconds)
+        if total_seconds <= 0:
+            return None
+        if self.track_lap_length_miles > 0:
+            total_distance = self.track_lap_length_miles * len(self.completed_lap_seconds)
+        else:
+            total_distance = sum(self.completed_lap_distances_miles)
+        return total_distance * 3600.0 / total_seconds if total_distance > 0 else None
+
+    def current_lap_average_speed(self, current_seconds=None):
+        if current_seconds is None or current_seconds <= 0 or self.lap_started_at is None:
+            return None
+        if self.current_lap_distance_miles <= 0:
+            return None
+        return self.current_lap_distance_miles * 3600.0 / current_seconds
+
+    def session_average_speed(self, now=None):
+        if self.trip_started_at is None or self.trip_distance_miles <= 0:
+            return None
+        elapsed = self.day_elapsed_seconds(now)
+        if elapsed <= 0:
+            return None
+        return self.trip_distance_miles * 3600.0 / elapsed
+
+    def day_elapsed_seconds(self, now=None):
+        if self.trip_started_at is None:
+            return 0.0
+        now = time.monotonic() if now is None else now
+        return max(0.0, now - self.trip_started_at)
+
+    def day_moving_average_speed(self):
+        if self.trip_distance_miles <= 0 or self.day_moving_seconds <= 0:
+            return None
+        return self.trip_distance_miles * 3600.0 / self.day_moving_seconds
+
+    def fsgp_official_distance(self):
+        if self.track_lap_length_miles > 0:
+            return self.lap_count * self.track_lap_length_miles
+        return sum(self.completed_lap_distances_miles)
+
+    def fsgp_projection(self, now=None):
+        if self.race_mode != self.RACE_MODE_FSGP or self.fsgp_day_duration_hours <= 0:
+            return None, None, None
+        now = time.monotonic() if now is None else now
+        scheduled_seconds = self.fsgp_day_duration_hours * 3600.0
+        remaining_seconds = max(0.0, scheduled_seconds - self.day_elapsed_seconds(now))
+        average_lap_seconds = self.average_lap_seconds()
+        if average_lap_seconds is None or average_lap_seconds <= 0:
+            return remaining_seconds, None, None
+
+        current_progress_seconds = 0.0
+        if self.lap_started_at is not None:
+            current_progress_seconds = min(
+                max(0.0, now - self.lap_started_at),
+                average_lap_seconds,
+            )
+        additional_laps = 0
+        if remaining_seconds > 0:
+            additional_laps = int(
+                (remaining_seconds + current_progress_seconds) // average_lap_seconds
+            )
+        projected_total_laps = self.lap_count + additional_laps
+
+        lap_distance = self.track_lap_length_miles
+        if lap_distance <= 0 and self.completed_lap_distances_miles:
+            lap_distance = sum(self.completed_lap_distances_miles) / len(
+                self.completed_lap_distances_miles
+            )
+        projected_distance = (
+            projected_total_laps * lap_distance if lap_distance > 0 else None
+        )
+        return remaining_seconds, projected_total_laps, projected_distance
+
+    # -------------------------------------------------------------------------
+    # SECTION: GEOMETRY
+    # -------------------------------------------------------------------------
+    def lap_line_ready(self):
+        return self.lap_start_point is not None and self.lap_end_point is not None
+
+    def movement_crossed_lap_line(self, previous_point, current_point):
+        ref_lat = (self.lap_start_point[0] + self.lap_end_point[0] + previous_point[0] + current_point[0]) / 4.0
+        ref_lon = (self.lap_start_point[1] + self.lap_end_point[1] + previous_point[1] + current_point[1]) / 4.0
+        a = project_to_meters(previous_point, ref_lat, ref_lon)
+        b = project_to_meters(current_point, ref_lat, ref_lon)
+        c = project_to_meters(self.lap_start_point, ref_lat, ref_lon)
+        d = project_to_meters(self.lap_end_point, ref_lat, ref_lon)
+        return segments_intersect(a, b, c, d)
+
+    def lap_line_crossing_direction(self, previous_point, current_point):
+        """Return the side-to-side direction of a lap-line crossing."""
+        ref_lat = (self.lap_start_point[0] + self.lap_end_point[0]) / 2.0
+        ref_lon = (self.lap_start_point[1] + self.lap_end_point[1]) / 2.0
+        start = project_to_meters(self.lap_start_point, ref_lat, ref_lon)
+        end = project_to_meters(self.lap_end_point, ref_lat, ref_lon)
+        previous = project_to_meters(previous_point, ref_lat, ref_lon)
+        current = project_to_meters(current_point, ref_lat, ref_lon)
+
+        def side(point):
+            return (
+                (end[0] - start[0]) * (point[1] - start[1])
+                - (end[1] - start[1]) * (point[0] - start[0])
+            )
+
+        previous_side = side(previous)
+        current_side = side(current)
+        if previous_side < 0.0 < current_side:
+            return 1
+        if previous_side > 0.0 > current_side:
+            return -1
+        return 0
+
+    def distance_to_lap_line_meters(self, point):
+        """Return the shortest distance from a GPS point to the timing segment."""
+        ref_lat = (self.lap_start_point[0] + self.lap_end_point[0] + point[0]) / 3.0
+        ref_lon = (self.lap_start_point[1] + self.lap_end_point[1] + point[1]) / 3.0
+        start = project_to_meters(self.lap_start_point, ref_lat, ref_lon)
+        end = project_to_meters(self.lap_end_point, ref_lat, ref_lon)
+        projected_point = project_to_meters(point, ref_lat, ref_lon)
+        line_x = end[0] - start[0]
+        line_y = end[1] - start[1]
+        line_length_squared = line_x * line_x + line_y * line_y
+        if line_length_squared <= 0.0:
+            return math.hypot(projected_point[0] - start[0], projected_point[1] - start[1])
+        fraction = (
+            (projected_point[0] - start[0]) * line_x
+            + (projected_point[1] - start[1]) * line_y
+        ) / line_length_squared
+        fraction = max(0.0, min(1.0, fraction))
+        nearest_x = start[0] + fraction * line_x
+        nearest_y = start[1] + fraction * line_y
+        return math.hypot(projected_point[0] - nearest_x, projected_point[1] - nearest_y)
+
+    def current_route_index(self):
+        """RouteIndex for route_segments, rebuilt if the segments were replaced."""
+        points = [segment["points"] for segment in self.route_segments]
+        indexed = self.route_index.segments if self.route_index is not None else None
+        if indexed is None or len(indexed) != len(points) or any(
+            old is not new for old, new in zip(indexed, points)
+        ):
+            self.route_index = RouteIndex(points)
+        return self.route_index
+
+    def nearest_route_position(self, lat, lon):
+        """Return (segment_index, point_index, fraction) of the closest route point."""
+        if not len(self.current_route_index()):
+            return None
+
+        # After the first fix, ASC matches are kept near the last one so a route
+        # that doubles back does not jump ahead. The full route is searched
+        # only when the car is more than two miles from that local window.
+        best = None
+        if self.race_mode == self.RACE_MODE_ASC and self.route_last_flat_index is not None:
+            best = self.route_index.nearest(
+                lat,
+                lon,
+                flat_range=(self.route_last_flat_index - 500, self.route_last_flat_index + 501),
+                max_distance_m=self.ROUTE_WINDOW_MAX_MILES * self.METERS_PER_MILE,
+            )
+        if best is None:
+            best = self.route_index.nearest(lat, lon)
+        if best is None:
+            return None
+        segment_index, point_index, fraction, flat_index, _distance = best
+        self.route_last_flat_index = flat_index
+        return segment_index, point_index, fraction
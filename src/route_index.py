@@ -0,0 +1,326 @@
+# src/route_index.py
+
+"""
+Precomputed geometry and spatial index for loaded GPX routes.
+
+Everything the live route metrics need is computed once when a route is
+loaded: point coordinates in radians and projected metres, cumulative miles
+along every route file, and prefix sums across files. Per-snapshot progress
+and checkpoint lookups are then array indexing and searchsorted.
+
+Routes are indexed as line segments in a local equirectangular projection
+(metres around the route's mean latitude). Every segment is registered in the
+uniform grid cells it passes through, so a lookup only measures the segments
+in a few cells around the fix instead of every route point. Distances are true
+point-to-segment projections, which keeps progress accurate between sparse
+GPX points.
+"""
+
+import math
+
+import numpy as np
+
+
+EARTH_RADIUS_METERS = 6371008.8
+EARTH_RADIUS_MILES = 3958.7613
+
+
+def haversine_miles(lat1, lon1, lat2, lon2):
+    """Great-circle miles between degree coordinates; accepts NumPy arrays."""
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = np.radians(np.asarray(lon2, dtype=np.float64) - lon1)
+    a = np.sin(d_phi / 2.0) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(d_lambda / 2.0) ** 2
+    return EARTH_RADIUS_MILES * 2.0 * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
+
+
+def cumulative_miles(points):
+    """Running great-circle distance along `points`, starting at 0.0."""
+    coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    cumulative = np.zeros(len(coords), dtype=np.float64)
+    if len(coords) > 1:
+        steps = haversine_miles(coords[:-1, 0], coords[:-1, 1], coords[1:, 0], coords[1:, 1])
+        np.cumsum(steps, out=cumulative[1:])
+    return cumulative
+
+
+class RouteIndex:
+    MIN_CELL_METERS = 20.0
+    MAX_CELL_METERS = 500.0
+    # Fixes farther than this many cells from any line are measured against
+    # the whole route in one vectorized pass instead of ring by ring.
+    MAX_SEARCH_RINGS = 32
+    # Upper bound on fix x line distances measured in one nearest_many() pass.
+    BATCH_MEASUREMENTS = 4_000_000
+
+    def __init__(self, segments):
+        """
+        `segments` is a list of point lists, one per route file. Segments are
+        only formed between consecutive points of the same list.
+        """
+        self.segments = segments
+        sizes = np.array([len(points) for points in segments], dtype=np.int64)
+        coords = np.array(
+            [point for points in segments for point in points], dtype=np.float64
+        ).reshape(-1, 2)
+        lats, lons = coords[:, 0], coords[:, 1]
+        self.lat_radians = np.radians(lats)
+        self.lon_radians = np.radians(lons)
+        self.ref_lat = float(lats.mean()) if len(lats) else 0.0
+        self.ref_lon = float(lons.mean()) if len(lons) else 0.0
+        x, y = self.project(lats, lons)
+        self.x, self.y = x, y
+
+        # Flat point index where each route file starts, per-file length, and
+        # route miles before each file (one extra entry for the total).
+        self.segment_offsets = np.concatenate(([0], np.cumsum(sizes)[:-1])).astype(np.int64)
+        self.point_miles = np.concatenate(
+            [cumulative_miles(points) for points in segments]
+        ) if len(coords) else np.empty(0, dtype=np.float64)
+        self.segment_miles = np.array(
+            [self.point_miles[offset + size - 1] if size else 0.0
+             for offset, size in zip(self.segment_offsets, sizes)],
+            dtype=np.float64,
+        )
+        self.segment_start_miles = np.concatenate(([0.0], np.cumsum(self.segment_miles)))
+        self.total_miles = float(self.segment_start_miles[-1])
+
+        # Per indexed line: route segment, start point within it, flat index of
+        # the start point, and projected end points. A one-point route becomes
+        # a zero-length line so it can still be matched.
+        route_index, point_index, flat_index = [], [], []
+        start = 0
+        for segment_index, points in enumerate(segments):
+            count = len(points)
+            lines = max(count - 1, 1 if count else 0)
+            route_index.append(np.full(lines, segment_index, dtype=np.int64))
+            point_index.append(np.arange(lines, dtype=np.int64))
+            flat_index.append(start + np.arange(lines, dtype=np.int64))
+            start += count
+        self.route_index = np.concatenate(route_index) if route_index else np.empty(0, dtype=np.int64)
+        self.point_index = np.concatenate(point_index) if point_index else np.empty(0, dtype=np.int64)
+        self.flat_index = np.concatenate(flat_index) if flat_index else np.empty(0, dtype=np.int64)
+        end = self.flat_index + np.minimum(1, sizes[self.route_index] - 1)
+        self.ax, self.ay = x[self.flat_index], y[self.flat_index]
+        self.bx, self.by = x[end], y[end]
+        # Route miles at both ends of every line, for batch progress lookups.
+        start_miles = self.segment_start_miles[self.route_index]
+        self.line_start_miles = start_miles + self.point_miles[self.flat_index]
+        self.line_end_miles = start_miles + self.point_miles[end]
+        self._build_grid()
+
+    def __len__(self):
+        return len(self.route_index)
+
+    def progress_miles(self, segment_index, point_index, fraction=0.0):
+        """Route miles at `fraction` of the way from a point to the next one."""
+        flat = self.segment_offsets[segment_index] + point_index
+        miles = self.point_miles[flat]
+        if fraction and point_index + 1 < len(self.segments[segment_index]):
+            miles += fraction * (self.point_miles[flat + 1] - miles)
+        return float(self.segment_start_miles[segment_index] + miles)
+
+    def segment_at(self, progress_miles):
+        """Index of the route file containing `progress_miles` of travel."""
+        index = int(np.searchsorted(self.segment_start_miles[1:], progress_miles, side="left"))
+        return min(index, len(self.segments) - 1)
+
+    def project(self, lat, lon):
+        """Project degrees to metres around the route's reference point."""
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        x = np.radians(lon - self.ref_lon) * math.cos(math.radians(self.ref_lat)) * EARTH_RADIUS_METERS
+        y = np.radians(lat - self.ref_lat) * EARTH_RADIUS_METERS
+        return x, y
+
+    # -------------------------------------------------------------------------
+    # SECTION: GRID
+    # -------------------------------------------------------------------------
+    def _build_grid(self):
+        lengths = np.hypot(self.bx - self.ax, self.by - self.ay)
+        typical = float(np.median(lengths)) if len(lengths) else 0.0
+        self.cell = min(self.MAX_CELL_METERS, max(self.MIN_CELL_METERS, 2.0 * typical))
+        self._cells = {}
+        if not len(lengths):
+            return
+
+        # Sample every line at half-cell steps and register it in each cell a
+        # sample falls in. A line that only clips a cell corner can be missed
+        # there, which nearest() allows for when deciding to stop searching.
+        samples = np.maximum(1, np.ceil(lengths / (self.cell / 2.0)).astype(np.int64)) + 1
+        line = np.repeat(np.arange(len(lengths)), samples)
+        first = np.repeat(np.cumsum(samples) - samples, samples)
+        fraction = (np.arange(len(line)) - first) / np.repeat(samples - 1, samples)
+        sx = self.ax[line] + fraction * (self.bx[line] - self.ax[line])
+        sy = self.ay[line] + fraction * (self.by[line] - self.ay[line])
+        cx = np.floor(sx / self.cell).astype(np.int64)
+        cy = np.floor(sy / self.cell).astype(np.int64)
+        self._min_cx, self._max_cx = int(cx.min()), int(cx.max())
+        self._min_cy, self._max_cy = int(cy.min()), int(cy.max())
+
+        pairs = np.unique(np.stack((cx, cy, line), axis=1), axis=0)
+        breaks = np.flatnonzero(np.any(pairs[1:, :2] != pairs[:-1, :2], axis=1)) + 1
+        for group in np.split(pairs, breaks):
+            self._cells[(int(group[0, 0]), int(group[0, 1]))] = group[:, 2]
+
+    def _ring(self, cx, cy, radius):
+        if radius == 0:
+            found = self._cells.get((cx, cy))
+            return [] if found is None else [found]
+        found = []
+        for x in range(cx - radius, cx + radius + 1):
+            for y in (cy - radius, cy + radius):
+                lines = self._cells.get((x, y))
+                if lines is not None:
+                    found.append(lines)
+        for y in range(cy - radius + 1, cy + radius):
+            for x in (cx - radius, cx + radius):
+                lines = self._cells.get((x, y))
+                if lines is not None:
+                    found.append(lines)
+        return found
+
+    # -------------------------------------------------------------------------
+    # SECTION: QUERIES
+    # -------------------------------------------------------------------------
+    def _measure(self, lines, px, py):
+        dx = self.bx[lines] - self.ax[lines]
+        dy = self.by[lines] - self.ay[lines]
+        length_squared = dx * dx + dy * dy
+        with np.errstate(invalid="ignore", divide="ignore"):
+            fraction = ((px - self.ax[lines]) * dx + (py - self.ay[lines]) * dy) / length_squared
+        fraction = np.clip(np.nan_to_num(fraction, nan=0.0), 0.0, 1.0)
+        distance = np.hypot(self.ax[lines] + fraction * dx - px, self.ay[lines] + fraction * dy - py)
+        return distance, fraction
+
+    def _closest(self, lines, px, py, flat_range):
+        if flat_range is not None and len(lines):
+            flat = self.flat_index[lines]
+            lines = lines[(flat >= flat_range[0]) & (flat < flat_range[1])]
+        if not len(lines):
+            return None
+        distance, fraction = self._measure(lines, px, py)
+        pick = int(np.argmin(distance))
+        line = int(lines[pick])
+        return (
+            int(self.route_index[line]),
+            int(self.point_index[line]),
+            float(fraction[pick]),
+            int(self.flat_index[line]),
+            float(distance[pick]),
+        )
+
+    def nearest(self, lat, lon, flat_range=None, max_distance_m=None):
+        """
+        Closest point on the route to (lat, lon).
+
+        Returns (segment_index, point_index, fraction, flat_index, distance_m)
+        where the match lies `fraction` of the way from point_index to the
+        next point, or None when no line qualifies. `flat_range` limits the
+        search to lines whose start point's flat index is in [low, high), and
+        `max_distance_m` ignores anything farther away.
+        """
+        if not len(self):
+            return None
+        px, py = (float(value) for value in self.project(lat, lon))
+        cx = math.floor(px / self.cell)
+        cy = math.floor(py / self.cell)
+
+        # Beyond this ring every cell of the grid has been visited.
+        last_ring = max(
+            abs(cx - self._min_cx), abs(cx - self._max_cx),
+            abs(cy - self._min_cy), abs(cy - self._max_cy),
+        )
+        if max_distance_m is not None:
+            last_ring = min(last_ring, int(max_distance_m // self.cell) + 2)
+
+        best = None
+        best_distance = math.inf
+        seen = set()
+        settled = False
+        for radius in range(min(last_ring, self.MAX_SEARCH_RINGS) + 1):
+            # A line is registered in every cell it crosses except possibly a
+            # clipped corner, so anything unvisited is at least (radius - 1)
+            # cells away once ring `radius` has been searched.
+            if best is not None and best_distance <= (radius - 1) * self.cell:
+                settled = True
+                break
+            found = self._ring(cx, cy, radius)
+            if not found:
+                continue
+            lines = np.unique(np.concatenate(found))
+            if seen:
+                lines = lines[[line not in seen for line in lines.tolist()]]
+            seen.update(lines.tolist())
+            candidate = self._closest(lines, px, py, flat_range)
+            if candidate is not None and candidate[-1] < best_distance:
+                best, best_distance = candidate, candidate[-1]
+        else:
+            settled = last_ring <= self.MAX_SEARCH_RINGS
+
+        if not settled:
+            best = self._closest(np.arange(len(self)), px, py, flat_range)
+            best_distance = math.inf if best is None else best[-1]
+
+        if best is None or (max_distance_m is not None and best_distance > max_distance_m):
+            return None
+        return best
+
+    def nearest_many(self, lat, lon):
+        """
+        nearest() for arrays of fixes, as (line, fraction, distance_m) arrays.
+
+        `line` indexes the route lines (-1 where the route is empty) and the
+        match lies `fraction` of the way along it. Fixes are grouped by grid
+        cell and each group is measured against the lines registered in the
+        3x3 cells around it at once. A match farther than one cell away could
+        be beaten by a line outside those cells, so those fixes are measured
+        against the whole route instead.
+        """
+        lat = np.asarray(lat, dtype=np.float64).reshape(-1)
+        lon = np.asarray(lon, dtype=np.float64).reshape(-1)
+        px, py = self.project(lat, lon)
+        count = len(px)
+        lines = np.full(count, -1, dtype=np.int64)
+        fractions = np.zeros(count, dtype=np.float64)
+        distances = np.full(count, np.inf, dtype=np.float64)
+        if not len(self) or not count:
+            return lines, fractions, distances
+
+        cells = np.stack((np.floor(px / self.cell), np.floor(py / self.cell)), axis=1).astype(np.int64)
+        unique_cells, group = np.unique(cells, axis=0, return_inverse=True)
+        group = group.reshape(-1)
+        order = np.argsort(group, kind="stable")
+        bounds = np.searchsorted(group[order], np.arange(len(unique_cells) + 1))
+        for cell_number, (cx, cy) in enumerate(unique_cells.tolist()):
+            found = self._ring(cx, cy, 0) + self._ring(cx, cy, 1)
+            if not found:
+                continue
+            candidates = np.unique(np.concatenate(found))
+            members = order[bounds[cell_number]:bounds[cell_number + 1]]
+            distance, fraction = self._measure(candidates[None, :], px[members, None], py[members, None])
+            pick = np.argmin(distance, axis=1)
+            rows = np.arange(len(members))
+            lines[members] = candidates[pick]
+            fractions[members] = fraction[rows, pick]
+            distances[members] = distance[rows, pick]
+
+        # Far fixes are measured against every line, a few thousand at a time.
+        far = np.flatnonzero(distances > self.cell)
+        all_lines = np.arange(len(self))[None, :]
+        step = max(1, self.BATCH_MEASUREMENTS // len(self))
+        for first in range(0, len(far), step):
+            members = far[first:first + step]
+            distance, fraction = self._measure(all_lines, px[members, None], py[members, None])
+            pick = np.argmin(distance, axis=1)
+            rows = np.arange(len(members))
+            lines[members] = pick
+            fractions[members] = fraction[rows, pick]
+            distances[members] = distance[rows, pick]
+        return lines, fractions, distances
+
+    def line_progress_miles(self, lines, fractions):
+        """Route miles at `fractions` along `lines`; the batch progress_miles()."""
+        start = self.line_start_miles[lines]
+        return start + fractions * (self.line_end_miles[lines] - start)
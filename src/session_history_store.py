@@ -0,0 +1,205 @@
+# src/session_history_store.py
+
+"""
+Append-only, memory-mapped history of plotted telemetry for one session.
+
+Graph tabs keep only their longest live window in memory. This store keeps
+every snapshot of the graphed keys on disk as one raw column file per key
+(float32 values, float64 epoch timestamps), so a graph can page through the
+whole race day by mapping just the slices it draws. Rows are buffered and
+written in blocks to keep per-flush file I/O small.
+"""
+
+import json
+import logging
+import math
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+
+
+class SessionHistoryStore:
+    MANIFEST_NAME = 'manifest.json'
+    STORE_VERSION = 1
+    TIME_FILE = 'time.f8'
+    TIME_DTYPE = np.float64
+    VALUE_DTYPE = np.float32
+    # Pending rows are written once either limit is reached.
+    BLOCK_ROWS = 64
+    BLOCK_SECONDS = 5.0
+
+    def __init__(self, session_dir: str, keys: list[str]):
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.session_dir = os.path.abspath(session_dir)
+        self._lock = threading.RLock()
+        os.makedirs(self.session_dir, exist_ok=True)
+
+        manifest = self._load_manifest()
+        self.keys = list(manifest.get("keys") or [])
+        self.rows = int(manifest.get("rows") or 0)
+        self._truncate_to_rows()
+        for key in keys:
+            if key not in self.keys:
+                self._add_column(key)
+        self._column_index = {key: index for index, key in enumerate(self.keys)}
+        self._pending_times = []
+        self._pending_values = []
+        self._last_write = time.monotonic()
+        self._save_manifest()
+
+    @classmethod
+    def create_session(cls, history_root: str, keys: list[str], keep_sessions: int = 7, prefix: str = 'session_'):
+        """
+        Start a new timestamped session under `history_root` and prune old ones.
+
+        Only sessions with the same `prefix` are counted and pruned, so turbo
+        replay sessions never evict race-day history.
+        """
+        cls.prune_sessions(history_root, max(0, keep_sessions - 1), prefix)
+        name = datetime.now().strftime(f'{prefix}%Y%m%d_%H%M%S')
+        # Two sessions started within one second must not share a directory.
+        path, suffix = os.path.join(history_root, name), 1
+        while os.path.exists(path):
+            suffix += 1
+            path = os.path.join(history_root, f"{name}_{suffix}")
+        return cls(path, keys)
+
+    @staticmethod
+    def prune_sessions(history_root: str, keep: int, prefix: str = 'session_'):
+        if not os.path.isdir(history_root):
+            return
+        sessions = sorted(
+            name for name in os.listdir(history_root)
+            if name.startswith(prefix) and os.path.isdir(os.path.join(history_root, name))
+        )
+        for name in sessions[:max(0, len(sessions) - keep)]:
+            shutil.rmtree(os.path.join(history_root, name), ignore_errors=True)
+
+    # -------------------------------------------------------------------------
+    # SECTION: FILES & MANIFEST
+    # -------------------------------------------------------------------------
+    def _column_file(self, index: int) -> str:
+        return os.path.join(self.session_dir, f"col_{index:04d}.f4")
+
+    def _time_file(self) -> str:
+        return os.path.join(self.session_dir, self.TIME_FILE)
+
+    def _load_manifest(self) -> dict:
+        path = os.path.join(self.session_dir, self.MANIFEST_NAME)
+        try:
+            with open(path, 'r', encoding='utf-8') as fh:
+                manifest = json.load(fh)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get("version") != self.STORE_VERSION:
+            return {}
+        return manifest
+
+    def _save_manifest(self):
+        path = os.path.join(self.session_dir, self.MANIFEST_NAME)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as fh:
+            json.dump({"version": self.STORE_VERSION, "keys": self.keys, "rows": self.rows}, fh, indent=2)
+        os.replace(tmp_path, path)
+
+    def _truncate_to_rows(self):
+        # The manifest row count is only advanced after every column block is
+        # written, so bytes beyond it belong to an interrupted write.
+        files = [(self._time_file(), self.TIME_DTYPE)]
+        files += [(self._column_file(index), self.VALUE_DTYPE) for index in range(len(self.keys))]
+        for path, dtype in files:
+            expected = self.rows * np.dtype(dtype).itemsize
+            if not os.path.exists(path):
+                self.rows = 0
+                continue
+            if os.path.getsize(path) != expected:
+                with open(path, 'r+b') as fh:
+                    fh.truncate(min(expected, os.path.getsize(path)))
+        if self.rows == 0:
+            for path, _dtype in files:
+                with open(path, 'wb'):
+                    pass
+
+    def _add_column(self, key: str):
+        index = len(self.keys)
+        # A key that appears mid-session is backfilled with gaps.
+        np.full(self.rows, np.nan, dtype=self.VALUE_DTYPE).tofile(self._column_file(index))
+        self.keys.append(key)
+
+
+    # -------------------------------------------------------------------------
+    # SECTION: WRITING
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _coerce(value) -> float:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            value = float(value)
+            return value if math.isfinite(value) else math.nan
+        return math.nan
+
+    def append(self, timestamp: float, snapshot: dict):
+        """Buffer one snapshot; non-numeric or missing values are stored as NaN."""
+        with self._lock:
+            self._pending_times.append(float(timestamp))
+            self._pending_values.append([self._coerce(snapshot.get(key)) for key in self.keys])
+            if (
+                len(self._pending_times) >= self.BLOCK_ROWS
+                or time.monotonic() - self._last_write >= self.BLOCK_SECONDS
+            ):
+                self.flush()
+
+    def flush(self):
+        """Write buffered rows to the column files."""
+        with self._lock:
+            self._last_write = time.monotonic()
+            if not self._pending_times:
+                return
+            block = np.asarray(self._pending_values, dtype=self.VALUE_DTYPE)
+            try:
+                with open(self._time_file(), 'ab') as fh:
+                    np.asarray(self._pending_times, dtype=self.TIME_DTYPE).tofile(fh)
+                for index in range(len(self.keys)):
+                    with open(self._column_file(index), 'ab') as fh:
+                        np.ascontiguousarray(block[:, index]).tofile(fh)
+            except OSError as e:
+                self.log.error(f"Failed to write session history: {e}")
+                self._truncate_to_rows()
+                return
+            self.rows += len(self._pending_times)
+            self._pending_times = []
+            self._pending_values = []
+            self._save_manifest()
+
+
+    # -------------------------------------------------------------------------
+    # SECTION: READING
+    # -------------------------------------------------------------------------
+    def has_key(self, key: str) -> bool:
+        return key in self._column_index
+
+    def _map(self, path: str, dtype, rows: int):
+        if rows == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode='r', shape=(rows,))
+
+    def flushed_times(self):
+        """Memory-mapped timestamps of every written row."""
+        with self._lock:
+            return self._map(self._time_file(), self.TIME_DTYPE, self.rows)
+
+    def flushed_column(self, key: str):
+        """Memory-mapped values of `key` for every written row."""
+        with self._lock:
+            return self._map(self._column_file(self._column_index[key]), self.VALUE_DTYPE, self.rows)
+
+    def pending(self, key: str):
+        """(times, values) of rows still buffered in memory."""
+        with self._lock:
+            index = self._column_index[key]
+            times = np.asarray(self._pending_times, dtype=self.TIME_DTYPE)
+            values = np.asarray([row[index] for row in self._pending_values], dtype=np.float64)
+            return times, values
@@ -1,10 +1,11 @@
-﻿import csv
-import os
+﻿import os
 import random
 import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 
+import pandas as pd
 from PyQt6.QtCore import QObject, QThread, pyqtSignal
 
 
@@ -46,6 +47,98 @@ def _parse_replay_timestamp(value):
     return None
 
 
+class ReplayData:
+    """
+    A replay CSV parsed once: one dict per row plus each row's timestamp.
+
+    Column types are inferred per column instead of per value. Numeric
+    columns become Python floats (ints when every value is integral text);
+    other columns are coerced value by value with _coerce_value, once per
+    distinct value. Missing cells are None, as with the row-by-row reader.
+    """
+
+    def __init__(self, file_path: str):
+        frame = pd.read_csv(
+            file_path,
+            dtype=str,
+            keep_default_na=False,
+            na_values=[""],
+            encoding="utf-8",
+        )
+        columns = {}
+        for name in frame.columns:
+            columns[name] = self._coerce_column(frame[name])
+        self.rows = [dict(zip(columns, values)) for values in zip(*columns.values())] if columns else []
+        self.timestamps = (
+            self._parse_timestamps(frame["timestamp"]) if "timestamp" in frame else [None] * len(self.rows)
+        )
+
+    @staticmethod
+    def _parse_timestamps(column):
+        # The application's own format parses in one vectorized pass; only
+        # other spellings (ISO "T", offsets, fractions) go through the
+        # per-value parser.
+        parsed = pd.to_datetime(column, format="%Y-%m-%d %H:%M:%S", errors="coerce")
+        stamps = [None if pd.isna(value) else value.to_pydatetime() for value in parsed]
+        for position in (parsed.isna() & column.notna()).to_numpy().nonzero()[0].tolist():
+            stamps[position] = _parse_replay_timestamp(column.iat[position])
+        return stamps
+
+    @staticmethod
+    def _coerce_column(column):
+        present = column.dropna()
+        numbers = pd.to_numeric(present, errors="coerce")
+        # Only plain decimal columns written all as integers or all with a
+        # decimal point are converted in one pass. Exponents, padding, words
+        # and columns mixing "5" with "5.5" take the per-value path, so the
+        # result always matches _coerce_value.
+        has_point = present.str.contains(".", regex=False)
+        uniform = has_point.all() or not has_point.any()
+        if len(present) and uniform and numbers.notna().all() and not present.str.contains(r"[^0-9.+\-]").any():
+            converted = numbers.astype("float64") if has_point.any() else numbers.astype("int64")
+            values = [None] * len(column)
+            positions = column.index.get_indexer(present.index)
+            for position, value in zip(positions.tolist(), converted.tolist()):
+                values[position] = value
+            return values
+        # Mixed or text columns: coerce each distinct value once.
+        cache = {}
+        values = []
+        for value in column.tolist():
+            if value not in cache:
+                cache[value] = _coerce_value(value) if isinstance(value, str) else None
+            values.append(cache[value])
+        return values
+
+    def seconds(self):
+        """Per-row POSIX seconds, or None where the timestamp did not parse."""
+        return [None if stamp is None else stamp.timestamp() for stamp in self.timestamps]
+
+
+_replay_cache = OrderedDict()
+REPLAY_CACHE_FILES = 2
+
+
+def load_replay_data(file_path: str) -> ReplayData:
+    """
+    Parsed ReplayData for a CSV, reusing the last parse while the file is unchanged.
+
+    The cache is keyed by path, size and modification time and holds the
+    REPLAY_CACHE_FILES most recent files, so replaying the same race day
+    again skips parsing entirely.
+    """
+    stat = os.stat(file_path)
+    key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+    data = _replay_cache.get(key)
+    if data is None:
+        data = ReplayData(file_path)
+        _replay_cache[key] = data
+        while len(_replay_cache) > REPLAY_CACHE_FILES:
+            _replay_cache.popitem(last=False)
+    _replay_cache.move_to_end(key)
+    return data
+
+
 def _scaled_delay(previous_timestamp, current_timestamp, speed: float, fallback_interval: float) -> float:
     speed = max(0.1, float(speed or 1.0))
     if previous_timestamp is None or current_timestamp is None:
@@ -58,15 +151,30 @@ def _scaled_delay(previous_timestamp, current_timestamp, speed: float, fallback_
 
 class _ReplayWorker(QObject):
     data_ready = pyqtSignal(dict)
+    # Turbo replay: a list of rows and a parallel list of their recorded
+    # POSIX seconds. Rows without a usable timestamp are given one
+    # fallback_interval after the previous row.
+    batch_ready = pyqtSignal(list, list)
     finished = pyqtSignal()
     error = pyqtSignal(str)
 
-    def __init__(self, file_path: str, speed_getter, stop_event: threading.Event):
+    TURBO_BATCH_ROWS = 200
+
+    def __init__(
+        self,
+        file_path: str,
+        speed_getter,
+        stop_event: threading.Event,
+        turbo: bool = False,
+        batch_slots: threading.Semaphore | None = None,
+    ):
         super().__init__()
         self.file_path = file_path
         self.speed_getter = speed_getter
         self.fallback_interval = 1.0
         self.stop_event = stop_event
+        self.turbo = turbo
+        self.batch_slots = batch_slots
 
     def _current_speed(self) -> float:
         try:
@@ -76,34 +184,69 @@ class _ReplayWorker(QObject):
 
     def run(self):
         try:
-            with open(self.file_path, "r", newline="", encoding="utf-8") as fh:
-                reader = csv.DictReader(fh)
-                previous_timestamp = None
-                first_row = True
-                for row in reader:
+            replay = load_replay_data(self.file_path)
+            if self.turbo:
+                self._run_turbo(replay)
+                return
+            previous_timestamp = None
+            for index, (row, current_timestamp) in enumerate(zip(replay.rows, replay.timestamps)):
+                if self.stop_event.is_set():
+                    break
+                delay = _scaled_delay(
+                    previous_timestamp,
+                    current_timestamp,
+                    self._current_speed(),
+                    self.fallback_interval,
+                )
+                if index and delay > 0:
+                    self.stop_event.wait(delay)
                     if self.stop_event.is_set():
                         break
-                    current_timestamp = _parse_replay_timestamp(row.get("timestamp"))
-                    delay = _scaled_delay(
-                        previous_timestamp,
-                        current_timestamp,
-                        self._current_speed(),
-                        self.fallback_interval,
-                    )
-                    if not first_row and delay > 0:
-                        self.stop_event.wait(delay)
-                        if self.stop_event.is_set():
-                            break
-                    data = {k: _coerce_value(v) for k, v in row.items()}
-                    data.setdefault("timestamp", datetime.utcnow().isoformat(timespec="seconds"))
-                    self.data_ready.emit(data)
-                    previous_timestamp = current_timestamp
-                    first_row = False
+                self.data_ready.emit(self._with_timestamp(row))
+                previous_timestamp = current_timestamp
         except Exception as exc:
             self.error.emit(str(exc))
         finally:
             self.finished.emit()
 
+    def _run_turbo(self, replay: ReplayData):
+        # No sleeping and one queued signal per batch: the receiver, not the
+        # recorded spacing, sets the pace.
+        seconds = self._filled_seconds(replay.seconds())
+        for start in range(0, len(replay.rows), self.TURBO_BATCH_ROWS):
+            # Wait for the receiver to finish an earlier batch so a stop takes
+            # effect quickly instead of after the whole file has been queued.
+            while self.batch_slots is not None and not self.batch_slots.acquire(timeout=0.1):
+                if self.stop_event.is_set():
+                    return
+            if self.stop_event.is_set():
+                break
+            end = start + self.TURBO_BATCH_ROWS
+            self.batch_ready.emit(
+                [self._with_timestamp(row) for row in replay.rows[start:end]],
+                seconds[start:end],
+            )
+
+    def _filled_seconds(self, seconds):
+        # Rows before the first parsed timestamp count back from it; a file
+        # with no timestamps at all starts at the current time.
+        first = next((value for value in seconds if value is not None), None)
+        leading = next((index for index, value in enumerate(seconds) if value is not None), len(seconds))
+        anchor = time.time() if first is None else first - leading * self.fallback_interval
+        previous = anchor - self.fallback_interval
+        filled = []
+        for value in seconds:
+            previous = previous + self.fallback_interval if value is None else value
+            filled.append(previous)
+        return filled
+
+    @staticmethod
+    def _with_timestamp(row: dict) -> dict:
+        # Rows are shared with the replay cache, so never mutate them here.
+        if "timestamp" in row:
+            return row
+        return {**row, "timestamp": datetime.utcnow().isoformat(timespec="seconds")}
+
 
 class _SyntheticWorker(QObject):
     data_ready = pyqtSignal(dict)
@@ -178,16 +321,21 @@ class TelemetrySimulator(QObject):
     """
 
     data_ready = pyqtSignal(dict)
+    batch_ready = pyqtSignal(list, list)
     error = pyqtSignal(str)
     finished = pyqtSignal()
     started = pyqtSignal(str)
 
+    # Turbo batches queued to the receiver at once; see batch_done().
+    TURBO_BATCHES_IN_FLIGHT = 2
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._thread: QThread | None = None
         self._worker: QObject | None = None
         self._stop_event = threading.Event()
         self._replay_speed = 1.0
+        self._batch_slots = threading.Semaphore(self.TURBO_BATCHES_IN_FLIGHT)
 
     def stop(self):
         self._stop_event.set()
@@ -198,14 +346,29 @@ class TelemetrySimulator(QObject):
         self._worker = None
         self._stop_event = threading.Event()
 
-    def start_replay(self, file_path: str, speed: float = 1.0):
+    def start_replay(self, file_path: str, speed: float = 1.0, turbo: bool = False):
+        """
+        Replay a recorded CSV. Turbo replay ignores the speed, never sleeps,
+        and delivers rows through batch_ready instead of data_ready.
+        """
         if not os.path.exists(file_path):
             self.error.emit(f"Replay file not found: {file_path}")
             return
         self.stop()
         self.set_replay_speed(speed)
-        worker = _ReplayWorker(file_path, lambda: self._replay_speed, self._stop_event)
-        self._start_worker(worker, mode="replay")
+        self._batch_slots = threading.Semaphore(self.TURBO_BATCHES_IN_FLIGHT)
+        worker = _ReplayWorker(
+            file_path,
+            lambda: self._replay_speed,
+            self._stop_event,
+            turbo=turbo,
+            batch_slots=self._batch_slots,
+        )
+        self._start_worker(worker, mode="turbo replay" if turbo else "replay")
+
+    def batch_done(self):
+        """Called by the batch_ready receiver once it has handled a batch."""
+        self._batch_slots.release()
 
     def set_replay_speed(self, speed: float):
         self._replay_speed = max(0.1, float(speed or 1.0))
@@ -223,6 +386,8 @@ class TelemetrySimulator(QObject):
         worker.moveToThread(thread)
         thread.started.connect(worker.run)
         worker.data_ready.connect(self.data_ready.emit)
+        if hasattr(worker, "batch_ready"):
+            worker.batch_ready.connect(self.batch_ready.emit)
         worker.error.connect(self.error.emit)
         worker.finished.connect(self.finished.emit)
         worker.finished.connect(thread.quit)
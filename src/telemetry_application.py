@@ -103,6 +103,7 @@ class TelemetryApplication(QObject):
     """
 
     update_data_signal = pyqtSignal(dict)  # Emits enriched telemetry snapshots to GUI/buffer listeners.
+    replay_data_signal = pyqtSignal(dict, float)  # Turbo replay snapshots with their recorded POSIX time.
     training_complete_signal = pyqtSignal(object)  # Emits None on success or an exception-like object on failure.
 
     def __init__(self, baudrate=9600, buffer_timeout=2.0, buffer_size=20,
@@ -125,6 +126,11 @@ class TelemetryApplication(QObject):
         self.selected_port = None
         self.endianness = 'little'  # Default endianness
         self.gui = None
+        # Qt-free lap/route state, owned by the map tab and fed by process_data.
+        self.navigation_engine = None
+        # Turbo replay rows carry recorded timestamps, not the live monotonic
+        # clock, so they go through a clone of the live engine's setup.
+        self.replay_navigation_engine = None
 
         # Solcast starts from environment defaults, then config/settings can
         # override them. Auto-location updates are rate-limited below.
@@ -166,6 +172,9 @@ class TelemetryApplication(QObject):
         self._break_even_auto_retrain_in_progress = False
         self._break_even_labels_pending = 0
         self.break_even_auto_retrain_batch_rows = 20
+        # Incremental mode grows and retires a few trees per batch instead of
+        # refitting the whole forest; manual retrains always do a full fit.
+        self.break_even_auto_retrain_incremental = True
         self.config_data_copy = None  # Initialize to store config data
         self.storage_folder = storage_folder
         self.log_file_path = log_file_path or (os.path.join(self.storage_folder, "telemetry_application.log") if self.storage_folder else None)
@@ -205,6 +214,7 @@ class TelemetryApplication(QObject):
         # to real driving without writing simulation data to real CSV files.
         self.simulator = TelemetrySimulator()
         self.simulator.data_ready.connect(self.process_data)
+        self.simulator.batch_ready.connect(self.process_data_batch)
         self.simulator.error.connect(self.on_simulation_error)
         self.simulator.finished.connect(self.on_simulation_finished)
         self.simulator.started.connect(self.on_simulation_started)
@@ -632,7 +642,8 @@ class TelemetryApplication(QObject):
 
     def init_machine_learning(self):
         """
-        Create the ML model object and load any compatible saved models.
+        Create the ML model object; compatible saved models load in the
+        background once the GUI is shown.
 
         Manual retraining remains available; break-even also retrains in the
         background after enough new steady-state labels have accumulated.
@@ -641,7 +652,9 @@ class TelemetryApplication(QObject):
         # runs do not accidentally share incompatible model files.
         models_folder = os.path.join(self.csv_handler.root_directory, 'models')
         os.makedirs(models_folder, exist_ok=True)
-        self.ml_model = MachineLearningModel(model_dir=models_folder)
+        # Saved models load lazily; run_application starts a background
+        # prewarm once the GUI is visible so unpickling never delays launch.
+        self.ml_model = MachineLearningModel(model_dir=models_folder, lazy_load=True)
         self.logger.info("Machine learning model initialized.")
 
     def connect_signals(self):
@@ -655,6 +668,7 @@ class TelemetryApplication(QObject):
             self.gui.driver_name_changed_signal.connect(self.on_driver_name_changed)
             self.update_data_signal.connect(self.buffer.add_data)
             self.update_data_signal.connect(self.gui.update_all_tabs)
+            self.replay_data_signal.connect(self.gui.update_all_tabs)
             self.gui.machine_learning_retrain_signal.connect(self.handle_retrain_model)
             self.gui.machine_learning_retrain_signal_with_files.connect(self.handle_retrain_with_files)
             self.gui.export_bundle_requested.connect(self.handle_export_bundle)
@@ -1266,6 +1280,7 @@ class TelemetryApplication(QObject):
                 self.csv_handler,
                 config_file=config_file_path
             )
+            self.navigation_engine = self.gui.gps_map_tab.navigation
 
             self.connect_signals()
 
@@ -1275,6 +1290,7 @@ class TelemetryApplication(QObject):
                 self.gui.set_initial_settings(self.config_data_copy)
 
             self.gui.show()
+            QTimer.singleShot(0, self.ml_model.prewarm_async)
             self.gui.set_connection_status(f"Connecting to {self.selected_port}")
             self.start_serial_reader(self.selected_port, self.baudrate)
             return True
@@ -1390,14 +1406,20 @@ class TelemetryApplication(QObject):
         training_path = self.csv_handler.get_training_data_csv_path()
         succeeded = False
         try:
-            # Avoid reading a half-written CSV row while telemetry continues.
-            with self.csv_handler.lock:
-                succeeded = bool(self.ml_model.train_break_even_model(training_path))
+            # Snapshot the row boundary under the CSV lock, then train without
+            # it so live appends are never blocked by the forest fit.
+            byte_limit = self.csv_handler.snapshot_csv(training_path)
+            if self.break_even_auto_retrain_incremental:
+                train_fn = self.ml_model.update_break_even_model
+            else:
+                train_fn = self.ml_model.train_break_even_model
+            succeeded = bool(train_fn(training_path, byte_limit=byte_limit))
             if succeeded:
                 metadata = self.ml_model.be_meta or {}
                 validation = metadata.get("validation") or {}
                 self.logger.info(
-                    "Break-even model auto-retrained from %s rows (MAE=%s mph).",
+                    "Break-even model auto-retrained (%s) from %s rows (MAE=%s mph).",
+                    metadata.get("update_mode", "full"),
                     metadata.get("row_count", "unknown"),
                     validation.get("mae_mph", "N/A"),
                 )
@@ -1476,6 +1498,7 @@ class TelemetryApplication(QObject):
         """Import a telemetry bundle and optionally make it the active CSV set."""
         try:
             info = self.csv_handler.import_telemetry_bundle(bundle_path, activate=activate)
+            self._annotate_imported_session_async(info.get('destination'))
             if activate:
                 self.csv_file = self.csv_handler.get_csv_file_path()
                 self.secondary_csv_file = self.csv_handler.get_secondary_csv_file_path()
@@ -1502,8 +1525,31 @@ class TelemetryApplication(QObject):
                 f"Failed to import telemetry bundle:\n{exc}"
             )
 
-    def start_simulation_replay(self, file_path, speed):
-        """Start replaying a recorded CSV through the normal telemetry pipeline."""
+    def _annotate_imported_session_async(self, destination):
+        """Write offline model predictions for an imported session off the GUI thread."""
+        session_csv = os.path.join(destination or "", "telemetry_data.csv")
+        if not destination or not os.path.exists(session_csv):
+            return
+
+        def annotate():
+            try:
+                # Batch prediction covers the whole session in one vectorized
+                # pass instead of replaying it row by row.
+                output = self.ml_model.annotate_session_csv(session_csv)
+                if output:
+                    self.logger.info(f"Imported session annotated with offline predictions: {output}")
+            except Exception as exc:
+                self.logger.error(f"Failed to annotate imported session {session_csv}: {exc}")
+
+        threading.Thread(target=annotate, name="session-annotation", daemon=True).start()
+
+    def start_simulation_replay(self, file_path, speed, turbo=False):
+        """
+        Start replaying a recorded CSV through the normal telemetry pipeline.
+
+        Turbo replay runs unthrottled, in batches, with every row flushed as its
+        own snapshot and timed by its recorded timestamp.
+        """
         if not file_path:
             QMessageBox.warning(self.gui, "Simulation", "Please choose a CSV file to replay.")
             return
@@ -1516,8 +1562,15 @@ class TelemetryApplication(QObject):
         self._resume_serial_after_sim = bool(self.serial_reader_thread and self.serial_reader_thread.isRunning())
         if self._resume_serial_after_sim:
             self.stop_serial_reader()
-        self._simulation_mode = f"Replay ({os.path.basename(file_path)})"
-        self.simulator.start_replay(file_path, speed)
+        label = "Turbo replay" if turbo else "Replay"
+        self.replay_navigation_engine = (
+            self.navigation_engine.clone_setup() if turbo and self.navigation_engine is not None else None
+        )
+        self._simulation_mode = f"{label} ({os.path.basename(file_path)})"
+        if turbo and self.gui is not None:
+            # Recorded timestamps predate the live graphs; give them their own.
+            self.gui.begin_replay_session()
+        self.simulator.start_replay(file_path, speed, turbo=turbo)
 
     def set_simulation_replay_speed(self, speed):
         """Update replay speed while a replay worker is running."""
@@ -1589,6 +1642,7 @@ class TelemetryApplication(QObject):
             self.gui.set_simulation_status("Live")
         self._resume_serial_after_sim = False
         self._simulation_mode = None
+        self.replay_navigation_engine = None
 
     def handle_settings_applied(self, port, baudrate, log_level, endianness):
         """Apply connection/logging/parser settings from the Settings tab."""
@@ -1643,7 +1697,21 @@ class TelemetryApplication(QObject):
                 self.gui.set_connection_status("Serial error")
             QMessageBox.critical(None, "Error", f"Failed to connect to COM Port {port} with baud rate {baudrate}.\nError: {e}")
 
-    def process_data(self, data):
+    def process_data_batch(self, rows, sample_times):
+        """Run a turbo replay batch through process_data, one snapshot per row."""
+        try:
+            for row, sample_time in zip(rows, sample_times):
+                if self._simulation_mode is None:
+                    break
+                self.process_data(row, sample_time=sample_time, replay=True)
+        finally:
+            self.simulator.batch_done()
+
+    def _navigation_engine_for(self, replay):
+        """Live engine for live rows, the turbo replay clone for replayed ones."""
+        return self.replay_navigation_engine if replay else self.navigation_engine
+
+    def process_data(self, data, sample_time=None, replay=False):
         """
         Main telemetry ingest path.
 
@@ -1651,6 +1719,11 @@ class TelemetryApplication(QObject):
         parses/merges packets, runs predictions, enriches with GPS/Solcast/static
         battery fields, writes real-drive CSV/training rows, updates the GUI, and
         optionally sends an online telemetry event.
+
+        `replay` marks a turbo replay row: a complete snapshot that is flushed
+        on its own and runs through the replay navigation engine. Its
+        `sample_time` is the recorded POSIX time, used instead of the wall
+        clock for navigation and GUI history.
         """
         try:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -1687,7 +1760,9 @@ class TelemetryApplication(QObject):
                 self.logger.debug(f"Processed data after adding 'timestamp': {processed_data}")
                 self.buffer.add_data(processed_data)
 
-                if self.buffer.is_ready_to_flush():
+                # A turbo replay row is already a complete snapshot; buffering
+                # by wall-clock time would merge many of them into one.
+                if replay or self.buffer.is_ready_to_flush():
                     # A flush creates a latest-known complete vehicle snapshot,
                     # writes it when appropriate, and returns it for prediction,
                     # GUI updates, and external storage.
@@ -1779,13 +1854,12 @@ class TelemetryApplication(QObject):
                     if self.battery_info:
                         combined_data.update(self.battery_info)
 
-                    if self.gui and hasattr(self.gui, "gps_map_tab"):
-                        # GPS/lap metrics depend on GUI route state, so they are
-                        # calculated here after the base telemetry snapshot exists.
-                        nav_metrics = self.gui.gps_map_tab.build_navigation_metrics_for_snapshot(
-                            combined_data,
-                            update_laps=True,
-                        )
+                    navigation = self._navigation_engine_for(replay)
+                    if navigation is not None:
+                        # GPS/lap metrics are calculated once here, before the
+                        # snapshot is emitted; the map tab only draws the NAV_*
+                        # fields instead of advancing lap state a second time.
+                        nav_metrics = navigation.update(combined_data, now=sample_time)
                         if nav_metrics:
                             combined_data.update(nav_metrics)
 
@@ -1800,7 +1874,12 @@ class TelemetryApplication(QObject):
                         self._note_break_even_training_result(training_result)
 
                     # --- emit to GUI & server ---
-                    self.update_data_signal.emit(combined_data)
+                    if not replay:
+                        self.update_data_signal.emit(combined_data)
+                    else:
+                        self.replay_data_signal.emit(
+                            combined_data, time.time() if sample_time is None else sample_time
+                        )
                     if not self._simulation_mode and self._should_send_online_telemetry():
                         # Online sends are throttled separately from local CSV/UI
                         # updates so the desktop remains high-resolution locally.
@@ -0,0 +1,70 @@
+# src/telemetry_snapshot.py
+
+"""
+Immutable telemetry snapshot shared by every GUI tab.
+
+TelemetryGUI builds one TelemetrySnapshot per tick and hands the same object
+to the map, graphs, tables, dashboard and data display. Tabs that remember
+the last tick keep the reference instead of copying the dict. Values live in
+a tuple of slots; the key -> slot index is shared by every snapshot with the
+same key order, which is the normal case for a running session.
+"""
+
+import itertools
+from collections.abc import Mapping
+
+
+class TelemetrySnapshot(Mapping):
+    __slots__ = ("_index", "_values", "version")
+
+    # Key order -> {key: slot}. Sessions produce very few distinct layouts.
+    _schemas = {}
+    MAX_SCHEMAS = 32
+    _versions = itertools.count(1)
+
+    def __init__(self, data=(), *updates):
+        if updates:
+            merged = dict(data)
+            for update in updates:
+                merged.update(update)
+            data = merged
+        elif not isinstance(data, Mapping):
+            data = dict(data)
+        keys = tuple(data)
+        index = self._schemas.get(keys)
+        if index is None:
+            if len(self._schemas) >= self.MAX_SCHEMAS:
+                self._schemas.clear()
+            index = self._schemas[keys] = {key: slot for slot, key in enumerate(keys)}
+        self._index = index
+        self._values = tuple(data.values())
+        # Increases with every snapshot built in this process.
+        self.version = next(self._versions)
+
+    @classmethod
+    def of(cls, data):
+        """Return `data` itself when it is already a snapshot, otherwise freeze it."""
+        return data if isinstance(data, cls) else cls(data)
+
+    def __getitem__(self, key):
+        return self._values[self._index[key]]
+
+    def get(self, key, default=None):
+        slot = self._index.get(key)
+        return default if slot is None else self._values[slot]
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._values)
+
+    def copy(self):
+        """Mutable dict copy, for callers that need to edit the values."""
+        return dict(zip(self._index, self._values))
+
+    def __repr__(self):
+        return f"TelemetrySnapshot(version={self.version}, {self.copy()!r})"
@@ -1,4 +1,8 @@
 # src/unit_conversions.py
+from functools import lru_cache
+
+import numpy as np
+
 from key_name_definitions import KEY_UNITS
 from extra_calculations import ExtraCalculations
 
@@ -140,20 +144,88 @@ _conversion_map = {
     ("mph", "m/s"): lambda mph: mph / 2.2369362921,
 }
 
-def convert_value(key: str, raw_value, target_unit: str):
+class ConversionPlan:
     """
-    Look up the original unit for this key in KEY_UNITS,
-    then, if (original, target) in our map, run conversion.
-    Otherwise return raw_value unchanged.
+    Resolved conversion for one (key, target unit) pair.
+
+    Scalars go through the conversion function itself, so table cells and
+    CSV rows are exactly what that function returns. Arrays use a scale and
+    offset derived from it instead of one call per sample: every conversion
+    in _conversion_map is linear or affine, and the last-bit rounding the
+    derived constants can differ by is far below what a plot shows. A
+    function that is not affine is applied element by element.
     """
-    if raw_value is None or not isinstance(raw_value, (int,float)):
-        return raw_value
+    __slots__ = ("fn", "scale", "offset", "affine")
+
+    def __init__(self, fn=None, scale=1.0, offset=0.0, affine=True):
+        self.fn = fn
+        self.scale = scale
+        self.offset = offset
+        self.affine = affine
+
+    @property
+    def is_identity(self) -> bool:
+        return self.fn is None
+
+    @classmethod
+    def compile(cls, fn):
+        offset = float(fn(0.0))
+        scale = float(fn(1.0)) - offset
+        for probe in (-40.0, 1000.0):
+            expected = scale * probe + offset
+            if abs(fn(probe) - expected) > 1e-9 * max(1.0, abs(expected)):
+                return cls(fn, affine=False)
+        return cls(fn, scale, offset)
+
+    def apply(self, value):
+        if self.fn is None:
+            return value
+        return self.fn(value)
+
+    def apply_array(self, values):
+        """Convert a whole array; the result is always a new float64 array."""
+        values = np.array(values, dtype=np.float64)
+        if self.fn is None:
+            return values
+        if not self.affine:
+            return np.fromiter((self.fn(v) for v in values), dtype=np.float64, count=len(values))
+        values *= self.scale
+        values += self.offset
+        return values
+
+
+_IDENTITY_PLAN = ConversionPlan()
+
 
+@lru_cache(maxsize=None)
+def conversion_plan(key: str, target_unit: str) -> ConversionPlan:
+    """
+    Resolve the conversion from key's KEY_UNITS unit to `target_unit` once.
+
+    Plans are cached by (key, target unit), so switching the units map or a
+    per-key override simply selects another cached plan.
+    """
     # Unknown keys or same-unit requests fall through unchanged. That makes new
     # telemetry fields displayable before a conversion has been explicitly added.
     orig_unit = _normalize_unit(KEY_UNITS.get(key, ""))
     target_unit = _normalize_unit(target_unit)
     if orig_unit == target_unit:
-        return raw_value
+        return _IDENTITY_PLAN
     fn = _conversion_map.get((orig_unit, target_unit))
-    return fn(raw_value) if fn else raw_value
+    return ConversionPlan.compile(fn) if fn else _IDENTITY_PLAN
+
+
+def convert_value(key: str, raw_value, target_unit: str):
+    """
+    Look up the original unit for this key in KEY_UNITS,
+    then, if (original, target) in our map, run conversion.
+    Otherwise return raw_value unchanged.
+    """
+    if raw_value is None or not isinstance(raw_value, (int,float)):
+        return raw_value
+    return conversion_plan(key, target_unit or "").apply(raw_value)
+
+
+def convert_array(key: str, raw_values, target_unit: str):
+    """Vectorized convert_value for a sequence of numeric samples (NaN stays NaN)."""
+    return conversion_plan(key, target_unit or "").apply_array(raw_values)
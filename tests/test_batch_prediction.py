@@ -0,0 +1,89 @@
+import math
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+import pandas as pd
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from learning_datasets.machine_learning import MachineLearningModel
+
+
+class BatchPredictionTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.model = MachineLearningModel(model_dir=self.temp_dir.name)
+        csv_path = Path(self.temp_dir.name) / "training.csv"
+        rows = []
+        for index in range(40):
+            array_power = 400.0 + index * 25.0
+            rows.append({
+                "BP_PVS_milliamp*s": 1000.0 + index * 10.0,
+                "BP_PVS_Ah": 0.5 + index * 0.01,
+                "BP_PVS_Voltage": 130.0 + (index % 5),
+                "Used_Ah_Remaining_Time": 5.0 - index * 0.05,
+                "BreakEven_Power_W": array_power,
+                "BreakEvenSpeed": 18.0 + array_power * 0.02,
+            })
+        pd.DataFrame(rows).to_csv(csv_path, index=False)
+        self.assertTrue(self.model.train_battery_life_model(str(csv_path)))
+        self.assertTrue(self.model.train_break_even_model(str(csv_path)))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_break_even_batch_matches_single_row_predictions(self):
+        frame = pd.DataFrame({
+            "BreakEven_Power_W": [500.0, 900.0, "N/A", 5000.0],
+            "BP_PVS_Voltage": [131.0, 133.0, 132.0, 132.0],
+        })
+
+        batch = self.model.predict_break_even_batch(frame)
+
+        for index in (0, 1, 3):
+            single = self.model.predict_break_even_speed_details(frame.iloc[index].to_dict())
+            self.assertAlmostEqual(batch["prediction"].iloc[index], single["prediction"])
+            self.assertAlmostEqual(batch["sigma"].iloc[index], single["sigma"])
+        self.assertTrue(math.isnan(batch["prediction"].iloc[2]))
+        self.assertEqual(list(batch["out_of_range"]), [False, False, False, True])
+        self.assertEqual(batch["out_of_range_features"].iloc[3], "BreakEven_Power_W")
+
+    def test_battery_batch_matches_single_row_predictions(self):
+        frame = pd.DataFrame({
+            "BP_PVS_milliamp*s": [1100.0, 1300.0],
+            "BP_PVS_Ah": [0.6, 0.8],
+            "BP_PVS_Voltage": [131.0, 133.0],
+        })
+
+        batch = self.model.predict_battery_life_batch(frame)
+
+        for index in range(len(frame)):
+            single = self.model.predict_battery_life_details(frame.iloc[index].to_dict())
+            self.assertAlmostEqual(batch["prediction"].iloc[index], single["prediction"])
+
+    def test_annotate_session_csv_adds_offline_columns(self):
+        session_path = Path(self.temp_dir.name) / "telemetry_data.csv"
+        pd.DataFrame({
+            "timestamp": ["2026-06-01 10:00:00", "2026-06-01 10:00:01"],
+            "BP_PVS_milliamp*s": [1100.0, "N/A"],
+            "BP_PVS_Ah": [0.6, 0.7],
+            "BP_PVS_Voltage": [131.0, 132.0],
+            "Array_Estimated_Power_W": [700.0, "N/A"],
+            "Predicted_BreakEven_Speed": [31.0, "Prediction unavailable"],
+        }).to_csv(session_path, index=False)
+
+        output = self.model.annotate_session_csv(str(session_path))
+
+        annotated = pd.read_csv(output)
+        self.assertEqual(len(annotated), 2)
+        self.assertIn("Offline_Predicted_Remaining_Time", annotated.columns)
+        self.assertFalse(math.isnan(annotated["Offline_Predicted_BreakEven_Speed"].iloc[0]))
+        self.assertTrue(math.isnan(annotated["Offline_Predicted_BreakEven_Speed"].iloc[1]))
+        self.assertEqual(annotated["Predicted_BreakEven_Speed"].iloc[0], "31.0")
+
+
+if __name__ == "__main__":
+    unittest.main()
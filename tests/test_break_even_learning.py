@@ -10,6 +10,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from learning_datasets.machine_learning import MachineLearningModel
 from buffer_data import BufferData
+from csv_handler import CSVHandler
 
 
 class MemoryCSVHandler:
@@ -68,6 +69,129 @@ class BreakEvenLearningTests(unittest.TestCase):
         self.assertIsInstance(details["prediction"], float)
         self.assertIsInstance(details["uncertainty"], float)
 
+    def test_snapshot_limits_training_to_rows_written_before_it(self):
+        csv_handler = CSVHandler(root_directory=self.temp_dir.name)
+        training_path = csv_handler.get_training_data_csv_path()
+
+        def append_rows(start, count):
+            for index in range(start, start + count):
+                array_power = 400.0 + index * 25.0
+                csv_handler.append_to_csv(training_path, {
+                    "BreakEven_Power_W": array_power,
+                    "BP_PVS_Voltage": 130.0 + (index % 5),
+                    "BreakEvenSpeed": 18.0 + array_power * 0.02,
+                })
+
+        append_rows(0, 30)
+        byte_limit = csv_handler.snapshot_csv(training_path)
+        append_rows(30, 15)
+
+        self.assertTrue(
+            self.model.train_break_even_model(training_path, byte_limit=byte_limit)
+        )
+        self.assertEqual(self.model.be_meta["row_count"], 30)
+
+    def test_incremental_update_replaces_oldest_trees(self):
+        csv_path = Path(self.temp_dir.name) / "steady.csv"
+
+        def rows(start, count):
+            for index in range(start, start + count):
+                array_power = 400.0 + index * 25.0
+                yield {
+                    "BreakEven_Power_W": array_power,
+                    "BP_PVS_Voltage": 130.0 + (index % 5),
+                    "BreakEvenSpeed": 18.0 + array_power * 0.02,
+                }
+
+        pd.DataFrame(list(rows(0, 40))).to_csv(csv_path, index=False)
+        self.assertTrue(self.model.train_break_even_model(str(csv_path)))
+        original_seeds = [
+            tree.random_state for tree in self.model.be_pipe.named_steps["rf"].estimators_
+        ]
+
+        pd.DataFrame(list(rows(40, 20))).to_csv(csv_path, mode="a", header=False, index=False)
+        self.assertTrue(self.model.update_break_even_model(str(csv_path)))
+
+        forest = self.model.be_pipe.named_steps["rf"]
+        replaced = self.model.BREAK_EVEN_INCREMENTAL_TREES
+        seeds = [tree.random_state for tree in forest.estimators_]
+        self.assertEqual(len(seeds), len(original_seeds))
+        self.assertEqual(seeds[:-replaced], original_seeds[replaced:])
+        self.assertEqual(self.model.be_meta["update_mode"], "incremental")
+        self.assertEqual(self.model.be_meta["row_count"], 60)
+        self.assertEqual(self.model.be_meta["validation"]["method"], "prequential")
+        self.assertEqual(self.model.be_meta["validation"]["rows"], 20)
+        self.assertGreaterEqual(
+            self.model.be_meta["feature_ranges"]["BreakEven_Power_W"][1],
+            400.0 + 59 * 25.0,
+        )
+
+    def test_incremental_update_without_model_runs_full_train(self):
+        csv_path = Path(self.temp_dir.name) / "steady.csv"
+        pd.DataFrame({
+            "BreakEven_Power_W": [400.0 + index * 25.0 for index in range(30)],
+            "BP_PVS_Voltage": [132.0] * 30,
+            "BreakEvenSpeed": [20.0 + index * 0.5 for index in range(30)],
+        }).to_csv(csv_path, index=False)
+
+        self.assertTrue(self.model.update_break_even_model(str(csv_path)))
+        self.assertEqual(self.model.be_meta["update_mode"], "full")
+
+    def test_lazy_model_loads_on_first_prediction_or_prewarm(self):
+        csv_path = Path(self.temp_dir.name) / "steady.csv"
+        pd.DataFrame({
+            "BreakEven_Power_W": [400.0 + index * 25.0 for index in range(30)],
+            "BP_PVS_Voltage": [132.0] * 30,
+            "BreakEvenSpeed": [20.0 + index * 0.5 for index in range(30)],
+        }).to_csv(csv_path, index=False)
+        self.assertTrue(self.model.train_break_even_model(str(csv_path)))
+
+        lazy = MachineLearningModel(model_dir=self.temp_dir.name, lazy_load=True)
+        self.assertEqual(lazy.be_meta, {})
+        details = lazy.predict_break_even_speed_details({
+            "BreakEven_Power_W": 700.0,
+            "BP_PVS_Voltage": 132.0,
+        })
+        self.assertIsInstance(details["prediction"], float)
+        self.assertEqual(lazy.be_meta["row_count"], 30)
+
+        prewarmed = MachineLearningModel(model_dir=self.temp_dir.name, lazy_load=True)
+        prewarmed.prewarm_async().join(timeout=30)
+        self.assertEqual(prewarmed.be_meta["row_count"], 30)
+        self.assertIsNone(prewarmed.prewarm_async())
+
+    def test_prediction_does_not_wait_for_a_running_prewarm(self):
+        lazy = MachineLearningModel(model_dir=self.temp_dir.name, lazy_load=True)
+        features = {"BreakEven_Power_W": 700.0, "BP_PVS_Voltage": 132.0}
+
+        # Holding the load lock stands in for a prewarm that is still loading.
+        with lazy._load_lock:
+            details = lazy.predict_break_even_speed_details(features)
+
+        self.assertTrue(details["not_fitted"])
+        self.assertIsNone(details["prediction"])
+        self.assertFalse(lazy._models_loaded)
+
+    def test_failed_load_is_not_marked_loaded(self):
+        lazy = MachineLearningModel(model_dir=self.temp_dir.name, lazy_load=True)
+        calls = []
+
+        def failing_load(*args, **kwargs):
+            calls.append(args)
+            raise OSError("disk unavailable")
+
+        lazy._load_or_train = failing_load
+        self.assertFalse(lazy.ensure_models_loaded())
+        self.assertFalse(lazy._models_loaded)
+
+        details = lazy.predict_battery_life_details({})
+        self.assertTrue(details["not_fitted"])
+        self.assertEqual(len(calls), 1)
+
+        del lazy._load_or_train
+        lazy.prewarm_async().join(timeout=30)
+        self.assertTrue(lazy._models_loaded)
+
     def test_full_telemetry_only_derives_labels_at_steady_state(self):
         raw = pd.DataFrame({
             "BP_PVS_milliamp*s": [1.0, 2.0, 3.0],
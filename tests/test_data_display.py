@@ -0,0 +1,72 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from data_display import DataDisplay
+from key_name_definitions import TelemetryKey
+from unit_conversion import build_metric_units_dict
+
+try:
+    from PyQt6.QtWidgets import QApplication
+    from gui_files.gui_data_display_tab import DataDisplayTab
+except ModuleNotFoundError:
+    QApplication = None
+
+
+VOLTAGE = TelemetryKey.MC1BUS_VOLTAGE.value[0]
+
+
+class DataDisplayFormattingTests(unittest.TestCase):
+    def test_cached_lines_follow_value_changes(self):
+        display = DataDisplay(build_metric_units_dict())
+
+        first = display.display({VOLTAGE: 100.0})
+        repeat = display.display({VOLTAGE: 100.0})
+        changed = display.display({VOLTAGE: 101.5})
+        missing = display.display({})
+
+        self.assertEqual(first, repeat)
+        self.assertIn(f"{VOLTAGE}: 100.00", first)
+        self.assertIn(f"{VOLTAGE}: 101.50", changed)
+        self.assertIn(f"{VOLTAGE}: N/A", missing)
+
+
+@unittest.skipIf(QApplication is None, "PyQt6 is not installed in this test environment")
+class DataDisplayTabTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_log_keeps_only_recent_snapshots(self):
+        tab = DataDisplayTab(build_metric_units_dict())
+        try:
+            for index in range(DataDisplayTab.MAX_SNAPSHOTS * 3):
+                tab.update_display({VOLTAGE: float(index)})
+
+            document = tab.data_display.document()
+            self.assertLessEqual(document.blockCount(), tab.data_display.maximumBlockCount())
+            text = tab.data_display.toPlainText()
+            self.assertNotIn(f"{VOLTAGE}: 0.00\n", text)
+            self.assertIn(f"{VOLTAGE}: {DataDisplayTab.MAX_SNAPSHOTS * 3 - 1:.2f}", text)
+        finally:
+            tab.deleteLater()
+
+    def test_hidden_snapshots_beyond_log_size_are_counted(self):
+        tab = DataDisplayTab(build_metric_units_dict())
+        try:
+            for index in range(DataDisplayTab.MAX_SNAPSHOTS + 4):
+                tab.queue_display({VOLTAGE: float(index)})
+            tab.flush_pending()
+
+            self.assertIn("5 updates skipped while hidden", tab.data_display.toPlainText())
+        finally:
+            tab.deleteLater()
+
+
+if __name__ == "__main__":
+    unittest.main()
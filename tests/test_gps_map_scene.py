@@ -0,0 +1,112 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+try:
+    from PyQt6.QtWidgets import QApplication
+    from gui_files.gui_gps_map_tab import GPSMapTab
+except ModuleNotFoundError:
+    QApplication = None
+    GPSMapTab = None
+
+
+@unittest.skipIf(QApplication is None, "PyQt6 is not installed in this test environment")
+class GPSMapSceneTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        # Keep the tests offline; tiles stay placeholders.
+        patcher = patch.object(GPSMapTab, "_request_tile")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.tab = GPSMapTab()
+
+    def tearDown(self):
+        self.tab.close()
+        self.tab.deleteLater()
+
+    def _drive(self, count, start_lon=-85.5872, step=0.00005):
+        for index in range(count):
+            self.tab._set_vehicle_location(42.2917, start_lon + index * step, recenter=True)
+        # Fixes are coalesced into timed renders; draw the latest one now.
+        self.tab._flush_map_render()
+
+    def test_following_the_vehicle_reuses_scene_items(self):
+        self._drive(2)
+        items_before = len(self.tab.scene.items())
+        marker = self.tab._marker_items[1]
+        trail = self.tab._trail_item
+
+        self._drive(20, start_lon=-85.5871)
+
+        self.assertEqual(len(self.tab.scene.items()), items_before)
+        self.assertIs(self.tab._marker_items[1], marker)
+        self.assertIs(self.tab._trail_item, trail)
+        self.assertEqual(self.tab._trail_drawn[1], len(self.tab.trail))
+
+    def test_panning_only_replaces_edge_tiles(self):
+        self._drive(1)
+        tiles_before = dict(self.tab.tile_items)
+        first_x = min(x for x, _y in tiles_before)
+
+        # Move the centre one full tile east.
+        tile_degrees = 360.0 / (1 << self.tab.zoom)
+        self.tab._set_map_center(self.tab.center_lat, self.tab.center_lon + tile_degrees)
+
+        tiles_after = self.tab.tile_items
+        self.assertEqual(len(tiles_after), len(tiles_before))
+        kept = set(tiles_before) & set(tiles_after)
+        self.assertEqual(len(tiles_before) - len(kept), int(len(tiles_before) ** 0.5))
+        self.assertNotIn((first_x, min(y for _x, y in tiles_before)), tiles_after)
+        for position in kept:
+            self.assertIs(tiles_after[position], tiles_before[position])
+
+    def test_zoom_change_rebuilds_the_scene(self):
+        self._drive(3)
+        trail = self.tab._trail_item
+
+        self.tab._set_zoom(self.tab.zoom - 1)
+
+        self.assertIsNot(self.tab._trail_item, trail)
+        self.assertEqual(self.tab._scene_zoom, self.tab.zoom)
+        self.assertFalse(self.tab._trail_item.path().isEmpty())
+
+    def test_fixes_within_the_frame_budget_are_coalesced(self):
+        self._drive(1)
+        with patch.object(self.tab, "_render_map") as render_map, \
+                patch.object(self.tab, "_follow_in_place") as follow_in_place:
+            for index in range(10):
+                self.tab._set_vehicle_location(42.2917, -85.5871 + index * 0.00001, recenter=True)
+
+            self.assertTrue(self.tab._render_timer.isActive())
+            render_map.assert_not_called()
+            follow_in_place.assert_not_called()
+            self.tab._flush_map_render()
+
+        follow_in_place.assert_called_once()
+        render_map.assert_not_called()
+        self.assertFalse(self.tab._render_timer.isActive())
+
+    def test_following_rebuilds_tiles_only_outside_the_dead_zone(self):
+        self._drive(1)
+        tile_degrees = 360.0 / (1 << self.tab.zoom)
+        with patch.object(self.tab, "_update_tile_layer", wraps=self.tab._update_tile_layer) as update_tiles:
+            self._drive(1, start_lon=-85.5872 + tile_degrees * 0.3)
+            update_tiles.assert_not_called()
+            marker_x, _marker_y = self.tab._latlon_to_scene_point(self.tab.vehicle_lat, self.tab.vehicle_lon)
+            self.assertAlmostEqual(self.tab._marker_items[1].pos().x(), marker_x, delta=1.0)
+
+            self._drive(1, start_lon=-85.5872 + tile_degrees * 1.5)
+            update_tiles.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
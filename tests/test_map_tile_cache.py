@@ -0,0 +1,117 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+try:
+    from PyQt6.QtCore import QBuffer, QByteArray, QIODevice
+    from PyQt6.QtGui import QColor, QImage
+    from PyQt6.QtWidgets import QApplication
+    from gui_files.gui_gps_map_tab import GPSMapTab
+    from gui_files.map_tile_cache import TileCache, tiles_ahead
+except ModuleNotFoundError:
+    QApplication = None
+    GPSMapTab = None
+
+
+def _png(size=256):
+    image = QImage(size, size, QImage.Format.Format_RGB32)
+    image.fill(QColor("#a3be8c"))
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(data)
+
+
+@unittest.skipIf(QApplication is None, "PyQt6 is not installed in this test environment")
+class TileCacheTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_evicted_decoded_tiles_keep_their_bytes(self):
+        cache = TileCache(max_decoded=2)
+        png = _png()
+        for x in range(3):
+            self.assertIsNotNone(cache.put((16, x, 0), png))
+
+        self.assertEqual(list(cache.decoded), [(16, 1, 0), (16, 2, 0)])
+        self.assertIn((16, 0, 0), cache)
+        pixmap = cache.get((16, 0, 0))
+        self.assertEqual((pixmap.width(), pixmap.height()), (256, 256))
+        self.assertIn((16, 0, 0), cache.decoded)
+
+    def test_protected_tiles_are_not_evicted(self):
+        png = _png()
+        cache = TileCache(max_decoded=2, max_compressed_bytes=len(png) * 2)
+        cache.protect({(16, 0, 0)})
+        for x in range(4):
+            cache.put((16, x, 0), png)
+
+        self.assertIn((16, 0, 0), cache.decoded)
+        self.assertIn((16, 0, 0), cache.compressed)
+        self.assertEqual(len(cache.compressed), 2)
+        self.assertEqual(cache.compressed_bytes, len(png) * 2)
+        self.assertNotIn((16, 1, 0), cache)
+
+    def test_tiles_are_scaled_and_invalid_data_is_rejected(self):
+        cache = TileCache(tile_size=256)
+
+        self.assertEqual(cache.put((1, 0, 0), _png(512)).width(), 256)
+        self.assertIsNone(cache.put((1, 1, 0), b"not a png"))
+        self.assertNotIn((1, 1, 0), cache)
+
+
+@unittest.skipIf(QApplication is None, "PyQt6 is not installed in this test environment")
+class TilesAheadTests(unittest.TestCase):
+    def test_follows_heading_with_side_tiles(self):
+        positions = tiles_ahead(10.5, 20.5, 1.0, 0.0, 3.0, limit=100, start_tiles=1.0)
+
+        self.assertEqual(positions[:3], [(11, 19), (11, 20), (11, 21)])
+        self.assertEqual({x for x, _y in positions}, {11, 12, 13})
+        self.assertEqual(len(positions), 9)
+
+    def test_limit_and_stationary(self):
+        self.assertEqual(len(tiles_ahead(0.5, 0.5, 0.0, -1.0, 50.0, limit=5)), 5)
+        self.assertEqual(tiles_ahead(0.5, 0.5, 0.0, 0.0, 5.0, limit=5), [])
+
+
+@unittest.skipIf(QApplication is None, "PyQt6 is not installed in this test environment")
+class GPSMapPrefetchTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        patcher = patch.object(GPSMapTab, "_request_tile")
+        self.request_tile = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.tab = GPSMapTab()
+        self.addCleanup(self.tab.deleteLater)
+
+    def test_driving_east_prefetches_tiles_past_the_visible_edge(self):
+        self.tab._set_vehicle_location(42.2917, -85.5872, speed=40.0)
+        self.request_tile.reset_mock()
+        self.tab._set_vehicle_location(42.2917, -85.5870, speed=40.0)
+
+        visible_max_x = max(x for x, _y in self.tab.tile_items)
+        requested = [call.args for call in self.request_tile.call_args_list]
+        self.assertTrue(self.tab.prefetch_tile_keys)
+        self.assertTrue(any(x > visible_max_x for x, _y in requested))
+        self.assertLessEqual(len(self.tab.prefetch_tile_keys), self.tab.PREFETCH_MAX_TILES)
+
+    def test_slow_or_stationary_vehicle_does_not_prefetch(self):
+        self.tab._set_vehicle_location(42.2917, -85.5872, speed=1.0)
+        self.tab._set_vehicle_location(42.2917, -85.5870, speed=1.0)
+
+        self.assertFalse(self.tab.prefetch_tile_keys)
+
+
+if __name__ == "__main__":
+    unittest.main()
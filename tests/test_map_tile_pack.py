@@ -0,0 +1,175 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from gui_files.map_tile_pack import MBTilesPack, corridor_tiles, tile_source_error
+
+try:
+    from PyQt6.QtCore import QBuffer, QByteArray, QIODevice
+    from PyQt6.QtGui import QColor, QImage
+    from PyQt6.QtNetwork import QNetworkAccessManager
+    from PyQt6.QtWidgets import QApplication, QFileDialog, QInputDialog, QMessageBox
+    from gui_files.gui_gps_map_tab import GPSMapTab
+    from navigation_engine import build_route_segment
+except ModuleNotFoundError:
+    QApplication = None
+    GPSMapTab = None
+
+
+class MBTilesPackTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "packs", "route.mbtiles")
+        self.pack = MBTilesPack(self.path)
+        self.addCleanup(self.pack.close)
+
+    def test_round_trip_and_tms_rows(self):
+        self.pack.put(16, 17000, 24000, b"tile-bytes")
+
+        self.assertEqual(self.pack.get(16, 17000, 24000), b"tile-bytes")
+        self.assertIsNone(self.pack.get(16, 17000, 24001))
+        self.assertTrue(self.pack.has(16, 17000, 24000))
+        self.assertEqual(self.pack.tile_count(), 1)
+        # MBTiles stores rows bottom-up.
+        row = sqlite3.connect(self.path).execute(
+            "SELECT tile_row FROM tiles WHERE zoom_level=16 AND tile_column=17000"
+        ).fetchone()[0]
+        self.assertEqual(row, (1 << 16) - 1 - 24000)
+
+    def test_missing_and_metadata(self):
+        self.pack.put(12, 1, 2, b"a", commit=False)
+        self.pack.commit()
+        self.pack.set_metadata(name="route", minzoom=12)
+
+        self.assertEqual(self.pack.missing([(12, 1, 2), (12, 1, 3)]), [(12, 1, 3)])
+        self.assertEqual(self.pack.metadata(), {"name": "route", "minzoom": "12"})
+
+
+class CorridorTilesTests(unittest.TestCase):
+    def test_covers_every_tile_crossed_by_a_long_line(self):
+        # Two points far apart: the tiles between them must still be included.
+        line = [(42.29, -85.70), (42.29, -85.50)]
+        tiles = corridor_tiles([line], [15], buffer_tiles=0)
+
+        xs = sorted(x for _zoom, x, _y in tiles)
+        self.assertEqual(xs, list(range(xs[0], xs[-1] + 1)))
+        self.assertGreater(len(xs), 10)
+        self.assertEqual(len({y for _zoom, _x, y in tiles}), 1)
+
+    def test_buffer_and_zooms(self):
+        point = [(42.2917, -85.5872)]
+        tiles = corridor_tiles([point, []], [14, 15], buffer_tiles=1)
+
+        self.assertEqual(len(tiles), 18)
+        self.assertEqual({zoom for zoom, _x, _y in tiles}, {14, 15})
+
+
+class TileSourceTests(unittest.TestCase):
+    def test_openstreetmap_servers_are_refused(self):
+        for url in (
+            "https://tile.openstreetmap.org/{z}/{x}/{y}.png",
+            "https://a.tile.openstreetmap.org/{z}/{x}/{y}.png",
+        ):
+            self.assertIn("does not allow bulk", tile_source_error(url))
+
+    def test_template_must_be_a_tile_url(self):
+        self.assertIsNotNone(tile_source_error(""))
+        self.assertIsNotNone(tile_source_error("ftp://tiles.example.com/{z}/{x}/{y}.png"))
+        self.assertIsNotNone(tile_source_error("https://tiles.example.com/{z}/{x}.png"))
+        self.assertIsNone(tile_source_error("https://tiles.example.com/{z}/{x}/{y}.png"))
+
+
+@unittest.skipIf(QApplication is None, "PyQt6 is not installed in this test environment")
+class GPSMapTilePackTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.pack = MBTilesPack(os.path.join(directory.name, "route.mbtiles"))
+        self.addCleanup(self.pack.close)
+
+    def _png(self):
+        image = QImage(256, 256, QImage.Format.Format_RGB32)
+        image.fill(QColor("#88c0d0"))
+        data = QByteArray()
+        buffer = QBuffer(data)
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        image.save(buffer, "PNG")
+        return bytes(data)
+
+    def test_packed_tiles_are_served_without_the_network(self):
+        # Pack the neighbourhood of the preview location the tab opens on.
+        tiles = corridor_tiles(
+            [[(GPSMapTab.KALAMAZOO_LAT, GPSMapTab.KALAMAZOO_LON)]], [16], buffer_tiles=12
+        )
+        png = self._png()
+        for tile in tiles:
+            self.pack.put(*tile, png, commit=False)
+        self.pack.commit()
+
+        def open_pack(tab):
+            tab.tile_pack = self.pack
+
+        with patch.object(GPSMapTab, "_open_saved_tile_pack", open_pack), \
+                patch.object(QNetworkAccessManager, "get") as network_get:
+            tab = GPSMapTab()
+            self.addCleanup(tab.deleteLater)
+            tab._set_vehicle_location(42.2920, -85.5870, recenter=True)
+
+        network_get.assert_not_called()
+        self.assertFalse(tab.pending_tiles)
+        self.assertTrue(tab.visible_tile_keys)
+        self.assertTrue(tab.visible_tile_keys.issubset(tab.tile_cache.keys()))
+
+    def _build_with(self, url, zooms="12-17"):
+        answers = iter([(url, True), (zooms, True)])
+        with patch.object(GPSMapTab, "_open_saved_tile_pack"), \
+                patch.object(GPSMapTab, "_request_tile"):
+            tab = GPSMapTab()
+        self.addCleanup(tab.deleteLater)
+        tab.navigation.set_route([
+            build_route_segment("leg.gpx", [(42.29, -85.70), (42.29, -85.40)]),
+        ])
+        with patch.object(QInputDialog, "getText", side_effect=lambda *a, **k: next(answers)), \
+                patch.object(QFileDialog, "getSaveFileName", return_value=(self.pack.path, "")), \
+                patch.object(QMessageBox, "warning") as warning, \
+                patch.object(QMessageBox, "question") as question, \
+                patch.object(QNetworkAccessManager, "get") as network_get, \
+                patch("gui_files.gui_gps_map_tab.QSettings"):
+            tab._build_tile_pack()
+        if tab.tile_pack is not None:
+            self.addCleanup(tab.tile_pack.close)
+        return tab, warning, question, network_get
+
+    def test_pack_build_refuses_the_openstreetmap_server(self):
+        tab, warning, question, network_get = self._build_with("https://tile.openstreetmap.org/{z}/{x}/{y}.png")
+
+        self.assertIn("does not allow bulk", warning.call_args.args[2])
+        question.assert_not_called()
+        network_get.assert_not_called()
+        self.assertIsNone(tab.tile_pack_progress)
+
+    def test_pack_build_is_capped(self):
+        with patch.object(GPSMapTab, "TILE_PACK_MAX_TILES", 50):
+            tab, warning, question, network_get = self._build_with("https://tiles.example.com/{z}/{x}/{y}.png")
+
+        self.assertIn("narrower zoom range", warning.call_args.args[2])
+        question.assert_not_called()
+        network_get.assert_not_called()
+        self.assertIsNone(tab.tile_pack_progress)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from gui_files.map_trail import MapTrail, douglas_peucker  # noqa: E402
+
+
+class DouglasPeuckerTests(unittest.TestCase):
+    def test_keeps_corners_and_drops_collinear_points(self):
+        x = np.array([0.0, 1.0, 2.0, 3.0, 3.0, 3.0])
+        y = np.array([0.0, 0.0, 0.0, 0.0, 1.0, 2.0])
+        np.testing.assert_array_equal(douglas_peucker(x, y, 0.5), [0, 3, 5])
+
+
+class MapTrailTests(unittest.TestCase):
+    def straight_trail(self, count, **kwargs):
+        trail = MapTrail(**kwargs)
+        for index in range(count):
+            trail.append(42.0, -85.0 + index * 1e-5, timestamp=float(index))
+        return trail
+
+    def test_completed_blocks_are_simplified_and_tail_is_raw(self):
+        trail = self.straight_trail(600)
+        lats, lons, sealed = trail.drawing_points(16)
+
+        # Two completed straight blocks collapse to their three boundary
+        # fixes; the 87 fixes after them are drawn as-is.
+        self.assertEqual(sealed, 3)
+        self.assertEqual(len(lats), 3 + 87)
+        self.assertEqual(lons[-1], trail.points()[1][-1])
+
+    def test_appending_without_completing_a_block_only_extends(self):
+        trail = self.straight_trail(300)
+        revision = trail.revision
+        _lats, before, sealed = trail.drawing_points(16)
+        trail.append(42.0, -84.0)
+        _lats, after, sealed_after = trail.drawing_points(16)
+
+        self.assertEqual(trail.revision, revision)
+        self.assertEqual(sealed_after, sealed)
+        np.testing.assert_array_equal(after[:-1], before)
+
+    def test_point_cap_trims_whole_blocks(self):
+        trail = self.straight_trail(1100, max_points=512)
+
+        self.assertLessEqual(len(trail), 512)
+        self.assertGreater(len(trail), 512 - MapTrail.BLOCK_POINTS)
+        self.assertEqual(trail.points()[1][0], -85.0 + 768 * 1e-5)
+
+    def test_age_cap_drops_expired_blocks(self):
+        trail = self.straight_trail(1000, max_age_seconds=300.0)
+
+        # Fixes older than the cutoff survive only inside the block that
+        # straddles it.
+        self.assertEqual(len(trail), 1000 - 512)
+        self.assertEqual(trail.last_point(), (42.0, -85.0 + 999 * 1e-5))
+
+    def test_clear_invalidates_drawn_points(self):
+        trail = self.straight_trail(10)
+        revision = trail.revision
+        trail.clear()
+
+        self.assertEqual(len(trail), 0)
+        self.assertIsNone(trail.last_point())
+        self.assertGreater(trail.revision, revision)
+
+
+if __name__ == "__main__":
+    unittest.main()
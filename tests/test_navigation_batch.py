@@ -0,0 +1,134 @@
+import math
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from key_name_definitions import TelemetryKey  # noqa: E402
+from navigation_batch import load_session_csv, recompute_session, recompute_session_csv  # noqa: E402
+from navigation_engine import NavigationEngine, build_route_segment  # noqa: E402
+from unit_conversion import convert_array  # noqa: E402
+
+
+TRACK_LAT, TRACK_LON = 42.29, -85.58
+LAP_LINE = ((42.29, -85.5745), (42.29, -85.5725))
+
+
+def _oval(angles):
+    return TRACK_LAT + 0.004 * np.sin(angles), TRACK_LON + 0.006 * np.cos(angles)
+
+
+def _session(count=2500, seed=3):
+    """Noisy laps of an oval with uneven sample gaps, a stop, and GPS dropouts."""
+    rng = np.random.default_rng(seed)
+    seconds = np.cumsum(rng.choice([0.5, 1.0, 2.0, 7.0], count, p=[0.15, 0.7, 0.1, 0.05]))
+    angles = np.cumsum(rng.uniform(0.0, 0.06, count))
+    angles[900:950] = angles[899]
+    lat, lon = _oval(angles)
+    lat = lat + rng.normal(0.0, 0.00002, count)
+    lon = lon + rng.normal(0.0, 0.00002, count)
+    speed = rng.uniform(0.0, 40.0, count)
+    speed[900:950] = 0.0
+    valid = rng.random(count) > 0.03
+    return seconds, lat, lon, speed, valid
+
+
+def _live(engine, seconds, lat, lon, speed, valid):
+    progress = []
+    for index in range(len(seconds)):
+        engine.update({
+            TelemetryKey.NAV_LATITUDE.value[0]: lat[index],
+            TelemetryKey.NAV_LONGITUDE.value[0]: lon[index],
+            TelemetryKey.NAV_GPS_VALID.value[0]: int(valid[index]),
+            TelemetryKey.NAV_FIX.value[0]: 3,
+            TelemetryKey.NAV_VEHICLE_MPH.value[0]: speed[index],
+        }, now=seconds[index])
+        if valid[index]:
+            progress.append(engine.route_progress_miles)
+    return progress
+
+
+class RecomputeSessionTests(unittest.TestCase):
+    def setUp(self):
+        self.session = _session()
+        route_lat, route_lon = _oval(np.linspace(0.0, 2.0 * math.pi, 200))
+        self.route = [build_route_segment("track.gpx", list(zip(route_lat, route_lon)))]
+
+    def test_matches_the_live_engine(self):
+        for race_mode in (NavigationEngine.RACE_MODE_FSGP, NavigationEngine.RACE_MODE_ASC):
+            with self.subTest(race_mode=race_mode):
+                engine = NavigationEngine(race_mode=race_mode)
+                engine.set_lap_line(*LAP_LINE)
+                engine.set_route(self.route)
+                live_progress = _live(engine, *self.session)
+
+                result = recompute_session(
+                    *self.session[:4],
+                    valid=self.session[4],
+                    lap_line=LAP_LINE,
+                    route_segments=self.route,
+                    race_mode=race_mode,
+                )
+
+                self.assertEqual(result.lap_count, engine.lap_count)
+                np.testing.assert_allclose([lap["seconds"] for lap in result.laps], engine.completed_lap_seconds)
+                np.testing.assert_allclose(
+                    [lap["distance_miles"] for lap in result.laps], engine.completed_lap_distances_miles
+                )
+                self.assertAlmostEqual(result.trip_miles[-1], engine.trip_distance_miles, places=9)
+                self.assertAlmostEqual(result.moving_seconds[-1], engine.day_moving_seconds, places=9)
+                np.testing.assert_allclose(result.route_progress_miles, live_progress)
+                if race_mode == NavigationEngine.RACE_MODE_FSGP:
+                    self.assertGreater(result.lap_count, 5)
+
+    def test_lap_gate_rules(self):
+        seconds = [0.0, 1.0, 2.0, 3.0, 4.0, 40.0, 41.0]
+        # Start northbound, back out southbound (ignored), then a real lap.
+        lat = [42.2895, 42.2905, 42.2895, 42.2850, 42.2895, 42.2895, 42.2905]
+        lon = [-85.5735] * len(seconds)
+        result = recompute_session(seconds, lat, lon, [20.0] * len(seconds), lap_line=LAP_LINE)
+
+        statuses = [crossing["status"] for crossing in result.crossings]
+        self.assertEqual(statuses, ["start", "wrong direction", "lap"])
+        self.assertEqual(result.lap_count, 1)
+        self.assertEqual(result.laps[0]["seconds"], 40.0)
+        self.assertEqual(result.best_lap_seconds, 40.0)
+
+    def test_metric_session_csv(self):
+        seconds, lat, lon, speed, valid = self.session
+        start = pd.Timestamp("2026-07-01 09:00:00")
+        frame = pd.DataFrame({
+            "csv_units_mode": "metric",
+            TelemetryKey.TIMESTAMP.value[0]: [
+                (start + pd.Timedelta(seconds=float(value))).strftime("%Y-%m-%d %H:%M:%S.%f")
+                for value in seconds
+            ],
+            TelemetryKey.NAV_LATITUDE.value[0]: lat,
+            TelemetryKey.NAV_LONGITUDE.value[0]: lon,
+            TelemetryKey.NAV_GPS_VALID.value[0]: valid.astype(int),
+            TelemetryKey.NAV_FIX.value[0]: 3,
+            TelemetryKey.NAV_VEHICLE_MPH.value[0]: convert_array("NAV_VEHICLE_MPH", speed, "km/h"),
+            "MC1BUS_Voltage": 120.0,
+        })
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = Path(directory) / "session.csv"
+            frame.to_csv(csv_path, index=False)
+            loaded = load_session_csv(csv_path)
+            result = recompute_session_csv(csv_path, lap_line=LAP_LINE)
+
+        np.testing.assert_allclose(loaded[0], seconds - seconds[0])
+        np.testing.assert_allclose(loaded[3], speed)
+        np.testing.assert_array_equal(loaded[4], valid)
+        expected = recompute_session(*self.session[:4], valid=valid, lap_line=LAP_LINE)
+        self.assertEqual(result.lap_count, expected.lap_count)
+        self.assertAlmostEqual(result.trip_miles[-1], expected.trip_miles[-1], places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
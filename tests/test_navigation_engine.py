@@ -0,0 +1,105 @@
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC))
+
+from key_name_definitions import TelemetryKey
+from navigation_engine import NavigationEngine, build_route_segment, format_duration
+
+
+def _fix(lat, lon, speed=30.0):
+    return {
+        TelemetryKey.NAV_LATITUDE.value[0]: lat,
+        TelemetryKey.NAV_LONGITUDE.value[0]: lon,
+        TelemetryKey.NAV_GPS_VALID.value[0]: 1,
+        TelemetryKey.NAV_FIX.value[0]: 3,
+        TelemetryKey.NAV_VEHICLE_MPH.value[0]: speed,
+    }
+
+
+class NavigationEngineTests(unittest.TestCase):
+    def test_laps_are_timed_from_sample_timestamps(self):
+        engine = NavigationEngine(track_lap_length_miles=1.0)
+        engine.set_lap_line((-0.001, 0.0), (0.001, 0.0))
+        # One circuit: cross the line eastbound, loop around its north end,
+        # and cross it eastbound again one minute later.
+        circuit = [(0.0, -0.0005), (0.0, 0.0005), (0.01, 0.002), (0.01, -0.002), (0.0, -0.0005)]
+        times = [0.0, 1.0, 20.0, 40.0, 60.0]
+        for (lat, lon), now in zip(circuit, times):
+            engine.update(_fix(lat, lon), now=now)
+        metrics = engine.update(_fix(0.0, 0.0005), now=61.0)
+
+        self.assertEqual(metrics[TelemetryKey.NAV_LAP_COUNT.value[0]], 1)
+        self.assertEqual(engine.last_lap_seconds, 60.0)
+        self.assertEqual(metrics[TelemetryKey.NAV_LAST_LAP_TIME.value[0]], format_duration(60.0))
+        self.assertEqual(metrics[TelemetryKey.NAV_LAST_LAP_AVERAGE_SPEED_MPH.value[0]], 60.0)
+        self.assertGreater(engine.trip_distance_miles, 0.0)
+
+    def test_invalid_fix_does_not_advance_state(self):
+        engine = NavigationEngine()
+        snapshot = _fix(42.29, -85.58)
+        snapshot[TelemetryKey.NAV_GPS_VALID.value[0]] = 0
+
+        metrics = engine.update(snapshot, now=5.0)
+
+        self.assertIsNone(engine.previous_trip_point)
+        self.assertEqual(metrics[TelemetryKey.NAV_ROUTE_NAME.value[0]], "N/A")
+        self.assertEqual(metrics[TelemetryKey.NAV_GPS_TRIP_DISTANCE_MI.value[0]], 0.0)
+
+    def test_asc_route_progress_does_not_move_backwards(self):
+        engine = NavigationEngine(race_mode=NavigationEngine.RACE_MODE_ASC)
+        engine.set_route([
+            build_route_segment("day-one.gpx", [(0.0, 0.0), (0.0, 0.01), (0.0, 0.02)]),
+            build_route_segment("day-two.gpx", [(0.0, 0.02), (0.0, 0.03), (0.0, 0.04)]),
+        ])
+
+        forward = engine.update(_fix(0.0, 0.03), now=0.0)
+        backward = engine.update(_fix(0.0, 0.005), now=1.0)
+
+        traveled = TelemetryKey.NAV_ROUTE_DISTANCE_TRAVELED_MI.value[0]
+        self.assertEqual(forward[TelemetryKey.NAV_CHECKPOINT_NAME.value[0]], "day-two")
+        self.assertEqual(backward[traveled], forward[traveled])
+
+    def test_replay_on_a_clone_leaves_live_lap_timing_intact(self):
+        live = NavigationEngine(track_lap_length_miles=1.0)
+        live.set_lap_line((-0.001, 0.0), (0.001, 0.0))
+        circuit = [(0.0, -0.0005), (0.0, 0.0005), (0.01, 0.002), (0.01, -0.002), (0.0, -0.0005)]
+
+        # A turbo replay timed by recorded POSIX seconds.
+        replay = live.clone_setup()
+        for offset, (lat, lon) in enumerate(circuit + [(0.0, 0.0005)]):
+            replay.update(_fix(lat, lon), now=1.7e9 + offset * 15.0)
+        self.assertEqual(replay.lap_count, 1)
+        self.assertEqual((replay.lap_start_point, replay.lap_end_point), (live.lap_start_point, live.lap_end_point))
+        self.assertEqual(live.lap_count, 0)
+
+        # Live laps afterwards run on the monotonic clock from a clean state.
+        with patch("navigation_engine.time.monotonic") as monotonic:
+            for now, (lat, lon) in zip([100.0, 101.0, 120.0, 140.0, 160.0], circuit):
+                monotonic.return_value = now
+                live.update(_fix(lat, lon))
+            monotonic.return_value = 161.0
+            metrics = live.update(_fix(0.0, 0.0005))
+
+            self.assertEqual(metrics[TelemetryKey.NAV_LAP_COUNT.value[0]], 1)
+            self.assertEqual(live.last_lap_seconds, 60.0)
+            self.assertGreaterEqual(live.current_lap_seconds(), 0.0)
+
+    def test_module_does_not_import_qt(self):
+        code = (
+            "import sys; sys.path.insert(0, sys.argv[1]); import navigation_engine; "
+            "print(any(name.startswith('PyQt') for name in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code, str(SRC)], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
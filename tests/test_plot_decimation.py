@@ -0,0 +1,87 @@
+import math
+import unittest
+from pathlib import Path
+import sys
+
+import numpy as np
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from gui_files.plot_decimation import MinMaxPyramid, minmax_decimate
+
+
+class MinMaxDecimateTests(unittest.TestCase):
+    def test_short_series_is_returned_unchanged(self):
+        times = np.arange(10, dtype=float)
+        values = np.arange(10, dtype=float)
+
+        out_times, out_values = minmax_decimate(times, values, 100)
+
+        self.assertIs(out_values, values)
+        self.assertEqual(len(out_times), 10)
+
+    def test_spikes_survive_decimation(self):
+        times = np.arange(10_000, dtype=float)
+        values = np.zeros(10_000)
+        values[4321] = 50.0
+        values[8765] = -25.0
+
+        out_times, out_values = minmax_decimate(times, values, 200)
+
+        self.assertLessEqual(len(out_values), 200)
+        self.assertEqual(out_values.max(), 50.0)
+        self.assertEqual(out_values.min(), -25.0)
+        self.assertIn(4321.0, out_times)
+        self.assertTrue(np.all(np.diff(out_times) >= 0))
+
+    def test_empty_buckets_keep_gaps(self):
+        times = np.arange(1000, dtype=float)
+        values = np.ones(1000)
+        values[400:600] = np.nan
+
+        _out_times, out_values = minmax_decimate(times, values, 20)
+
+        self.assertTrue(any(math.isnan(value) for value in out_values))
+        self.assertTrue(np.nanmax(out_values) == 1.0)
+
+
+class MinMaxPyramidTests(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.values = rng.normal(size=200_000)
+        self.values[123_457] = 50.0
+        self.values[180_001] = -40.0
+
+    def test_incremental_updates_match_single_build(self):
+        incremental = MinMaxPyramid()
+        for stop in (1_000, 50_001, 120_000, 200_000):
+            incremental.update(self.values[:stop])
+        single = MinMaxPyramid()
+        single.update(self.values)
+
+        np.testing.assert_array_equal(
+            incremental.select(0, 200_000, 1_000), single.select(0, 200_000, 1_000)
+        )
+
+    def test_select_keeps_extremes_and_newest_rows(self):
+        pyramid = MinMaxPyramid()
+        pyramid.update(self.values[:199_990])
+
+        rows = pyramid.select(0, 200_000, 2_000)
+
+        self.assertLessEqual(len(rows), 2_000)
+        self.assertTrue(np.all(np.diff(rows) >= 0))
+        self.assertIn(123_457, rows)
+        self.assertIn(180_001, rows)
+        self.assertEqual(rows[-1], 199_999)
+
+    def test_short_span_returns_every_row(self):
+        pyramid = MinMaxPyramid()
+        pyramid.update(self.values)
+
+        self.assertEqual(list(pyramid.select(10, 15, 100)), [10, 11, 12, 13, 14])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import math
+import unittest
+from pathlib import Path
+import sys
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from gui_files.plot_ring_buffer import PlotRingBuffer
+
+
+class PlotRingBufferTests(unittest.TestCase):
+    def test_view_returns_newest_samples_in_order_after_wrap(self):
+        buf = PlotRingBuffer(4)
+        for index in range(10):
+            buf.append(100.0 + index, index)
+
+        times, values = buf.view()
+
+        self.assertEqual(len(buf), 4)
+        self.assertEqual(list(values), [6.0, 7.0, 8.0, 9.0])
+        self.assertEqual(list(times), [106.0, 107.0, 108.0, 109.0])
+
+    def test_invalid_values_are_stored_as_nan(self):
+        buf = PlotRingBuffer(3)
+        buf.append(1.0, "N/A")
+        buf.append(2.0, float("inf"))
+        buf.append(3.0, 5)
+
+        _times, values = buf.view()
+
+        self.assertTrue(math.isnan(values[0]))
+        self.assertTrue(math.isnan(values[1]))
+        self.assertEqual(values[2], 5.0)
+
+    def test_resize_keeps_newest_samples(self):
+        buf = PlotRingBuffer(5)
+        for index in range(7):
+            buf.append(float(index), index)
+
+        buf.resize(3)
+        self.assertEqual(list(buf.view()[1]), [4.0, 5.0, 6.0])
+
+        buf.resize(6)
+        buf.append(7.0, 7)
+        self.assertEqual(list(buf.view()[1]), [4.0, 5.0, 6.0, 7.0])
+
+    def test_clear_empties_buffer(self):
+        buf = PlotRingBuffer(3)
+        buf.append(1.0, 1)
+        buf.clear()
+
+        self.assertEqual(len(buf), 0)
+        self.assertEqual(len(buf.view()[1]), 0)
+
+    def test_window_returns_samples_within_duration(self):
+        buf = PlotRingBuffer.for_duration(60, 1.0)
+        for index in range(100):
+            buf.append(1000.0 + index, index)
+
+        times, values = buf.window(10)
+
+        self.assertEqual(list(times), [1089.0 + offset for offset in range(11)])
+        self.assertEqual(values[-1], 99.0)
+
+    def test_samples_faster_than_min_interval_replace_newest(self):
+        buf = PlotRingBuffer.for_duration(10, 2.0)
+        for index in range(6):
+            buf.append(100.0 + index * 0.25, index)
+        buf.append(99.0, 6)
+
+        times, values = buf.view()
+
+        # Slots open at 100.0, 100.5 and 101.0; the clock step backwards is
+        # clamped to the newest time and folds into the last slot.
+        self.assertEqual(list(values), [1.0, 3.0, 6.0])
+        self.assertEqual(list(times), [100.25, 100.75, 101.25])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import math
+import random
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from route_index import RouteIndex, cumulative_miles, haversine_miles  # noqa: E402
+
+
+class RouteIndexTests(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        lat, lon = 42.0, -85.0
+        self.points = []
+        for _ in range(3000):
+            lat += rng.uniform(-2e-5, 3e-5)
+            lon += rng.uniform(-2e-5, 4e-5)
+            self.points.append((lat, lon))
+        self.index = RouteIndex([self.points[:1500], self.points[1500:]])
+        self.rng = rng
+
+    def brute_force_distance(self, lat, lon):
+        px, py = self.index.project(lat, lon)
+        distance, _fraction = self.index._measure(np.arange(len(self.index)), float(px), float(py))
+        return float(distance.min())
+
+    def test_matches_brute_force_nearest_segment(self):
+        for _ in range(200):
+            lat, lon = self.rng.choice(self.points)
+            lat += self.rng.uniform(-2e-3, 2e-3)
+            lon += self.rng.uniform(-2e-3, 2e-3)
+            match = self.index.nearest(lat, lon)
+            self.assertAlmostEqual(match[-1], self.brute_force_distance(lat, lon), places=6)
+
+    def test_far_fix_still_finds_the_route(self):
+        match = self.index.nearest(45.0, -80.0)
+        self.assertAlmostEqual(match[-1], self.brute_force_distance(45.0, -80.0), places=3)
+
+    def test_projects_between_sparse_points(self):
+        index = RouteIndex([[(0.0, 0.0), (0.0, 0.1)]])
+        segment_index, point_index, fraction, flat_index, distance = index.nearest(0.0001, 0.025)
+
+        self.assertEqual((segment_index, point_index, flat_index), (0, 0, 0))
+        self.assertAlmostEqual(fraction, 0.25, places=3)
+        self.assertLess(distance, 15.0)
+
+    def test_flat_range_and_max_distance_limit_matches(self):
+        lat, lon = self.points[2500]
+        local = self.index.nearest(lat, lon, flat_range=(0, 100), max_distance_m=50.0)
+        self.assertIsNone(local)
+
+        match = self.index.nearest(lat, lon, flat_range=(2400, 2600))
+        self.assertEqual(match[0], 1)
+        self.assertTrue(2400 <= match[3] < 2600)
+        self.assertLess(match[-1], 1e-6)
+
+    def test_nearest_many_matches_nearest(self):
+        fixes = []
+        for spread in (2e-4, 2e-3, 5e-2):
+            for _ in range(100):
+                lat, lon = self.rng.choice(self.points)
+                fixes.append((lat + self.rng.uniform(-spread, spread), lon + self.rng.uniform(-spread, spread)))
+        lat, lon = np.array(fixes).T
+
+        lines, fractions, distances = self.index.nearest_many(lat, lon)
+        progress = self.index.line_progress_miles(lines, fractions)
+
+        for position, fix in enumerate(fixes):
+            match = self.index.nearest(*fix)
+            self.assertAlmostEqual(distances[position], match[-1], places=6)
+            self.assertAlmostEqual(progress[position], self.index.progress_miles(*match[:3]), places=9)
+
+    def test_single_point_route_is_matchable(self):
+        index = RouteIndex([[(1.0, 1.0)]])
+        match = index.nearest(1.0, 1.001)
+        self.assertEqual(match[:2], (0, 0))
+        self.assertAlmostEqual(match[-1], math.radians(0.001) * math.cos(math.radians(1.0)) * 6371008.8, places=1)
+
+
+class RouteGeometryTests(unittest.TestCase):
+    def test_cumulative_miles_matches_scalar_haversine(self):
+        points = [(42.0, -85.0), (42.01, -85.0), (42.01, -84.98)]
+        expected = [0.0]
+        for previous, current in zip(points, points[1:]):
+            expected.append(expected[-1] + float(haversine_miles(*previous, *current)))
+
+        np.testing.assert_allclose(cumulative_miles(points), expected)
+        self.assertAlmostEqual(expected[1], 0.691, places=3)
+
+    def test_progress_and_segment_lookup_use_prefix_sums(self):
+        first = [(0.0, 0.0), (0.0, 0.01), (0.0, 0.02)]
+        second = [(0.0, 0.02), (0.0, 0.04)]
+        index = RouteIndex([first, second])
+        first_miles = cumulative_miles(first)[-1]
+
+        self.assertAlmostEqual(index.total_miles, first_miles + cumulative_miles(second)[-1])
+        self.assertAlmostEqual(index.progress_miles(1, 0, 0.5), first_miles * 1.5)
+        self.assertEqual(index.segment_at(0.0), 0)
+        self.assertEqual(index.segment_at(first_miles), 0)
+        self.assertEqual(index.segment_at(first_miles + 0.01), 1)
+        self.assertEqual(index.segment_at(index.total_miles + 5.0), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,190 @@
+import math
+import os
+import sys
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+
+import numpy as np
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from session_history_store import SessionHistoryStore
+from unit_conversion import build_imperial_units_dict, build_metric_units_dict
+
+try:
+    from PyQt6.QtWidgets import QApplication
+    from gui_files.base_graph_tab import BaseGraphTab
+    from gui_files.gui_display import TelemetryGUI
+except ModuleNotFoundError:
+    QApplication = None
+
+
+class SessionHistoryStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.session_dir = Path(self.temp_dir.name) / "session_a"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_rows_are_readable_before_and_after_flush(self):
+        store = SessionHistoryStore(str(self.session_dir), ["A", "B"])
+        for index in range(SessionHistoryStore.BLOCK_ROWS + 3):
+            store.append(1000.0 + index, {"A": index, "B": "N/A"})
+
+        self.assertEqual(store.rows, SessionHistoryStore.BLOCK_ROWS)
+        pending_times, pending_values = store.pending("A")
+        self.assertEqual(list(pending_values), [64.0, 65.0, 66.0])
+
+        store.flush()
+        times = store.flushed_times()
+        column = store.flushed_column("A")
+        self.assertEqual(len(times), SessionHistoryStore.BLOCK_ROWS + 3)
+        self.assertEqual(times[-1], 1066.0)
+        self.assertEqual(column[10], 10.0)
+        self.assertTrue(math.isnan(store.flushed_column("B")[0]))
+        self.assertEqual(len(store.pending("A")[0]), 0)
+
+    def test_reopen_drops_partial_block_and_backfills_new_keys(self):
+        store = SessionHistoryStore(str(self.session_dir), ["A"])
+        for index in range(5):
+            store.append(float(index), {"A": index})
+        store.flush()
+        # Simulate a crash after one column block was appended.
+        with open(self.session_dir / "col_0000.f4", "ab") as fh:
+            np.zeros(3, dtype=np.float32).tofile(fh)
+
+        reopened = SessionHistoryStore(str(self.session_dir), ["A", "C"])
+
+        self.assertEqual(reopened.rows, 5)
+        self.assertEqual(list(reopened.flushed_column("A")), [0.0, 1.0, 2.0, 3.0, 4.0])
+        self.assertTrue(np.isnan(reopened.flushed_column("C")).all())
+        reopened.append(5.0, {"A": 5, "C": 7})
+        reopened.flush()
+        self.assertEqual(reopened.flushed_column("C")[-1], 7.0)
+
+    def test_create_session_prunes_oldest_sessions(self):
+        root = Path(self.temp_dir.name) / "history"
+        for name in ("session_20260101_000000", "session_20260102_000000", "session_20260103_000000"):
+            (root / name).mkdir(parents=True)
+
+        SessionHistoryStore.create_session(str(root), ["A"], keep_sessions=2)
+
+        remaining = sorted(os.listdir(root))
+        self.assertEqual(len(remaining), 2)
+        self.assertEqual(remaining[0], "session_20260103_000000")
+
+    def test_replay_sessions_are_pruned_separately_and_never_collide(self):
+        root = Path(self.temp_dir.name) / "history"
+        (root / "session_20260101_000000").mkdir(parents=True)
+
+        first = SessionHistoryStore.create_session(str(root), ["A"], keep_sessions=2, prefix="replay_")
+        second = SessionHistoryStore.create_session(str(root), ["A"], keep_sessions=2, prefix="replay_")
+        SessionHistoryStore.create_session(str(root), ["A"], keep_sessions=2, prefix="replay_")
+
+        self.assertNotEqual(first.session_dir, second.session_dir)
+        remaining = sorted(os.listdir(root))
+        self.assertIn("session_20260101_000000", remaining)
+        self.assertEqual(len([name for name in remaining if name.startswith("replay_")]), 2)
+
+
+@unittest.skipIf(QApplication is None, "PyQt6 is not installed in this test environment")
+class FullSessionGraphTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_full_session_window_draws_history_older_than_live_ring(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = SessionHistoryStore(str(Path(temp_dir) / "session"), ["A"])
+            tab = BaseGraphTab("History Test", ["A"], {}, {})
+            try:
+                tab.set_history_store(store)
+                for index in range(6000):
+                    snapshot = {"A": 500.0 if index == 10 else float(index % 7)}
+                    store.append(1000.0 + index, snapshot)
+                    tab.update_graphs(snapshot, render=False, timestamp=1000.0 + index)
+
+                tab.window_combo.setCurrentIndex(tab.window_combo.findData(BaseGraphTab.FULL_SESSION))
+                times, values = tab.graph_widgets["A"].graph_curve.getData()
+
+                self.assertLess(len(values), 6000)
+                self.assertEqual(times[0], 1000.0)
+                self.assertEqual(np.nanmax(values), 500.0)
+                self.assertEqual(times[-1], 6999.0)
+            finally:
+                tab.deleteLater()
+
+    def test_turbo_replay_after_live_data_keeps_every_recorded_sample(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tab = BaseGraphTab("Replay Test", ["A"], {}, {})
+            gui = TelemetryGUI.__new__(TelemetryGUI)
+            gui.logger = unittest.mock.MagicMock()
+            gui.history_root = temp_dir
+            gui.history_keys = ["A"]
+            gui.history_store = SessionHistoryStore.create_session(temp_dir, ["A"])
+            gui._live_history_store = None
+            gui._replaying = False
+            gui._replay_last_time = None
+            gui._graph_tab_list = lambda: [tab]
+            live_store = gui.history_store
+            try:
+                tab.set_history_store(live_store)
+                for _ in range(3):
+                    gui._record_graph_sample({"A": 1.0})
+
+                # Recorded times predate the live samples and repeat one second.
+                recorded = [1000.0, 1001.0, 1001.0, 1002.0, 1003.5]
+                gui.begin_replay_session()
+                for index, seconds in enumerate(recorded):
+                    gui._record_graph_sample({"A": float(index)}, seconds)
+
+                replay_store = gui.history_store
+                self.assertIsNot(replay_store, live_store)
+                self.assertIs(tab.history_store, replay_store)
+                self.assertEqual(len(tab.data_buffers["A"]), 4)
+                replay_store.flush()
+                times = np.asarray(replay_store.flushed_times())
+                self.assertEqual(list(times), sorted(times))
+                self.assertEqual(times[0], 1000.0)
+
+                gui._record_graph_sample({"A": 2.0})
+                self.assertIs(gui.history_store, live_store)
+                self.assertIs(tab.history_store, live_store)
+                self.assertEqual(len(tab.data_buffers["A"]), 1)
+            finally:
+                tab.deleteLater()
+
+    def test_units_change_converts_buffered_samples_without_appending(self):
+        key = "MC1TP1_Motor_Temp"
+        tab = BaseGraphTab("Units Test", [key], build_metric_units_dict(), {})
+        try:
+            for index in range(3):
+                tab.update_graphs({key: 100.0}, timestamp=1000.0 + index)
+            tab.set_units_map(build_imperial_units_dict())
+
+            times, values = tab.graph_widgets[key].graph_curve.getData()
+            self.assertEqual(len(tab.data_buffers[key]), 3)
+            self.assertEqual(list(times), [1000.0, 1001.0, 1002.0])
+            np.testing.assert_allclose(values, [212.0] * 3)
+        finally:
+            tab.deleteLater()
+
+    def test_full_session_label_reflects_missing_history_store(self):
+        tab = BaseGraphTab("Label Test", ["A"], {}, {})
+        try:
+            index = tab.window_combo.findData(BaseGraphTab.FULL_SESSION)
+            self.assertEqual(tab.window_combo.itemText(index), "Full session (last 15 min)")
+            with tempfile.TemporaryDirectory() as temp_dir:
+                tab.set_history_store(SessionHistoryStore(str(Path(temp_dir) / "session"), ["A"]))
+                self.assertEqual(tab.window_combo.itemText(index), "Full session")
+        finally:
+            tab.deleteLater()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+try:
+    import simulation
+    from simulation import ReplayData, _ReplayWorker, _coerce_value, load_replay_data
+    from navigation_engine import NavigationEngine
+    from telemetry_application import TelemetryApplication
+except ModuleNotFoundError:
+    simulation = None
+
+
+CSV_TEXT = (
+    "timestamp,MC1BUS_Voltage,count,status,mixed,blank,mixed_numbers\n"
+    "2025-07-01 10:00:00,98.5,1,OK,3,,5\n"
+    "2025-07-01 10:00:01,98.25,2,N/A,x,,5.5\n"
+    "2025-07-01T10:00:03,,3,OK,1e5,,6\n"
+)
+
+
+@unittest.skipIf(simulation is None, "PyQt6 or pandas is not installed in this test environment")
+class ReplayDataTests(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".csv")
+        os.close(handle)
+        self.addCleanup(os.remove, self.path)
+        self._write(CSV_TEXT)
+        simulation._replay_cache.clear()
+
+    def _write(self, text):
+        with open(self.path, "w", encoding="utf-8") as handle:
+            handle.write(text)
+
+    def test_values_match_the_row_by_row_coercion(self):
+        replay = ReplayData(self.path)
+
+        header, *lines = CSV_TEXT.splitlines()
+        expected = [
+            {name: _coerce_value(value) for name, value in zip(header.split(","), line.split(","))}
+            for line in lines
+        ]
+        self.assertEqual(replay.rows, expected)
+        self.assertIsInstance(replay.rows[0]["count"], int)
+        self.assertEqual(replay.rows[2]["mixed"], "1e5")
+        # A column mixing integer and decimal text keeps each value's own type.
+        self.assertEqual([type(row["mixed_numbers"]) for row in replay.rows], [int, float, int])
+
+    def test_timestamps_accept_both_spellings(self):
+        replay = ReplayData(self.path)
+
+        seconds = replay.seconds()
+        self.assertEqual(seconds[1] - seconds[0], 1.0)
+        self.assertEqual(seconds[2] - seconds[0], 3.0)
+
+    def test_cache_is_reused_until_the_file_changes(self):
+        first = load_replay_data(self.path)
+        self.assertIs(load_replay_data(self.path), first)
+
+        stat = os.stat(self.path)
+        self._write(CSV_TEXT + "2025-07-01 10:00:04,97.0,4,OK,2,,7\n")
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = load_replay_data(self.path)
+        self.assertIsNot(second, first)
+        self.assertEqual(len(second.rows), 4)
+
+    def test_turbo_worker_emits_batches_without_waiting(self):
+        rows = ["timestamp,value"]
+        rows += [f"2025-07-01 10:{minute:02d}:00,{minute}" for minute in range(50)]
+        self._write("\n".join(rows) + "\n")
+        worker = _ReplayWorker(self.path, lambda: 0.1, threading.Event(), turbo=True)
+        worker.TURBO_BATCH_ROWS = 20
+        batches = []
+        worker.batch_ready.connect(lambda batch, seconds: batches.append((batch, seconds)))
+        worker.data_ready.connect(lambda _row: self.fail("turbo replay emitted a single row"))
+
+        started = time.monotonic()
+        worker.run()
+
+        self.assertLess(time.monotonic() - started, 5.0)
+        self.assertEqual([len(batch) for batch, _seconds in batches], [20, 20, 10])
+        values = [row["value"] for batch, _seconds in batches for row in batch]
+        self.assertEqual(values, list(range(50)))
+        seconds = [value for _batch, batch_seconds in batches for value in batch_seconds]
+        self.assertEqual(seconds[-1] - seconds[0], 49 * 60.0)
+
+    def test_turbo_worker_fills_missing_timestamps_from_the_fallback_interval(self):
+        worker = _ReplayWorker(self.path, lambda: 1.0, threading.Event(), turbo=True)
+        worker.fallback_interval = 0.5
+
+        self.assertEqual(worker._filled_seconds([None, 10.0, None, None]), [9.5, 10.0, 10.5, 11.0])
+        before = time.time()
+        filled = worker._filled_seconds([None, None])
+        self.assertGreaterEqual(filled[0], before)
+        self.assertEqual(filled[1] - filled[0], 0.5)
+
+    def test_turbo_worker_stops_while_waiting_for_a_batch_slot(self):
+        stop = threading.Event()
+        slots = threading.Semaphore(1)
+        worker = _ReplayWorker(self.path, lambda: 1.0, stop, turbo=True, batch_slots=slots)
+        worker.TURBO_BATCH_ROWS = 1
+        batches = []
+        worker.batch_ready.connect(lambda batch, _seconds: (batches.append(batch), stop.set()))
+
+        worker.run()
+
+        self.assertEqual(len(batches), 1)
+
+
+@unittest.skipIf(simulation is None, "PyQt6 or pandas is not installed in this test environment")
+class TurboReplayNavigationTests(unittest.TestCase):
+    def test_turbo_rows_use_a_clone_of_the_live_engine(self):
+        handle, path = tempfile.mkstemp(suffix=".csv")
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        app = TelemetryApplication.__new__(TelemetryApplication)
+        app.navigation_engine = NavigationEngine()
+        app.navigation_engine.set_lap_line((-0.001, 0.0), (0.001, 0.0))
+        app.serial_reader_thread = None
+        app.simulator = MagicMock()
+        app.gui = None
+
+        app.start_simulation_replay(path, 1.0, turbo=True)
+        replay = app.replay_navigation_engine
+
+        self.assertIsNot(replay, app.navigation_engine)
+        self.assertEqual(replay.lap_end_point, (0.001, 0.0))
+        self.assertIs(app._navigation_engine_for(False), app.navigation_engine)
+        self.assertIs(app._navigation_engine_for(True), replay)
+
+        app.process_data = MagicMock()
+        app.process_data_batch([{"value": 1}, {"value": 2}], [1.7e9, 1.7e9 + 1.0])
+        self.assertEqual(
+            [call.kwargs["replay"] for call in app.process_data.call_args_list], [True, True]
+        )
+
+        app.selected_port = None
+        app._handle_simulation_complete("Simulation finished.")
+        self.assertIsNone(app.replay_navigation_engine)
+
+
+if __name__ == "__main__":
+    unittest.main()
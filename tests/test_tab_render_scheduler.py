@@ -0,0 +1,76 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+try:
+    from PyQt6.QtWidgets import QApplication, QTabWidget, QWidget
+    from gui_files.base_graph_tab import BaseGraphTab
+    from gui_files.tab_render_scheduler import TabRenderScheduler
+except ModuleNotFoundError:
+    QApplication = None
+
+
+@unittest.skipIf(QApplication is None, "PyQt6 is not installed in this test environment")
+class TabRenderSchedulerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.root = QTabWidget()
+        self.dashboard = QWidget()
+        self.nested = QTabWidget()
+        self.first = QWidget()
+        self.second = QWidget()
+        self.root.addTab(self.dashboard, "Dashboard")
+        self.root.addTab(self.nested, "Graphs")
+        self.nested.addTab(self.first, "First")
+        self.nested.addTab(self.second, "Second")
+        self.scheduler = TabRenderScheduler(self.root)
+        self.scheduler.watch(self.nested)
+
+    def tearDown(self):
+        self.root.deleteLater()
+
+    def test_visible_page_renders_immediately(self):
+        calls = []
+        self.scheduler.submit(self.dashboard, lambda: calls.append("dashboard"))
+
+        self.assertEqual(calls, ["dashboard"])
+        self.assertFalse(self.scheduler.has_pending(self.dashboard))
+
+    def test_hidden_page_renders_newest_work_when_selected(self):
+        calls = []
+        self.scheduler.submit(self.second, lambda: calls.append("old"))
+        self.scheduler.submit(self.second, lambda: calls.append("new"))
+        self.assertEqual(calls, [])
+
+        self.root.setCurrentIndex(1)
+        self.assertEqual(calls, [])
+        self.nested.setCurrentIndex(1)
+
+        self.assertEqual(calls, ["new"])
+        self.assertFalse(self.scheduler.has_pending(self.second))
+
+    def test_graph_tab_ingests_without_rendering(self):
+        tab = BaseGraphTab("Scheduler Test", ["A"], {}, {})
+        try:
+            for value in range(5):
+                tab.update_graphs({"A": value}, render=False, timestamp=1000.0 + value)
+
+            self.assertEqual(len(tab.data_buffers["A"]), 5)
+            self.assertEqual(len(tab.graph_widgets["A"].hover_values), 0)
+
+            tab.render_graphs()
+            self.assertEqual(list(tab.graph_widgets["A"].hover_values), [0.0, 1.0, 2.0, 3.0, 4.0])
+        finally:
+            tab.deleteLater()
+
+
+if __name__ == "__main__":
+    unittest.main()
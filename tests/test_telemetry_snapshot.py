@@ -0,0 +1,44 @@
+import sys
+import unittest
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from telemetry_snapshot import TelemetrySnapshot  # noqa: E402
+
+
+class TelemetrySnapshotTests(unittest.TestCase):
+    def test_reads_like_the_merged_dict(self):
+        source = {"A": 1, "B": "ok"}
+        snapshot = TelemetrySnapshot(source, {"B": "fault", "C": 3.5})
+
+        self.assertEqual(dict(snapshot), {"A": 1, "B": "fault", "C": 3.5})
+        self.assertEqual(snapshot, {"A": 1, "B": "fault", "C": 3.5})
+        self.assertEqual(snapshot.get("missing", "--"), "--")
+        self.assertIn("C", snapshot)
+        self.assertEqual(len(snapshot), 3)
+
+        # Later edits to the source dict do not leak into the snapshot.
+        source["A"] = 99
+        self.assertEqual(snapshot["A"], 1)
+
+    def test_is_read_only_and_copy_is_mutable(self):
+        snapshot = TelemetrySnapshot({"A": 1})
+        with self.assertRaises(TypeError):
+            snapshot["A"] = 2
+        copy = snapshot.copy()
+        copy["A"] = 2
+        self.assertEqual(snapshot["A"], 1)
+
+    def test_same_layout_shares_slot_index_and_versions_increase(self):
+        first = TelemetrySnapshot({"A": 1, "B": 2})
+        second = TelemetrySnapshot({"A": 3, "B": 4})
+
+        self.assertIs(first._index, second._index)
+        self.assertGreater(second.version, first.version)
+        self.assertIs(TelemetrySnapshot.of(second), second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+try:
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtWidgets import QApplication
+    from gui_files.gui_custom_data_table import CustomizableDataTableTab
+    from gui_files.gui_data_table import ERROR_COLOR, WARNING_COLOR, DataTableTab
+    from key_name_definitions import TelemetryKey
+    from gui_files.telemetry_table_model import TelemetryTableModel
+except ModuleNotFoundError:
+    QApplication = None
+
+
+@unittest.skipIf(QApplication is None, "PyQt6 is not installed in this test environment")
+class TelemetryTableModelTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.model = TelemetryTableModel()
+        self.model.set_groups({"Pack": ["A", "B", "C"], "Motor": ["D"]})
+        self.changes = []
+        self.model.dataChanged.connect(
+            lambda first, last, _roles=None: self.changes.append((first.row(), last.row()))
+        )
+
+    def display(self, row, column):
+        return self.model.data(self.model.index(row, column), Qt.ItemDataRole.DisplayRole)
+
+    def test_only_changed_rows_emit_data_changed(self):
+        unit = lambda _key: "V"
+        self.model.update_values({"A": 1, "B": 2, "C": 3, "D": 4}, unit)
+        self.assertEqual(self.changes, [(1, 3), (5, 5)])
+
+        self.changes.clear()
+        self.model.update_values({"A": 1, "B": 9, "C": 3, "D": 4}, unit)
+
+        self.assertEqual(self.changes, [(2, 2)])
+        self.assertEqual(self.display(2, TelemetryTableModel.VALUE), "9")
+        self.assertEqual(self.display(4, TelemetryTableModel.PARAMETER), "Motor")
+
+    def test_unchanged_raw_values_skip_formatting(self):
+        calls = []
+
+        def unit(key):
+            calls.append(key)
+            return "V"
+
+        self.model.update_values({"A": 1, "B": 2, "C": 3, "D": 4}, unit)
+        self.changes.clear()
+        self.model.update_values({"A": 1.0, "B": 2, "C": 3, "D": 4}, unit)
+
+        # An int -> float change is reformatted even though 1 == 1.0.
+        self.assertEqual(self.display(1, TelemetryTableModel.VALUE), "1.0")
+        self.assertEqual(self.changes, [(1, 1)])
+        self.assertEqual(len(calls), 8)
+
+    def test_unchanged_groups_do_not_reset_layout(self):
+        resets = []
+        self.model.modelReset.connect(lambda: resets.append(True))
+
+        self.assertFalse(self.model.set_groups({"Pack": ["A", "B", "C"], "Motor": ["D"]}))
+        self.assertTrue(self.model.set_groups({"Pack": ["A", "B"], "Motor": ["D"]}))
+        self.assertEqual(len(resets), 1)
+        self.assertEqual(self.model.position_at(4), ("Motor", 0))
+
+
+@unittest.skipIf(QApplication is None, "PyQt6 is not installed in this test environment")
+class CustomizableDataTableTabTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_layout_changes_rebuild_rows_and_spans(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tab = CustomizableDataTableTab(
+                {}, "metric", {"Group": ["A"]}, layout_path=str(Path(temp_dir) / "layout.json")
+            )
+            try:
+                tab.update_data({"A": 1})
+                self.assertEqual(tab._row_key_map, {1: ("Group", 0)})
+                self.assertEqual(tab.table.columnSpan(0, 0), 3)
+
+                tab.groups["Other"] = ["B"]
+                tab.update_data({"A": 1, "B": 2})
+
+                self.assertEqual(tab._row_key_map, {1: ("Group", 0), 3: ("Other", 0)})
+                self.assertEqual(tab.table.columnSpan(2, 0), 3)
+                self.assertEqual(tab.model.data(tab.model.index(3, 1)), "2")
+            finally:
+                tab.deleteLater()
+
+
+@unittest.skipIf(QApplication is None, "PyQt6 is not installed in this test environment")
+class DataTableTabTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_error_highlights_and_spacer_rows(self):
+        status = TelemetryKey.TELEMETRY_STATUS.value[0]
+        count = TelemetryKey.MC1LIM_CAN_RECEIVE_ERROR_COUNT.value[0]
+        tab = DataTableTab({}, "metric", {"Status": [status, count]})
+        tab.unit_overrides = {}
+        try:
+            tab.update_data({status: "OK", count: 0})
+            self.assertEqual(tab.model.rowCount(), 4)
+            self.assertIsNone(tab.model.data(tab.model.index(1, 1), Qt.ItemDataRole.BackgroundRole))
+
+            tab.update_data({status: "Fault", count: 3})
+            status_brush = tab.model.data(tab.model.index(1, 1), Qt.ItemDataRole.BackgroundRole)
+            count_brush = tab.model.data(tab.model.index(2, 1), Qt.ItemDataRole.BackgroundRole)
+            self.assertEqual(status_brush.color(), ERROR_COLOR)
+            self.assertEqual(count_brush.color(), WARNING_COLOR)
+            self.assertEqual(tab.model.key_at(2), count)
+            self.assertIsNone(tab.model.key_at(3))
+        finally:
+            tab.deleteLater()
+
+
+if __name__ == "__main__":
+    unittest.main()
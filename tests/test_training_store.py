@@ -0,0 +1,113 @@
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+import pandas as pd
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from csv_handler import CSVHandler
+from learning_datasets.machine_learning import MachineLearningModel
+
+
+def steady_row(index):
+    array_power = 400.0 + index * 25.0
+    return {
+        "BreakEven_Power_W": array_power,
+        "BP_PVS_Voltage": 130.0 + (index % 5),
+        "BreakEvenSpeed": 18.0 + array_power * 0.02,
+    }
+
+
+class TrainingStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.model = MachineLearningModel(model_dir=str(Path(self.temp_dir.name) / "models"))
+        self.store = self.model.training_store
+        self.csv_handler = CSVHandler(root_directory=self.temp_dir.name)
+        self.training_path = self.csv_handler.get_training_data_csv_path()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def append_rows(self, start, count):
+        for index in range(start, start + count):
+            self.csv_handler.append_to_csv(self.training_path, steady_row(index))
+
+    def test_sync_only_parses_appended_rows(self):
+        self.append_rows(0, 10)
+        first = self.store.sync(self.training_path)
+        self.append_rows(10, 5)
+        second = self.store.sync(self.training_path)
+
+        self.assertEqual([segment["rows"] for segment in second["segments"]], [10, 5])
+        self.assertGreater(second["consumed_bytes"], first["consumed_bytes"])
+
+        cached = self.store.load(self.training_path)
+        expected = self.model._normalize_training_frame(
+            pd.read_csv(self.training_path), "expected"
+        ).reset_index(drop=True)
+        pd.testing.assert_frame_equal(cached, expected, check_dtype=False)
+
+    def test_rewritten_csv_rebuilds_cache(self):
+        self.append_rows(0, 10)
+        self.store.sync(self.training_path)
+
+        pd.DataFrame([steady_row(index) for index in range(50, 53)]).to_csv(
+            self.training_path, index=False
+        )
+        cached = self.store.load(self.training_path)
+
+        self.assertEqual(len(cached), 3)
+        self.assertEqual(cached["BreakEven_Power_W"].iloc[0], steady_row(50)["BreakEven_Power_W"])
+
+    def test_imported_files_are_normalized_once(self):
+        import_path = Path(self.temp_dir.name) / "import.csv"
+        pd.DataFrame([steady_row(index) for index in range(5)]).to_csv(import_path, index=False)
+
+        calls = []
+        normalize = self.store.normalize
+        self.store.normalize = lambda df, source: calls.append(source) or normalize(df, source)
+
+        first = self.store.load_import(str(import_path))
+        second = self.store.load_import(str(import_path))
+
+        self.assertEqual(len(calls), 1)
+        pd.testing.assert_frame_equal(first, second, check_dtype=False)
+
+    def test_byte_limited_load_ignores_rows_mirrored_past_the_limit(self):
+        self.append_rows(0, 10)
+        limit = self.csv_handler.snapshot_csv(self.training_path)
+        self.append_rows(10, 5)
+        self.store.sync(self.training_path)
+        self.append_rows(15, 5)
+        self.store.sync(self.training_path)
+
+        # The first 15 rows share one segment, so the limit falls inside it.
+        bounded = self.store.load(self.training_path, byte_limit=limit)
+        self.assertEqual(len(bounded), 10)
+        self.assertEqual(bounded["BreakEven_Power_W"].iloc[-1], steady_row(9)["BreakEven_Power_W"])
+        self.assertEqual(len(self.store.load(self.training_path)), 20)
+
+    def test_reimported_file_replaces_its_stale_cache_entry(self):
+        import_path = Path(self.temp_dir.name) / "import.csv"
+        pd.DataFrame([steady_row(index) for index in range(5)]).to_csv(import_path, index=False)
+        self.store.load_import(str(import_path))
+        pd.DataFrame([steady_row(index) for index in range(7)]).to_csv(import_path, index=False)
+
+        self.assertEqual(len(self.store.load_import(str(import_path))), 7)
+        imports_dir = Path(self.store.store_dir) / "imports"
+        self.assertEqual(len(list(imports_dir.glob("*.npy"))), 1)
+
+    def test_retrain_uses_cached_rows(self):
+        self.append_rows(0, 25)
+        self.assertTrue(self.model.train_break_even_model(self.training_path))
+        self.append_rows(25, 10)
+        self.assertTrue(self.model.train_break_even_model(self.training_path))
+        self.assertEqual(self.model.be_meta["row_count"], 35)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from key_name_definitions import KEY_UNITS  # noqa: E402
+from unit_conversion import (  # noqa: E402
+    ConversionPlan,
+    _conversion_map,
+    _normalize_unit,
+    build_imperial_units_dict,
+    build_metric_units_dict,
+    conversion_plan,
+    convert_array,
+    convert_value,
+)
+
+
+class ConversionPlanTests(unittest.TestCase):
+    def test_plans_match_conversion_functions(self):
+        samples = (-40.0, 0.0, 12.5, 37.7, 100.0, 3600.0, 7)
+        for (source, target), fn in _conversion_map.items():
+            plan = ConversionPlan.compile(fn)
+            self.assertTrue(plan.affine, f"{source} -> {target} should compile to scale/offset")
+            for value in samples:
+                # Scalars are bit-for-bit what the conversion function returns.
+                self.assertEqual(plan.apply(value), fn(value), f"{source} -> {target} at {value}")
+            np.testing.assert_allclose(
+                plan.apply_array(samples), [fn(float(value)) for value in samples], rtol=1e-12
+            )
+
+    def test_convert_value_matches_unplanned_conversion_for_every_display_unit(self):
+        for units in (build_metric_units_dict(), build_imperial_units_dict()):
+            for key, target in units.items():
+                fn = _conversion_map.get((_normalize_unit(KEY_UNITS.get(key, "")), _normalize_unit(target)))
+                for value in (-17.3, 0.1, 25, 99.99, 100.0, 1234.5678):
+                    expected = fn(value) if fn else value
+                    self.assertEqual(convert_value(key, value, target), expected, f"{key} -> {target}")
+
+    def test_non_affine_function_is_kept(self):
+        plan = ConversionPlan.compile(lambda value: value * value)
+        self.assertFalse(plan.affine)
+        self.assertEqual(plan.apply(3.0), 9.0)
+        self.assertEqual(list(plan.apply_array([2.0, 3.0])), [4.0, 9.0])
+
+    def test_plans_are_cached_per_key_and_unit(self):
+        self.assertIs(
+            conversion_plan("MC1TP1_Motor_Temp", "°F"),
+            conversion_plan("MC1TP1_Motor_Temp", "°F"),
+        )
+        self.assertTrue(conversion_plan("MC1TP1_Motor_Temp", "°C").is_identity)
+
+    def test_convert_value_keeps_identity_and_non_numeric_values(self):
+        self.assertEqual(convert_value("MC1TP1_Motor_Temp", 25, "°C"), 25)
+        self.assertIsInstance(convert_value("MC1TP1_Motor_Temp", 25, "°C"), int)
+        self.assertEqual(convert_value("MC1TP1_Motor_Temp", "N/A", "°F"), "N/A")
+        self.assertEqual(convert_value("MC1TP1_Motor_Temp", 100.0, "°F"), 212.0)
+        self.assertEqual(convert_value("MC1TP1_Motor_Temp", 100, "°F"), 212.0)
+
+    def test_convert_array_matches_scalar_path(self):
+        values = np.array([-10.0, 0.0, np.nan, 37.5])
+        converted = convert_array("MC1TP1_Motor_Temp", values, "°F")
+
+        self.assertTrue(np.isnan(converted[2]))
+        for raw, result in zip(values[[0, 1, 3]], converted[[0, 1, 3]]):
+            expected = convert_value("MC1TP1_Motor_Temp", float(raw), "°F")
+            self.assertAlmostEqual(result, expected, delta=1e-12 * max(1.0, abs(expected)))
+        # The input buffer is never converted in place.
+        self.assertEqual(values[0], -10.0)
+
+
+if __name__ == "__main__":
+    unittest.main()